@@ -133,7 +133,8 @@ def _setup_gpu() -> str:
 def configure_for_preview(
     output_path: str = "//preview.png",
     resolution: Tuple[int, int] = (960, 540),
-    samples: int = 16
+    samples: int = 16,
+    engine: str = 'CYCLES'
 ) -> dict:
     """
     Configure quick preview render settings.
@@ -142,6 +143,7 @@ def configure_for_preview(
         output_path: Output file path
         resolution: Lower resolution for speed
         samples: Fewer samples for speed
+        engine: 'CYCLES' or 'BLENDER_EEVEE' (faster, needs a GPU context)
 
     Returns:
         Applied settings dictionary
@@ -150,7 +152,7 @@ def configure_for_preview(
         output_path=output_path,
         resolution=resolution,
         samples=samples,
-        engine='CYCLES',
+        engine=engine,
         use_denoising=False
     )
 
@@ -17,6 +17,9 @@ Usage:
     # Full iterative loop
     python scripts/pipeline.py --scene "scene description" --iterate --max-iterations 3
 
+    # Iterate on cheap previews, render production once at the end
+    python scripts/pipeline.py --scene "scene description" --iterate --progressive
+
     # From config file
     python scripts/pipeline.py --config scene_config.json
 """
@@ -34,7 +37,8 @@ from dataclasses import dataclass, field
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-from render.engine import RenderEngine, RenderResult, generate_render_script
+from render.engine import RenderEngine, RenderResult, RenderConfig, generate_render_script
+from render.cache import RenderCache
 from render.batch import BatchRenderer, BatchJob
 from validate.vision import (
     RenderValidator,
@@ -57,6 +61,11 @@ class PipelineConfig:
     max_iterations: int = 3
     style_reference: Optional[str] = None
     verbose: bool = True
+    use_cache: bool = False  # opt-in: see render/cache.py for what it cannot see
+    progressive: bool = False
+    preview_scale: float = 0.5
+    preview_samples: int = 16
+    preview_engine: str = 'CYCLES'
 
     @classmethod
     def from_dict(cls, data: dict) -> 'PipelineConfig':
@@ -70,7 +79,12 @@ class PipelineConfig:
             iterate=data.get('iterate', False),
             max_iterations=data.get('max_iterations', 3),
             style_reference=data.get('style_reference'),
-            verbose=data.get('verbose', True)
+            verbose=data.get('verbose', True),
+            use_cache=data.get('use_cache', False),
+            progressive=data.get('progressive', False),
+            preview_scale=data.get('preview_scale', 0.5),
+            preview_samples=data.get('preview_samples', 16),
+            preview_engine=data.get('preview_engine', 'CYCLES')
         )
 
     @classmethod
@@ -89,6 +103,7 @@ class PipelineResult:
     validation_result: Optional[ValidationResult] = None
     history: List[Dict[str, Any]] = field(default_factory=list)
     error_message: Optional[str] = None
+    time_saved: float = 0.0
 
     def to_dict(self) -> dict:
         return {
@@ -96,6 +111,7 @@ class PipelineResult:
             'output_path': self.output_path,
             'iterations': self.iterations,
             'render_time': self.render_time,
+            'time_saved': self.time_saved,
             'validation': self.validation_result.to_dict() if self.validation_result else None,
             'error_message': self.error_message,
         }
@@ -123,6 +139,12 @@ class Pipeline:
         # Ensure output directory exists
         Path(self.config.output_dir).mkdir(parents=True, exist_ok=True)
 
+        # Unchanged scene + settings = reuse the previous render
+        self.cache = (
+            RenderCache.for_dir(self.config.output_dir)
+            if self.config.use_cache else None
+        )
+
     def log(self, message: str) -> None:
         """Log a message if verbose mode is enabled."""
         if self.config.verbose:
@@ -247,12 +269,23 @@ class Pipeline:
             f"{self.config.output_name}.png"
         )
 
-        result = self.engine.render(
-            script_path,
-            output_path,
-            samples=self.config.samples,
-            resolution=self.config.resolution
-        )
+        def render() -> RenderResult:
+            return self.engine.render(
+                script_path,
+                output_path,
+                samples=self.config.samples,
+                resolution=self.config.resolution
+            )
+
+        if self.cache is not None:
+            config = RenderConfig(
+                output_path=output_path,
+                samples=self.config.samples,
+                resolution=self.config.resolution
+            )
+            result = self.cache.render(script_path, output_path, config, render)
+        else:
+            result = render()
 
         if not result.success:
             return PipelineResult(
@@ -260,8 +293,13 @@ class Pipeline:
                 error_message=result.error_message
             )
 
-        self.log(f"  Render complete: {output_path}")
-        self.log(f"  Render time: {result.render_time:.1f}s")
+        cache_info = result.metadata.get('cache', {})
+        if cache_info.get('status') == 'hit':
+            self.log(f"  Inputs unchanged since {cache_info.get('rendered_at')}; "
+                     f"reusing {output_path}")
+        else:
+            self.log(f"  Render complete: {output_path}")
+            self.log(f"  Render time: {result.render_time:.1f}s")
 
         # Validate if requested
         validation_result = None
@@ -298,30 +336,78 @@ class Pipeline:
             validation_result=validation_result
         )
 
+    def _render_at(self, script_path: str, output_path: str, quality: str) -> RenderResult:
+        """Render the generated scene script at 'preview' or 'production' quality."""
+        if quality == 'preview':
+            w, h = self.config.resolution
+            scale = self.config.preview_scale
+            resolution = (max(1, int(w * scale)), max(1, int(h * scale)))
+            samples = self.config.preview_samples
+            script_args = {'engine': self.config.preview_engine}
+        else:
+            resolution = self.config.resolution
+            samples = self.config.samples
+            script_args = {}
+
+        script_args.update({
+            'quality': quality,
+            'resolution': f"{resolution[0]}x{resolution[1]}",
+        })
+        return self.engine.render(
+            script_path,
+            output_path,
+            samples=samples,
+            resolution=resolution,
+            script_args=script_args
+        )
+
     def _run_iterative(self, script_path: str) -> PipelineResult:
-        """Run iterative render-validate-improve loop."""
+        """Run iterative render-validate-improve loop.
+
+        In progressive mode every iteration renders a low-resolution,
+        low-sample preview, which is enough to judge composition. The
+        production render happens once, of the last previewed script, when
+        the loop ends (whether or not validation passed). A preview is
+        never returned as the output.
+        """
         self.log("\n[3/4] Starting iterative render loop...")
+        progressive = self.config.progressive
+        if progressive:
+            self.log(f"  Progressive: previews at {self.config.preview_scale:.0%} "
+                     f"resolution, {self.config.preview_samples} samples "
+                     f"({self.config.preview_engine})")
 
         total_render_time = 0
         current_script = script_path
         final_output = None
         final_validation = None
+        production_time = None
+        error_message = None
+        previewed = None  # iteration of the last successful preview
+        previewed_time = 0.0
 
         for iteration in range(1, self.config.max_iterations + 1):
             self.log(f"\n--- Iteration {iteration}/{self.config.max_iterations} ---")
 
             # Render
-            output_path = os.path.join(
-                self.config.output_dir,
-                f"{self.config.output_name}_iter{iteration}.png"
-            )
-
-            result = self.engine.render(
-                current_script,
-                output_path,
-                samples=self.config.samples,
-                resolution=self.config.resolution
-            )
+            if progressive:
+                output_path = os.path.join(
+                    self.config.output_dir,
+                    f"{self.config.output_name}_iter{iteration}_preview.png"
+                )
+                result = self._render_at(current_script, output_path, 'preview')
+            else:
+                output_path = os.path.join(
+                    self.config.output_dir,
+                    f"{self.config.output_name}_iter{iteration}.png"
+                )
+
+                result = self.engine.render(
+                    current_script,
+                    output_path,
+                    samples=self.config.samples,
+                    resolution=self.config.resolution
+                )
 
             if not result.success:
                 self.log(f"  Render failed: {result.error_message}")
@@ -329,6 +415,7 @@ class Pipeline:
 
             total_render_time += result.render_time
             final_output = output_path
+            previewed, previewed_time = iteration, result.render_time
             self.log(f"  Rendered: {output_path} ({result.render_time:.1f}s)")
 
             # Validate
@@ -349,6 +436,7 @@ class Pipeline:
             self.history.append({
                 'iteration': iteration,
                 'output': output_path,
+                'quality': 'preview' if progressive else 'production',
                 'render_time': result.render_time,
                 'matches': validation.matches_description,
                 'confidence': validation.confidence,
@@ -370,17 +458,55 @@ class Pipeline:
                 # For now, we just note that improvements are needed
                 self.log("  (Script modification not yet implemented)")
 
+        if progressive and previewed is not None:
+            # A preview is not a deliverable: render the last previewed
+            # script at production quality, or fail.
+            production_output = os.path.join(
+                self.config.output_dir,
+                f"{self.config.output_name}.png"
+            )
+            self.log("\n  Rendering at production quality...")
+            production = self._render_at(current_script, production_output, 'production')
+            if production.success:
+                production_time = production.render_time
+                total_render_time += production_time
+                final_output = production_output
+                self.log(f"  Rendered: {production_output} ({production_time:.1f}s)")
+            else:
+                final_output = None
+                error_message = f"Production render failed: {production.error_message}"
+                self.log(f"  {error_message}")
+
         self.log(f"\n[4/4] Iterative loop complete")
         self.log(f"  Total iterations: {len(self.history)}")
         self.log(f"  Total render time: {total_render_time:.1f}s")
 
+        # A preview that led to another iteration stood in for a production
+        # render. The last preview did not: production was rendered after
+        # it anyway, so its time is pure overhead.
+        time_saved = 0.0
+        if progressive and production_time is not None:
+            for entry in self.history:
+                if entry['iteration'] == previewed:
+                    entry['time_saved'] = -entry['render_time']
+                else:
+                    entry['time_saved'] = production_time - entry['render_time']
+                time_saved += entry['time_saved']
+                self.log(f"  Iteration {entry['iteration']}: preview {entry['render_time']:.1f}s, "
+                         f"saved {entry['time_saved']:.1f}s vs production")
+            if all(entry['iteration'] != previewed for entry in self.history):
+                time_saved -= previewed_time  # its validation errored out
+            self.log(f"  Time saved by previews: {time_saved:.1f}s")
+
         return PipelineResult(
-            success=True,
+            success=error_message is None,
             output_path=final_output,
             iterations=len(self.history),
             render_time=total_render_time,
             validation_result=final_validation,
-            history=self.history
+            history=self.history,
+            error_message=error_message,
+            time_saved=time_saved
         )
 
 
@@ -458,6 +584,30 @@ Examples:
         action='store_true',
         help='Suppress output messages'
     )
+    parser.add_argument(
+        '--progressive',
+        action='store_true',
+        help='Iterate on low-res, low-sample previews; render production once at the end'
+    )
+    parser.add_argument(
+        '--preview-samples',
+        type=int,
+        default=16,
+        help='Samples for progressive previews (default: 16)'
+    )
+    parser.add_argument(
+        '--preview-engine',
+        choices=['CYCLES', 'BLENDER_EEVEE'],
+        default='CYCLES',
+        help='Render engine for progressive previews (default: CYCLES)'
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Skip renders whose scene, assets and settings are unchanged '
+             '(scripts that read files, env vars or randomness at run time '
+             'can be served stale renders)'
+    )
     parser.add_argument(
         '--check',
         action='store_true',
@@ -505,6 +655,13 @@ Examples:
             verbose=not args.quiet
         )
 
+    if args.cache:
+        config.use_cache = True
+    if args.progressive:
+        config.progressive = True
+        config.preview_samples = args.preview_samples
+        config.preview_engine = args.preview_engine
+
     # Run pipeline
     pipeline = Pipeline(config)
     result = pipeline.run()
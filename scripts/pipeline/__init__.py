@@ -6,8 +6,19 @@ and runaway-loop circuit breakers across every paid call in the pipeline.
 The :mod:`scripts.pipeline.orchestrator` module wires that governor up to
 a pluggable Generator + Validator pair to drive the closed
 generate -> validate -> regenerate loop for a whole scene.
+
+The :mod:`scripts.pipeline.asset_cache` module is the shared, revalidating
+cache the orchestrator fetches reference images through.
+
+The :mod:`scripts.pipeline.panel_index` module is a perceptual-hash index
+of graded panels, used to skip validating near-duplicate regenerations.
+
+The :mod:`scripts.pipeline.tracing` module records span timings for a run
+and exports them as a Chrome trace.
 """
 
+from .asset_cache import AssetCache, AssetUnavailable
+
 from .cost_governor import (
     BudgetExceeded,
     CostGovernor,
@@ -17,6 +28,7 @@ from .cost_governor import (
     PipelineHalted,
     RetryCapExceeded,
 )
+from .panel_index import PanelIndex
 from .orchestrator import (
     ExistingClipsGenerator,
     Generator,
@@ -32,8 +44,11 @@ from .orchestrator import (
     Validator,
     ValidationOutcome,
 )
+from .tracing import Tracer
 
 __all__ = [
+    "AssetCache",
+    "AssetUnavailable",
     "BudgetExceeded",
     "CostGovernor",
     "ExistingClipsGenerator",
@@ -44,6 +59,7 @@ __all__ = [
     "MitteSeedanceGenerator",
     "NoProgress",
     "Orchestrator",
+    "PanelIndex",
     "PRICING",
     "PipelineHalted",
     "RealValidator",
@@ -52,6 +68,7 @@ __all__ = [
     "ShotState",
     "StubGenerator",
     "StubValidator",
+    "Tracer",
     "ValidationOutcome",
     "Validator",
 ]
@@ -0,0 +1,336 @@
+"""Shared on-disk cache for reference assets fetched over HTTP(S).
+
+The orchestrator resolves the locked turnarounds, location plates and
+storyboard start frames for every shot. Fetching them one ``urlopen`` at a
+time, per shot, costs a fresh TLS handshake per file, never notices when
+the canonical copy on R2 changes, and retries a missing file on every
+shot. ``AssetCache`` fixes all three:
+
+* Connection pooling: keep-alive ``http.client`` connections are reused
+  per host, so a scene's worth of references share a few connections.
+* Revalidation: each cached file remembers its ``ETag`` /
+  ``Last-Modified``. Once it is older than ``fresh_for_s`` the next use
+  sends a conditional GET; a ``304`` costs one round trip and no body.
+  If revalidation fails, the stale copy is served.
+* Negative caching: a failed fetch is remembered for ``negative_ttl_s``;
+  lookups inside that window fail fast without touching the network.
+* ``prefetch`` fetches a batch of URLs in parallel (the orchestrator does
+  this for the whole manifest at ``run_start``).
+
+Cache metadata lives in ``<cache_dir>/.asset-index.json``. The files
+themselves live wherever the caller points ``dest``, so existing
+``references/`` layouts keep working.
+
+Usage::
+
+    from scripts.pipeline.asset_cache import AssetCache
+
+    cache = AssetCache.for_dir(Path("footage/scene-01/references"))
+    path = cache.fetch(url, dest)               # raises AssetUnavailable
+    failures = cache.prefetch([(url, dest), ...])
+"""
+
+from __future__ import annotations
+
+import email.utils
+import http.client
+import json
+import shutil
+import threading
+import time
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from . import tracing
+
+DEFAULT_FRESH_FOR_S = 300.0
+DEFAULT_NEGATIVE_TTL_S = 300.0
+DEFAULT_TIMEOUT_S = 120.0
+DEFAULT_PREFETCH_WORKERS = 8
+_MAX_REDIRECTS = 5
+_USER_AGENT = "rex-orchestrator/1.0"
+
+
+class AssetUnavailable(RuntimeError):
+    """A fetch failed (or failed recently and is negatively cached)."""
+
+
+@dataclass
+class _Entry:
+    """Index record for one URL."""
+
+    dest: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    checked_at: float = 0.0  # last successful 200/304
+    failed_at: float = 0.0  # last failure; 0 = none outstanding
+    error: Optional[str] = None
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections, per (scheme, host, port)."""
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop()
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(netloc, timeout=self.timeout)
+
+    def release(
+        self, scheme: str, netloc: str, conn: http.client.HTTPConnection
+    ) -> None:
+        with self._lock:
+            self._idle.setdefault((scheme, netloc), []).append(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+class AssetCache:
+    """Revalidating, negatively-caching HTTP fetcher shared by every shot."""
+
+    _shared: dict[Path, "AssetCache"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        *,
+        fresh_for_s: float = DEFAULT_FRESH_FOR_S,
+        negative_ttl_s: float = DEFAULT_NEGATIVE_TTL_S,
+        timeout_s: float = DEFAULT_TIMEOUT_S,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.fresh_for_s = fresh_for_s
+        self.negative_ttl_s = negative_ttl_s
+        self.index_path = self.cache_dir / ".asset-index.json"
+        self._pool = _ConnectionPool(timeout_s)
+        self._lock = threading.Lock()
+        self._url_locks: dict[str, threading.Lock] = {}
+        self._entries: dict[str, _Entry] = self._load_index()
+
+    @classmethod
+    def for_dir(cls, cache_dir: Path) -> "AssetCache":
+        """The process-wide cache for ``cache_dir`` (created on first use)."""
+        key = Path(cache_dir).resolve()
+        with cls._shared_lock:
+            cache = cls._shared.get(key)
+            if cache is None:
+                cache = cls._shared[key] = cls(key)
+            return cache
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def fetch(self, url: str, dest: Path) -> Path:
+        """Return ``dest`` holding a current copy of ``url``.
+
+        Downloads on a miss, revalidates a copy older than ``fresh_for_s``,
+        and raises ``AssetUnavailable`` on failure (immediately, without a
+        request, while an earlier failure is inside ``negative_ttl_s``).
+        A stale copy is returned if revalidation fails.
+        """
+        dest = Path(dest)
+        with self._url_lock(url):
+            now = time.time()
+            entry = self._entries.get(url)
+            if entry is not None and entry.failed_at:
+                if now - entry.failed_at < self.negative_ttl_s:
+                    if dest.exists():
+                        return dest
+                    raise AssetUnavailable(
+                        f"{url} failed {now - entry.failed_at:.0f}s ago: {entry.error}"
+                    )
+            if (
+                entry is not None
+                and dest.exists()
+                and entry.dest == str(dest)
+                and now - entry.checked_at < self.fresh_for_s
+            ):
+                return dest
+            try:
+                with tracing.span("download", url=url):
+                    entry = self._get(url, dest, entry)
+            except Exception as exc:
+                failed = entry or _Entry(dest=str(dest))
+                failed.failed_at = time.time()
+                failed.error = str(exc)
+                self._store(url, failed)
+                if dest.exists():
+                    return dest  # serve stale rather than nothing
+                if isinstance(exc, AssetUnavailable):
+                    raise
+                raise AssetUnavailable(f"download failed for {url}: {exc}") from exc
+            self._store(url, entry)
+            return dest
+
+    def prefetch(
+        self,
+        items: list[tuple[str, Path]],
+        *,
+        max_workers: int = DEFAULT_PREFETCH_WORKERS,
+    ) -> dict[str, Optional[str]]:
+        """Fetch every ``(url, dest)`` in parallel.
+
+        Returns ``url -> error message`` (None on success). Never raises for
+        an individual asset; failures are also negatively cached.
+        """
+        unique = list(dict.fromkeys((url, Path(dest)) for url, dest in items))
+        results: dict[str, Optional[str]] = {}
+
+        def _one(item: tuple[str, Path]) -> None:
+            url, dest = item
+            try:
+                self.fetch(url, dest)
+                results[url] = None
+            except AssetUnavailable as exc:
+                results[url] = str(exc)
+
+        if unique:
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(unique))),
+                thread_name_prefix="asset-prefetch",
+            ) as pool:
+                list(pool.map(_one, unique))
+        return results
+
+    def close(self) -> None:
+        self._pool.close()
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def _get(self, url: str, dest: Path, entry: Optional[_Entry]) -> _Entry:
+        """(Conditional) GET ``url`` into ``dest``; returns the updated entry."""
+        headers = {"User-Agent": _USER_AGENT}
+        if dest.exists():
+            known = entry is not None and entry.dest == str(dest)
+            if known and entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if known and entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+            elif not (known and entry.etag):
+                # Downloaded before the index existed: the file's mtime is
+                # the best validator we have.
+                headers["If-Modified-Since"] = email.utils.formatdate(
+                    dest.stat().st_mtime, usegmt=True
+                )
+
+        target = url
+        for _ in range(_MAX_REDIRECTS + 1):
+            status, resp_headers, location = self._request(target, headers, dest)
+            if status in (301, 302, 303, 307, 308) and location:
+                target = urllib.parse.urljoin(target, location)
+                continue
+            break
+        else:
+            raise AssetUnavailable(f"too many redirects for {url}")
+
+        if status not in (200, 304):
+            raise AssetUnavailable(f"HTTP {status} for {url}")
+        fresh = entry if status == 304 and entry is not None else _Entry(dest=str(dest))
+        fresh.dest = str(dest)
+        if status == 200 or resp_headers.get("etag"):
+            fresh.etag = resp_headers.get("etag") or None
+        if status == 200 or resp_headers.get("last-modified"):
+            fresh.last_modified = resp_headers.get("last-modified") or None
+        fresh.checked_at = time.time()
+        fresh.failed_at = 0.0
+        fresh.error = None
+        return fresh
+
+    def _request(
+        self, url: str, headers: dict[str, str], dest: Path
+    ) -> tuple[int, dict[str, str], Optional[str]]:
+        """One request on a pooled connection. A 200 body is written to
+        ``dest`` via a temp file + rename, so readers never see a partial
+        file. Retries once if a pooled connection went stale."""
+        parts = urllib.parse.urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        for attempt in range(2):
+            conn = self._pool.acquire(parts.scheme, parts.netloc)
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionError, BrokenPipeError):
+                conn.close()
+                if attempt == 0:
+                    continue
+                raise
+            except Exception:
+                conn.close()
+                raise
+            try:
+                resp_headers = {k.lower(): v for k, v in resp.getheaders()}
+                if resp.status == 200:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = dest.with_name(f".{dest.name}.{threading.get_ident()}.part")
+                    try:
+                        with open(tmp, "wb") as f:
+                            shutil.copyfileobj(resp, f)
+                        tmp.replace(dest)
+                    finally:
+                        tmp.unlink(missing_ok=True)
+                else:
+                    resp.read()
+            except Exception:
+                conn.close()
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._pool.release(parts.scheme, parts.netloc, conn)
+            return resp.status, resp_headers, resp_headers.get("location")
+        raise AssetUnavailable(f"connection failed for {url}")  # pragma: no cover
+
+    # ------------------------------------------------------------------
+    # Index persistence
+    # ------------------------------------------------------------------
+
+    def _url_lock(self, url: str) -> threading.Lock:
+        # One in-flight fetch per URL: concurrent shots sharing a reference
+        # wait for the first download instead of duplicating it.
+        with self._lock:
+            return self._url_locks.setdefault(url, threading.Lock())
+
+    def _load_index(self) -> dict[str, _Entry]:
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        entries = {}
+        for url, fields in (raw.get("entries") or {}).items():
+            try:
+                entries[url] = _Entry(**fields)
+            except TypeError:
+                continue
+        return entries
+
+    def _store(self, url: str, entry: _Entry) -> None:
+        with self._lock:
+            self._entries[url] = entry
+            payload = {"entries": {u: asdict(e) for u, e in self._entries.items()}}
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_name(
+                f"{self.index_path.name}.{threading.get_ident()}.tmp"
+            )
+            tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            tmp.replace(self.index_path)
@@ -14,8 +14,17 @@ Hard guarantees:
   retries, the shot is escalated instead of looped.
 * Kill switch: dropping a ``STOP`` file beside this module halts the
   pipeline on the next check.
-* Crash-safe ledger: state is flushed to JSON after every record so a
-  killed process never loses accounting.
+* Crash-safe ledger: every record is appended to a JSONL journal the
+  moment it happens, so a killed process never loses accounting. The
+  journal is periodically compacted into a JSON snapshot; reloading
+  replays the snapshot plus whatever the journal holds past it.
+* Thread-safe: every check/record is serialized on an internal lock, and
+  ``reserve`` holds an estimate against the caps while a paid call is in
+  flight, so concurrent shots can never jointly overshoot a cap.
+* Process-safe daily cap: reservations are also written to the shared
+  daily-spend file under an exclusive ``flock``, so concurrent runs on one
+  host share the daily budget exactly. The lock is held only for the
+  read-check-write, never across the paid call itself.
 
 Usage::
 
@@ -25,17 +34,30 @@ Usage::
     gov.check_can_spend_strict("veo3_fast_seconds", 8)   # raises if blocked
     # ... call paid API ...
     gov.record_spend("veo3_fast_seconds", 8, metadata={"shot": "01a"})
+
+    # Concurrent callers hold the estimate while the call is in flight:
+    held = gov.reserve("veo3_fast_seconds", 8, shot_id="01a")
+    # ... call paid API ...
+    gov.record_spend("veo3_fast_seconds", 8, reservation=held)
 """
 
 from __future__ import annotations
 
 import json
 import os
+import threading
 import time
+import uuid
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:  # POSIX only; without it the daily cap is exact per process only.
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
 
 
 # ---------------------------------------------------------------------------
@@ -112,6 +134,17 @@ class LedgerEntry:
         return asdict(self)
 
 
+@dataclass
+class Reservation:
+    """Budget held against the caps for one in-flight paid call."""
+
+    token: str
+    action: str
+    units: float
+    cost_usd: float
+    shot_id: str | None = None
+
+
 @dataclass
 class ShotAttempts:
     """Tracks regeneration attempts and validation scores for one shot."""
@@ -146,6 +179,11 @@ DEFAULT_PER_SHOT_ATTEMPTS = 3
 DEFAULT_PER_RUN_ATTEMPTS = 30
 DEFAULT_PROGRESS_DELTA = 0.05
 DEFAULT_PROGRESS_WINDOW = 2  # consecutive non-improving attempts -> escalate
+DEFAULT_COMPACT_EVERY = 500  # journal events between snapshot rewrites
+# A hold older than this is treated as abandoned even if its pid is alive
+# (pid reuse); no single paid call runs anywhere near this long.
+DEFAULT_HOLD_TTL_S = 6 * 3600
+_HOLDS_KEY = "_holds"
 
 # Repo-relative defaults. Tests pass explicit paths to avoid touching these.
 _PIPELINE_DIR = Path(__file__).resolve().parent
@@ -181,10 +219,12 @@ class CostGovernor:
     pricing:
         Override pricing table (defaults to module-level ``PRICING``).
     state_dir:
-        Where per-run ledger JSON files live. Defaults to
-        ``scripts/pipeline/state/``.
+        Where per-run ledger files live (``run_<id>.json`` snapshot plus
+        ``run_<id>.jsonl`` journal). Defaults to ``scripts/pipeline/state/``.
     daily_state_path:
-        Shared file tracking spend per UTC day across runs.
+        Shared file tracking spend per UTC day across runs, plus the
+        in-flight reservations of every run on this host. A sibling
+        ``.lock`` file serializes updates across processes.
     kill_switch_path:
         File path whose existence halts the governor.
     report_dir:
@@ -193,6 +233,9 @@ class CostGovernor:
         If True, all spend is recorded with ``dry_run=True`` and still
         consumes the budget, but pipeline code is expected to skip the
         actual paid call.
+    compact_every:
+        Journal events appended before the snapshot is rewritten and the
+        journal truncated. Default 500.
     """
 
     def __init__(
@@ -211,6 +254,7 @@ class CostGovernor:
         kill_switch_path: Path | str | None = None,
         report_dir: Path | str | None = None,
         dry_run: bool | None = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
     ) -> None:
         self.run_id = run_id
         self.per_run_usd = float(per_run_usd)
@@ -220,6 +264,7 @@ class CostGovernor:
         self.progress_min_delta = float(progress_min_delta)
         self.progress_window = int(progress_window)
         self.pricing = pricing or PRICING
+        self.compact_every = max(1, int(compact_every))
 
         self.state_dir = Path(state_dir) if state_dir else _DEFAULT_STATE_DIR
         self.daily_state_path = (
@@ -237,18 +282,33 @@ class CostGovernor:
 
         self.ledger: list[LedgerEntry] = []
         self.shots: dict[str, ShotAttempts] = {}
+        self._spent_usd = 0.0
+        # In-flight reservations (never persisted: a crash means the call
+        # was never committed). The RLock serializes every check + record
+        # so concurrent shots see one consistent view of the caps.
+        self._reservations: dict[str, Reservation] = {}
+        self._lock = threading.RLock()
         self.halted: bool = False
         self.halted_reason: str | None = None
         self.created_at = _utcnow_iso()
+        # Journal bookkeeping: ``_journal_seq`` numbers every appended event
+        # so replay can skip what a snapshot already covers.
+        self._journal_seq = 0
+        self._journal_events = 0
+        # Cached daily-spend file contents, keyed on its stat signature.
+        self._daily_sig: tuple[int, int, int] | None = None
+        self._daily_data: dict[str, float] = {}
+        self._daily_holds: dict[str, dict[str, Any]] = {}
 
         self.state_dir.mkdir(parents=True, exist_ok=True)
         self.state_path = self.state_dir / f"run_{_safe_filename(run_id)}.json"
+        self.journal_path = self.state_path.with_suffix(".jsonl")
 
         # Load prior ledger for this run, if present, so a re-invocation
         # after a crash continues exactly where it left off.
         self._load_state()
-        # Flush at least once so the file always exists after init.
-        self._flush_state()
+        # Compact once so the snapshot always exists after init.
+        self._compact()
 
     # ------------------------------------------------------------------
     # Pricing helpers
@@ -294,34 +354,98 @@ class CostGovernor:
     ) -> float:
         """Raise if a spend of ``units`` of ``action`` would be refused.
 
-        Returns the estimated cost in dollars on success.
+        Returns the estimated cost in dollars on success. Budget held by
+        outstanding reservations counts as already spent.
         """
-        if self.halted:
-            raise PipelineHalted(
-                f"governor halted: {self.halted_reason}. Call reset_halt() to clear."
-            )
-        self.check_kill_switch()
-
-        cost = self.estimate(action, units)
-
-        # Per-run cap
-        if self.total_spent_usd + cost > self.per_run_usd + 1e-9:
-            self._halt(
-                f"per-run cap ${self.per_run_usd:.2f} would be exceeded "
-                f"(spent ${self.total_spent_usd:.4f}, +${cost:.4f})"
-            )
-            raise BudgetExceeded(self.halted_reason or "per-run cap exceeded")
+        with self._lock, self._daily_lock():
+            self._check_live()
+            cost = self.estimate(action, units)
+            self._enforce_caps(cost, phase="would be exceeded")
+            return cost
 
-        # Daily cap
-        daily_spent = self._read_daily_spend(_utc_today())
-        if daily_spent + cost > self.daily_usd + 1e-9:
-            self._halt(
-                f"daily cap ${self.daily_usd:.2f} would be exceeded "
-                f"(today ${daily_spent:.4f}, +${cost:.4f})"
-            )
-            raise BudgetExceeded(self.halted_reason or "daily cap exceeded")
+    def reserve(
+        self, action: str, units: float, *, shot_id: str | None = None
+    ) -> Reservation:
+        """Authorize a paid call and hold its estimated cost until it settles.
+
+        Same checks as ``check_can_spend_strict``, but the estimate stays
+        counted against the per-run and daily caps until it is committed
+        with ``record_spend(..., reservation=...)`` or returned with
+        ``release``. Concurrent callers therefore cannot both pass a check
+        for the last dollar of budget. The hold is written to the shared
+        daily-spend file, so this also holds across processes.
+        """
+        with self._lock, self._daily_lock():
+            self._check_live()
+            cost = self.estimate(action, units)
+            self._enforce_caps(cost, phase="would be exceeded")
+            totals, holds = self._daily_state()
+            holds = dict(holds)
+            reservation = self._hold(holds, action, units, cost, shot_id)
+            self._write_daily_state(totals, holds)
+            return reservation
+
+    def reserve_up_to(
+        self, action: str, units: float, count: int, *, shot_id: str | None = None
+    ) -> list[Reservation]:
+        """Reserve budget for up to ``count`` identical calls in one step.
+
+        The first hold behaves exactly like ``reserve`` (it raises and halts
+        if it does not fit). Further holds are only taken while they fit
+        under every cap; running out of headroom for them is not an error
+        and does not halt. All holds are written under one daily lock, so
+        a concurrent run never sees half of the batch.
+        """
+        with self._lock, self._daily_lock():
+            self._check_live()
+            cost = self.estimate(action, units)
+            self._enforce_caps(cost, phase="would be exceeded")
+            totals, holds = self._daily_state()
+            holds = dict(holds)
+            taken = [self._hold(holds, action, units, cost, shot_id)]
+            while (
+                len(taken) < count
+                and self._cap_breach(cost, phase="", daily_state=(totals, holds)) is None
+            ):
+                taken.append(self._hold(holds, action, units, cost, shot_id))
+            self._write_daily_state(totals, holds)
+            return taken
+
+    def _hold(
+        self,
+        holds: dict,
+        action: str,
+        units: float,
+        cost: float,
+        shot_id: str | None,
+    ) -> Reservation:
+        """Register one reservation locally and in ``holds`` (not yet written)."""
+        reservation = Reservation(
+            token=uuid.uuid4().hex,
+            action=action,
+            units=float(units),
+            cost_usd=cost,
+            shot_id=shot_id,
+        )
+        self._reservations[reservation.token] = reservation
+        holds[reservation.token] = {
+            "run_id": self.run_id,
+            "pid": os.getpid(),
+            "cost_usd": cost,
+            "created": time.time(),
+        }
+        return reservation
 
-        return cost
+    def release(self, reservation: Reservation | None) -> None:
+        """Return a reservation's budget without spending it (call failed)."""
+        if reservation is None:
+            return
+        with self._lock, self._daily_lock():
+            self._reservations.pop(reservation.token, None)
+            totals, holds = self._daily_state()
+            if reservation.token in holds:
+                holds = {k: v for k, v in holds.items() if k != reservation.token}
+                self._write_daily_state(totals, holds)
 
     # ------------------------------------------------------------------
     # Spend recording
@@ -334,55 +458,62 @@ class CostGovernor:
         *,
         metadata: dict[str, Any] | None = None,
         shot_id: str | None = None,
+        reservation: Reservation | None = None,
     ) -> LedgerEntry:
         """Record a paid (or dry-run) action against the ledger.
 
         Pipeline contract: callers should call ``check_can_spend_strict``
-        BEFORE invoking the paid API, and ``record_spend`` AFTER it
-        returns. ``record_spend`` itself also enforces caps, so a caller
-        that forgets the pre-check still cannot blow the budget.
+        (or ``reserve``) BEFORE invoking the paid API, and ``record_spend``
+        AFTER it returns. ``record_spend`` itself also enforces caps, so a
+        caller that forgets the pre-check still cannot blow the budget.
+
+        When ``reservation`` is given, the held estimate is committed: the
+        money was already authorized, so the entry is recorded even if
+        another caller halted the governor meanwhile, and only an overshoot
+        beyond the held estimate is re-checked against the caps.
         """
-        if self.halted:
-            raise PipelineHalted(
-                f"governor halted: {self.halted_reason}. Call reset_halt() to clear."
+        with self._lock, self._daily_lock():
+            held = (
+                self._reservations.pop(reservation.token, None)
+                if reservation is not None
+                else None
             )
-        self.check_kill_switch()
-
-        cost = self.estimate(action, units)
-        rate = float(self.pricing[action]["usd_per_unit"])
+            if held is None:
+                self._check_live()
+
+            cost = self.estimate(action, units)
+            rate = float(self.pricing[action]["usd_per_unit"])
+
+            # Re-check caps at record time too — defense in depth.
+            if held is None or cost > held.cost_usd + 1e-9:
+                self._enforce_caps(
+                    cost,
+                    phase="exceeded at record_spend",
+                    exclude_hold=held.token if held is not None else None,
+                )
 
-        # Re-check caps at record time too — defense in depth.
-        if self.total_spent_usd + cost > self.per_run_usd + 1e-9:
-            self._halt(
-                f"per-run cap ${self.per_run_usd:.2f} exceeded at record_spend "
-                f"(spent ${self.total_spent_usd:.4f}, +${cost:.4f})"
-            )
-            raise BudgetExceeded(self.halted_reason or "per-run cap exceeded")
-        today = _utc_today()
-        daily_spent = self._read_daily_spend(today)
-        if daily_spent + cost > self.daily_usd + 1e-9:
-            self._halt(
-                f"daily cap ${self.daily_usd:.2f} exceeded at record_spend "
-                f"(today ${daily_spent:.4f}, +${cost:.4f})"
+            today = _utc_today()
+            totals, holds = self._daily_state()
+            meta = dict(metadata or {})
+            if shot_id is not None:
+                meta.setdefault("shot_id", shot_id)
+            entry = LedgerEntry(
+                timestamp=_utcnow_iso(),
+                action=action,
+                units=float(units),
+                usd_per_unit=rate,
+                cost_usd=cost,
+                metadata=meta,
+                dry_run=self.dry_run,
             )
-            raise BudgetExceeded(self.halted_reason or "daily cap exceeded")
-
-        meta = dict(metadata or {})
-        if shot_id is not None:
-            meta.setdefault("shot_id", shot_id)
-        entry = LedgerEntry(
-            timestamp=_utcnow_iso(),
-            action=action,
-            units=float(units),
-            usd_per_unit=rate,
-            cost_usd=cost,
-            metadata=meta,
-            dry_run=self.dry_run,
-        )
-        self.ledger.append(entry)
-        self._write_daily_spend(today, daily_spent + cost)
-        self._flush_state()
-        return entry
+            self._append_entry(entry)
+            totals = dict(totals)
+            totals[today] = totals.get(today, 0.0) + cost
+            if held is not None:
+                holds = {k: v for k, v in holds.items() if k != held.token}
+            self._write_daily_state(totals, holds)
+            self._journal({"type": "spend", "entry": entry.as_dict()})
+            return entry
 
     # ------------------------------------------------------------------
     # Retry / no-progress tracking
@@ -397,66 +528,95 @@ class CostGovernor:
         Raises ``RetryCapExceeded`` or ``NoProgress`` if any trigger,
         and marks the shot escalated so future attempts also raise.
         """
-        if self.halted:
-            raise PipelineHalted(
-                f"governor halted: {self.halted_reason}. Call reset_halt() to clear."
-            )
-        self.check_kill_switch()
+        with self._lock:
+            self._check_live()
 
-        shot = self.shots.get(shot_id)
-        if shot is None:
-            shot = ShotAttempts(shot_id=shot_id)
-            self.shots[shot_id] = shot
+            shot = self.shots.get(shot_id)
+            if shot is None:
+                shot = ShotAttempts(shot_id=shot_id)
+                self.shots[shot_id] = shot
 
-        if shot.escalated:
-            raise RetryCapExceeded(
-                f"shot {shot_id!r} already escalated: {shot.escalation_reason}"
-            )
+            if shot.escalated:
+                raise RetryCapExceeded(
+                    f"shot {shot_id!r} already escalated: {shot.escalation_reason}"
+                )
 
-        # Per-shot cap.
-        if shot.attempts + 1 > self.per_shot_attempts:
-            reason = (
-                f"per-shot cap {self.per_shot_attempts} reached for shot {shot_id!r}"
-            )
-            shot.escalate(reason)
-            self._flush_state()
-            raise RetryCapExceeded(reason)
-
-        # Per-run cap.
-        total_attempts = self.total_attempts + 1
-        if total_attempts > self.per_run_attempts:
-            reason = (
-                f"per-run attempts cap {self.per_run_attempts} reached "
-                f"(would be {total_attempts})"
-            )
-            shot.escalate(reason)
-            self._halt(reason)
-            self._flush_state()
-            raise RetryCapExceeded(reason)
-
-        shot.record_attempt(score)
-
-        # No-progress detection: only meaningful once we have at least
-        # ``progress_window + 1`` scores, so we can compare an attempt to
-        # the one ``progress_window`` steps before it.
-        if score is not None and len(shot.scores) >= self.progress_window + 1:
-            recent = shot.scores[-(self.progress_window + 1) :]
-            baseline = recent[0]
-            no_improvement = all(
-                (s - baseline) < self.progress_min_delta for s in recent[1:]
-            )
-            if no_improvement:
+            # Per-shot cap.
+            if shot.attempts + 1 > self.per_shot_attempts:
                 reason = (
-                    f"no-progress: shot {shot_id!r} score did not improve by "
-                    f"{self.progress_min_delta} over {self.progress_window} "
-                    f"attempts (scores={recent})"
+                    f"per-shot cap {self.per_shot_attempts} reached for shot {shot_id!r}"
                 )
                 shot.escalate(reason)
-                self._flush_state()
-                raise NoProgress(reason)
+                self._journal_shot(shot)
+                raise RetryCapExceeded(reason)
 
-        self._flush_state()
-        return shot
+            # Per-run cap.
+            total_attempts = self.total_attempts + 1
+            if total_attempts > self.per_run_attempts:
+                reason = (
+                    f"per-run attempts cap {self.per_run_attempts} reached "
+                    f"(would be {total_attempts})"
+                )
+                shot.escalate(reason)
+                self._halt(reason)
+                self._journal_shot(shot)
+                raise RetryCapExceeded(reason)
+
+            shot.record_attempt(score)
+
+            # No-progress detection: only meaningful once we have at least
+            # ``progress_window + 1`` scores, so we can compare an attempt to
+            # the one ``progress_window`` steps before it.
+            if score is not None and len(shot.scores) >= self.progress_window + 1:
+                recent = shot.scores[-(self.progress_window + 1) :]
+                baseline = recent[0]
+                no_improvement = all(
+                    (s - baseline) < self.progress_min_delta for s in recent[1:]
+                )
+                if no_improvement:
+                    reason = (
+                        f"no-progress: shot {shot_id!r} score did not improve by "
+                        f"{self.progress_min_delta} over {self.progress_window} "
+                        f"attempts (scores={recent})"
+                    )
+                    shot.escalate(reason)
+                    self._journal_shot(shot)
+                    raise NoProgress(reason)
+
+            self._journal_shot(shot)
+            return shot
+
+    def attempts_remaining(self, shot_id: str) -> int:
+        """Attempts ``shot_id`` may still register under the retry caps."""
+        with self._lock:
+            shot = self.shots.get(shot_id)
+            used = shot.attempts if shot else 0
+            if shot is not None and shot.escalated:
+                return 0
+            return max(
+                0,
+                min(
+                    self.per_shot_attempts - used,
+                    self.per_run_attempts - self.total_attempts,
+                ),
+            )
+
+    def register_extra_attempts(self, shot_id: str, count: int) -> int:
+        """Count up to ``count`` more attempts for ``shot_id`` without scores.
+
+        Used for speculative candidates launched alongside an attempt that
+        already went through ``register_attempt``. Never escalates or
+        halts: returns how many attempts the caps actually granted (0 when
+        the shot is out of retries).
+        """
+        with self._lock:
+            self._check_live()
+            granted = min(max(0, count), self.attempts_remaining(shot_id))
+            if granted:
+                shot = self.shots.setdefault(shot_id, ShotAttempts(shot_id=shot_id))
+                shot.attempts += granted
+                self._journal_shot(shot)
+            return granted
 
     # ------------------------------------------------------------------
     # State / halt management
@@ -464,13 +624,24 @@ class CostGovernor:
 
     def reset_halt(self) -> None:
         """Clear the halted flag. Caller is responsible for the reason."""
-        self.halted = False
-        self.halted_reason = None
-        self._flush_state()
+        with self._lock:
+            self.halted = False
+            self.halted_reason = None
+            self._journal_halt()
 
     @property
     def total_spent_usd(self) -> float:
-        return sum(e.cost_usd for e in self.ledger)
+        return self._spent_usd
+
+    @property
+    def reserved_usd(self) -> float:
+        """Budget currently held by this run's in-flight reservations."""
+        return sum(r.cost_usd for r in self._reservations.values())
+
+    def daily_reserved_usd(self) -> float:
+        """Budget held by in-flight reservations of every run on this host."""
+        _totals, holds = self._daily_state()
+        return sum(float(h.get("cost_usd", 0.0)) for h in holds.values())
 
     @property
     def total_attempts(self) -> int:
@@ -494,8 +665,10 @@ class CostGovernor:
             "total_spent_usd": round(self.total_spent_usd, 6),
             "per_run_usd": self.per_run_usd,
             "remaining_run_usd": round(self.remaining_run_usd, 6),
+            "reserved_usd": round(self.reserved_usd, 6),
             "daily_usd": self.daily_usd,
             "daily_spent_usd": round(self._read_daily_spend(_utc_today()), 6),
+            "daily_reserved_usd": round(self.daily_reserved_usd(), 6),
             "remaining_daily_usd": round(self.remaining_daily_usd(), 6),
             "total_attempts": self.total_attempts,
             "per_run_attempts": self.per_run_attempts,
@@ -567,90 +740,244 @@ class CostGovernor:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _check_live(self) -> None:
+        """Raise if the governor is halted or the kill switch is present."""
+        if self.halted:
+            raise PipelineHalted(
+                f"governor halted: {self.halted_reason}. Call reset_halt() to clear."
+            )
+        self.check_kill_switch()
+
+    def _enforce_caps(
+        self, cost: float, *, phase: str, exclude_hold: str | None = None
+    ) -> None:
+        """Halt + raise ``BudgetExceeded`` if ``cost`` would breach a cap.
+
+        Committed spend and in-flight reservations both count, so the check
+        stays exact when several shots are authorized concurrently. The
+        daily cap counts every run's holds from the shared file; callers
+        must hold ``_daily_lock``. ``exclude_hold`` skips a hold that is
+        being committed right now.
+        """
+        reason = self._cap_breach(cost, phase=phase, exclude_hold=exclude_hold)
+        if reason is not None:
+            self._halt(reason)
+            raise BudgetExceeded(reason)
+
+    def _cap_breach(
+        self,
+        cost: float,
+        *,
+        phase: str,
+        exclude_hold: str | None = None,
+        daily_state: tuple[dict, dict] | None = None,
+    ) -> str | None:
+        """Why ``cost`` would breach a cap, or None if it fits. No side effects.
+
+        ``daily_state`` is a ``(totals, holds)`` pair not yet written to
+        disk (e.g. holds being added in one step); defaults to the file.
+        """
+        spent = self.total_spent_usd + self.reserved_usd
+        if spent + cost > self.per_run_usd + 1e-9:
+            return (
+                f"per-run cap ${self.per_run_usd:.2f} {phase} "
+                f"(spent ${spent:.4f}, +${cost:.4f})"
+            )
+        totals, holds = daily_state if daily_state is not None else self._daily_state()
+        daily_spent = totals.get(_utc_today(), 0.0) + sum(
+            float(h.get("cost_usd", 0.0))
+            for token, h in holds.items()
+            if token != exclude_hold
+        )
+        if daily_spent + cost > self.daily_usd + 1e-9:
+            return (
+                f"daily cap ${self.daily_usd:.2f} {phase} "
+                f"(today ${daily_spent:.4f}, +${cost:.4f})"
+            )
+        return None
+
     def _halt(self, reason: str) -> None:
-        self.halted = True
-        self.halted_reason = reason
-        self._flush_state()
+        with self._lock:
+            self.halted = True
+            self.halted_reason = reason
+            self._journal_halt()
 
-    def _flush_state(self) -> None:
-        """Persist the ledger + retry state atomically to disk."""
-        payload = {
-            "run_id": self.run_id,
-            "created_at": self.created_at,
-            "dry_run": self.dry_run,
-            "halted": self.halted,
-            "halted_reason": self.halted_reason,
-            "per_run_usd": self.per_run_usd,
-            "daily_usd": self.daily_usd,
-            "per_shot_attempts": self.per_shot_attempts,
-            "per_run_attempts": self.per_run_attempts,
-            "progress_min_delta": self.progress_min_delta,
-            "progress_window": self.progress_window,
-            "ledger": [e.as_dict() for e in self.ledger],
-            "shots": {sid: s.as_dict() for sid, s in self.shots.items()},
-        }
-        tmp = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
-        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        os.replace(tmp, self.state_path)
+    def _append_entry(self, entry: LedgerEntry) -> None:
+        self.ledger.append(entry)
+        self._spent_usd += entry.cost_usd
+
+    def _journal_shot(self, shot: ShotAttempts) -> None:
+        self._journal({"type": "shot", "shot": shot.as_dict()})
+
+    def _journal_halt(self) -> None:
+        self._journal(
+            {"type": "halt", "halted": self.halted, "halted_reason": self.halted_reason}
+        )
+
+    def _journal(self, event: dict[str, Any]) -> None:
+        """Append one event to the JSONL journal; compact when it grows.
+
+        A single ``write`` of one line per event keeps every record durable
+        the moment it returns, at O(1) cost instead of rewriting the ledger.
+        """
+        with self._lock:
+            self._journal_seq += 1
+            line = json.dumps({"seq": self._journal_seq, **event})
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            self._journal_events += 1
+            if self._journal_events >= self.compact_every:
+                self._compact()
+
+    def _compact(self) -> None:
+        """Fold the journal into the JSON snapshot atomically, then truncate it.
+
+        The snapshot records the last journal ``seq`` it covers, so a crash
+        between the snapshot rename and the truncate replays nothing twice.
+        """
+        with self._lock:
+            payload = {
+                "run_id": self.run_id,
+                "created_at": self.created_at,
+                "dry_run": self.dry_run,
+                "halted": self.halted,
+                "halted_reason": self.halted_reason,
+                "per_run_usd": self.per_run_usd,
+                "daily_usd": self.daily_usd,
+                "per_shot_attempts": self.per_shot_attempts,
+                "per_run_attempts": self.per_run_attempts,
+                "progress_min_delta": self.progress_min_delta,
+                "progress_window": self.progress_window,
+                "journal_seq": self._journal_seq,
+                "ledger": [e.as_dict() for e in self.ledger],
+                "shots": {sid: s.as_dict() for sid, s in self.shots.items()},
+            }
+            tmp = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+            tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            os.replace(tmp, self.state_path)
+            with open(self.journal_path, "w", encoding="utf-8"):
+                pass
+            self._journal_events = 0
 
     def _load_state(self) -> None:
-        """Reload ledger + retry state if a prior state file exists."""
-        if not self.state_path.exists():
+        """Reload the snapshot, then replay journal events written after it."""
+        if self.state_path.exists():
+            try:
+                payload = json.loads(self.state_path.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, OSError):
+                # Corrupt snapshot — start fresh rather than blow up.
+                payload = {}
+            self.created_at = payload.get("created_at", self.created_at)
+            self.halted = bool(payload.get("halted", False))
+            self.halted_reason = payload.get("halted_reason")
+            self._journal_seq = int(payload.get("journal_seq", 0))
+            for raw in payload.get("ledger", []):
+                self._append_entry(_entry_from_dict(raw))
+            for sid, raw in (payload.get("shots") or {}).items():
+                self.shots[sid] = _shot_from_dict(sid, raw)
+
+        if not self.journal_path.exists():
             return
         try:
-            payload = json.loads(self.state_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            # Corrupt state file — start fresh rather than blow up.
+            lines = self.journal_path.read_text(encoding="utf-8").splitlines()
+        except OSError:
             return
-        self.created_at = payload.get("created_at", self.created_at)
-        self.halted = bool(payload.get("halted", False))
-        self.halted_reason = payload.get("halted_reason")
-        for raw in payload.get("ledger", []):
-            self.ledger.append(
-                LedgerEntry(
-                    timestamp=raw.get("timestamp", _utcnow_iso()),
-                    action=raw["action"],
-                    units=float(raw.get("units", 0)),
-                    usd_per_unit=float(raw.get("usd_per_unit", 0)),
-                    cost_usd=float(raw.get("cost_usd", 0)),
-                    metadata=raw.get("metadata", {}) or {},
-                    dry_run=bool(raw.get("dry_run", False)),
-                )
-            )
-        for sid, raw in (payload.get("shots") or {}).items():
-            self.shots[sid] = ShotAttempts(
-                shot_id=raw.get("shot_id", sid),
-                attempts=int(raw.get("attempts", 0)),
-                scores=[float(x) for x in raw.get("scores", [])],
-                escalated=bool(raw.get("escalated", False)),
-                escalation_reason=raw.get("escalation_reason"),
-            )
+        for line in lines:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from a crash mid-write; nothing follows it.
+                continue
+            seq = int(event.get("seq", 0))
+            if seq <= self._journal_seq:
+                continue
+            self._journal_seq = seq
+            kind = event.get("type")
+            if kind == "spend":
+                self._append_entry(_entry_from_dict(event["entry"]))
+            elif kind == "shot":
+                sid = event["shot"].get("shot_id")
+                self.shots[sid] = _shot_from_dict(sid, event["shot"])
+            elif kind == "halt":
+                self.halted = bool(event.get("halted", False))
+                self.halted_reason = event.get("halted_reason")
+
+    @contextmanager
+    def _daily_lock(self) -> Iterator[None]:
+        """Exclusive cross-process lock on the shared daily-spend file.
+
+        Only ever taken inside ``self._lock`` and never nested, so it is held
+        for one read-check-write and cannot deadlock.
+        """
+        if fcntl is None:
+            yield
+            return
+        self.daily_state_path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.daily_state_path.with_suffix(
+            self.daily_state_path.suffix + ".lock"
+        )
+        with open(lock_path, "a+") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
-    def _read_daily_spend(self, day: str) -> float:
-        if not self.daily_state_path.exists():
-            return 0.0
-        try:
-            data = json.loads(self.daily_state_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            return 0.0
-        return float(data.get(day, 0.0))
+    def _daily_state(self) -> tuple[dict[str, float], dict[str, dict[str, Any]]]:
+        """(per-day totals, live holds), re-parsed only when the file changed.
 
-    def _write_daily_spend(self, day: str, value: float) -> None:
-        self.daily_state_path.parent.mkdir(parents=True, exist_ok=True)
-        data: dict[str, float] = {}
-        if self.daily_state_path.exists():
+        Other runs share the file, so the cache is keyed on its stat
+        signature rather than trusted blindly. Holds left by a process that
+        has died, or older than ``DEFAULT_HOLD_TTL_S``, are dropped here.
+        """
+        try:
+            st = self.daily_state_path.stat()
+        except OSError:
+            self._daily_sig = None
+            self._daily_data = {}
+            self._daily_holds = {}
+            return self._daily_data, self._daily_holds
+        sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+        if sig != self._daily_sig:
             try:
-                data = json.loads(
-                    self.daily_state_path.read_text(encoding="utf-8")
-                )
+                data = json.loads(self.daily_state_path.read_text(encoding="utf-8"))
             except (json.JSONDecodeError, OSError):
                 data = {}
-        data[day] = float(value)
+            raw_holds = data.pop(_HOLDS_KEY, None) or {}
+            self._daily_data = {k: float(v) for k, v in data.items()}
+            self._daily_holds = dict(raw_holds)
+            self._daily_sig = sig
+        now = time.time()
+        live = {
+            token: h
+            for token, h in self._daily_holds.items()
+            if now - float(h.get("created", 0.0)) < DEFAULT_HOLD_TTL_S
+            and _pid_alive(int(h.get("pid", 0)))
+        }
+        if len(live) != len(self._daily_holds):
+            self._daily_holds = live
+        return self._daily_data, self._daily_holds
+
+    def _read_daily_spend(self, day: str) -> float:
+        return float(self._daily_state()[0].get(day, 0.0))
+
+    def _write_daily_state(
+        self, totals: dict[str, float], holds: dict[str, dict[str, Any]]
+    ) -> None:
+        """Atomically replace the daily-spend file. Caller holds ``_daily_lock``."""
+        self.daily_state_path.parent.mkdir(parents=True, exist_ok=True)
+        data: dict[str, Any] = {k: float(v) for k, v in totals.items()}
+        if holds:
+            data[_HOLDS_KEY] = holds
         tmp = self.daily_state_path.with_suffix(
-            self.daily_state_path.suffix + ".tmp"
+            self.daily_state_path.suffix + f".{os.getpid()}.tmp"
         )
         tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
         os.replace(tmp, self.daily_state_path)
+        st = self.daily_state_path.stat()
+        self._daily_sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+        self._daily_data = dict(totals)
+        self._daily_holds = dict(holds)
 
 
 # ---------------------------------------------------------------------------
@@ -671,11 +998,50 @@ def _truthy_env(name: str) -> bool:
     return val.strip().lower() in {"1", "true", "yes", "on"}
 
 
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    if pid == os.getpid() or os.name != "posix":
+        # On Windows ``os.kill`` would terminate the process; rely on the TTL.
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # exists, owned by another user
+        return True
+    except OSError:
+        return False
+    return True
+
+
 def _safe_filename(name: str) -> str:
     safe = "".join(c if c.isalnum() or c in "-_." else "_" for c in name)
     return safe or "run"
 
 
+def _entry_from_dict(raw: dict[str, Any]) -> LedgerEntry:
+    return LedgerEntry(
+        timestamp=raw.get("timestamp", _utcnow_iso()),
+        action=raw["action"],
+        units=float(raw.get("units", 0)),
+        usd_per_unit=float(raw.get("usd_per_unit", 0)),
+        cost_usd=float(raw.get("cost_usd", 0)),
+        metadata=raw.get("metadata", {}) or {},
+        dry_run=bool(raw.get("dry_run", False)),
+    )
+
+
+def _shot_from_dict(sid: str, raw: dict[str, Any]) -> ShotAttempts:
+    return ShotAttempts(
+        shot_id=raw.get("shot_id", sid),
+        attempts=int(raw.get("attempts", 0)),
+        scores=[float(x) for x in raw.get("scores", [])],
+        escalated=bool(raw.get("escalated", False)),
+        escalation_reason=raw.get("escalation_reason"),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Self-test demo (no paid API calls)
 # ---------------------------------------------------------------------------
@@ -38,8 +38,31 @@ The orchestrator:
   * Is resumable (per-shot state is flushed to disk after every state
     change, so a killed process restarts where it left off).
   * Never stitches until every shot is approved or escalated.
+  * Can run several shots at once (``max_concurrent_shots``). The cost
+    governor holds budget for every in-flight paid call, so caps stay
+    exact; a shot only waits for its predecessor when the continuity
+    check actually needs the predecessor's last keyframe.
+  * Drives generation through ``Generator.submit`` / ``poll`` / ``fetch``:
+    one ``JobDriver`` thread polls every in-flight remote job, so waiting
+    on a slow video backend costs no thread per job. Blocking generators
+    are wrapped by a synchronous adapter.
+  * Can pipeline the two gates (``pipeline_stages``): later shots' panel
+    gates run while earlier shots are in their video gate. No video still
+    starts before its own panel passes.
+  * Screens each panel and clip locally (``PreScreen``: black frames,
+    static, flat fields, wrong aspect, undecodable files) before the paid
+    validator; rejects cost $0 and feed the next regeneration prompt.
+    A regenerated panel that is a perceptual-hash near-duplicate of an
+    already-graded one reuses that verdict (``PanelIndex``).
+  * Optionally races several video candidates per shot
+    (``speculative_candidates``): budget is reserved for all of them, the
+    first to pass validation wins, and the rest are cancelled.
   * Stitches ONLY the approved shots, into ``reports/scene-XX-stitched.mp4``.
   * Writes a human-readable run report to ``reports/scene-XX-run.md``.
+  * Times every hot path (queueing, downloads, keyframe extraction, image
+    encoding, vision calls, retry backoff) as spans, exported as a Chrome
+    trace to ``reports/scene-XX-trace.json`` and summarised as p50/p95
+    per stage in the run report (see ``tracing``).
 
 See ``test_orchestrator.py`` for unit tests that demonstrate the loop with
 zero paid API calls (StubGenerator + StubValidator).
@@ -76,23 +99,31 @@ from __future__ import annotations
 import abc
 import argparse
 import json
+import queue
 import shutil
 import subprocess
 import sys
+import threading
 import time
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Optional
 
+from . import tracing
+from .asset_cache import AssetCache, AssetUnavailable
+from .panel_index import PanelIndex
 from .cost_governor import (
     BudgetExceeded,
     CostGovernor,
     KillSwitchTripped,
     NoProgress,
     PipelineHalted,
+    PRICING,
+    Reservation,
     RetryCapExceeded,
 )
 
@@ -127,6 +158,21 @@ class GenerationResult:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class GenerationJob:
+    """Handle for one submitted generation (see ``Generator.submit``).
+
+    ``handle`` is backend-specific (a remote job id, an SDK operation, or a
+    ``Future`` for the synchronous adapter). ``JobDriver`` polls the job
+    every ``poll_interval_s`` seconds.
+    """
+
+    request: GenerationRequest
+    handle: Any
+    submitted_at: float = field(default_factory=time.monotonic)
+    poll_interval_s: float = 0.05
+
+
 @dataclass
 class ValidationOutcome:
     """Compact summary the orchestrator needs from any validator backend.
@@ -142,6 +188,7 @@ class ValidationOutcome:
     cost_action: Optional[str] = None  # e.g. "anthropic_vision_call"
     cost_units: float = 0.0
     raw: dict[str, Any] = field(default_factory=dict)
+    cache_hits: int = 0  # vision calls answered from the verdict cache ($0)
 
 
 @dataclass
@@ -161,6 +208,7 @@ class AttemptRecord:
     score: float
     reasons: list[str]
     error: Optional[str] = None  # set if the generator/validator raised
+    candidate: Optional[int] = None  # slot within a speculative round
 
 
 @dataclass
@@ -193,6 +241,8 @@ class ShotState:
     escalation_reason: Optional[str] = None
     last_reasons: list[str] = field(default_factory=list)
     last_score: float = 0.0
+    # Speculative mode: which candidate passed the video gate, and why.
+    winner: Optional[dict[str, Any]] = None
 
     def to_dict(self) -> dict:
         d = asdict(self)
@@ -264,6 +314,231 @@ class Generator(abc.ABC):
             return self.default_cost  # type: ignore[return-value]
         return ("mitte_seedance_5s_shot", 1.0)
 
+    # Non-blocking protocol. The defaults are a synchronous adapter that
+    # runs ``generate`` on a worker thread; backends with a remote job API
+    # (submit now, poll later) override all three.
+
+    def submit(self, request: GenerationRequest) -> GenerationJob:
+        """Start generating ``request`` and return at once."""
+        queued = time.perf_counter()
+        shot_id = request.shot.get("shot_id")
+
+        def _generate() -> GenerationResult:
+            tracing.record(
+                "generator.queue", queued, cat="generate", shot_id=shot_id,
+                generator=self.name,
+            )
+            with tracing.span(
+                "generator.run", cat="generate", shot_id=shot_id, generator=self.name
+            ):
+                return self.generate(request)
+
+        return GenerationJob(request=request, handle=_sync_generate_pool().submit(_generate))
+
+    def poll(self, job: GenerationJob) -> bool:
+        """True once ``job`` has finished, successfully or not."""
+        return job.handle.done()
+
+    def fetch(self, job: GenerationJob) -> GenerationResult:
+        """Result of a finished job; raises whatever the generation raised."""
+        return job.handle.result()
+
+    def cancel(self, job: GenerationJob) -> bool:
+        """Try to stop an unfinished job. True means it will not be billed.
+
+        The synchronous adapter can only cancel a job that has not started
+        yet; a remote backend overrides this to cancel the remote job.
+        """
+        return job.handle.cancel()
+
+
+_SYNC_GENERATE_POOL: Optional[ThreadPoolExecutor] = None
+_SYNC_GENERATE_POOL_LOCK = threading.Lock()
+
+
+def _sync_generate_pool() -> ThreadPoolExecutor:
+    global _SYNC_GENERATE_POOL
+    with _SYNC_GENERATE_POOL_LOCK:
+        if _SYNC_GENERATE_POOL is None:
+            _SYNC_GENERATE_POOL = ThreadPoolExecutor(
+                max_workers=32, thread_name_prefix="generate"
+            )
+        return _SYNC_GENERATE_POOL
+
+
+@dataclass
+class _TrackedJob:
+    generator: Generator
+    job: GenerationJob
+    next_poll: float
+    done: bool = False
+    cancelled: bool = False
+    error: Optional[BaseException] = None
+    on_done: Optional[Callable[["_TrackedJob"], None]] = None
+
+
+class JobDriver:
+    """Drives every in-flight generation job from one polling thread.
+
+    ``run`` submits a request and blocks its caller until the job is done,
+    then fetches the result on the caller's thread (so downloads still
+    overlap). Polling happens on a single background loop, once per job
+    per ``poll_interval_s``, however many jobs are in flight. The loop
+    thread exits when idle and restarts on the next submission.
+
+    ``start`` / ``wait_any`` / ``cancel`` expose the same loop for callers
+    that race several jobs (speculative candidates). A job that lost the
+    race but could not be cancelled is ``abandon``-ed: its callback runs
+    on the loop thread when it finishes, and ``drain`` waits for those.
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._jobs: list[_TrackedJob] = []
+        self._settling = 0
+        self._thread: Optional[threading.Thread] = None
+
+    def run(self, generator: Generator, request: GenerationRequest) -> GenerationResult:
+        tracked = self.start(generator, request)
+        self.wait_any([tracked])
+        if tracked.error is not None:
+            raise tracked.error
+        return generator.fetch(tracked.job)
+
+    def start(self, generator: Generator, request: GenerationRequest) -> _TrackedJob:
+        """Submit ``request`` and hand the job to the polling loop."""
+        job = generator.submit(request)
+        tracked = _TrackedJob(generator=generator, job=job, next_poll=time.monotonic())
+        with self._cond:
+            self._jobs.append(tracked)
+            self._ensure_thread()
+            self._cond.notify_all()
+        return tracked
+
+    def wait_any(self, tracked: list[_TrackedJob]) -> list[_TrackedJob]:
+        """Block until at least one of ``tracked`` is done; return the done ones."""
+        with self._cond:
+            while not any(t.done for t in tracked):
+                self._cond.wait()
+            return [t for t in tracked if t.done]
+
+    def cancel(self, tracked: _TrackedJob) -> bool:
+        """Stop polling ``tracked`` if its generator can cancel it."""
+        if tracked.done or not tracked.generator.cancel(tracked.job):
+            return False
+        with self._cond:
+            if tracked in self._jobs:
+                self._jobs.remove(tracked)
+            tracked.done = tracked.cancelled = True
+            self._cond.notify_all()
+        return True
+
+    def abandon(
+        self, tracked: _TrackedJob, on_done: Callable[[_TrackedJob], None]
+    ) -> None:
+        """Stop waiting on ``tracked``; call ``on_done`` once it finishes."""
+        with self._cond:
+            if not tracked.done:
+                tracked.on_done = on_done
+                self._settling += 1
+                return
+        on_done(tracked)
+
+    def drain(self) -> None:
+        """Block until every abandoned job has finished and settled."""
+        with self._cond:
+            while self._settling:
+                self._cond.wait()
+
+    @property
+    def in_flight(self) -> int:
+        with self._cond:
+            return len(self._jobs)
+
+    def _ensure_thread(self) -> None:
+        """Start the polling loop if it is not running. Caller holds the lock."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._loop, name="job-driver", daemon=True
+            )
+            self._thread.start()
+
+    def _loop(self) -> None:
+        try:
+            self._poll_until_idle()
+        finally:
+            # Whatever ended the loop, let the next submission (or the jobs
+            # still tracked) get a fresh thread instead of waiting forever.
+            with self._cond:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+                    if self._jobs:
+                        self._ensure_thread()
+
+    def _poll_until_idle(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if not self._jobs:
+                        self._thread = None
+                        return
+                    now = time.monotonic()
+                    due = [t for t in self._jobs if t.next_poll <= now]
+                    if due:
+                        break
+                    self._cond.wait(min(t.next_poll for t in self._jobs) - now)
+            # Poll outside the lock: a poll may be a network round trip.
+            finished = []
+            for tracked in due:
+                try:
+                    if tracked.generator.poll(tracked.job):
+                        finished.append(tracked)
+                    else:
+                        tracked.next_poll = time.monotonic() + tracked.job.poll_interval_s
+                except Exception as exc:
+                    tracked.error = exc
+                    finished.append(tracked)
+            if finished:
+                with self._cond:
+                    for tracked in finished:
+                        tracked.done = True
+                        if tracked in self._jobs:
+                            self._jobs.remove(tracked)
+                    self._cond.notify_all()
+                for tracked in finished:
+                    if tracked.on_done is None:
+                        continue
+                    try:
+                        tracked.on_done(tracked)
+                    except Exception as exc:
+                        print(f"  [job-driver] on_done callback for {tracked.job} "
+                              f"raised: {exc!r}", flush=True)
+                    finally:
+                        with self._cond:
+                            self._settling -= 1
+                            self._cond.notify_all()
+
+
+@dataclass
+class _PanelHandoff:
+    """What a shot's passed PANEL GATE hands to its VIDEO GATE."""
+
+    char_refs: dict[str, Path]
+    location_ref: Optional[Path]
+    start_frame: Optional[Path]  # the verified panel (or manifest start frame)
+
+
+@dataclass
+class _Candidate:
+    """One speculative video candidate within a round."""
+
+    slot: int
+    request: GenerationRequest
+    hold: Reservation
+    record: AttemptRecord
+    tracked: Optional[_TrackedJob] = None
+    started: float = 0.0  # perf_counter at launch, for the trace
+
 
 class StubGenerator(Generator):
     """Returns a canned 1-second silent MP4 for tests.
@@ -671,11 +946,43 @@ def _wait_for_completion(page, timeout_s: float, description: str) -> None:
 def _download_to(url: str, dest: Path) -> None:
     dest.parent.mkdir(parents=True, exist_ok=True)
     req = urllib.request.Request(url, headers={"User-Agent": "rex-orchestrator/1.0"})
+    # Download to a private temp file and rename, so concurrent shots that
+    # share a reference never observe a half-written file.
+    tmp = dest.with_name(f".{dest.name}.{threading.get_ident()}.part")
     try:
-        with urllib.request.urlopen(req, timeout=120) as resp, open(dest, "wb") as f:
+        with tracing.span("download", url=url), urllib.request.urlopen(
+            req, timeout=120
+        ) as resp, open(tmp, "wb") as f:
             shutil.copyfileobj(resp, f)
+        tmp.replace(dest)
     except urllib.error.URLError as exc:
         raise RuntimeError(f"download failed for {url}: {exc}") from exc
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _verdict_cache(work_dir: Path):
+    """Keyframe verdict cache shared by the real video + panel validators."""
+    from scripts.validate import shot_validator as sv
+
+    return sv.ValidationCache(work_dir / "validation-cache")
+
+
+def _frame_store(work_dir: Path):
+    """Clip frames keyed by content hash, shared by the real video
+    validator (keyframes) and the orchestrator (continuity frames)."""
+    from scripts.validate import shot_validator as sv
+
+    return sv.FrameStore.for_dir(work_dir / "frames")
+
+
+def _stage_copy(src: Path, dest: Path) -> None:
+    """Copy ``src`` to ``dest`` once, atomically (safe across shot threads)."""
+    if dest.exists():
+        return
+    tmp = dest.with_name(f".{dest.name}.{threading.get_ident()}.part")
+    shutil.copyfile(src, tmp)
+    tmp.replace(dest)
 
 
 # ---------------------------------------------------------------------------
@@ -685,6 +992,10 @@ def _download_to(url: str, dest: Path) -> None:
 
 class Validator(abc.ABC):
     name: str = "validator"
+    # Whether ``validate`` scores continuity against ``prior_keyframe``.
+    # The concurrent scheduler only serializes a shot behind its
+    # predecessor when this is True (and the two shots share a location).
+    uses_prior_keyframe: bool = True
 
     @abc.abstractmethod
     def validate(
@@ -772,6 +1083,14 @@ class RealValidator(Validator):
     Real vision API calls — but cheap (the Scene 1 baseline run was ~$0.04
     total). Cost is recorded as one ``anthropic_vision_call`` per keyframe;
     that's an upper-bound estimate the cost governor can budget against.
+    Keyframes answered from the verdict cache (``work_dir/validation-cache``,
+    disable with ``use_cache=False``) are not charged.
+
+    ``batched=True`` grades a shot's keyframes in a single request. Its cost
+    is recorded from the reported token usage (in vision-call units), and
+    ``cost_estimate`` then budgets against the dearest batch seen so far,
+    scaled to ``keyframes_per_shot`` keyframes, instead of one call per
+    keyframe.
     """
 
     name = "real"
@@ -782,18 +1101,49 @@ class RealValidator(Validator):
         backend: Optional[str] = None,
         model: Optional[str] = None,
         keyframes_per_shot: int = 3,
+        use_cache: bool = True,
+        batched: bool = False,
     ) -> None:
         self.backend = backend
         self.model = model
         self.keyframes_per_shot = keyframes_per_shot
+        self.use_cache = use_cache
+        self.batched = batched
+        self._batch_units: Optional[float] = None
         self._client = None
         self._effective_backend: Optional[str] = None
         self._effective_model: Optional[str] = None
 
     def cost_estimate(self) -> tuple[str, float]:
         # ~3 keyframes -> 3 vision calls per shot, upper-bound.
+        if self.batched and self._batch_units is not None:
+            return ("anthropic_vision_call", self._batch_units)
         return ("anthropic_vision_call", float(self.keyframes_per_shot))
 
+    def _batch_cost_units(self, usage: dict) -> float:
+        """Price one batched request's token usage in vision-call units."""
+        from scripts.validate import shot_validator as sv
+
+        if not usage.get("requests"):
+            return 0.0
+        usd = sv.estimate_cost(
+            self._effective_model or "",
+            int(usage.get("input_tokens", 0)),
+            int(usage.get("output_tokens", 0)),
+        )
+        if usd <= 0.0:
+            # Unpriced model: fall back to one call per request.
+            return float(usage["requests"])
+        units = usd / PRICING["anthropic_vision_call"]["usd_per_unit"]
+        if usage["requests"] == 1:
+            # A still image (or a short clip) is one request for fewer
+            # keyframes than a full shot; scale it up to what a full shot
+            # would send so it does not lower the budget for later videos.
+            parts = max(1, int(usage.get("keyframes", self.keyframes_per_shot)))
+            per_shot = units * max(1.0, self.keyframes_per_shot / parts)
+            self._batch_units = max(self._batch_units or 0.0, per_shot)
+        return units
+
     def _lazy_init(self) -> None:
         if self._client is not None:
             return
@@ -820,7 +1170,9 @@ class RealValidator(Validator):
         from scripts.validate import shot_validator as sv
 
         self._lazy_init()
-        keyframes_dir = work_dir / "keyframes"
+        # Per-shot dir: every shot's first clip is ``attempt-00.mp4``, so a
+        # shared dir would let concurrent shots overwrite each other's frames.
+        keyframes_dir = work_dir / "keyframes" / shot["shot_id"]
         keyframes_dir.mkdir(parents=True, exist_ok=True)
 
         # ``validate_shot`` expects characters_dir / locations_dir, not
@@ -834,12 +1186,10 @@ class RealValidator(Validator):
             tgt = scratch_chars / (
                 f"{name.lower()}_turnaround_APPROVED{path.suffix.lower()}"
             )
-            if not tgt.exists():
-                shutil.copyfile(path, tgt)
+            _stage_copy(path, tgt)
         if location_ref is not None:
             tgt = scratch_locs / f"storyboard-{shot['shot_id']}{location_ref.suffix.lower()}"
-            if not tgt.exists():
-                shutil.copyfile(location_ref, tgt)
+            _stage_copy(location_ref, tgt)
 
         result = sv.validate_shot(
             shot=shot,
@@ -851,6 +1201,10 @@ class RealValidator(Validator):
             backend=self._effective_backend,
             model=self._effective_model,
             client=self._client,
+            cache=_verdict_cache(work_dir) if self.use_cache else None,
+            keyframe_count=self.keyframes_per_shot,
+            batched=self.batched,
+            frame_store=_frame_store(work_dir),
         )
         # Build a single 0..1 score for the no-progress guard: mean of the
         # rubric sub-scores plus mean character-identity score.
@@ -866,6 +1220,11 @@ class RealValidator(Validator):
             sub.append(sum(ids.values()) / len(ids))
         score = sum(sub) / len(sub) if sub else 0.0
         action, units = self.cost_estimate()
+        hits = int(result.usage.get("cache_hits", 0))
+        if self.batched:
+            units = self._batch_cost_units(result.usage)
+        else:
+            units = max(0.0, units - hits)
         return ValidationOutcome(
             passed=bool(result.overall_pass),
             score=round(score, 4),
@@ -873,6 +1232,7 @@ class RealValidator(Validator):
             cost_action=action,
             cost_units=units,
             raw=result.to_dict(),
+            cache_hits=hits,
         )
 
 
@@ -969,6 +1329,12 @@ class GeminiPanelGenerator(PanelGenerator):
     the prior validator's failure reasons. Output: one PNG written to the
     requested path. Cost is recorded as ``gemini_image`` units.
 
+    References go through the validator's image preparation (downsized to
+    ``max_reference_edge``, media type sniffed from the bytes, cached per
+    process), so a turnaround is decoded and resized once per run and
+    shared with the panel and video validators rather than re-uploaded at
+    full resolution on every regenerate.
+
     The actual Gemini API call is isolated here so failures (network,
     quota, content filter) raise cleanly into the orchestrator's failed-
     attempt path rather than corrupting state.
@@ -983,9 +1349,12 @@ class GeminiPanelGenerator(PanelGenerator):
         model: str = "gemini-2.5-flash-image",
         cost_action: str = "gemini_image",
         cost_units: float = 1.0,
+        max_reference_edge: Optional[int] = None,
     ) -> None:
         self.model = model
         self.default_cost = (cost_action, cost_units)
+        # None = the validator's edge, so both share one cached copy.
+        self.max_reference_edge = max_reference_edge
         self._client = None
 
     def _lazy_client(self):
@@ -1043,20 +1412,29 @@ class GeminiPanelGenerator(PanelGenerator):
         client = self._lazy_client()
         prompt = self._build_prompt(request)
 
+        from scripts.validate import rate_limit
+        from scripts.validate import shot_validator as sv
+
+        max_edge = self.max_reference_edge or sv._MAX_IMAGE_EDGE
         # Conditioning images: character turnarounds, then location plate.
         contents: list[Any] = [prompt]
+        upload_bytes = 0
         for ref in list(request.character_refs.values()) + (
             [request.location_ref] if request.location_ref else []
         ):
-            raw = Path(ref).read_bytes()
-            mime = (
-                "image/png" if str(ref).lower().endswith(".png") else "image/jpeg"
-            )
-            contents.append(types.Part.from_bytes(data=raw, mime_type=mime))
-
-        response = client.models.generate_content(
-            model=self.model,
-            contents=contents,
+            data, mime = sv._prepare_part(Path(ref), max_edge)
+            upload_bytes += len(data)
+            contents.append(types.Part.from_bytes(data=data, mime_type=mime))
+
+        # Paced by the same per-model limiter as the Gemini validators, so
+        # panel regeneration and validation share one quota.
+        response = sv._call_with_retry(
+            lambda: client.models.generate_content(
+                model=self.model,
+                contents=contents,
+            ),
+            label=f"panel {request.shot['shot_id']}",
+            limiter=rate_limit.limiter_for("gemini", self.model),
         )
         # Find an inline image part in the response.
         out_path = request.output_path
@@ -1092,7 +1470,7 @@ class GeminiPanelGenerator(PanelGenerator):
             panel_path=out_path,
             cost_action=action,
             cost_units=units,
-            metadata={"model": self.model},
+            metadata={"model": self.model, "reference_bytes": upload_bytes},
         )
 
 
@@ -1178,9 +1556,11 @@ class RealPanelValidator(PanelValidator):
         *,
         backend: Optional[str] = None,
         model: Optional[str] = None,
+        use_cache: bool = True,
     ) -> None:
         self.backend = backend
         self.model = model
+        self.use_cache = use_cache
         self._client = None
         self._effective_backend: Optional[str] = None
         self._effective_model: Optional[str] = None
@@ -1221,14 +1601,12 @@ class RealPanelValidator(PanelValidator):
             tgt = scratch_chars / (
                 f"{name.lower()}_turnaround_APPROVED{path.suffix.lower()}"
             )
-            if not tgt.exists():
-                shutil.copyfile(path, tgt)
+            _stage_copy(path, tgt)
         if location_ref is not None:
             tgt = scratch_locs / (
                 f"storyboard-{shot['shot_id']}{location_ref.suffix.lower()}"
             )
-            if not tgt.exists():
-                shutil.copyfile(location_ref, tgt)
+            _stage_copy(location_ref, tgt)
 
         result = sv.validate_panel(
             shot=shot,
@@ -1239,6 +1617,7 @@ class RealPanelValidator(PanelValidator):
             backend=self._effective_backend,
             model=self._effective_model,
             client=self._client,
+            cache=_verdict_cache(work_dir) if self.use_cache else None,
         )
         agg = result.aggregate_scores or {}
         sub = [
@@ -1254,13 +1633,15 @@ class RealPanelValidator(PanelValidator):
             sub.append(sum(wds.values()) / len(wds))
         score = sum(sub) / len(sub) if sub else 0.0
         action, units = self.cost_estimate()
+        hits = int(result.usage.get("cache_hits", 0))
         return ValidationOutcome(
             passed=bool(result.overall_pass),
             score=round(score, 4),
             reasons=list(result.reasons or []),
             cost_action=action,
-            cost_units=units,
+            cost_units=max(0.0, units - hits),
             raw=result.to_dict(),
+            cache_hits=hits,
         )
 
 
@@ -1347,6 +1728,93 @@ class StubStitchValidator(StitchValidator):
         return self._outcome
 
 
+# ---------------------------------------------------------------------------
+# Local pre-screen (runs before the paid panel / video validators)
+# ---------------------------------------------------------------------------
+
+
+# StoryboardQAValidator issue -> correction the next generation can act on.
+_PRESCREEN_REASONS = {
+    "corrupted": "image is unreadable or truncated",
+    "tv_static": "frame is TV static / noise, not a picture",
+    "too_dark": "frame is black or near-black",
+    "too_bright": "frame is blown out to white",
+    "low_contrast": "frame is a flat, near-uniform field",
+    "low_resolution": "resolution is too low",
+    "aspect_ratio": "aspect ratio is not 16:9",
+    "small_file": "file is implausibly small (likely truncated)",
+}
+# Per-frame issues that only reject a clip when EVERY keyframe has them:
+# a fade from black legitimately starts on a black frame.
+_PRESCREEN_WHOLE_CLIP = ("tv_static", "too_dark", "too_bright", "low_contrast")
+
+
+class PreScreen:
+    """Cheap local checks that reject obviously broken media at $0.
+
+    Reuses ``StoryboardQAValidator.analyze_image`` (brightness, contrast,
+    neighbour-difference noise, size and aspect checks, all NumPy) on a
+    downsampled copy, so a panel or a clip's keyframes are screened in
+    milliseconds. The orchestrator runs it before the paid validator; a
+    rejection is recorded as a failed attempt with no validation spend,
+    and its reasons feed the next regeneration prompt like any other.
+
+    Clip keyframes come from the shared frame store, so the real
+    validator reuses them when the clip passes. If Pillow / NumPy are not
+    installed the pre-screen passes everything through.
+    """
+
+    name = "local_prescreen"
+
+    def __init__(self, *, max_edge: int = 512, keyframe_count: int = 3) -> None:
+        self.max_edge = max_edge
+        self.keyframe_count = keyframe_count
+        self._qa = None
+        self._unavailable: Optional[str] = None
+
+    def _analyzer(self):
+        if self._qa is None and self._unavailable is None:
+            try:
+                from scripts.qa_validate_storyboards import StoryboardQAValidator
+            except ImportError as exc:
+                self._unavailable = str(exc)
+                print(f"  [prescreen] disabled: {exc}", flush=True)
+            else:
+                self._qa = StoryboardQAValidator()
+        return self._qa
+
+    def screen_panel(self, panel_path: Path) -> list[str]:
+        """Reasons to reject a storyboard panel; empty if it may proceed."""
+        qa = self._analyzer()
+        if qa is None:
+            return []
+        issues = qa.analyze_image(Path(panel_path), max_edge=self.max_edge)["issues"]
+        return [f"prescreen: {_PRESCREEN_REASONS[i]}" for i in issues if i in _PRESCREEN_REASONS]
+
+    def screen_clip(self, clip_path: Path, work_dir: Path) -> list[str]:
+        """Reasons to reject a generated clip; empty if it may proceed."""
+        qa = self._analyzer()
+        if qa is None:
+            return []
+        clip_path = Path(clip_path)
+        try:
+            frames = _frame_store(work_dir).keyframes(clip_path, self.keyframe_count)
+        except (subprocess.CalledProcessError, OSError, RuntimeError, ValueError) as exc:
+            return [f"prescreen: clip could not be decoded (truncated or corrupt): {exc}"]
+        per_frame = [
+            set(qa.analyze_image(f, max_edge=self.max_edge)["issues"]) for f in frames
+        ]
+        issues = [
+            i for i in _PRESCREEN_WHOLE_CLIP if all(i in found for found in per_frame)
+        ]
+        # Shape problems show on any frame; a corrupt JPEG means a bad decode.
+        issues += [
+            i for i in ("corrupted", "low_resolution", "aspect_ratio")
+            if any(i in found for found in per_frame)
+        ]
+        return [f"prescreen: {_PRESCREEN_REASONS[i]}" for i in issues]
+
+
 # ---------------------------------------------------------------------------
 # Reference resolution
 # ---------------------------------------------------------------------------
@@ -1355,68 +1823,100 @@ class StubStitchValidator(StitchValidator):
 _R2_BASE = "https://pub-97d84d215bf5412b8f7d32e7b9047c54.r2.dev"
 
 
+def reference_fetches(
+    shot: dict,
+    *,
+    references_dir: Path,
+    download_dir: Path,
+    fetch_from_r2: bool = True,
+) -> list[tuple[str, Path]]:
+    """``(url, dest)`` for every reference of ``shot`` not found locally."""
+    fetches: list[tuple[str, Path]] = []
+    if fetch_from_r2:
+        for ch in shot.get("characters", []):
+            name = f"{ch.lower()}_turnaround_APPROVED.png"
+            if not (references_dir / "characters" / name).exists():
+                fetches.append(
+                    (
+                        f"{_R2_BASE}/asset-bible/characters/{name}",
+                        download_dir / "characters" / name,
+                    )
+                )
+        location = shot.get("location")
+        if location and not (references_dir / "locations" / f"{location}.png").exists():
+            fetches.append(
+                (
+                    f"{_R2_BASE}/asset-bible/locations/{location}.png",
+                    download_dir / "locations" / f"{location}.png",
+                )
+            )
+    panel_url = shot.get("panel_url")
+    if panel_url:
+        suffix = ".png" if panel_url.endswith(".png") else ".jpg"
+        fetches.append(
+            (panel_url, download_dir / "start-frames" / f"{shot['shot_id']}{suffix}")
+        )
+    return fetches
+
+
 def resolve_references(
     shot: dict,
     *,
     references_dir: Path,
     download_dir: Path,
     fetch_from_r2: bool = True,
+    cache: Optional[AssetCache] = None,
 ) -> tuple[dict[str, Path], Optional[Path], Optional[Path]]:
     """Find the locked turnarounds + location plate + start frame for a shot.
 
     Looks first under ``references_dir/characters`` and
     ``references_dir/locations``; falls back to fetching the canonical
     files from R2 into ``download_dir`` so the orchestrator works on a
-    fresh checkout where these aren't on disk.
+    fresh checkout where these aren't on disk. Fetches go through
+    ``cache`` (by default the shared ``AssetCache`` for ``download_dir``),
+    which revalidates stale copies and remembers recent failures.
     """
     char_dir = references_dir / "characters"
     loc_dir = references_dir / "locations"
     char_dir.mkdir(parents=True, exist_ok=True)
     loc_dir.mkdir(parents=True, exist_ok=True)
+    cache = cache or AssetCache.for_dir(download_dir)
+
+    fetched: dict[Path, Optional[Path]] = {}
+    for url, dest in reference_fetches(
+        shot,
+        references_dir=references_dir,
+        download_dir=download_dir,
+        fetch_from_r2=fetch_from_r2,
+    ):
+        try:
+            fetched[dest] = cache.fetch(url, dest)
+        except AssetUnavailable:
+            fetched[dest] = None
 
     char_refs: dict[str, Path] = {}
     for ch in shot.get("characters", []):
-        slug = ch.lower()
-        local = char_dir / f"{slug}_turnaround_APPROVED.png"
-        if not local.exists() and fetch_from_r2:
-            url = f"{_R2_BASE}/asset-bible/characters/{slug}_turnaround_APPROVED.png"
-            target = download_dir / "characters" / f"{slug}_turnaround_APPROVED.png"
-            try:
-                if not target.exists():
-                    _download_to(url, target)
-                local = target
-            except Exception:
-                continue
-        if local.exists():
+        name = f"{ch.lower()}_turnaround_APPROVED.png"
+        local = char_dir / name
+        if not local.exists():
+            local = fetched.get(download_dir / "characters" / name)
+        if local is not None and local.exists():
             char_refs[ch] = local
 
     location_ref: Optional[Path] = None
     location = shot.get("location")
     if location:
         local = loc_dir / f"{location}.png"
-        if not local.exists() and fetch_from_r2:
-            url = f"{_R2_BASE}/asset-bible/locations/{location}.png"
-            target = download_dir / "locations" / f"{location}.png"
-            try:
-                if not target.exists():
-                    _download_to(url, target)
-                local = target
-            except Exception:
-                local = local  # leave as-is; orchestrator will treat missing as None
-        if local.exists():
+        if not local.exists():
+            local = fetched.get(download_dir / "locations" / f"{location}.png")
+        if local is not None and local.exists():
             location_ref = local
 
     start_frame: Optional[Path] = None
-    panel_url = shot.get("panel_url")
-    if panel_url:
-        suffix = ".png" if panel_url.endswith(".png") else ".jpg"
-        target = download_dir / "start-frames" / f"{shot['shot_id']}{suffix}"
-        try:
-            if not target.exists():
-                _download_to(panel_url, target)
-            start_frame = target
-        except Exception:
-            start_frame = None
+    if shot.get("panel_url"):
+        start_frame = next(
+            (p for d, p in fetched.items() if d.parent.name == "start-frames"), None
+        )
 
     return char_refs, location_ref, start_frame
 
@@ -1466,6 +1966,7 @@ class RunReport:
     estimated_spend_usd: float
     state_path: Path
     report_path: Path
+    trace_path: Optional[Path] = None  # Chrome trace-event JSON for the run
     # Per-stage gate outcomes
     panel_passed: list[str] = field(default_factory=list)
     panel_escalated: list[tuple[str, str]] = field(default_factory=list)
@@ -1496,6 +1997,12 @@ class Orchestrator:
         panel_generator: Optional[PanelGenerator] = None,
         panel_validator: Optional[PanelValidator] = None,
         stitch_validator: Optional[StitchValidator] = None,
+        max_concurrent_shots: int = 1,
+        speculative_candidates: int = 1,
+        pipeline_stages: bool = False,
+        tracer: Optional[tracing.Tracer] = None,
+        prescreen: Optional[PreScreen] = None,
+        panel_index: Optional[PanelIndex] = None,
     ) -> None:
         self.manifest_path = Path(manifest_path)
         self.manifest: list[dict] = json.loads(self.manifest_path.read_text())
@@ -1508,8 +2015,31 @@ class Orchestrator:
         self.scene_slug = scene_slug or _scene_slug_from_manifest(self.manifest_path)
         self.report_dir = Path(report_dir) if report_dir else Path("reports")
         self.fetch_references_from_r2 = fetch_references_from_r2
-        self.on_event = on_event or (lambda *_: None)
+        self.on_event = _serialized_events(on_event or (lambda *_: None))
         self.stitch_on_complete = stitch_on_complete
+        # Shot-level parallelism. 1 keeps the original strictly serial loop.
+        self.max_concurrent_shots = max(1, int(max_concurrent_shots))
+        # Stage pipelining: later shots' panel gates overlap earlier shots'
+        # video gates. An alternative to shot-level parallelism, not an
+        # addition to it.
+        self.pipeline_stages = bool(pipeline_stages)
+        if self.pipeline_stages and self.max_concurrent_shots > 1:
+            raise ValueError(
+                "pipeline_stages and max_concurrent_shots > 1 are alternative "
+                "schedulers; pick one"
+            )
+        # Guards the state file; set per shot by the concurrent scheduler
+        # so successors can wait for a predecessor's final clip.
+        self._state_lock = threading.RLock()
+        self._shot_done: dict[str, threading.Event] = {}
+        # One polling loop for every in-flight generation job.
+        self._jobs = JobDriver()
+        # Video candidates launched per round; 1 keeps the serial
+        # generate -> validate -> regenerate loop.
+        self.speculative_candidates = max(1, int(speculative_candidates))
+        # Span timings for the run; exported as a Chrome trace next to the
+        # run report and summarised in its "Stage latency" section.
+        self.tracer = tracer or tracing.Tracer()
 
         # Panel gate (PANEL GATE). Both panel_generator and panel_validator
         # are optional for backward compatibility with stub-only video tests.
@@ -1525,10 +2055,27 @@ class Orchestrator:
         # StubStitchValidator.
         self.stitch_validator = stitch_validator or AlwaysPassStitchValidator()
 
+        # Local $0 checks run before the paid panel / video validators.
+        # None (the default, used by stub tests) skips them.
+        self.prescreen = prescreen
+        # Perceptual-hash index of graded panels: a regenerated panel that
+        # is a near-duplicate of a graded one reuses its verdict. None
+        # disables deduplication.
+        self.panel_index = panel_index
+
         self.work_dir.mkdir(parents=True, exist_ok=True)
         self.report_dir.mkdir(parents=True, exist_ok=True)
+        # Reference downloads are shared by every shot (and every run that
+        # uses this work dir) through one revalidating cache.
+        self.reference_download_dir = self.work_dir / "references"
+        self.asset_cache = AssetCache.for_dir(self.reference_download_dir)
         self.state_path = self.work_dir / f"{self.scene_slug}-state.json"
         self.shots: dict[str, ShotState] = {}
+        # shot_id -> manifest-order predecessor shot (None for the first).
+        self._predecessors: dict[str, Optional[dict]] = {
+            shot["shot_id"]: (self.manifest[i - 1] if i else None)
+            for i, shot in enumerate(self.manifest)
+        }
         self._load_state()
         # Estimate spend for the entire run so we can warn the user up-front.
         self.estimated_spend_usd = self._estimate_run_spend()
@@ -1574,17 +2121,21 @@ class Orchestrator:
                 escalation_reason=raw.get("escalation_reason"),
                 last_reasons=list(raw.get("last_reasons", [])),
                 last_score=float(raw.get("last_score", 0.0)),
+                winner=raw.get("winner"),
             )
 
     def _flush_state(self) -> None:
-        payload = {
-            "manifest_path": str(self.manifest_path),
-            "scene_label": self.scene_label,
-            "shots": {sid: s.to_dict() for sid, s in self.shots.items()},
-        }
-        tmp = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
-        tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
-        tmp.replace(self.state_path)
+        # Serialized so concurrent shots never interleave writes to the
+        # shared temp file; the rename keeps the state file crash-safe.
+        with self._state_lock:
+            payload = {
+                "manifest_path": str(self.manifest_path),
+                "scene_label": self.scene_label,
+                "shots": {sid: s.to_dict() for sid, s in self.shots.items()},
+            }
+            tmp = self.state_path.with_suffix(self.state_path.suffix + ".tmp")
+            tmp.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            tmp.replace(self.state_path)
 
     # ------------------------------------------------------------------
     # Spend estimation
@@ -1592,7 +2143,8 @@ class Orchestrator:
 
     def _estimate_run_spend(self) -> float:
         """Rough up-front estimate: one panel-validate + one generation +
-        one video-validate per shot. If a panel generator is configured,
+        one video-validate per shot (one generation per speculative
+        candidate in speculative mode). If a panel generator is configured,
         we do NOT pre-charge for regeneration since attempt 0 reuses the
         manifest panel."""
         try:
@@ -1610,9 +2162,9 @@ class Orchestrator:
         except Exception:
             gen_action, gen_units = ("mitte_seedance_5s_shot", 1.0)
         val_action, val_units = self.validator.cost_estimate()
-        per_shot = self.governor.estimate(gen_action, gen_units) + self.governor.estimate(
-            val_action, val_units
-        )
+        per_shot = self.governor.estimate(
+            gen_action, gen_units
+        ) * self.speculative_candidates + self.governor.estimate(val_action, val_units)
         if self.panel_validator is not None:
             pval_action, pval_units = self.panel_validator.cost_estimate()
             per_shot += self.governor.estimate(pval_action, pval_units)
@@ -1623,6 +2175,12 @@ class Orchestrator:
     # ------------------------------------------------------------------
 
     def run_scene(self) -> RunReport:
+        # Active for the whole run, so generators and shot_validator (which
+        # have no handle on the orchestrator) record into this run's trace.
+        with tracing.activate(self.tracer):
+            return self._run_scene()
+
+    def _run_scene(self) -> RunReport:
         self.on_event(
             "run_start",
             {
@@ -1633,38 +2191,25 @@ class Orchestrator:
                 "resumed_state": any(
                     s.status != "pending" for s in self.shots.values()
                 ),
+                "max_concurrent_shots": self.max_concurrent_shots,
+                "pipeline_stages": self.pipeline_stages,
             },
         )
 
+        self._prefetch_references()
+
         # The orchestrator NEVER stitches until the loop completes or the
         # governor halts. We track per-shot status only.
-        for shot in self.manifest:
-            sid = shot["shot_id"]
-            state = self.shots[sid]
-            if state.status in ("approved", "escalated", "skipped"):
-                self.on_event(
-                    "shot_skip_already_done",
-                    {"shot_id": sid, "status": state.status},
-                )
-                continue
-            # Honor any halt that landed mid-run (e.g. KillSwitchTripped).
-            if self.governor.halted:
-                self.on_event(
-                    "run_halted_before_shot",
-                    {"shot_id": sid, "reason": self.governor.halted_reason},
-                )
-                break
-            try:
-                self._run_one_shot(shot, state)
-            except PipelineHalted as exc:
-                # Budget cap / kill switch / per-run attempts cap.
-                # The shot may be marked escalated already; if not, leave
-                # it pending so a later resume can pick it up.
-                self.on_event(
-                    "run_halted",
-                    {"shot_id": sid, "reason": str(exc), "kind": type(exc).__name__},
-                )
-                break
+        if self.pipeline_stages:
+            self._run_shots_pipelined()
+        elif self.max_concurrent_shots > 1:
+            self._run_shots_concurrently()
+        else:
+            self._run_shots_serially()
+
+        # Abandoned speculative candidates still bill when they finish;
+        # settle them before the report totals spend.
+        self._jobs.drain()
 
         # Build the report and (optionally) stitch.
         report_path = self.report_dir / f"{self.scene_slug}-run.md"
@@ -1691,10 +2236,11 @@ class Orchestrator:
             and approved
         ):
             try:
-                stitched_path = stitch_clips(
-                    [Path(self.shots[sid].final_clip) for sid in approved if self.shots[sid].final_clip],
-                    self.report_dir / f"{self.scene_slug}-stitched.mp4",
-                )
+                with self.tracer.span("stitch", clips=len(approved)):
+                    stitched_path = stitch_clips(
+                        [Path(self.shots[sid].final_clip) for sid in approved if self.shots[sid].final_clip],
+                        self.report_dir / f"{self.scene_slug}-stitched.mp4",
+                    )
                 self.on_event(
                     "stitched",
                     {"path": str(stitched_path), "n_clips": len(approved)},
@@ -1736,7 +2282,8 @@ class Orchestrator:
             if s.status == "escalated" and s.panel_status == "passed"
         ]
 
-        self._write_report(report_path, stitched_path=stitched_path)
+        trace_path = self.tracer.write(self.report_dir / f"{self.scene_slug}-trace.json")
+        self._write_report(report_path, stitched_path=stitched_path, trace_path=trace_path)
 
         report = RunReport(
             scene_label=self.scene_label,
@@ -1751,6 +2298,7 @@ class Orchestrator:
             estimated_spend_usd=round(self.estimated_spend_usd, 6),
             state_path=self.state_path,
             report_path=report_path,
+            trace_path=trace_path,
             panel_passed=panel_passed_list,
             panel_escalated=panel_escalated_list,
             video_passed=video_passed_list,
@@ -1763,6 +2311,238 @@ class Orchestrator:
         self.on_event("run_complete", asdict(report))
         return report
 
+    def _prefetch_references(self) -> None:
+        """Fetch every unresolved shot's references in parallel, up front,
+        so no shot waits on a download once the gates start."""
+        fetches: list[tuple[str, Path]] = []
+        for shot in self.manifest:
+            if self.shots[shot["shot_id"]].status in ("approved", "escalated", "skipped"):
+                continue
+            fetches.extend(
+                reference_fetches(
+                    shot,
+                    references_dir=self.references_dir,
+                    download_dir=self.reference_download_dir,
+                    fetch_from_r2=self.fetch_references_from_r2,
+                )
+            )
+        if not fetches:
+            return
+        started = time.monotonic()
+        with self.tracer.span("references.prefetch", assets=len(fetches)):
+            errors = self.asset_cache.prefetch(fetches)
+        failed = {url: err for url, err in errors.items() if err}
+        self.on_event(
+            "references_prefetched",
+            {
+                "assets": len(errors),
+                "failed": len(failed),
+                "seconds": round(time.monotonic() - started, 3),
+                "errors": dict(list(failed.items())[:5]),
+            },
+        )
+
+    def _run_shots_serially(self) -> None:
+        for shot in self.manifest:
+            sid = shot["shot_id"]
+            state = self.shots[sid]
+            if state.status in ("approved", "escalated", "skipped"):
+                self.on_event(
+                    "shot_skip_already_done",
+                    {"shot_id": sid, "status": state.status},
+                )
+                continue
+            # Honor any halt that landed mid-run (e.g. KillSwitchTripped).
+            if self.governor.halted:
+                self.on_event(
+                    "run_halted_before_shot",
+                    {"shot_id": sid, "reason": self.governor.halted_reason},
+                )
+                break
+            try:
+                self._run_one_shot(shot, state)
+            except PipelineHalted as exc:
+                # Budget cap / kill switch / per-run attempts cap.
+                # The shot may be marked escalated already; if not, leave
+                # it pending so a later resume can pick it up.
+                self.on_event(
+                    "run_halted",
+                    {"shot_id": sid, "reason": str(exc), "kind": type(exc).__name__},
+                )
+                break
+
+    def _run_shots_concurrently(self) -> None:
+        """Run up to ``max_concurrent_shots`` shots at once.
+
+        Shots are submitted in manifest order to a thread pool and each
+        runs the same panel + video gates as the serial loop. Before its
+        video gate a shot waits for its predecessor only when
+        ``_needs_prior_keyframe`` says the continuity check will use the
+        predecessor's last keyframe. The pool dequeues in submission
+        order, so the shot being waited on has always started already
+        and the waits cannot deadlock.
+        """
+        self._shot_done = {shot["shot_id"]: threading.Event() for shot in self.manifest}
+        pending: list[dict] = []
+        for shot in self.manifest:
+            sid = shot["shot_id"]
+            state = self.shots[sid]
+            if state.status in ("approved", "escalated", "skipped"):
+                self.on_event(
+                    "shot_skip_already_done",
+                    {"shot_id": sid, "status": state.status},
+                )
+                self._shot_done[sid].set()
+                continue
+            pending.append(shot)
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=self.max_concurrent_shots,
+                thread_name_prefix="shot",
+            ) as pool:
+                futures = [pool.submit(self._run_shot_worker, shot) for shot in pending]
+                for future in futures:
+                    future.result()
+        finally:
+            self._shot_done = {}
+
+    def _run_shots_pipelined(self) -> None:
+        """Overlap later shots' PANEL GATEs with earlier shots' VIDEO GATEs.
+
+        A panel thread runs the panel gates in manifest order and hands each
+        passed shot to the video stage on this thread, which runs the video
+        gates in manifest order. Panel regeneration and video generation use
+        different providers, so they now run side by side. A shot's video
+        gate still starts only after its own panel passed, and video gates
+        stay serial, so the continuity check always sees the predecessor's
+        final clip.
+        """
+        pending: list[dict] = []
+        for shot in self.manifest:
+            sid = shot["shot_id"]
+            state = self.shots[sid]
+            if state.status in ("approved", "escalated", "skipped"):
+                self.on_event(
+                    "shot_skip_already_done",
+                    {"shot_id": sid, "status": state.status},
+                )
+                continue
+            pending.append(shot)
+
+        ready: queue.Queue = queue.Queue()  # (shot, _PanelHandoff) | None
+        stop = threading.Event()
+        panel_error: list[BaseException] = []
+
+        def _panel_stage() -> None:
+            try:
+                for shot in pending:
+                    if stop.is_set():
+                        return
+                    if self.governor.halted:
+                        self.on_event(
+                            "run_halted_before_shot",
+                            {"shot_id": shot["shot_id"], "reason": self.governor.halted_reason},
+                        )
+                        return
+                    handoff = self._run_panel_stage(shot, self.shots[shot["shot_id"]])
+                    if handoff is not None:
+                        ready.put((shot, handoff))
+            except PipelineHalted as exc:
+                self.on_event(
+                    "run_halted",
+                    {
+                        "shot_id": shot["shot_id"],
+                        "reason": str(exc),
+                        "kind": type(exc).__name__,
+                        "stage": "panel",
+                    },
+                )
+            except BaseException as exc:
+                panel_error.append(exc)
+            finally:
+                ready.put(None)
+
+        panel_thread = threading.Thread(
+            target=_panel_stage, name="panel-stage", daemon=True
+        )
+        panel_thread.start()
+        try:
+            while True:
+                item = ready.get()
+                if item is None:
+                    break
+                shot, handoff = item
+                sid = shot["shot_id"]
+                if self.governor.halted:
+                    self.on_event(
+                        "run_halted_before_shot",
+                        {"shot_id": sid, "reason": self.governor.halted_reason},
+                    )
+                    break
+                self.on_event(
+                    "video_stage_start",
+                    {"shot_id": sid, "panels_ready": ready.qsize()},
+                )
+                try:
+                    self._run_video_stage(shot, self.shots[sid], handoff)
+                except PipelineHalted as exc:
+                    self.on_event(
+                        "run_halted",
+                        {"shot_id": sid, "reason": str(exc), "kind": type(exc).__name__},
+                    )
+                    break
+        finally:
+            stop.set()
+            panel_thread.join()
+        if panel_error:
+            raise panel_error[0]
+
+    def _run_shot_worker(self, shot: dict) -> None:
+        sid = shot["shot_id"]
+        try:
+            if self.governor.halted:
+                self.on_event(
+                    "run_halted_before_shot",
+                    {"shot_id": sid, "reason": self.governor.halted_reason},
+                )
+                return
+            self._run_one_shot(shot, self.shots[sid])
+        except PipelineHalted as exc:
+            self.on_event(
+                "run_halted",
+                {"shot_id": sid, "reason": str(exc), "kind": type(exc).__name__},
+            )
+        finally:
+            self._shot_done[sid].set()
+
+    def _predecessor(self, shot: dict) -> Optional[dict]:
+        """Manifest-order predecessor of ``shot`` (None for the first shot)."""
+        return self._predecessors.get(shot["shot_id"])
+
+    def _needs_prior_keyframe(self, shot: dict) -> bool:
+        """True if the video validator will score continuity for ``shot``.
+
+        The rubric only scores continuity across a same-location cut, and
+        only validators that consume ``prior_keyframe`` care at all.
+        """
+        prev = self._predecessor(shot)
+        if prev is None or not self.validator.uses_prior_keyframe:
+            return False
+        return prev.get("location") == shot.get("location")
+
+    def _wait_for_predecessor(self, shot: dict) -> None:
+        prev = self._predecessor(shot)
+        done = self._shot_done.get(prev["shot_id"]) if prev else None
+        if done is None or done.is_set():
+            return
+        self.on_event(
+            "shot_wait_predecessor",
+            {"shot_id": shot["shot_id"], "predecessor": prev["shot_id"]},
+        )
+        with self.tracer.span("predecessor.wait", shot_id=shot["shot_id"]):
+            done.wait()
+
     # ------------------------------------------------------------------
     # Per-shot inner loop
     # ------------------------------------------------------------------
@@ -1774,17 +2554,26 @@ class Orchestrator:
         has set ``state.panel_status == 'passed'``. The stitch gate runs
         once at the end of ``run_scene`` over all video-passed shots.
         """
+        handoff = self._run_panel_stage(shot, state)
+        if handoff is not None:
+            self._run_video_stage(shot, state, handoff)
+
+    def _run_panel_stage(self, shot: dict, state: ShotState) -> Optional[_PanelHandoff]:
+        """PANEL GATE for one shot; the handoff the video gate needs, or
+        None if the panel escalated (the shot is then escalated too)."""
         sid = shot["shot_id"]
         self.on_event("shot_start", {"shot_id": sid})
 
-        # Resolve references once per shot (cached on disk).
-        ref_download_dir = self.work_dir / "references"
-        char_refs, location_ref, start_frame = resolve_references(
-            shot,
-            references_dir=self.references_dir,
-            download_dir=ref_download_dir,
-            fetch_from_r2=self.fetch_references_from_r2,
-        )
+        # Resolve references once per shot. Downloads go through the shared
+        # asset cache, so this is normally all local after the prefetch.
+        with self.tracer.span("references.resolve", shot_id=sid):
+            char_refs, location_ref, start_frame = resolve_references(
+                shot,
+                references_dir=self.references_dir,
+                download_dir=self.reference_download_dir,
+                fetch_from_r2=self.fetch_references_from_r2,
+                cache=self.asset_cache,
+            )
 
         # ---------- PANEL GATE ----------
         if state.panel_status != "passed":
@@ -1807,21 +2596,54 @@ class Orchestrator:
                         "reason": state.escalation_reason,
                     },
                 )
-                return
+                return None
             # else: panel_status == "passed"; panel_path is the verified
             # storyboard panel to use as the video start frame.
         else:
             panel_path = (
                 Path(state.panel_path) if state.panel_path else None
             )
+        return _PanelHandoff(
+            char_refs=char_refs,
+            location_ref=location_ref,
+            start_frame=panel_path if panel_path is not None else start_frame,
+        )
+
+    def _run_video_stage(
+        self, shot: dict, state: ShotState, handoff: _PanelHandoff
+    ) -> None:
+        """VIDEO GATE for one shot whose panel gate has passed."""
+        if state.panel_status != "passed":
+            raise RuntimeError(
+                f"video gate reached for shot {shot['shot_id']!r} before its "
+                f"panel passed (panel_status={state.panel_status!r})"
+            )
+        sid = shot["shot_id"]
+        char_refs = handoff.char_refs
+        location_ref = handoff.location_ref
+        video_start_frame = handoff.start_frame
 
         # ---------- VIDEO GATE ----------
         # By construction we only reach here with a panel that PASSED the
         # panel gate (or, in legacy auto-pass mode, with the manifest's
         # existing panel). The orchestrator's only call site for video
         # generation is below; there is no other code path.
-        prior_keyframe = self._prior_keyframe(shot)
-        video_start_frame = panel_path if panel_path is not None else start_frame
+        if self._shot_done:
+            # Concurrent scheduler: block on the predecessor only when the
+            # continuity check needs its final clip; otherwise don't feed a
+            # timing-dependent keyframe to the validator at all.
+            if self._needs_prior_keyframe(shot):
+                self._wait_for_predecessor(shot)
+                prior_keyframe = self._prior_keyframe(shot)
+            else:
+                prior_keyframe = None
+        else:
+            prior_keyframe = self._prior_keyframe(shot)
+        if self.speculative_candidates > 1:
+            self._run_video_speculative(
+                shot, state, char_refs, location_ref, video_start_frame, prior_keyframe
+            )
+            return
 
         while True:
             attempt_idx = len(state.attempts)
@@ -1864,9 +2686,7 @@ class Orchestrator:
             )
             gen_action, gen_units = self.generator.cost_estimate(req)
             try:
-                self.governor.check_can_spend_strict(
-                    gen_action, gen_units, shot_id=sid
-                )
+                gen_hold = self.governor.reserve(gen_action, gen_units, shot_id=sid)
             except PipelineHalted:
                 # We've already registered an attempt above, so back it out
                 # of the shot's score history isn't possible — but the
@@ -1901,27 +2721,39 @@ class Orchestrator:
             val_units = 0.0
             outcome = ValidationOutcome(passed=False, score=0.0, reasons=[])
             try:
-                gen_result = self.generator.generate(req)
+                with self.tracer.span(
+                    "video.generate", cat="generate", shot_id=sid, attempt=attempt_idx
+                ):
+                    gen_result = self._jobs.run(self.generator, req)
                 spend_entry = self.governor.record_spend(
                     gen_result.cost_action,
                     gen_result.cost_units,
                     metadata={"shot_id": sid, "stage": "generate", **gen_result.metadata},
                     shot_id=sid,
+                    reservation=gen_hold,
                 )
                 gen_cost_usd = spend_entry.cost_usd
             except PipelineHalted:
+                self.governor.release(gen_hold)
                 raise
             except Exception as exc:
+                self.governor.release(gen_hold)
                 gen_error = f"generator: {exc}"
                 gen_result = None
 
-            # 4) Validate. Skip if generation failed.
-            if gen_result is not None:
+            # 4) Validate. Skip if generation failed; skip the paid
+            #    validator if the local pre-screen already rejected the clip.
+            rejected = (
+                self._prescreen("video", sid, gen_result.clip_path)
+                if gen_result is not None
+                else None
+            )
+            if rejected is not None:
+                outcome = rejected
+            elif gen_result is not None:
                 val_action, val_units = self.validator.cost_estimate()
                 try:
-                    self.governor.check_can_spend_strict(
-                        val_action, val_units, shot_id=sid
-                    )
+                    val_hold = self.governor.reserve(val_action, val_units, shot_id=sid)
                 except PipelineHalted:
                     state.attempts.append(
                         AttemptRecord(
@@ -1943,24 +2775,29 @@ class Orchestrator:
                     self._flush_state()
                     raise
                 try:
-                    outcome = self.validator.validate(
-                        shot=shot,
-                        media_path=gen_result.clip_path,
-                        character_refs=char_refs,
-                        location_ref=location_ref,
-                        prior_keyframe=prior_keyframe,
-                        work_dir=self.work_dir,
-                    )
+                    with self.tracer.span(
+                        "video.validate", cat="validate", shot_id=sid, attempt=attempt_idx
+                    ):
+                        outcome = self.validator.validate(
+                            shot=shot,
+                            media_path=gen_result.clip_path,
+                            character_refs=char_refs,
+                            location_ref=location_ref,
+                            prior_keyframe=prior_keyframe,
+                            work_dir=self.work_dir,
+                        )
                 except PipelineHalted:
+                    self.governor.release(val_hold)
                     raise
                 except Exception as exc:
+                    self.governor.release(val_hold)
                     gen_error = (gen_error + " | " if gen_error else "") + f"validator: {exc}"
                 else:
                     val_spend_entry = self.governor.record_spend(
-                        outcome.cost_action or val_action,
-                        outcome.cost_units or val_units,
-                        metadata={"shot_id": sid, "stage": "validate"},
+                        *_outcome_cost(outcome, val_action, val_units),
+                        metadata=_validate_metadata(sid, "validate", outcome),
                         shot_id=sid,
+                        reservation=val_hold,
                     )
                     val_cost_usd = val_spend_entry.cost_usd
 
@@ -2006,6 +2843,324 @@ class Orchestrator:
                 return
             # else: loop and let register_attempt enforce caps on the next pass.
 
+    def _run_video_speculative(
+        self,
+        shot: dict,
+        state: ShotState,
+        char_refs: dict[str, Path],
+        location_ref: Optional[Path],
+        video_start_frame: Optional[Path],
+        prior_keyframe: Optional[Path],
+    ) -> None:
+        """VIDEO GATE in speculative mode: race several candidates per round.
+
+        Each round launches up to ``speculative_candidates`` generations at
+        once (fewer when the retry caps or the budget leave less room), each
+        holding its own reservation, and validates them as they finish. The
+        first candidate to pass wins. Candidates still running are then
+        cancelled, or, when the backend cannot cancel them, abandoned and
+        billed once they finish. Candidates that finish after a winner are
+        billed but not validated. If no candidate passes, the best score
+        feeds the next round and the no-progress guard.
+        """
+        sid = shot["shot_id"]
+        video_gate_key = f"{sid}::video"
+        round_idx = sum(1 for a in state.attempts if a.candidate == 0)
+
+        while True:
+            base_idx = len(state.attempts)
+            round_started = _utcnow_iso()
+
+            # 1) Retry caps: the round's first candidate goes through the
+            #    normal guard (and escalates the shot when exhausted); the
+            #    rest only run if the caps still have room for them.
+            try:
+                last_score = state.last_score if state.attempts else None
+                self.governor.register_attempt(video_gate_key, score=last_score)
+            except (RetryCapExceeded, NoProgress) as exc:
+                state.status = "escalated"
+                state.escalation_reason = str(exc)
+                self._flush_state()
+                self.on_event(
+                    "shot_escalated",
+                    {"shot_id": sid, "stage": "video", "reason": str(exc)},
+                )
+                return
+
+            prior_clip = next(
+                (Path(a.clip_path) for a in reversed(state.attempts) if a.clip_path),
+                None,
+            )
+
+            def _request(slot: int) -> GenerationRequest:
+                return GenerationRequest(
+                    shot=shot,
+                    attempt_index=base_idx + slot,
+                    prior_reasons=list(state.last_reasons),
+                    character_refs=char_refs,
+                    location_ref=location_ref,
+                    start_frame=video_start_frame,
+                    output_path=self._attempt_clip_path(sid, base_idx + slot),
+                    prior_clip=prior_clip,
+                )
+
+            # 2) Hold budget for every candidate before launching any.
+            gen_action, gen_units = self.generator.cost_estimate(_request(0))
+            wanted = 1 + min(
+                self.speculative_candidates - 1,
+                self.governor.attempts_remaining(video_gate_key),
+            )
+            try:
+                holds = self.governor.reserve_up_to(
+                    gen_action, gen_units, wanted, shot_id=sid
+                )
+            except PipelineHalted:
+                state.attempts.append(
+                    _blank_attempt(
+                        base_idx, round_started, gen_action, gen_units,
+                        error="budget_blocked_pre_generation", candidate=0,
+                    )
+                )
+                self._flush_state()
+                raise
+            extra = self.governor.register_extra_attempts(video_gate_key, len(holds) - 1)
+            for hold in holds[1 + extra:]:
+                self.governor.release(hold)
+            candidates = [
+                _Candidate(
+                    slot=slot,
+                    request=_request(slot),
+                    hold=hold,
+                    record=_blank_attempt(
+                        base_idx + slot, round_started, gen_action, gen_units,
+                        candidate=slot,
+                    ),
+                )
+                for slot, hold in enumerate(holds[: 1 + extra])
+            ]
+            self.on_event(
+                "speculation_round",
+                {
+                    "shot_id": sid,
+                    "round": round_idx,
+                    "candidates": len(candidates),
+                    "first_attempt": base_idx,
+                },
+            )
+
+            # 3) Launch, then validate in completion order.
+            racing: list[_Candidate] = []
+            for cand in candidates:
+                try:
+                    cand.started = time.perf_counter()
+                    cand.tracked = self._jobs.start(self.generator, cand.request)
+                except Exception as exc:
+                    self.governor.release(cand.hold)
+                    cand.record.error = f"generator: {exc}"
+                    continue
+                racing.append(cand)
+
+            winner: Optional[_Candidate] = None
+            stop_reason = "round aborted"
+            try:
+                while racing and winner is None:
+                    done = self._jobs.wait_any([c.tracked for c in racing])
+                    for cand in [c for c in racing if c.tracked in done]:
+                        racing.remove(cand)
+                        passed = self._settle_candidate(
+                            cand,
+                            shot=shot,
+                            validate=winner is None,
+                            char_refs=char_refs,
+                            location_ref=location_ref,
+                            prior_keyframe=prior_keyframe,
+                        )
+                        if passed and winner is None:
+                            winner = cand
+                if winner is not None:
+                    stop_reason = f"candidate {winner.slot} passed first"
+            finally:
+                for cand in racing:
+                    self._stop_candidate(cand, sid, stop_reason)
+                for cand in candidates:
+                    state.attempts.append(cand.record)
+                    self.on_event(
+                        "attempt_recorded",
+                        {
+                            "shot_id": sid,
+                            "attempt": cand.record.index,
+                            "candidate": cand.slot,
+                            "passed": cand.record.passed,
+                            "score": cand.record.score,
+                            "gen_cost_usd": round(cand.record.gen_cost_usd, 4),
+                            "val_cost_usd": round(cand.record.val_cost_usd, 4),
+                            "reasons": cand.record.reasons[:3],
+                            "error": cand.record.error,
+                        },
+                    )
+                self._flush_state()
+
+            # 4) Decide the round.
+            if winner is not None:
+                rec = winner.record
+                state.last_reasons = list(rec.reasons)
+                state.last_score = rec.score
+                state.status = "approved"
+                state.final_clip = rec.clip_path
+                state.winner = _winner_summary(winner, candidates, round_idx)
+                self._flush_state()
+                self.on_event(
+                    "shot_approved",
+                    {
+                        "shot_id": sid,
+                        "attempts": len(state.attempts),
+                        "winner": state.winner,
+                    },
+                )
+                return
+            best = max((c.record for c in candidates), key=lambda r: r.score)
+            state.last_reasons = list(best.reasons)
+            state.last_score = best.score
+            self._flush_state()
+            round_idx += 1
+
+    def _settle_candidate(
+        self,
+        cand: _Candidate,
+        *,
+        shot: dict,
+        validate: bool,
+        char_refs: dict[str, Path],
+        location_ref: Optional[Path],
+        prior_keyframe: Optional[Path],
+    ) -> bool:
+        """Bill a finished candidate and (unless a winner exists) validate it.
+
+        Fills ``cand.record``; returns True if the candidate passed.
+        """
+        sid = shot["shot_id"]
+        rec = cand.record
+        self.tracer.record(
+            "video.generate", cand.started, cat="generate", shot_id=sid,
+            attempt=rec.index, candidate=cand.slot,
+        )
+        try:
+            if cand.tracked.error is not None:
+                raise cand.tracked.error
+            gen_result = self.generator.fetch(cand.tracked.job)
+            spend_entry = self.governor.record_spend(
+                gen_result.cost_action,
+                gen_result.cost_units,
+                metadata={
+                    "shot_id": sid,
+                    "stage": "generate",
+                    "candidate": cand.slot,
+                    **gen_result.metadata,
+                },
+                shot_id=sid,
+                reservation=cand.hold,
+            )
+        except PipelineHalted:
+            self.governor.release(cand.hold)
+            raise
+        except Exception as exc:
+            self.governor.release(cand.hold)
+            rec.error = f"generator: {exc}"
+            return False
+        rec.clip_path = str(gen_result.clip_path)
+        rec.gen_cost_action = gen_result.cost_action
+        rec.gen_cost_units = gen_result.cost_units
+        rec.gen_cost_usd = spend_entry.cost_usd
+        if not validate:
+            rec.error = "superseded: another candidate already passed"
+            return False
+
+        rejected = self._prescreen("video", sid, gen_result.clip_path)
+        if rejected is not None:
+            rec.reasons = list(rejected.reasons)
+            return False
+
+        val_action, val_units = self.validator.cost_estimate()
+        rec.val_cost_action = val_action
+        rec.val_cost_units = val_units
+        try:
+            val_hold = self.governor.reserve(val_action, val_units, shot_id=sid)
+        except PipelineHalted:
+            rec.error = "budget_blocked_pre_validation"
+            raise
+        try:
+            with self.tracer.span(
+                "video.validate", cat="validate", shot_id=sid, attempt=rec.index,
+                candidate=cand.slot,
+            ):
+                outcome = self.validator.validate(
+                    shot=shot,
+                    media_path=gen_result.clip_path,
+                    character_refs=char_refs,
+                    location_ref=location_ref,
+                    prior_keyframe=prior_keyframe,
+                    work_dir=self.work_dir,
+                )
+        except PipelineHalted:
+            self.governor.release(val_hold)
+            raise
+        except Exception as exc:
+            self.governor.release(val_hold)
+            rec.error = f"validator: {exc}"
+            return False
+        val_spend_entry = self.governor.record_spend(
+            *_outcome_cost(outcome, val_action, val_units),
+            metadata=_validate_metadata(sid, "validate", outcome),
+            shot_id=sid,
+            reservation=val_hold,
+        )
+        rec.val_cost_usd = val_spend_entry.cost_usd
+        rec.passed = outcome.passed
+        rec.score = outcome.score
+        rec.reasons = list(outcome.reasons)
+        return outcome.passed
+
+    def _stop_candidate(self, cand: _Candidate, sid: str, why: str) -> None:
+        """Cancel a candidate that lost the race, or bill it when it ends."""
+        if self._jobs.cancel(cand.tracked):
+            self.governor.release(cand.hold)
+            cand.record.error = f"cancelled: {why}"
+            self.on_event(
+                "candidate_cancelled", {"shot_id": sid, "candidate": cand.slot}
+            )
+            return
+        cand.record.error = f"abandoned: {why}; billed when it finishes"
+
+        def _settle(tracked: _TrackedJob) -> None:
+            try:
+                if tracked.error is not None:
+                    raise tracked.error
+                result = self.generator.fetch(tracked.job)
+                entry = self.governor.record_spend(
+                    result.cost_action,
+                    result.cost_units,
+                    metadata={
+                        "shot_id": sid,
+                        "stage": "generate_abandoned",
+                        "candidate": cand.slot,
+                        **result.metadata,
+                    },
+                    shot_id=sid,
+                    reservation=cand.hold,
+                )
+            except Exception:
+                self.governor.release(cand.hold)
+                return
+            with self._state_lock:
+                cand.record.clip_path = str(result.clip_path)
+                cand.record.gen_cost_usd = entry.cost_usd
+                self._flush_state()
+
+        self._jobs.abandon(cand.tracked, _settle)
+        self.on_event(
+            "candidate_abandoned", {"shot_id": sid, "candidate": cand.slot}
+        )
+
     # ------------------------------------------------------------------
     # Panel gate (PANEL GATE)
     # ------------------------------------------------------------------
@@ -2151,9 +3306,7 @@ class Orchestrator:
                 )
                 gen_action, gen_units = self.panel_generator.cost_estimate(preq)
                 try:
-                    self.governor.check_can_spend_strict(
-                        gen_action, gen_units, shot_id=sid
-                    )
+                    gen_hold = self.governor.reserve(gen_action, gen_units, shot_id=sid)
                 except PipelineHalted:
                     state.panel_attempts.append(
                         AttemptRecord(
@@ -2176,10 +3329,13 @@ class Orchestrator:
                     raise
 
                 try:
-                    gres = self.panel_generator.generate(preq)
+                    with self.tracer.span("panel.generate", cat="generate", shot_id=sid):
+                        gres = self.panel_generator.generate(preq)
                 except PipelineHalted:
+                    self.governor.release(gen_hold)
                     raise
                 except Exception as exc:
+                    self.governor.release(gen_hold)
                     gen_error = f"panel_generator: {exc}"
                     gres = None
 
@@ -2193,6 +3349,7 @@ class Orchestrator:
                             **gres.metadata,
                         },
                         shot_id=sid,
+                        reservation=gen_hold,
                     )
                     gen_cost_usd = spend_entry.cost_usd
                     panel_path_for_attempt = gres.panel_path
@@ -2204,11 +3361,20 @@ class Orchestrator:
             val_action, val_units = self.panel_validator.cost_estimate()
             val_cost_usd = 0.0
             outcome = ValidationOutcome(passed=False, score=0.0, reasons=[])
-            if panel_path_for_attempt is not None:
+            # Local, $0 verdicts first: the pre-screen, then the verdict of
+            # an already-graded near-duplicate of this panel.
+            local_outcome = (
+                self._prescreen("panel", sid, panel_path_for_attempt)
+                or self._reuse_panel_verdict(sid, panel_path_for_attempt)
+                if panel_path_for_attempt is not None
+                else None
+            )
+            if local_outcome is not None:
+                outcome = local_outcome
+                val_action, val_units = None, 0.0
+            elif panel_path_for_attempt is not None:
                 try:
-                    self.governor.check_can_spend_strict(
-                        val_action, val_units, shot_id=sid
-                    )
+                    val_hold = self.governor.reserve(val_action, val_units, shot_id=sid)
                 except PipelineHalted:
                     state.panel_attempts.append(
                         AttemptRecord(
@@ -2230,28 +3396,32 @@ class Orchestrator:
                     self._flush_state()
                     raise
                 try:
-                    outcome = self.panel_validator.validate(
-                        shot=shot,
-                        panel_path=panel_path_for_attempt,
-                        character_refs=char_refs,
-                        location_ref=location_ref,
-                        work_dir=self.work_dir,
-                    )
+                    with self.tracer.span("panel.validate", cat="validate", shot_id=sid):
+                        outcome = self.panel_validator.validate(
+                            shot=shot,
+                            panel_path=panel_path_for_attempt,
+                            character_refs=char_refs,
+                            location_ref=location_ref,
+                            work_dir=self.work_dir,
+                        )
                 except PipelineHalted:
+                    self.governor.release(val_hold)
                     raise
                 except Exception as exc:
+                    self.governor.release(val_hold)
                     gen_error = (
                         (gen_error + " | " if gen_error else "")
                         + f"panel_validator: {exc}"
                     )
                 else:
                     val_spend = self.governor.record_spend(
-                        outcome.cost_action or val_action,
-                        outcome.cost_units or val_units,
-                        metadata={"shot_id": sid, "stage": "panel_validate"},
+                        *_outcome_cost(outcome, val_action, val_units),
+                        metadata=_validate_metadata(sid, "panel_validate", outcome),
                         shot_id=sid,
+                        reservation=val_hold,
                     )
                     val_cost_usd = val_spend.cost_usd
+                    self._index_panel(sid, panel_path_for_attempt, outcome)
 
             # 4) Record the panel attempt.
             attempt = AttemptRecord(
@@ -2316,12 +3486,13 @@ class Orchestrator:
         approved_shots: list[str],
     ) -> StitchValidationOutcome:
         try:
-            outcome = self.stitch_validator.validate(
-                manifest=self.manifest,
-                stitched_path=stitched_path,
-                approved_shots=approved_shots,
-                work_dir=self.work_dir,
-            )
+            with self.tracer.span("stitch.validate", cat="validate"):
+                outcome = self.stitch_validator.validate(
+                    manifest=self.manifest,
+                    stitched_path=stitched_path,
+                    approved_shots=approved_shots,
+                    work_dir=self.work_dir,
+                )
         except Exception as exc:
             outcome = StitchValidationOutcome(
                 passed=False,
@@ -2342,6 +3513,85 @@ class Orchestrator:
     # Helpers
     # ------------------------------------------------------------------
 
+    def _prescreen(
+        self, stage: str, sid: str, media_path: Path
+    ) -> Optional[ValidationOutcome]:
+        """Run the local pre-screen on a panel or clip.
+
+        Returns a failing outcome (no validation spend) if the media is
+        obviously broken, or None if it may go on to the paid validator.
+        """
+        if self.prescreen is None:
+            return None
+        with self.tracer.span("prescreen", cat="validate", shot_id=sid, stage=stage):
+            if stage == "panel":
+                reasons = self.prescreen.screen_panel(media_path)
+            else:
+                reasons = self.prescreen.screen_clip(media_path, self.work_dir)
+        if not reasons:
+            return None
+        self.on_event(
+            "prescreen_rejected", {"shot_id": sid, "stage": stage, "reasons": reasons}
+        )
+        return ValidationOutcome(
+            passed=False, score=0.0, reasons=reasons, raw={"prescreen": True}
+        )
+
+    def _reuse_panel_verdict(
+        self, sid: str, panel_path: Path
+    ) -> Optional[ValidationOutcome]:
+        """The verdict of an already-graded near-duplicate of ``panel_path``
+        (same shot), to record at $0; None if there is none."""
+        if self.panel_index is None:
+            return None
+        try:
+            match = self.panel_index.graded_duplicate(panel_path, shot_id=sid)
+        except (ImportError, OSError, ValueError):
+            return None  # no Pillow / unreadable panel: validate normally
+        if match is None:
+            return None
+        distance, entry = match
+        self.on_event(
+            "panel_duplicate",
+            {
+                "shot_id": sid,
+                "panel_path": str(panel_path),
+                "duplicate_of": entry.path,
+                "distance": distance,
+                "passed": entry.passed,
+            },
+        )
+        reasons = list(entry.reasons or [])
+        if not entry.passed:
+            reasons.insert(
+                0,
+                f"duplicate: nearly identical to already-failed "
+                f"{Path(entry.path).name} ({distance}/64 bits differ); "
+                f"change the composition, not just the rendering",
+            )
+        return ValidationOutcome(
+            passed=bool(entry.passed),
+            score=entry.score or 0.0,
+            reasons=reasons,
+            raw={"duplicate_of": entry.path, "distance": distance},
+        )
+
+    def _index_panel(self, sid: str, panel_path: Path, outcome: ValidationOutcome) -> None:
+        """Record a paid panel verdict so near-duplicates can reuse it."""
+        if self.panel_index is None:
+            return
+        try:
+            self.panel_index.add(
+                panel_path,
+                kind="approved" if outcome.passed else "attempt",
+                shot_id=sid,
+                passed=outcome.passed,
+                score=outcome.score,
+                reasons=outcome.reasons,
+            )
+        except (ImportError, OSError, ValueError):
+            pass
+
     def _attempt_panel_path(self, shot_id: str, attempt_idx: int) -> Path:
         panels_dir = self.work_dir / "panels" / shot_id
         panels_dir.mkdir(parents=True, exist_ok=True)
@@ -2355,40 +3605,27 @@ class Orchestrator:
     def _prior_keyframe(self, shot: dict) -> Optional[Path]:
         """Last keyframe of the previous shot's final clip, if any.
 
-        We extract it lazily on demand from the approved clip of the
-        manifest-order predecessor."""
-        sid = shot["shot_id"]
-        prev_sid = None
-        for s in self.manifest:
-            if s["shot_id"] == sid:
-                break
-            prev_sid = s["shot_id"]
-        if prev_sid is None:
+        Served from the frame store: when the validator graded the
+        predecessor's approved clip it already stored that frame, so this
+        is normally a lookup, not an ffmpeg run."""
+        prev_shot = self._predecessor(shot)
+        if prev_shot is None:
             return None
-        prev = self.shots.get(prev_sid)
+        prev = self.shots.get(prev_shot["shot_id"])
         if not prev or not prev.final_clip:
             return None
-        out = self.work_dir / "prior-keyframes" / f"{prev_sid}-last.jpg"
-        if out.exists():
-            return out
-        out.parent.mkdir(parents=True, exist_ok=True)
         try:
-            subprocess.run(
-                [
-                    "ffmpeg", "-y", "-loglevel", "error",
-                    "-sseof", "-0.5",
-                    "-i", prev.final_clip,
-                    "-update", "1",
-                    "-q:v", "3",
-                    str(out),
-                ],
-                check=True,
-            )
-        except (subprocess.CalledProcessError, FileNotFoundError):
+            return _frame_store(self.work_dir).last_frame(Path(prev.final_clip))
+        except (subprocess.CalledProcessError, OSError, RuntimeError, ValueError):
             return None
-        return out if out.exists() else None
 
-    def _write_report(self, path: Path, *, stitched_path: Optional[Path]) -> None:
+    def _write_report(
+        self,
+        path: Path,
+        *,
+        stitched_path: Optional[Path],
+        trace_path: Optional[Path] = None,
+    ) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         lines: list[str] = []
         s = self.governor.summary()
@@ -2407,8 +3644,18 @@ class Orchestrator:
             f"`{self.panel_validator.name if self.panel_validator else '(none - legacy auto-pass)'}`"
         )
         lines.append(f"- Stitch validator: `{self.stitch_validator.name}`")
+        lines.append(
+            f"- Local pre-screen: "
+            f"`{self.prescreen.name if self.prescreen else '(off)'}`"
+        )
+        lines.append(
+            f"- Panel dedup index: "
+            f"`{self.panel_index.index_path if self.panel_index else '(off)'}`"
+        )
         lines.append(f"- Run state file: `{self.state_path}`")
         lines.append(f"- Governor state file: `{s.get('state_path','?')}`")
+        if trace_path is not None:
+            lines.append(f"- Trace (chrome://tracing / Perfetto): `{trace_path}`")
         lines.append("")
         lines.append("## Budget summary")
         lines.append("")
@@ -2425,6 +3672,21 @@ class Orchestrator:
             f"- Daily cap: **${s['daily_usd']:.2f}**  -  "
             f"spent today: **${s['daily_spent_usd']:.4f}**"
         )
+        if self.max_concurrent_shots > 1:
+            lines.append(
+                f"- Shot scheduler: concurrent, up to "
+                f"**{self.max_concurrent_shots}** shots in flight"
+            )
+        if self.pipeline_stages:
+            lines.append(
+                "- Shot scheduler: stage-pipelined (panel gates of later shots "
+                "overlap video gates of earlier ones)"
+            )
+        if self.speculative_candidates > 1:
+            lines.append(
+                f"- Video gate: speculative, up to "
+                f"**{self.speculative_candidates}** candidates per round"
+            )
         if s["halted"]:
             lines.append(f"- **HALTED**: {s['halted_reason']}")
         lines.append("")
@@ -2491,6 +3753,25 @@ class Orchestrator:
             )
         lines.append("")
 
+        winners = [
+            self.shots[shot["shot_id"]]
+            for shot in self.manifest
+            if self.shots[shot["shot_id"]].winner
+        ]
+        if winners:
+            lines.append("## Speculative winners")
+            lines.append("")
+            lines.append("| Shot | Attempt | Candidate | Round | Score | Why |")
+            lines.append("|------|---------|-----------|-------|-------|-----|")
+            for st in winners:
+                w = st.winner
+                lines.append(
+                    f"| {st.shot_id} | {w['attempt']} | "
+                    f"{w['candidate'] + 1} of {w['candidates']} | {w['round']} | "
+                    f"{w['score']:.2f} | {w['why']} |"
+                )
+            lines.append("")
+
         if escalated:
             lines.append("## Escalations (for human review)")
             lines.append("")
@@ -2521,6 +3802,24 @@ class Orchestrator:
             lines.append(f"- `{stitched_path}` (approved clips only)")
             lines.append("")
 
+        stages = self.tracer.stage_stats()
+        if stages:
+            lines.append("## Stage latency")
+            lines.append("")
+            lines.append(
+                "Wall-clock time per traced stage, slowest total first. "
+                "Concurrent spans overlap, so totals can exceed the run time."
+            )
+            lines.append("")
+            lines.append("| stage | calls | total s | p50 s | p95 s | max s |")
+            lines.append("|-------|-------|---------|-------|-------|-------|")
+            for name, st in stages.items():
+                lines.append(
+                    f"| {name} | {st['count']} | {st['total_s']:.2f} | "
+                    f"{st['p50_s']:.3f} | {st['p95_s']:.3f} | {st['max_s']:.3f} |"
+                )
+            lines.append("")
+
         lines.append("## Per-shot attempt log")
         lines.append("")
         for shot in self.manifest:
@@ -2563,8 +3862,9 @@ class Orchestrator:
                 for a in st.attempts:
                     err = a.error or ""
                     rstr = "; ".join(a.reasons[:2])
+                    idx = f"{a.index} (c{a.candidate})" if a.candidate is not None else a.index
                     lines.append(
-                        f"| {a.index} | {'yes' if a.passed else 'no'} | "
+                        f"| {idx} | {'yes' if a.passed else 'no'} | "
                         f"{a.score:.2f} | ${a.gen_cost_usd:.4f} | "
                         f"${a.val_cost_usd:.4f} | {err} | {rstr} |"
                     )
@@ -2580,6 +3880,96 @@ def _scene_slug_from_manifest(manifest_path: Path) -> str:
     return stem if stem.startswith("scene-") else f"scene-{stem}"
 
 
+def _blank_attempt(
+    index: int,
+    started_at: str,
+    gen_action: Optional[str],
+    gen_units: float,
+    *,
+    error: Optional[str] = None,
+    candidate: Optional[int] = None,
+) -> AttemptRecord:
+    """An attempt with no spend or verdict yet."""
+    return AttemptRecord(
+        index=index,
+        started_at=started_at,
+        clip_path=None,
+        gen_cost_action=gen_action,
+        gen_cost_units=gen_units,
+        gen_cost_usd=0.0,
+        val_cost_action=None,
+        val_cost_units=0.0,
+        val_cost_usd=0.0,
+        passed=False,
+        score=0.0,
+        reasons=[],
+        error=error,
+        candidate=candidate,
+    )
+
+
+def _winner_summary(
+    winner: _Candidate, candidates: list[_Candidate], round_idx: int
+) -> dict[str, Any]:
+    """Which speculative candidate won a shot, and why, for the report."""
+    fates: dict[str, int] = {}
+    for cand in candidates:
+        if cand is winner:
+            continue
+        err = cand.record.error or ""
+        fate = err.split(":", 1)[0] if err else "failed validation"
+        fates[fate] = fates.get(fate, 0) + 1
+    rec = winner.record
+    why = (
+        f"first of {len(candidates)} candidates to pass validation "
+        f"(score {rec.score:.2f})"
+    )
+    if fates:
+        why += "; others: " + ", ".join(f"{n} {fate}" for fate, n in sorted(fates.items()))
+    return {
+        "attempt": rec.index,
+        "candidate": winner.slot,
+        "round": round_idx,
+        "candidates": len(candidates),
+        "score": rec.score,
+        "why": why,
+        "validator_reasons": list(rec.reasons[:3]),
+    }
+
+
+def _outcome_cost(
+    outcome: ValidationOutcome, est_action: str, est_units: float
+) -> tuple[str, float]:
+    """Cost a validator reported, falling back to its pre-call estimate.
+
+    A validator that names its ``cost_action`` is trusted on units too, so
+    fully cached verdicts are recorded at $0 rather than at the estimate.
+    """
+    if outcome.cost_action:
+        return outcome.cost_action, outcome.cost_units
+    return est_action, outcome.cost_units or est_units
+
+
+def _validate_metadata(sid: str, stage: str, outcome: ValidationOutcome) -> dict:
+    meta: dict[str, Any] = {"shot_id": sid, "stage": stage}
+    if outcome.cache_hits:
+        meta["cache_hits"] = outcome.cache_hits
+    return meta
+
+
+def _serialized_events(
+    callback: Callable[[str, dict[str, Any]], None],
+) -> Callable[[str, dict[str, Any]], None]:
+    """Wrap an ``on_event`` callback so concurrent shots never interleave it."""
+    lock = threading.Lock()
+
+    def emit(name: str, data: dict[str, Any]) -> None:
+        with lock:
+            callback(name, data)
+
+    return emit
+
+
 def _utcnow_iso() -> str:
     return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
@@ -2613,7 +4003,12 @@ def _make_generator(name: str, args: argparse.Namespace) -> Generator:
 
 def _make_validator(name: str, args: argparse.Namespace) -> Validator:
     if name == "real":
-        return RealValidator(backend=args.validator_backend, model=args.validator_model)
+        return RealValidator(
+            backend=args.validator_backend,
+            model=args.validator_model,
+            use_cache=not args.no_cache,
+            batched=args.batch_validation,
+        )
     if name == "stub_pass":
         return StubValidator(
             script={
@@ -2639,7 +4034,9 @@ def _make_panel_validator(name: str, args: argparse.Namespace) -> Optional[Panel
         return None
     if name == "real":
         return RealPanelValidator(
-            backend=args.validator_backend, model=args.validator_model
+            backend=args.validator_backend,
+            model=args.validator_model,
+            use_cache=not args.no_cache,
         )
     if name == "stub_pass":
         return StubPanelValidator(
@@ -2668,6 +4065,16 @@ def cmd_run(args: argparse.Namespace) -> int:
     validator = _make_validator(args.validator, args)
     panel_generator = _make_panel_generator(args.panel_generator, args)
     panel_validator = _make_panel_validator(args.panel_validator, args)
+    # The pre-screen only earns its keep in front of paid validators.
+    paid_validation = isinstance(validator, RealValidator) or isinstance(
+        panel_validator, RealPanelValidator
+    )
+    prescreen = PreScreen() if paid_validation and not args.no_prescreen else None
+    panel_index = (
+        PanelIndex.for_dir(Path(args.work_dir))
+        if isinstance(panel_validator, RealPanelValidator) and not args.no_panel_dedup
+        else None
+    )
     orch = Orchestrator(
         manifest_path=Path(args.manifest),
         generator=generator,
@@ -2682,6 +4089,11 @@ def cmd_run(args: argparse.Namespace) -> int:
         stitch_on_complete=not args.no_stitch,
         panel_generator=panel_generator,
         panel_validator=panel_validator,
+        max_concurrent_shots=args.max_concurrent_shots,
+        speculative_candidates=args.speculative_candidates,
+        pipeline_stages=args.pipeline_stages,
+        prescreen=prescreen,
+        panel_index=panel_index,
     )
     report = orch.run_scene()
     governor.write_report()
@@ -2692,6 +4104,7 @@ def cmd_run(args: argparse.Namespace) -> int:
     print(f"  spent:     ${report.total_spent_usd:.4f} of ${governor.per_run_usd:.2f} cap")
     print(f"  estimate:  ${report.estimated_spend_usd:.4f}")
     print(f"  report:    {report.report_path}")
+    print(f"  trace:     {report.trace_path}")
     if report.stitched_path:
         print(f"  stitched:  {report.stitched_path}")
     if report.halted:
@@ -2850,6 +4263,31 @@ def build_parser() -> argparse.ArgumentParser:
                    help="Don't try to download references from R2.")
     r.add_argument("--no-stitch", action="store_true",
                    help="Skip the final ffmpeg stitch.")
+    r.add_argument("--no-cache", action="store_true",
+                   help="Re-grade every keyframe even if an identical verdict "
+                        "is cached under <work-dir>/validation-cache.")
+    r.add_argument("--batch-validation", action="store_true",
+                   help="Grade each clip's keyframes in one vision request "
+                        "(references sent once); charged by token usage.")
+    r.add_argument("--max-concurrent-shots", default=1, type=int,
+                   help="Run up to N shots at once (default 1 = serial). "
+                        "Budget caps stay exact; same-location shots still "
+                        "wait for their predecessor's final clip.")
+    r.add_argument("--pipeline-stages", action="store_true",
+                   help="Run later shots' panel gates while earlier shots are "
+                        "in their video gate (alternative to "
+                        "--max-concurrent-shots).")
+    r.add_argument("--speculative-candidates", default=1, type=int,
+                   help="Launch up to N video candidates per attempt round "
+                        "and keep the first that passes (default 1 = "
+                        "regenerate only on failure). Budget is reserved "
+                        "for every in-flight candidate.")
+    r.add_argument("--no-prescreen", action="store_true",
+                   help="Send every panel and clip to the paid validator, "
+                        "skipping the local black/static/aspect pre-screen.")
+    r.add_argument("--no-panel-dedup", action="store_true",
+                   help="Validate every regenerated panel, even a near-duplicate "
+                        "(by perceptual hash) of one already graded.")
     r.add_argument("--dry-run", action="store_true",
                    help="Pass through to the cost governor (still counts spend).")
     r.set_defaults(func=cmd_run)
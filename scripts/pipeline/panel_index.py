@@ -0,0 +1,278 @@
+"""Perceptual-hash index over storyboard panels.
+
+Regenerated panels often come back nearly identical to an attempt that
+was already graded, and validating them again costs a paid vision call.
+``PanelIndex`` keeps a 64-bit difference hash (dHash) per image, so:
+
+* ``graded_duplicate`` finds an already-graded attempt of the same shot
+  within ``max_distance`` bits; the orchestrator reuses its verdict
+  instead of paying for validation again.
+* ``nearest`` answers "which existing panel is closest to this one"
+  across every indexed attempt, approved panel and (via ``index_tree``)
+  the storyboards tree.
+
+dHash (grayscale 9x8 resize, one bit per horizontal gradient) is cheap,
+survives re-encoding and small resizes, and needs only Pillow. The index
+lives in ``<root>/panel-index.json``; entries are refreshed when a file's
+mtime or size changes.
+
+Usage::
+
+    python3 -m scripts.pipeline.panel_index nearest path/to/panel.png \\
+        --index footage/scene-01 --tree storyboards
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_MAX_DISTANCE = 4  # of 64 bits: same picture, different encode
+IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp")
+
+
+def dhash(path: Path, size: int = 8) -> int:
+    """64-bit difference hash of the image at ``path``. Needs Pillow."""
+    from PIL import Image
+
+    with Image.open(path) as img:
+        img.draft("L", (size * 8, size * 8))  # JPEG: decode at reduced size
+        small = img.convert("L").resize((size + 1, size), Image.LANCZOS)
+        pixels = list(small.getdata())
+    value = 0
+    for row in range(size):
+        offset = row * (size + 1)
+        for col in range(size):
+            value = (value << 1) | (pixels[offset + col] > pixels[offset + col + 1])
+    return value
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+@dataclass
+class IndexEntry:
+    path: str
+    hash: str  # 16 hex digits
+    mtime_ns: int
+    size: int
+    kind: str = "attempt"  # attempt | approved | storyboard
+    shot_id: Optional[str] = None
+    # Verdict of the panel validator, for graded attempts.
+    passed: Optional[bool] = None
+    score: Optional[float] = None
+    reasons: Optional[list[str]] = None
+
+    @property
+    def value(self) -> int:
+        return int(self.hash, 16)
+
+    @property
+    def graded(self) -> bool:
+        return self.passed is not None
+
+
+class PanelIndex:
+    """Persistent dHash index; thread-safe, shared per directory."""
+
+    _shared: dict[Path, "PanelIndex"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.index_path = self.root / "panel-index.json"
+        self._lock = threading.Lock()
+        self._entries: dict[str, IndexEntry] = self._load()
+
+    @classmethod
+    def for_dir(cls, root: Path) -> "PanelIndex":
+        """The process-wide index for ``root`` (created on first use)."""
+        key = Path(root).resolve()
+        with cls._shared_lock:
+            index = cls._shared.get(key)
+            if index is None:
+                index = cls._shared[key] = cls(key)
+            return index
+
+    # ------------------------------------------------------------------
+    # Indexing
+    # ------------------------------------------------------------------
+
+    def add(
+        self,
+        path: Path,
+        *,
+        kind: str = "attempt",
+        shot_id: Optional[str] = None,
+        passed: Optional[bool] = None,
+        score: Optional[float] = None,
+        reasons: Optional[list[str]] = None,
+        save: bool = True,
+    ) -> IndexEntry:
+        """Hash ``path`` (reusing the stored hash if the file is unchanged)
+        and record it with the given kind / verdict."""
+        entry = self._entry(Path(path))
+        entry.kind = kind
+        if shot_id is not None:
+            entry.shot_id = shot_id
+        if passed is not None:
+            entry.passed, entry.score = passed, score
+            entry.reasons = list(reasons or [])
+        with self._lock:
+            self._entries[entry.path] = entry
+        if save:
+            self.save()
+        return entry
+
+    def index_tree(self, tree: Path, *, kind: str = "storyboard") -> int:
+        """Index every image under ``tree``; returns how many were (re)hashed."""
+        hashed = 0
+        for path in sorted(Path(tree).rglob("*")):
+            if path.suffix.lower() not in IMAGE_SUFFIXES or not path.is_file():
+                continue
+            key = str(path.resolve())
+            st = path.stat()
+            with self._lock:
+                known = self._entries.get(key)
+            if known and (known.mtime_ns, known.size) == (st.st_mtime_ns, st.st_size):
+                continue
+            try:
+                self.add(path, kind=kind, save=False)
+            except (OSError, ValueError):
+                continue  # unreadable image: nothing to compare against
+            hashed += 1
+        self.save()
+        return hashed
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def nearest(
+        self,
+        path: Path,
+        *,
+        limit: int = 5,
+        max_distance: Optional[int] = None,
+        kinds: Optional[tuple[str, ...]] = None,
+    ) -> list[tuple[int, IndexEntry]]:
+        """Indexed images closest to ``path``: ``(distance, entry)`` pairs,
+        nearest first, excluding ``path`` itself."""
+        probe = self._entry(Path(path))
+        with self._lock:
+            candidates = [e for e in self._entries.values() if e.path != probe.path]
+        scored = [
+            (hamming(probe.value, e.value), e)
+            for e in candidates
+            if kinds is None or e.kind in kinds
+        ]
+        if max_distance is not None:
+            scored = [(d, e) for d, e in scored if d <= max_distance]
+        scored.sort(key=lambda pair: pair[0])
+        return scored[:limit]
+
+    def graded_duplicate(
+        self, path: Path, *, shot_id: str, max_distance: int = DEFAULT_MAX_DISTANCE
+    ) -> Optional[tuple[int, IndexEntry]]:
+        """The closest already-graded panel of ``shot_id`` within
+        ``max_distance`` bits of ``path``, or None."""
+        for distance, entry in self.nearest(
+            path, limit=len(self._entries) or 1, max_distance=max_distance
+        ):
+            if entry.graded and entry.shot_id == shot_id:
+                return distance, entry
+        return None
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _entry(self, path: Path) -> IndexEntry:
+        key = str(path.resolve())
+        st = path.stat()
+        with self._lock:
+            known = self._entries.get(key)
+        if known and (known.mtime_ns, known.size) == (st.st_mtime_ns, st.st_size):
+            return IndexEntry(**asdict(known))
+        return IndexEntry(
+            path=key,
+            hash=f"{dhash(path):016x}",
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            shot_id=known.shot_id if known else None,
+            kind=known.kind if known else "attempt",
+        )
+
+    def _load(self) -> dict[str, IndexEntry]:
+        try:
+            raw = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+        entries = {}
+        for fields in raw.get("entries") or []:
+            try:
+                entry = IndexEntry(**fields)
+            except TypeError:
+                continue
+            entries[entry.path] = entry
+        return entries
+
+    def save(self) -> None:
+        with self._lock:
+            payload = {"entries": [asdict(e) for e in self._entries.values()]}
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_name(
+                f"{self.index_path.name}.{threading.get_ident()}.tmp"
+            )
+            tmp.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+            os.replace(tmp, self.index_path)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def cmd_nearest(args: argparse.Namespace) -> int:
+    index = PanelIndex.for_dir(Path(args.index))
+    for tree in args.tree or []:
+        index.index_tree(Path(tree))
+    matches = index.nearest(
+        Path(args.image), limit=args.limit, max_distance=args.max_distance
+    )
+    for distance, entry in matches:
+        verdict = "" if not entry.graded else (" passed" if entry.passed else " failed")
+        shot = f" shot={entry.shot_id}" if entry.shot_id else ""
+        print(f"{distance:2d}  {entry.kind}{shot}{verdict}  {entry.path}")
+    return 0 if matches else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Perceptual-hash panel index.")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    n = sub.add_parser("nearest", help="List the indexed panels closest to an image.")
+    n.add_argument("image")
+    n.add_argument("--index", required=True,
+                   help="Directory holding panel-index.json (e.g. the run work dir).")
+    n.add_argument("--tree", action="append",
+                   help="Also index every image under this directory (repeatable).")
+    n.add_argument("--limit", type=int, default=5)
+    n.add_argument("--max-distance", type=int, default=None,
+                   help="Only show matches within this many bits (of 64).")
+    n.set_defaults(func=cmd_nearest)
+    return p
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+"""Unit tests for ``scripts.pipeline.asset_cache``.
+
+Run with::
+
+    python3 -m pytest scripts/pipeline/test_asset_cache.py -v
+
+A local keep-alive HTTP server stands in for R2, so no network is used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scripts.pipeline.asset_cache import AssetCache, AssetUnavailable
+
+
+class _Server:
+    """Serves ``files`` with ETags and counts requests per path."""
+
+    def __init__(self) -> None:
+        self.files: dict[str, bytes] = {}
+        self.hits: dict[str, list[int]] = {}  # path -> statuses
+        self.peers: set[int] = set()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):  # keep pytest output quiet
+                pass
+
+            def do_GET(self):
+                server.peers.add(self.client_address[1])
+                body = server.files.get(self.path)
+                if body is None:
+                    status, payload, headers = 404, b"missing", {}
+                else:
+                    etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+                    headers = {"ETag": etag}
+                    if self.headers.get("If-None-Match") == etag:
+                        status, payload = 304, b""
+                    else:
+                        status, payload = 200, body
+                server.hits.setdefault(self.path, []).append(status)
+                self.send_response(status)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    srv = _Server()
+    yield srv
+    srv.stop()
+
+
+def test_revalidates_with_etag_and_picks_up_changes(server, tmp_path):
+    server.files["/ref.png"] = b"v1"
+    cache = AssetCache(tmp_path, fresh_for_s=0)
+    dest = tmp_path / "characters" / "ref.png"
+
+    cache.fetch(f"{server.base}/ref.png", dest)
+    assert dest.read_bytes() == b"v1"
+    cache.fetch(f"{server.base}/ref.png", dest)
+    assert server.hits["/ref.png"] == [200, 304]
+
+    server.files["/ref.png"] = b"v2"
+    cache.fetch(f"{server.base}/ref.png", dest)
+    assert dest.read_bytes() == b"v2"
+    # Validators survive a restart via the on-disk index.
+    AssetCache(tmp_path, fresh_for_s=0).fetch(f"{server.base}/ref.png", dest)
+    assert server.hits["/ref.png"] == [200, 304, 200, 304]
+    cache.close()
+
+
+def test_fresh_copy_is_served_without_a_request(server, tmp_path):
+    server.files["/ref.png"] = b"v1"
+    cache = AssetCache(tmp_path, fresh_for_s=3600)
+    dest = tmp_path / "ref.png"
+    for _ in range(3):
+        cache.fetch(f"{server.base}/ref.png", dest)
+    assert server.hits["/ref.png"] == [200]
+
+
+def test_failures_are_negatively_cached(server, tmp_path):
+    cache = AssetCache(tmp_path, negative_ttl_s=3600)
+    dest = tmp_path / "gone.png"
+    for _ in range(3):
+        with pytest.raises(AssetUnavailable):
+            cache.fetch(f"{server.base}/gone.png", dest)
+    assert server.hits["/gone.png"] == [404]
+
+    expired = AssetCache(tmp_path, negative_ttl_s=0)
+    server.files["/gone.png"] = b"back"
+    assert expired.fetch(f"{server.base}/gone.png", dest).read_bytes() == b"back"
+
+
+def test_prefetch_reuses_pooled_connections(server, tmp_path):
+    for i in range(6):
+        server.files[f"/{i}.png"] = bytes([i])
+    cache = AssetCache(tmp_path)
+    items = [(f"{server.base}/{i}.png", tmp_path / f"{i}.png") for i in range(6)]
+    items.append((f"{server.base}/missing.png", tmp_path / "missing.png"))
+
+    errors = cache.prefetch(items, max_workers=2)
+    assert [url for url, err in errors.items() if err] == [f"{server.base}/missing.png"]
+    assert all((tmp_path / f"{i}.png").read_bytes() == bytes([i]) for i in range(6))
+    # Two workers, keep-alive: at most two TCP connections for 7 requests.
+    assert len(server.peers) <= 2
+    cache.close()
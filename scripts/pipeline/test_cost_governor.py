@@ -151,6 +151,61 @@ def test_record_spend_also_enforces_caps(tmp_path):
         gov.record_spend("gemini_image", 5)  # 5 * 0.04 = 0.20 > 0.05
 
 
+# ---------------------------------------------------------------------------
+# Reservations (concurrent in-flight calls)
+# ---------------------------------------------------------------------------
+
+
+def test_reservation_counts_against_cap_until_released(tmp_path):
+    gov = _make_gov(tmp_path, per_run_usd=0.50)
+    held = gov.reserve("gemini_image", 10)  # $0.40 in flight
+    assert gov.reserved_usd == pytest.approx(0.40)
+    assert gov.total_spent_usd == 0.0
+    with pytest.raises(BudgetExceeded):
+        gov.reserve("gemini_image", 5)  # 0.40 held + 0.20 > 0.50
+    gov.reset_halt()
+    gov.release(held)
+    assert gov.reserved_usd == 0.0
+    gov.check_can_spend_strict("gemini_image", 5)
+
+
+def test_reserve_up_to_takes_only_what_fits(tmp_path):
+    gov = _make_gov(tmp_path, per_run_usd=0.50)
+    holds = gov.reserve_up_to("gemini_image", 5, 4)  # $0.20 each
+    assert len(holds) == 2
+    assert gov.reserved_usd == pytest.approx(0.40)
+    assert not gov.halted  # running out of room for extras is not a halt
+    with pytest.raises(BudgetExceeded):
+        gov.reserve_up_to("gemini_image", 5, 4)
+    assert gov.reserved_usd == pytest.approx(0.40)
+
+
+def test_reserve_up_to_respects_the_daily_cap(tmp_path):
+    """Holds taken earlier in the same call count against the daily cap."""
+    gov = _make_gov(tmp_path, per_run_usd=10.0, daily_usd=1.0)
+    holds = gov.reserve_up_to("veo3_seconds", 1, 5)  # $0.40 each
+    assert len(holds) == 2
+    assert gov.reserved_usd == pytest.approx(0.80)
+    with pytest.raises(BudgetExceeded):
+        gov.reserve("veo3_seconds", 1)
+
+
+def test_committed_reservation_is_recorded_even_after_halt(tmp_path):
+    """Money authorized before another caller halted the governor was
+    really spent, so it must still reach the ledger."""
+    gov = _make_gov(tmp_path, per_run_usd=0.50)
+    held = gov.reserve("gemini_image", 10)
+    with pytest.raises(BudgetExceeded):
+        gov.check_can_spend_strict("gemini_image", 5)
+    assert gov.halted
+    entry = gov.record_spend("gemini_image", 10, reservation=held)
+    assert entry.cost_usd == pytest.approx(0.40)
+    assert gov.reserved_usd == 0.0
+    assert gov.total_spent_usd == pytest.approx(0.40)
+    with pytest.raises(PipelineHalted):
+        gov.record_spend("gemini_image", 1)
+
+
 # ---------------------------------------------------------------------------
 # Daily cap (shared across runs via the daily-spend file)
 # ---------------------------------------------------------------------------
@@ -181,6 +236,93 @@ def test_daily_cap_shared_across_runs(tmp_path):
         gov2.check_can_spend_strict("gemini_image", 5)
 
 
+def test_reservations_are_shared_across_runs(tmp_path):
+    """A hold taken by one run counts against every run's daily cap until it
+    is committed or released."""
+    daily = tmp_path / "shared_daily.json"
+    govs = [
+        _make_gov(
+            tmp_path,
+            run_id=rid,
+            per_run_usd=1000.0,
+            daily_usd=0.50,
+            state_dir=tmp_path / rid,
+            daily_state_path=daily,
+        )
+        for rid in ("runA", "runB")
+    ]
+    held = govs[0].reserve("gemini_image", 10)  # $0.40 in flight
+    assert govs[1].daily_reserved_usd() == pytest.approx(0.40)
+    with pytest.raises(BudgetExceeded):
+        govs[1].reserve("gemini_image", 5)
+    govs[1].reset_halt()
+    govs[0].release(held)
+    held_b = govs[1].reserve("gemini_image", 5)
+    govs[1].record_spend("gemini_image", 5, reservation=held_b)
+    assert govs[0].daily_reserved_usd() == 0.0
+    assert govs[0].summary()["daily_spent_usd"] == pytest.approx(0.20)
+
+
+def test_hold_of_dead_process_is_ignored(tmp_path):
+    import subprocess
+    import sys
+
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    daily = tmp_path / "daily.json"
+    daily.write_text(json.dumps({
+        "_holds": {"stale": {"run_id": "gone", "pid": proc.pid,
+                             "cost_usd": 100.0, "created": 0.0}},
+    }))
+    gov = _make_gov(tmp_path, daily_usd=1.0, daily_state_path=daily)
+    assert gov.daily_reserved_usd() == 0.0
+    gov.check_can_spend_strict("gemini_image", 1)
+
+
+def _spend_until_blocked(state_dir: str, daily: str, stop: str) -> None:
+    gov = CostGovernor(
+        run_id=Path(state_dir).name,
+        per_run_usd=1000.0,
+        daily_usd=1.00,
+        state_dir=state_dir,
+        daily_state_path=daily,
+        kill_switch_path=stop,
+        dry_run=False,
+    )
+    while True:
+        try:
+            held = gov.reserve("gemini_image", 1)
+        except BudgetExceeded:
+            return
+        gov.record_spend("gemini_image", 1, reservation=held)
+
+
+def test_concurrent_processes_share_daily_cap_exactly(tmp_path):
+    import multiprocessing
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("needs fork")
+    ctx = multiprocessing.get_context("fork")
+    daily = tmp_path / "daily.json"
+    procs = [
+        ctx.Process(
+            target=_spend_until_blocked,
+            args=(str(tmp_path / f"run{i}"), str(daily), str(tmp_path / "STOP")),
+        )
+        for i in range(4)
+    ]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(timeout=60)
+        assert p.exitcode == 0
+    # 25 images at $0.04 fill the $1.00 cap exactly; never one more.
+    today = json.loads(daily.read_text())
+    spent = sum(v for k, v in today.items() if not k.startswith("_"))
+    assert spent == pytest.approx(1.00)
+    assert "_holds" not in today
+
+
 # ---------------------------------------------------------------------------
 # Retry / no-progress
 # ---------------------------------------------------------------------------
@@ -194,6 +336,17 @@ def test_per_shot_retry_cap(tmp_path):
         gov.register_attempt("shotX", score=None)
 
 
+def test_extra_attempts_never_escalate(tmp_path):
+    gov = _make_gov(tmp_path, per_shot_attempts=3)
+    gov.register_attempt("shotX", score=None)
+    assert gov.attempts_remaining("shotX") == 2
+    assert gov.register_extra_attempts("shotX", 5) == 2
+    assert gov.register_extra_attempts("shotX", 1) == 0
+    assert not gov.shots["shotX"].escalated
+    with pytest.raises(RetryCapExceeded):
+        gov.register_attempt("shotX", score=None)
+
+
 def test_per_run_attempt_cap(tmp_path):
     gov = _make_gov(tmp_path, per_shot_attempts=100, per_run_attempts=4)
     gov.register_attempt("a")
@@ -301,11 +454,11 @@ def test_ledger_survives_simulated_crash(tmp_path):
     gov.record_spend("veo3_fast_seconds", 4, shot_id="shot_a")  # $0.60
     gov.register_attempt("shot_a", score=0.5)
 
-    state_path = gov.state_path
-    assert state_path.exists()
-    saved = json.loads(state_path.read_text())
-    assert len(saved["ledger"]) == 2
-    assert saved["shots"]["shot_a"]["attempts"] == 1
+    assert gov.state_path.exists()
+    # Each record hit the journal the moment it was made.
+    events = [json.loads(line) for line in gov.journal_path.read_text().splitlines()]
+    assert [e["type"] for e in events] == ["spend", "spend", "shot"]
+    assert events[2]["shot"]["attempts"] == 1
 
     # Simulate crash: drop the in-memory governor, build a new one with
     # the same paths.
@@ -329,6 +482,34 @@ def test_halted_state_survives_crash(tmp_path):
         gov2.record_spend("gemini_image", 1)
 
 
+def test_compaction_folds_journal_into_snapshot(tmp_path):
+    gov = _make_gov(tmp_path, run_id="compact", compact_every=3)
+    for _ in range(4):
+        gov.record_spend("gemini_image", 1)
+    # The third event triggered a compaction; only the fourth is journaled.
+    assert len(json.loads(gov.state_path.read_text())["ledger"]) == 3
+    assert len(gov.journal_path.read_text().splitlines()) == 1
+
+    gov2 = _make_gov(tmp_path, run_id="compact", compact_every=3)
+    assert len(gov2.ledger) == 4
+    assert gov2.total_spent_usd == pytest.approx(0.16)
+
+
+def test_replay_skips_events_already_in_snapshot(tmp_path):
+    """A crash between the snapshot rename and the journal truncate must not
+    double-count, and a torn final journal line is ignored."""
+    gov = _make_gov(tmp_path, run_id="torn")
+    gov.record_spend("gemini_image", 1)
+    gov.record_spend("gemini_image", 1)
+    journal = gov.journal_path.read_text()
+    gov._compact()
+    gov.journal_path.write_text(journal + '{"seq": 3, "type": "sp')
+
+    gov2 = _make_gov(tmp_path, run_id="torn")
+    assert len(gov2.ledger) == 2
+    assert gov2.total_spent_usd == pytest.approx(0.08)
+
+
 # ---------------------------------------------------------------------------
 # Reporting
 # ---------------------------------------------------------------------------
@@ -15,6 +15,16 @@ These tests prove the loop logic with ZERO paid API calls:
   * the STOP kill switch halts the run at the next check
   * stitching: only approved clips are concatenated, escalated clips
     are excluded
+  * concurrent shots: overlap in flight, never overshoot the budget cap,
+    and same-location shots still wait for their predecessor
+  * submit/poll generators: every shot's remote job is in flight at once
+    and all of them are polled from one driver loop, which survives a
+    raising completion callback
+  * cached validation verdicts are recorded in the ledger at $0, and
+    batched validation is charged from its reported token usage
+  * every run writes a Chrome trace and a per-stage latency table
+  * the local pre-screen rejects broken media at $0 before the paid
+    validator and feeds its reasons into the next attempt
 
 Run with::
 
@@ -23,8 +33,12 @@ Run with::
 
 from __future__ import annotations
 
+import hashlib
 import json
 import subprocess
+import sys
+import threading
+import types
 from pathlib import Path
 
 import pytest
@@ -32,13 +46,23 @@ import pytest
 from scripts.pipeline.cost_governor import CostGovernor
 from scripts.pipeline.orchestrator import (
     ExistingClipsGenerator,
+    GeminiPanelGenerator,
+    GenerationJob,
+    Generator,
+    GenerationResult,
+    JobDriver,
     Orchestrator,
+    RealValidator,
     StubGenerator,
     StubPanelGenerator,
     StubPanelValidator,
     StubStitchValidator,
     StubValidator,
     StitchValidationOutcome,
+    ValidationOutcome,
+    PanelGenerationRequest,
+    PreScreen,
+    Validator,
     stitch_clips,
 )
 
@@ -64,11 +88,13 @@ def _make_clip(path: Path, *, color: str = "black", seconds: float = 0.5) -> Pat
     return path
 
 
-def _make_manifest(path: Path, shot_ids: list[str]) -> Path:
+def _make_manifest(
+    path: Path, shot_ids: list[str], *, locations: dict[str, str] | None = None
+) -> Path:
     manifest = [
         {
             "shot_id": sid,
-            "location": "test_room",
+            "location": (locations or {}).get(sid, "test_room"),
             "characters": [],
             "wardrobe": {},
             "key_props": ["nothing"],
@@ -115,6 +141,8 @@ def _make_orch(
     governor: CostGovernor,
     label: str = "Test Scene",
     stitch: bool = True,
+    max_concurrent_shots: int = 1,
+    speculative_candidates: int = 1,
 ) -> Orchestrator:
     return Orchestrator(
         manifest_path=manifest_path,
@@ -127,6 +155,8 @@ def _make_orch(
         report_dir=tmp_path / "reports",
         fetch_references_from_r2=False,
         stitch_on_complete=stitch,
+        max_concurrent_shots=max_concurrent_shots,
+        speculative_candidates=speculative_candidates,
     )
 
 
@@ -934,3 +964,720 @@ def test_stitch_gate_reported_in_run_report(tmp_path):
     text = report.report_path.read_text()
     assert "Stitch gate" in text
     assert "FAIL" in text
+
+
+def _install_fake_genai(monkeypatch) -> list[tuple[bytes, str]]:
+    """Stand-in ``google.genai`` module; returns the list of uploaded parts."""
+    uploaded: list[tuple[bytes, str]] = []
+    fake_types = types.SimpleNamespace(
+        Part=types.SimpleNamespace(
+            from_bytes=lambda data, mime_type: uploaded.append((data, mime_type))
+        )
+    )
+    genai = types.ModuleType("google.genai")
+    genai.types = fake_types
+    google = types.ModuleType("google")
+    google.genai = genai
+    monkeypatch.setitem(sys.modules, "google", google)
+    monkeypatch.setitem(sys.modules, "google.genai", genai)
+    return uploaded
+
+
+def _panel_response(data: bytes = b"PNG"):
+    image_part = types.SimpleNamespace(inline_data=types.SimpleNamespace(data=data))
+    return types.SimpleNamespace(
+        candidates=[types.SimpleNamespace(content=types.SimpleNamespace(parts=[image_part]))]
+    )
+
+
+def test_gemini_panel_references_use_shared_image_prep(tmp_path, monkeypatch):
+    """Conditioning images go through the validator's image preparation:
+    the media type comes from the bytes, not the file extension."""
+    uploaded = _install_fake_genai(monkeypatch)
+
+    # JPEG bytes behind a .png name (the case the old extension guess got wrong).
+    ref = tmp_path / "mia_turnaround_APPROVED.png"
+    ref.write_bytes(b"\xff\xd8\xff" + b"not really decodable")
+    response = _panel_response()
+    gen = GeminiPanelGenerator()
+    gen._client = types.SimpleNamespace(
+        models=types.SimpleNamespace(generate_content=lambda **kw: response)
+    )
+    result = gen.generate(
+        PanelGenerationRequest(
+            shot={"shot_id": "a"},
+            attempt_index=1,
+            prior_reasons=[],
+            character_refs={"Mia": ref},
+            location_ref=None,
+            output_path=tmp_path / "out.png",
+            existing_panel=None,
+        )
+    )
+    assert [mime for _data, mime in uploaded] == ["image/jpeg"]
+    assert result.metadata["reference_bytes"] == len(uploaded[0][0])
+    assert result.panel_path.read_bytes() == b"PNG"
+
+
+def test_gemini_panel_throttle_pauses_the_shared_limiter(tmp_path, monkeypatch):
+    """A 429 on panel generation halves the model's shared rate and waits
+    out the server's retryDelay once, instead of a private 8-90s backoff."""
+    from scripts.validate import rate_limit
+    from scripts.validate import shot_validator as sv
+
+    _install_fake_genai(monkeypatch)
+    now = [100.0]
+    slept: list[float] = []
+
+    def fake_sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(sv.time, "sleep", fake_sleep)
+    limiter = rate_limit.AdaptiveRateLimiter(2.0, clock=lambda: now[0])
+    monkeypatch.setitem(rate_limit._limiters, ("gemini", "panel-model"), limiter)
+
+    class QuotaError(Exception):
+        code = 429
+
+    replies = [
+        QuotaError("429 RESOURCE_EXHAUSTED. {'retryDelay': '7s'}"),
+        _panel_response(),
+    ]
+
+    def generate_content(**kw):
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    gen = GeminiPanelGenerator(model="panel-model")
+    gen._client = types.SimpleNamespace(
+        models=types.SimpleNamespace(generate_content=generate_content)
+    )
+    result = gen.generate(
+        PanelGenerationRequest(
+            shot={"shot_id": "a"},
+            attempt_index=1,
+            prior_reasons=[],
+            character_refs={},
+            location_ref=None,
+            output_path=tmp_path / "out.png",
+            existing_panel=None,
+        )
+    )
+    assert result.panel_path.read_bytes() == b"PNG"
+    assert slept == [7.0]
+    assert limiter.throttles == 1
+    # Halved to 1.0/s, then one additive step for the success.
+    assert limiter.rate == pytest.approx(1.1)
+
+
+# ---------------------------------------------------------------------------
+# Concurrent shot scheduler
+# ---------------------------------------------------------------------------
+
+
+def _fake_clip(path: Path) -> Path:
+    """Placeholder clip bytes: stub generators only copy the file, and
+    these tests disable stitching, so no real MP4 is needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"not-really-an-mp4")
+    return path
+
+
+def test_concurrent_shots_are_in_flight_together(tmp_path):
+    """Different-location shots generate in parallel: a 2-party barrier in
+    the generator only releases if both shots are mid-generation at once."""
+    clip = _fake_clip(tmp_path / "stub.mp4")
+    manifest = _make_manifest(
+        tmp_path / "m.json", ["a", "b"], locations={"a": "kitchen", "b": "garage"}
+    )
+    barrier = threading.Barrier(2, timeout=10)
+    gen = StubGenerator(clip_path=clip, before_generate=lambda req: barrier.wait())
+    val = StubValidator(script={"a": [(1.0, True, [])], "b": [(1.0, True, [])]})
+    gov = _make_gov(tmp_path)
+    orch = _make_orch(
+        tmp_path,
+        manifest_path=manifest,
+        generator=gen,
+        validator=val,
+        governor=gov,
+        stitch=False,
+        max_concurrent_shots=2,
+    )
+    report = orch.run_scene()
+    assert report.approved == ["a", "b"]
+    assert not report.halted
+    # 2 shots x (0.24 generation + 0.05 validation).
+    assert report.total_spent_usd == pytest.approx(0.58)
+    assert "concurrent" in report.report_path.read_text()
+
+
+def test_concurrent_shots_never_overshoot_budget_cap(tmp_path):
+    """Four shots race for a budget that only covers two: in-flight
+    reservations keep the committed spend under the cap."""
+    clip = _fake_clip(tmp_path / "stub.mp4")
+    sids = ["a", "b", "c", "d"]
+    manifest = _make_manifest(
+        tmp_path / "m.json", sids, locations={sid: f"loc_{sid}" for sid in sids}
+    )
+    gen = StubGenerator(clip_path=clip)
+    val = StubValidator(script={sid: [(1.0, True, [])] for sid in sids})
+    gov = _make_gov(tmp_path, per_run_usd=0.60)
+    orch = _make_orch(
+        tmp_path,
+        manifest_path=manifest,
+        generator=gen,
+        validator=val,
+        governor=gov,
+        stitch=False,
+        max_concurrent_shots=4,
+    )
+    report = orch.run_scene()
+    assert report.halted
+    assert report.total_spent_usd <= 0.60 + 1e-9
+    assert gov.reserved_usd == 0.0
+    ledger = [e.as_dict() for e in gov.ledger]
+    assert sum(e["cost_usd"] for e in ledger) == pytest.approx(report.total_spent_usd)
+    # Shots the cap blocked stay pending so a later resume picks them up.
+    pending = [sid for sid in sids if orch.shots[sid].status == "pending"]
+    assert len(report.approved) + len(pending) == len(sids)
+
+
+def test_concurrent_same_location_shot_waits_for_predecessor(tmp_path):
+    """Continuity needs the predecessor's final clip, so a same-location
+    successor only starts its video gate after the predecessor resolves."""
+    clip = _fake_clip(tmp_path / "stub.mp4")
+    manifest = _make_manifest(tmp_path / "m.json", ["a", "b"])
+    order: list[str] = []
+    gen = StubGenerator(
+        clip_path=clip, before_generate=lambda req: order.append(req.shot["shot_id"])
+    )
+    val = StubValidator(
+        script={
+            "a": [(0.3, False, ["wrong pose"]), (0.9, True, [])],
+            "b": [(1.0, True, [])],
+        }
+    )
+    gov = _make_gov(tmp_path)
+    orch = _make_orch(
+        tmp_path,
+        manifest_path=manifest,
+        generator=gen,
+        validator=val,
+        governor=gov,
+        stitch=False,
+        max_concurrent_shots=2,
+    )
+    report = orch.run_scene()
+    assert report.approved == ["a", "b"]
+    assert order == ["a", "a", "b"]
+
+
+class _RemoteJobGenerator(Generator):
+    """Native submit/poll backend: a job finishes once every submitted job
+    has been polled at least once, proving they were all in flight."""
+
+    def __init__(self, clip: Path) -> None:
+        self.clip = clip
+        self.submitted: list[str] = []
+        self.poll_threads: set[str] = set()
+        self.default_cost = ("mitte_seedance_5s_shot", 1.0)
+
+    def generate(self, request):  # pragma: no cover - submit() is used
+        raise AssertionError("orchestrator must use submit/poll/fetch")
+
+    def submit(self, request):
+        self.submitted.append(request.shot["shot_id"])
+        return GenerationJob(request=request, handle={"polls": 0}, poll_interval_s=0.01)
+
+    def poll(self, job):
+        self.poll_threads.add(threading.current_thread().name)
+        job.handle["polls"] += 1
+        return len(self.submitted) == 3 and job.handle["polls"] >= 2
+
+    def fetch(self, job):
+        job.request.output_path.parent.mkdir(parents=True, exist_ok=True)
+        job.request.output_path.write_bytes(self.clip.read_bytes())
+        return GenerationResult(
+            clip_path=job.request.output_path,
+            cost_action="mitte_seedance_5s_shot",
+            cost_units=1.0,
+        )
+
+
+def test_remote_jobs_are_driven_from_one_poll_loop(tmp_path):
+    clip = _fake_clip(tmp_path / "stub.mp4")
+    sids = ["a", "b", "c"]
+    manifest = _make_manifest(
+        tmp_path / "m.json", sids, locations={"a": "x", "b": "y", "c": "z"}
+    )
+    gen = _RemoteJobGenerator(clip)
+    orch = _make_orch(
+        tmp_path,
+        manifest_path=manifest,
+        generator=gen,
+        validator=StubValidator(script={sid: [(1.0, True, [])] for sid in sids}),
+        governor=_make_gov(tmp_path),
+        stitch=False,
+        max_concurrent_shots=3,
+    )
+    report = orch.run_scene()
+    assert sorted(report.approved) == sids
+    assert sorted(gen.submitted) == sids
+    assert gen.poll_threads == {"job-driver"}
+
+
+class _CountdownGenerator:
+    """Minimal submit/poll generator: each job finishes after ``polls`` polls."""
+
+    def submit(self, request):
+        return GenerationJob(request=request, handle={"left": request}, poll_interval_s=0.01)
+
+    def poll(self, job):
+        job.handle["left"] -= 1
+        return job.handle["left"] <= 0
+
+    def cancel(self, job):
+        return False
+
+
+def test_job_driver_survives_a_raising_on_done_callback(capsys):
+    driver = JobDriver()
+    gen = _CountdownGenerator()
+    abandoned = driver.start(gen, 2)
+    survivor = driver.start(gen, 6)
+
+    def boom(tracked):
+        raise RuntimeError("callback bug")
+
+    driver.abandon(abandoned, boom)
+    # Wait from a helper thread so a dead loop fails the test, not hangs it.
+    waiter = threading.Thread(
+        target=lambda: (driver.wait_any([survivor]), driver.drain()), daemon=True
+    )
+    waiter.start()
+    waiter.join(timeout=5)
+    assert not waiter.is_alive()
+    assert survivor.done and survivor.error is None
+    assert "callback bug" in capsys.readouterr().out
+
+    # The loop is still usable for later submissions.
+    late = driver.start(gen, 1)
+    waiter = threading.Thread(target=driver.wait_any, args=([late],), daemon=True)
+    waiter.start()
+    waiter.join(timeout=5)
+    assert late.done
+
+
+def test_pipelined_stages_overlap_panel_and_video_gates(tmp_path):
+    """Shot b's panel gate runs while shot a is in its video gate, and no
+    shot's video starts before its own panel passed."""
+    clip = _fake_clip(tmp_path / "stub.mp4")
+    panel = tmp_path / "panel.png"
+    panel.write_bytes(b"png")
+    manifest = _make_manifest(tmp_path / "m.json", ["a", "b"])
+    log: list[tuple[str, str]] = []
+    b_panel_passed = threading.Event()
+    overlapped: list[bool] = []
+
+    class _Panels(StubPanelValidator):
+        def validate(self, **kwargs):
+            out = super().validate(**kwargs)
+            sid = kwargs["shot"]["shot_id"]
+            log.append(("panel", sid))
+            if sid == "b":
+                b_panel_passed.set()
+            return out
+
+    def video_before(req):
+        sid = req.shot["shot_id"]
+        log.append(("video", sid))
+        if sid == "a":
+            overlapped.append(b_panel_passed.wait(timeout=5))
+
+    orch = Orchestrator(
+        manifest_path=manifest,
+        generator=StubGenerator(clip_path=clip, before_generate=video_before),
+        validator=StubValidator(script={"a": [(1.0, True, [])], "b": [(1.0, True, [])]}),
+        governor=_make_gov(tmp_path),
+        references_dir=tmp_path / "refs",
+        work_dir=tmp_path / "work",
+        report_dir=tmp_path / "reports",
+        fetch_references_from_r2=False,
+        stitch_on_complete=False,
+        panel_generator=StubPanelGenerator(panel_path=panel),
+        panel_validator=_Panels(script={"a": [(1.0, True, [])], "b": [(1.0, True, [])]}),
+        pipeline_stages=True,
+    )
+    report = orch.run_scene()
+    assert report.approved == ["a", "b"]
+    assert overlapped == [True]
+    for sid in ("a", "b"):
+        assert log.index(("panel", sid)) < log.index(("video", sid))
+
+
+def test_pipelined_stages_exclude_concurrent_shots(tmp_path):
+    clip = _fake_clip(tmp_path / "stub.mp4")
+    with pytest.raises(ValueError):
+        Orchestrator(
+            manifest_path=_make_manifest(tmp_path / "m.json", ["a"]),
+            generator=StubGenerator(clip_path=clip),
+            validator=StubValidator(script={"a": [(1.0, True, [])]}),
+            governor=_make_gov(tmp_path),
+            references_dir=tmp_path / "refs",
+            work_dir=tmp_path / "work",
+            report_dir=tmp_path / "reports",
+            max_concurrent_shots=2,
+            pipeline_stages=True,
+        )
+
+
+class _RacingGenerator(Generator):
+    """Speculative candidates: slot 1 finishes at once, slot 0 can be
+    cancelled, slot 2 cannot and only finishes after the race is decided."""
+
+    def __init__(self, clip: Path) -> None:
+        self.clip = clip
+        self.decided = threading.Event()
+        self.default_cost = ("mitte_seedance_5s_shot", 1.0)
+
+    def generate(self, request):  # pragma: no cover - submit() is used
+        raise AssertionError("orchestrator must use submit/poll/fetch")
+
+    def submit(self, request):
+        return GenerationJob(
+            request=request, handle=request.attempt_index, poll_interval_s=0.01
+        )
+
+    def poll(self, job):
+        if job.handle == 2:
+            return self.decided.is_set()
+        return job.handle == 1
+
+    def cancel(self, job):
+        self.decided.set()
+        return job.handle == 0
+
+    def fetch(self, job):
+        job.request.output_path.parent.mkdir(parents=True, exist_ok=True)
+        job.request.output_path.write_bytes(self.clip.read_bytes())
+        return GenerationResult(
+            clip_path=job.request.output_path,
+            cost_action="mitte_seedance_5s_shot",
+            cost_units=1.0,
+        )
+
+
+def test_speculative_candidates_first_pass_wins(tmp_path):
+    clip = _fake_clip(tmp_path / "stub.mp4")
+    manifest = _make_manifest(tmp_path / "m.json", ["a"])
+    gov = _make_gov(tmp_path)
+    orch = _make_orch(
+        tmp_path,
+        manifest_path=manifest,
+        generator=_RacingGenerator(clip),
+        validator=StubValidator(script={"a": [(0.9, True, ["looks right"])]}),
+        governor=gov,
+        stitch=False,
+        speculative_candidates=3,
+    )
+    report = orch.run_scene()
+    assert report.approved == ["a"]
+
+    st = orch.shots["a"]
+    assert st.winner["candidate"] == 1
+    assert st.winner["attempt"] == 1
+    assert st.final_clip.endswith("attempt-01.mp4")
+    by_slot = {a.candidate: a for a in st.attempts}
+    assert by_slot[0].error.startswith("cancelled")
+    assert by_slot[0].gen_cost_usd == 0.0
+    # The uncancellable candidate is billed once it finishes, not dropped.
+    assert by_slot[2].error.startswith("abandoned")
+    assert by_slot[2].gen_cost_usd > 0.0
+    assert gov.reserved_usd == 0.0
+    generate = [e for e in gov.ledger if e.metadata.get("stage", "").startswith("generate")]
+    assert len(generate) == 2
+    assert "Speculative winners" in report.report_path.read_text()
+
+
+# ---------------------------------------------------------------------------
+# Local pre-screen
+# ---------------------------------------------------------------------------
+
+
+class _RejectFirstClip(PreScreen):
+    """Rejects the first clip it sees, passes the rest."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.screened: list[Path] = []
+
+    def screen_clip(self, clip_path, work_dir):
+        self.screened.append(Path(clip_path))
+        return ["prescreen: frame is black or near-black"] if len(self.screened) == 1 else []
+
+
+def test_prescreen_rejects_at_zero_cost_and_feeds_reasons_forward(tmp_path):
+    clip = _fake_clip(tmp_path / "stub.mp4")
+    requests = []
+    val = StubValidator(script={"a": [(0.9, True, [])]})
+    orch = _make_orch(
+        tmp_path,
+        manifest_path=_make_manifest(tmp_path / "m.json", ["a"]),
+        generator=StubGenerator(clip_path=clip, before_generate=requests.append),
+        validator=val,
+        governor=_make_gov(tmp_path),
+        stitch=False,
+    )
+    orch.prescreen = _RejectFirstClip()
+    report = orch.run_scene()
+
+    assert report.approved == ["a"]
+    first, second = orch.shots["a"].attempts
+    assert not first.passed
+    assert first.val_cost_usd == 0.0 and first.val_cost_action is None
+    assert first.reasons == ["prescreen: frame is black or near-black"]
+    assert second.passed
+    # The paid validator only ever saw the clip that passed the pre-screen.
+    assert val._idx["a"] == 1
+    assert requests[1].prior_reasons == first.reasons
+    # 2 generations + 1 validation.
+    assert report.total_spent_usd == pytest.approx(0.24 * 2 + 0.05)
+    assert "Local pre-screen: `local_prescreen`" in report.report_path.read_text()
+
+
+def test_prescreen_flags_black_static_and_wrong_aspect_panels(tmp_path):
+    np = pytest.importorskip("numpy")
+    Image = pytest.importorskip("PIL.Image")
+
+    def panel(name, pixels):
+        path = tmp_path / f"{name}.png"
+        Image.fromarray(pixels.astype("uint8")).save(path)
+        return path
+
+    rng = np.random.default_rng(0)
+    ramp = np.linspace(30, 220, 640)[None, :, None].repeat(360, 0).repeat(3, 2)
+    screen = PreScreen()
+    assert screen.screen_panel(panel("ok", ramp + rng.integers(0, 8, ramp.shape))) == []
+    assert "prescreen: frame is black or near-black" in screen.screen_panel(
+        panel("black", np.zeros((360, 640, 3)))
+    )
+    assert "prescreen: frame is TV static / noise, not a picture" in screen.screen_panel(
+        panel("static", rng.integers(0, 256, (360, 640, 1)).repeat(3, 2))
+    )
+    assert "prescreen: aspect ratio is not 16:9" in screen.screen_panel(
+        panel("square", ramp[:, :360])
+    )
+
+
+def test_near_duplicate_panel_reuses_graded_verdict(tmp_path, monkeypatch):
+    from scripts.pipeline import panel_index
+
+    # Content hash in place of dHash: identical bytes are distance 0,
+    # anything else is far apart. Keeps the test free of Pillow.
+    monkeypatch.setattr(
+        panel_index, "dhash",
+        lambda path: int.from_bytes(hashlib.sha256(path.read_bytes()).digest()[:8], "big"),
+    )
+    (tmp_path / "panels").mkdir()
+    same = tmp_path / "panels" / "same.png"
+    same.write_bytes(b"panel-v1")
+    fixed = tmp_path / "panels" / "fixed.png"
+    fixed.write_bytes(b"panel-v2")
+    panel_val = StubPanelValidator(
+        script={"s1": [(0.4, False, ["off-model"]), (0.95, True, [])]}
+    )
+    orch = _make_orch_with_panel_gate(
+        tmp_path,
+        manifest_path=_make_manifest(tmp_path / "m.json", ["s1"]),
+        generator=StubGenerator(clip_path=_fake_clip(tmp_path / "stub.mp4")),
+        validator=StubValidator(script={"s1": [(0.9, True, [])]}),
+        panel_generator=StubPanelGenerator(per_shot_panels={"s1": [same, same, fixed]}),
+        panel_validator=panel_val,
+        governor=_make_gov(tmp_path),
+        stitch=False,
+    )
+    orch.panel_index = panel_index.PanelIndex.for_dir(tmp_path / "work")
+    events = []
+    orch.on_event = lambda kind, payload: events.append((kind, payload))
+    orch.run_scene()
+
+    first, dup, third = orch.shots["s1"].panel_attempts
+    assert not first.passed and first.val_cost_usd > 0
+    assert not dup.passed and dup.val_cost_usd == 0.0
+    assert dup.reasons[0].startswith("duplicate: nearly identical to already-failed")
+    assert dup.reasons[1:] == ["off-model"]
+    assert third.passed
+    # The paid validator never saw the duplicate.
+    assert panel_val._idx["s1"] == 2
+    assert [p["distance"] for k, p in events if k == "panel_duplicate"] == [0]
+    saved = json.loads((tmp_path / "work" / "panel-index.json").read_text())
+    assert sorted(e["kind"] for e in saved["entries"]) == ["approved", "attempt"]
+
+
+# ---------------------------------------------------------------------------
+# Tracing
+# ---------------------------------------------------------------------------
+
+
+def test_run_writes_trace_and_stage_latency(tmp_path):
+    clip = _fake_clip(tmp_path / "stub.mp4")
+    orch = _make_orch(
+        tmp_path,
+        manifest_path=_make_manifest(tmp_path / "m.json", ["a", "b"]),
+        generator=StubGenerator(clip_path=clip),
+        validator=StubValidator(
+            script={"a": [(0.3, False, ["drift"]), (0.9, True, [])], "b": [(0.9, True, [])]}
+        ),
+        governor=_make_gov(tmp_path),
+        stitch=False,
+    )
+    report = orch.run_scene()
+    assert report.approved == ["a", "b"]
+
+    trace = json.loads(report.trace_path.read_text())
+    spans = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    names = [e["name"] for e in spans]
+    for stage in ("video.generate", "generator.queue", "generator.run", "video.validate"):
+        assert names.count(stage) == 3, stage
+    # Sync-adapter generation runs on the pool, not the shot's thread.
+    run_tids = {e["tid"] for e in spans if e["name"] == "generator.run"}
+    shot_tids = {e["tid"] for e in spans if e["name"] == "video.validate"}
+    assert run_tids.isdisjoint(shot_tids)
+    assert {e["args"]["shot_id"] for e in spans if e["name"] == "video.generate"} == {"a", "b"}
+
+    text = report.report_path.read_text()
+    assert "## Stage latency" in text
+    assert "| video.generate | 3 |" in text
+    assert str(report.trace_path) in text
+
+
+# ---------------------------------------------------------------------------
+# Frame store (continuity frames)
+# ---------------------------------------------------------------------------
+
+
+def test_prior_keyframe_is_served_from_frame_store(tmp_path, monkeypatch):
+    """The predecessor's last keyframe, stored when its clip was graded, is
+    reused for continuity even via another path to the same bytes."""
+    from scripts.pipeline.orchestrator import _frame_store
+    from scripts.validate import shot_validator as sv
+
+    extracted: list[Path] = []
+
+    def fake_extract(clip, out_dir, count=3):
+        extracted.append(clip)
+        paths = []
+        for label in ("first", "mid", "last"):
+            p = out_dir / f"{clip.stem}-{label}.jpg"
+            p.write_bytes(label.encode())
+            paths.append(p)
+        return paths
+
+    def no_ffmpeg(*args, **kwargs):
+        raise AssertionError("continuity frame must not be re-extracted")
+
+    monkeypatch.setattr(sv, "extract_keyframes", fake_extract)
+    monkeypatch.setattr(sv, "_extract_with_ffmpeg", no_ffmpeg)
+
+    clip = _fake_clip(tmp_path / "work" / "clips" / "a" / "attempt-00.mp4")
+    orch = _make_orch(
+        tmp_path,
+        manifest_path=_make_manifest(tmp_path / "m.json", ["a", "b"]),
+        generator=StubGenerator(clip_path=clip),
+        validator=StubValidator(script={}),
+        governor=_make_gov(tmp_path),
+        stitch=False,
+    )
+    # What RealValidator does while grading shot a's clip.
+    store = _frame_store(orch.work_dir)
+    graded = store.keyframes(clip, 3)
+
+    final = tmp_path / "approved" / "a.mp4"
+    final.parent.mkdir()
+    final.write_bytes(clip.read_bytes())
+    orch.shots["a"].final_clip = str(final)
+
+    prior = orch._prior_keyframe(orch.manifest[1])
+    assert prior == graded[-1]
+    assert prior.read_bytes() == b"last"
+    assert orch._prior_keyframe(orch.manifest[0]) is None
+    assert store.keyframes(final, 3) == graded
+    assert extracted == [clip]
+
+
+# ---------------------------------------------------------------------------
+# Verdict cache accounting
+# ---------------------------------------------------------------------------
+
+
+class _FullyCachedValidator(Validator):
+    """Passes every shot as if all keyframes were served from the cache."""
+
+    def cost_estimate(self):
+        return ("anthropic_vision_call", 3.0)
+
+    def validate(self, **kwargs):
+        return ValidationOutcome(
+            passed=True,
+            score=1.0,
+            reasons=[],
+            cost_action="anthropic_vision_call",
+            cost_units=0.0,
+            cache_hits=3,
+        )
+
+
+def test_cached_validation_is_recorded_at_zero_cost(tmp_path):
+    """Zero reported units must be recorded as $0, not replaced by the
+    validator's pre-call estimate."""
+    clip = _fake_clip(tmp_path / "stub.mp4")
+    manifest = _make_manifest(tmp_path / "m.json", ["a"])
+    gov = _make_gov(tmp_path)
+    orch = _make_orch(
+        tmp_path,
+        manifest_path=manifest,
+        generator=StubGenerator(clip_path=clip),
+        validator=_FullyCachedValidator(),
+        governor=gov,
+        stitch=False,
+    )
+    report = orch.run_scene()
+    assert report.approved == ["a"]
+    ledger = [e.as_dict() for e in gov.ledger]
+    validate = [e for e in ledger if e["metadata"].get("stage") == "validate"]
+    assert len(validate) == 1
+    assert validate[0]["cost_usd"] == 0.0
+    assert validate[0]["metadata"]["cache_hits"] == 3
+    assert report.total_spent_usd == pytest.approx(0.24)
+
+
+def test_batched_validation_is_charged_from_token_usage():
+    """One batched request is priced from its tokens, and later estimates
+    budget against that instead of one call per keyframe."""
+    v = RealValidator(model="claude-sonnet-4-5", batched=True)
+    v._effective_model = v.model
+    assert v.cost_estimate() == ("anthropic_vision_call", 3.0)
+    # 10k in @ $3/M + 1k out @ $15/M = $0.045 = 0.9 vision calls.
+    units = v._batch_cost_units(
+        {"input_tokens": 10_000, "output_tokens": 1_000, "requests": 1}
+    )
+    assert units == pytest.approx(0.9)
+    assert v.cost_estimate()[1] == pytest.approx(0.9)
+    # A cached batch made no request and costs nothing.
+    assert v._batch_cost_units({"input_tokens": 0, "output_tokens": 0, "requests": 0}) == 0.0
+
+
+def test_batched_estimate_from_a_still_image_is_scaled_to_a_full_shot():
+    """A still image is graded as one keyframe; its request must not set the
+    per-shot budget as if a whole clip cost that little."""
+    v = RealValidator(model="claude-sonnet-4-5", batched=True, keyframes_per_shot=3)
+    v._effective_model = v.model
+    # $0.045 = 0.9 vision calls for the one keyframe actually sent.
+    units = v._batch_cost_units(
+        {"input_tokens": 10_000, "output_tokens": 1_000, "requests": 1, "keyframes": 1}
+    )
+    assert units == pytest.approx(0.9)
+    assert v.cost_estimate()[1] == pytest.approx(2.7)
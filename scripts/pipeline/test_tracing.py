@@ -0,0 +1,69 @@
+"""Unit tests for ``scripts.pipeline.tracing``.
+
+Run with::
+
+    python3 -m pytest scripts/pipeline/test_tracing.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from scripts.pipeline import tracing
+from scripts.validate import shot_validator as sv
+
+
+def test_stage_stats_percentiles_and_chrome_export(tmp_path):
+    tracer = tracing.Tracer()
+    for i in range(1, 21):
+        tracer.record("vision.claude", 0.0, i / 10.0, model="m")
+    worker = threading.Thread(
+        target=lambda: tracer.record("download", 0.0, 0.5, url="u"), name="fetcher"
+    )
+    worker.start()
+    worker.join()
+
+    stats = tracer.stage_stats()
+    assert list(stats) == ["vision.claude", "download"]  # by total time
+    claude = stats["vision.claude"]
+    assert claude["count"] == 20
+    assert claude["p50_s"] == pytest.approx(1.0)
+    assert claude["p95_s"] == pytest.approx(1.9)
+    assert claude["max_s"] == pytest.approx(2.0)
+
+    trace = json.loads(tracer.write(tmp_path / "trace.json").read_text())
+    events = trace["traceEvents"]
+    assert {e["args"]["name"] for e in events if e["ph"] == "M"} >= {"fetcher"}
+    download = next(e for e in events if e["name"] == "download")
+    assert download["dur"] == pytest.approx(0.5e6)
+    assert download["args"] == {"url": "u"}
+
+
+def test_activate_hooks_shot_validator_retry_backoff(monkeypatch):
+    monkeypatch.setattr(sv.time, "sleep", lambda s: None)
+    calls = iter([RuntimeError("429 rate limited"), "ok"])
+
+    def flaky():
+        result = next(calls)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    tracer = tracing.Tracer()
+    with tracing.activate(tracer):
+        assert sv._call_with_retry(flaky, label="kf") == "ok"
+        with pytest.raises(ValueError), tracing.span("boom"):
+            raise ValueError("x")
+    assert sv._tracer is None and tracing.current() is None
+    # Outside activate() the module-level helpers are no-ops.
+    with tracing.span("ignored"):
+        pass
+
+    spans = {s.name: s for s in tracer.spans()}
+    assert set(spans) == {"retry.backoff", "boom"}
+    assert spans["retry.backoff"].cat == "validate"
+    assert spans["retry.backoff"].args == {"label": "kf"}
+    assert spans["boom"].args == {"error": "ValueError"}
@@ -0,0 +1,229 @@
+"""Span timing for the pipeline's hot paths.
+
+A slow scene can be dominated by generator queueing, reference downloads,
+ffmpeg keyframe extraction, image encoding, vision API latency or retry
+backoff sleeps. ``Tracer`` records a timed span around each of those so
+a run can say which.
+
+* ``Tracer.span(name, **args)`` times a block on the calling thread.
+  ``Tracer.record`` adds a span whose start was taken elsewhere (e.g. the
+  time a job sat in a worker pool's queue).
+* ``activate(tracer)`` makes a tracer the process-wide active one. Code that
+  has no handle on the orchestrator (generators, ``shot_validator``) calls
+  the module-level ``span`` / ``record``, which are no-ops when nothing is
+  active. ``activate`` also installs the tracer as ``shot_validator``'s
+  span hook.
+* ``Tracer.to_chrome_trace`` / ``write`` export the Chrome trace-event
+  format (``chrome://tracing``, https://ui.perfetto.dev). ``stage_stats``
+  gives count / total / p50 / p95 / max per span name for the run report.
+
+Usage::
+
+    from scripts.pipeline import tracing
+
+    tracer = tracing.Tracer()
+    with tracing.activate(tracer):
+        with tracing.span("download", url=url):
+            ...
+    tracer.write(Path("reports/scene-01-trace.json"))
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+
+@dataclass
+class Span:
+    """One finished, timed block (seconds on ``time.perf_counter``)."""
+
+    name: str
+    cat: str
+    start: float
+    end: float
+    thread_id: int
+    thread_name: str
+    args: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration_s(self) -> float:
+        return self.end - self.start
+
+
+class Tracer:
+    """Thread-safe span recorder for one run."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: list[Span] = []
+        self._origin = time.perf_counter()
+        self._origin_wall = time.time()
+
+    @contextlib.contextmanager
+    def span(self, name: str, *, cat: str = "pipeline", **args: Any) -> Iterator[dict]:
+        """Time the ``with`` block. Yields the span's ``args`` dict so the
+        block can attach results (status codes, byte counts, ...)."""
+        start = time.perf_counter()
+        try:
+            yield args
+        except BaseException as exc:
+            args.setdefault("error", type(exc).__name__)
+            raise
+        finally:
+            self.record(name, start, cat=cat, **args)
+
+    def record(
+        self,
+        name: str,
+        start: float,
+        end: Optional[float] = None,
+        *,
+        cat: str = "pipeline",
+        **args: Any,
+    ) -> None:
+        """Add a span that started at ``start`` (a ``perf_counter`` value)."""
+        thread = threading.current_thread()
+        span = Span(
+            name=name,
+            cat=cat,
+            start=start,
+            end=time.perf_counter() if end is None else end,
+            thread_id=thread.ident or 0,
+            thread_name=thread.name,
+            args=args,
+        )
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self) -> list[Span]:
+        with self._lock:
+            return list(self._spans)
+
+    def stage_stats(self) -> dict[str, dict[str, float]]:
+        """Per span name: ``count``, ``total_s``, ``p50_s``, ``p95_s``,
+        ``max_s``. Ordered by total time, largest first."""
+        by_name: dict[str, list[float]] = {}
+        for span in self.spans():
+            by_name.setdefault(span.name, []).append(span.duration_s)
+        stats = {}
+        for name, durations in by_name.items():
+            durations.sort()
+            stats[name] = {
+                "count": len(durations),
+                "total_s": sum(durations),
+                "p50_s": _percentile(durations, 50),
+                "p95_s": _percentile(durations, 95),
+                "max_s": durations[-1],
+            }
+        return dict(sorted(stats.items(), key=lambda kv: -kv[1]["total_s"]))
+
+    def to_chrome_trace(self) -> dict:
+        """Trace-event JSON: one complete ("X") event per span, plus
+        thread-name metadata so each worker gets a labelled track."""
+        pid = os.getpid()
+        events: list[dict] = []
+        threads: dict[int, str] = {}
+        for span in sorted(self.spans(), key=lambda s: s.start):
+            threads.setdefault(span.thread_id, span.thread_name)
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.cat,
+                    "ph": "X",
+                    "ts": round((span.start - self._origin) * 1e6, 1),
+                    "dur": round(span.duration_s * 1e6, 1),
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {k: _jsonable(v) for k, v in span.args.items()},
+                }
+            )
+        meta = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+             "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        return {
+            "traceEvents": meta + events,
+            "displayTimeUnit": "ms",
+            "otherData": {"started_at_unix": self._origin_wall},
+        }
+
+    def write(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        tmp.replace(path)
+        return path
+
+
+# ---------------------------------------------------------------------------
+# Process-wide active tracer
+# ---------------------------------------------------------------------------
+
+_active: Optional[Tracer] = None
+_active_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def activate(tracer: Tracer) -> Iterator[Tracer]:
+    """Make ``tracer`` the active tracer for the ``with`` block (all
+    threads). The previous tracer, if any, is restored on exit."""
+    from scripts.validate import shot_validator as sv
+
+    global _active
+    with _active_lock:
+        previous, _active = _active, tracer
+    previous_hook = sv.set_tracer(tracer)
+    try:
+        yield tracer
+    finally:
+        sv.set_tracer(previous_hook)
+        with _active_lock:
+            _active = previous
+
+
+def current() -> Optional[Tracer]:
+    return _active
+
+
+def span(name: str, *, cat: str = "pipeline", **args: Any):
+    """``Tracer.span`` on the active tracer; a no-op without one."""
+    tracer = _active
+    if tracer is None:
+        return contextlib.nullcontext(args)
+    return tracer.span(name, cat=cat, **args)
+
+
+def record(
+    name: str,
+    start: float,
+    end: Optional[float] = None,
+    *,
+    cat: str = "pipeline",
+    **args: Any,
+) -> None:
+    """``Tracer.record`` on the active tracer; a no-op without one."""
+    tracer = _active
+    if tracer is not None:
+        tracer.record(name, start, end, cat=cat, **args)
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value)
@@ -7,6 +7,9 @@ from the command line or from external Python scripts.
 Modules:
     engine: Core render engine controller for headless execution
     batch: Batch rendering support for multiple scenes/frames
+    pool: Persistent Blender worker pool for animation frames
+    chunked: Adaptive frame-range chunking with one Blender run per chunk
+    cache: Incremental render cache keyed by scene inputs
 
 Usage (from outside Blender):
     from render import engine, batch
@@ -26,6 +29,9 @@ Usage (from outside Blender):
 """
 
 from . import engine
+from . import cache
 from . import batch
+from . import pool
+from . import chunked
 
-__all__ = ['engine', 'batch']
+__all__ = ['engine', 'cache', 'batch', 'pool', 'chunked']
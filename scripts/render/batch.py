@@ -6,14 +6,16 @@ Run multiple render jobs sequentially or in parallel.
 
 import os
 import json
+import heapq
 import time
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable
 from dataclasses import dataclass, field
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 
 from .engine import RenderResult, RenderConfig, render_script, render_blend_file
+from .cache import RenderCache, cache_manifest, fingerprint
 
 
 @dataclass
@@ -27,6 +29,8 @@ class BatchJob:
     priority: int = 0  # Higher = run first
     dependencies: List[str] = field(default_factory=list)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    retries: int = 0  # Extra attempts after a failed render
+    timeout: int = 600  # Seconds per attempt
 
     def to_dict(self) -> dict:
         return {
@@ -38,6 +42,8 @@ class BatchJob:
             'priority': self.priority,
             'dependencies': self.dependencies,
             'metadata': self.metadata,
+            'retries': self.retries,
+            'timeout': self.timeout,
         }
 
 
@@ -49,6 +55,7 @@ class BatchResult:
     failed: int
     total_time: float
     results: Dict[str, RenderResult] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> dict:
         return {
@@ -58,6 +65,7 @@ class BatchResult:
             'total_time': self.total_time,
             'success_rate': self.completed / self.total_jobs if self.total_jobs > 0 else 0,
             'results': {k: v.to_dict() for k, v in self.results.items()},
+            'metadata': self.metadata,
         }
 
 
@@ -148,106 +156,164 @@ def render_jobs(
     jobs: List[BatchJob],
     parallel: int = 1,
     progress_callback: Optional[Callable[[str, RenderResult], None]] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    state_path: Optional[str] = None,
+    cache: Optional[RenderCache] = None
 ) -> BatchResult:
     """
-    Execute a batch of render jobs.
+    Execute a batch of render jobs as a dependency graph.
+
+    Each job is dispatched as soon as all of its dependencies have
+    succeeded; among ready jobs, higher priority runs first. A single pool
+    of `parallel` workers is shared by the whole batch, so an idle worker
+    takes the next ready job instead of waiting for a slow one.
+    Failed renders are retried up to `job.retries` times. A job whose
+    dependency failed (or does not exist, or is part of a cycle) fails
+    with "Unmet dependencies".
 
     Args:
         jobs: List of BatchJob objects
         parallel: Number of parallel renders (1 = sequential)
         progress_callback: Called after each job completes
         verbose: Print progress
+        state_path: JSON file recording finished jobs. When given, jobs it
+            lists as succeeded (same source, output and input fingerprint,
+            output still on disk) are not rendered again, so a killed batch
+            resumes. The file is removed once every job has succeeded.
+        cache: Render cache; jobs whose output exists with a matching
+            input fingerprint are skipped (see cache.py)
 
     Returns:
         BatchResult with all outcomes
     """
     start_time = time.time()
 
-    # Sort by priority (higher first) and check dependencies
-    sorted_jobs = sorted(jobs, key=lambda j: -j.priority)
+    by_name = {job.name: job for job in jobs}
+    order = {job.name: i for i, job in enumerate(jobs)}
+    state = _load_state(state_path)
 
     results = {}
-    completed_names = set()
-
-    if parallel <= 1:
-        # Sequential execution
-        for i, job in enumerate(sorted_jobs):
-            if verbose:
-                print(f"\n[{i + 1}/{len(jobs)}] {job.name}")
+    attempts: Dict[str, int] = {}
+    cache_misses: Dict[str, Dict[str, Any]] = {}
+    dependents: Dict[str, List[str]] = {name: [] for name in by_name}
+    waiting_on: Dict[str, int] = {}
+    ready = []  # heap of (-priority, submission order, name)
 
-            # Check dependencies
-            if job.dependencies:
-                missing = [d for d in job.dependencies if d not in completed_names]
-                if missing:
-                    result = RenderResult(
+    def finish(name: str, result: RenderResult) -> None:
+        results[name] = result
+        if verbose:
+            status = f"{result.render_time:.1f}s" if result.success else f"FAILED: {result.error_message}"
+            print(f"[{len(results)}/{len(jobs)}] {name}: {status}")
+        if progress_callback:
+            progress_callback(name, result)
+        for child in dependents[name]:
+            if not result.success:
+                if child not in results:
+                    finish(child, RenderResult(
                         success=False,
-                        error_message=f"Unmet dependencies: {missing}"
-                    )
-                    results[job.name] = result
-                    if progress_callback:
-                        progress_callback(job.name, result)
+                        error_message=f"Unmet dependencies: ['{name}']"
+                    ))
+                continue
+            waiting_on[child] -= 1
+            if waiting_on[child] == 0:
+                _push_ready(ready, by_name[child], order)
+
+    for job in jobs:
+        waiting_on[job.name] = 0
+        for dep in job.dependencies:
+            if dep in dependents:
+                dependents[dep].append(job.name)
+                waiting_on[job.name] += 1
+            else:
+                waiting_on[job.name] += 1  # unknown dependency: never met
+
+    for job in jobs:
+        if waiting_on[job.name] == 0:
+            _push_ready(ready, job, order)
+
+    with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+        running = {}
+
+        while ready or running:
+            while ready and len(running) < max(1, parallel):
+                _, _, name = heapq.heappop(ready)
+                job = by_name[name]
+
+                resumed = _resumed_result(job, state) if state else None
+                if resumed is not None:
+                    finish(name, resumed)
                     continue
 
-            # Execute
-            result = _execute_job(job, verbose)
-            results[job.name] = result
-
-            if result.success:
-                completed_names.add(job.name)
-
-            if progress_callback:
-                progress_callback(job.name, result)
-    else:
-        # Parallel execution (dependencies handled in waves)
-        remaining = list(sorted_jobs)
-
-        while remaining:
-            # Find jobs whose dependencies are met
-            ready = []
-            still_waiting = []
-
-            for job in remaining:
-                missing_deps = [d for d in job.dependencies if d not in completed_names]
-                if not missing_deps:
-                    ready.append(job)
-                else:
-                    still_waiting.append(job)
-
-            if not ready:
-                # No jobs can run - circular dependency or missing deps
-                for job in still_waiting:
-                    results[job.name] = RenderResult(
-                        success=False,
-                        error_message=f"Unmet dependencies: {job.dependencies}"
+                if cache is not None and name not in cache_misses:
+                    cached, fp, reason = cache.lookup(
+                        job.source, job.output, _job_config(job), _job_extra(job)
                     )
-                break
-
-            # Execute ready jobs in parallel
-            with ThreadPoolExecutor(max_workers=parallel) as executor:
-                futures = {
-                    executor.submit(_execute_job, job, verbose): job
-                    for job in ready
-                }
-
-                for future in as_completed(futures):
-                    job = futures[future]
+                    if cached is not None:
+                        finish(name, cached)
+                        continue
+                    cache_misses[name] = {'status': 'miss', 'fingerprint': fp, 'reason': reason}
+
+                attempts[name] = attempts.get(name, 0) + 1
+                if verbose and attempts[name] > 1:
+                    print(f"  Retrying {name} (attempt {attempts[name]}/{job.retries + 1})")
+                running[executor.submit(_execute_job, job, verbose)] = name
+
+            if not running:
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                job = by_name[name]
+                try:
                     result = future.result()
-                    results[job.name] = result
+                except Exception as e:
+                    result = RenderResult(success=False, error_message=str(e))
+                result.metadata['attempts'] = attempts[name]
 
-                    if result.success:
-                        completed_names.add(job.name)
+                if not result.success and attempts[name] <= job.retries:
+                    _push_ready(ready, job, order)
+                    continue
 
-                    if progress_callback:
-                        progress_callback(job.name, result)
+                if name in cache_misses:
+                    result.metadata['cache'] = cache_misses[name]
+                    if result.success:
+                        cache.store(job.output, cache_misses[name]['fingerprint'], result)
 
-            remaining = still_waiting
+                if state_path:
+                    if result.success:
+                        fp = (cache_misses[name]['fingerprint'] if name in cache_misses
+                              else _job_fingerprint(job))
+                        state[name] = {
+                            'source': job.source,
+                            'output': job.output,
+                            'fingerprint': fp,
+                            'result': result.to_dict(),
+                        }
+                    else:
+                        state.pop(name, None)
+                    _save_state(state_path, state)
+                finish(name, result)
+
+    # Anything never dispatched depends on a missing job or is in a cycle.
+    for job in jobs:
+        if job.name not in results:
+            missing = [d for d in job.dependencies
+                       if not (d in results and results[d].success)]
+            finish(job.name, RenderResult(
+                success=False,
+                error_message=f"Unmet dependencies: {missing}"
+            ))
 
     # Calculate statistics
     completed = sum(1 for r in results.values() if r.success)
     failed = len(results) - completed
     total_time = time.time() - start_time
 
+    # Nothing left to resume; a stale state file could only mask later edits.
+    if state_path and failed == 0 and os.path.exists(state_path):
+        os.remove(state_path)
+
     return BatchResult(
         total_jobs=len(jobs),
         completed=completed,
@@ -257,14 +323,73 @@ def render_jobs(
     )
 
 
-def _execute_job(job: BatchJob, verbose: bool) -> RenderResult:
-    """Execute a single batch job."""
-    config = RenderConfig(
+def _push_ready(ready: list, job: BatchJob, order: Dict[str, int]) -> None:
+    heapq.heappush(ready, (-job.priority, order[job.name], job.name))
+
+
+def _load_state(state_path: Optional[str]) -> Dict[str, Any]:
+    """Load the jobs a previous run of this batch finished."""
+    if not state_path or not os.path.exists(state_path):
+        return {}
+    try:
+        with open(state_path, 'r') as f:
+            return json.load(f).get('jobs', {})
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state_path: Optional[str], state: Dict[str, Any]) -> None:
+    if not state_path:
+        return
+    Path(state_path).parent.mkdir(parents=True, exist_ok=True)
+    tmp = f"{state_path}.tmp"
+    with open(tmp, 'w') as f:
+        json.dump({'jobs': state, 'updated': datetime.now().isoformat()}, f, indent=2)
+    os.replace(tmp, state_path)
+
+
+def _resumed_result(job: BatchJob, state: Dict[str, Any]) -> Optional[RenderResult]:
+    """The recorded result of `job` if a previous run already rendered it."""
+    entry = state.get(job.name)
+    if not entry:
+        return None
+    if entry.get('source') != job.source or entry.get('output') != job.output:
+        return None
+    if not Path(job.output).exists():
+        return None
+    if entry.get('fingerprint') != _job_fingerprint(job):
+        return None  # scene, assets or settings changed since
+    recorded = entry.get('result', {})
+    return RenderResult(
+        success=True,
+        output_path=job.output,
+        render_time=recorded.get('render_time', 0.0),
+        metadata={**recorded.get('metadata', {}), 'resumed': True}
+    )
+
+
+def _job_config(job: BatchJob) -> RenderConfig:
+    return RenderConfig(
         output_path=job.output,
         samples=job.samples,
-        resolution=job.resolution
+        resolution=job.resolution,
+        timeout=job.timeout
     )
 
+
+def _job_extra(job: BatchJob) -> Dict[str, Any]:
+    """Job inputs outside RenderConfig that still change the image."""
+    return {'frame': job.metadata['frame']} if 'frame' in job.metadata else {}
+
+
+def _job_fingerprint(job: BatchJob) -> str:
+    return fingerprint(job.source, _job_config(job), _job_extra(job))
+
+
+def _execute_job(job: BatchJob, verbose: bool) -> RenderResult:
+    """Execute a single batch job."""
+    config = _job_config(job)
+
     # Ensure output directory exists
     Path(job.output).parent.mkdir(parents=True, exist_ok=True)
 
@@ -279,25 +404,73 @@ def render_animation_frames(
     output_pattern: str,
     start_frame: int,
     end_frame: int,
-    samples: int = 128,
+    samples: Optional[int] = None,
     parallel: int = 1,
-    verbose: bool = True
+    verbose: bool = True,
+    pool: bool = False,
+    chunk_size: Optional[int] = None,
+    chunked: bool = False,
+    target_chunk_seconds: Optional[float] = None
 ) -> BatchResult:
     """
     Render animation frames as individual jobs.
 
+    With pool=True the frames are rendered by `parallel` persistent Blender
+    workers that each load the scene once (see pool.py). With chunked=True
+    a .blend is rendered in contiguous frame ranges, one `-a` invocation
+    per range, sized from measured frame times (see chunked.py). Otherwise
+    every frame runs in its own Blender process. Output names and
+    per-frame results are the same in every mode.
+
     Args:
         source: Path to .py script or .blend file
         output_pattern: Output pattern with {frame} placeholder
         start_frame: First frame number
         end_frame: Last frame number
-        samples: Render samples
-        parallel: Number of parallel renders
+        samples: Render samples (None = 128, or in pool mode the scene's
+            own setting)
+        parallel: Number of parallel renders (workers in pool mode)
         verbose: Print progress
+        pool: Use persistent Blender workers
+        chunk_size: Frames per chunk in pool mode (None = automatic)
+        chunked: Render .blend frame ranges with -a (script sources fall
+            back to single-frame jobs)
+        target_chunk_seconds: Desired wall time per chunk in chunked mode
 
     Returns:
         BatchResult with all frame outcomes
     """
+    if pool and chunked:
+        raise ValueError("pool and chunked are alternative render modes")
+
+    if chunked and source.endswith('.blend'):
+        from .chunked import render_frames_chunked, DEFAULT_TARGET_CHUNK_SECONDS
+        return render_frames_chunked(
+            source,
+            output_pattern,
+            start_frame,
+            end_frame,
+            samples=128 if samples is None else samples,
+            parallel=max(1, parallel),
+            target_chunk_seconds=target_chunk_seconds or DEFAULT_TARGET_CHUNK_SECONDS,
+            verbose=verbose
+        )
+    if chunked and verbose:
+        print("Chunked rendering needs a .blend; rendering script frames individually")
+
+    if pool:
+        from .pool import render_frames_pooled
+        return render_frames_pooled(
+            source,
+            output_pattern,
+            start_frame,
+            end_frame,
+            samples=samples,
+            workers=max(1, parallel),
+            chunk_size=chunk_size,
+            verbose=verbose
+        )
+
     jobs = []
 
     for frame in range(start_frame, end_frame + 1):
@@ -307,7 +480,7 @@ def render_animation_frames(
             name=f"frame_{frame:04d}",
             source=source,
             output=output,
-            samples=samples,
+            samples=128 if samples is None else samples,
             metadata={'frame': frame}
         ))
 
@@ -337,7 +510,9 @@ def load_batch_config(config_path: str) -> List[BatchJob]:
             resolution=tuple(item.get('resolution', [1920, 1080])),
             priority=item.get('priority', 0),
             dependencies=item.get('dependencies', []),
-            metadata=item.get('metadata', {})
+            metadata=item.get('metadata', {}),
+            retries=item.get('retries', 0),
+            timeout=item.get('timeout', 600)
         ))
 
     return jobs
@@ -347,6 +522,9 @@ def save_batch_report(result: BatchResult, output_path: str) -> None:
     """
     Save batch render report to a JSON file.
 
+    When the batch ran with a render cache, the report includes a 'cache'
+    manifest: hit/miss counts and, per job, its status and fingerprint.
+
     Args:
         result: BatchResult to save
         output_path: Path for the report file
@@ -354,6 +532,10 @@ def save_batch_report(result: BatchResult, output_path: str) -> None:
     report = result.to_dict()
     report['timestamp'] = datetime.now().isoformat()
 
+    manifest = cache_manifest(result.results)
+    if manifest is not None:
+        report['cache'] = manifest
+
     with open(output_path, 'w') as f:
         json.dump(report, f, indent=2)
 
@@ -365,16 +547,22 @@ class BatchRenderer:
     Provides a convenient API for managing batch render jobs.
     """
 
-    def __init__(self, output_dir: str = './renders'):
+    def __init__(self, output_dir: str = './renders', use_cache: bool = False):
         """
         Initialize the batch renderer.
 
         Args:
             output_dir: Default output directory for renders
+            use_cache: Skip jobs whose inputs are unchanged since their
+                last successful render (manifest kept in output_dir).
+                Off by default: the fingerprint cannot see inputs a
+                script finds at run time (globbed or computed paths,
+                environment variables, time, randomness).
         """
         self.output_dir = output_dir
         self.jobs: List[BatchJob] = []
         Path(output_dir).mkdir(parents=True, exist_ok=True)
+        self.cache = RenderCache.for_dir(output_dir) if use_cache else None
 
     def add_job(
         self,
@@ -424,7 +612,8 @@ class BatchRenderer:
     def run(
         self,
         parallel: int = 1,
-        verbose: bool = True
+        verbose: bool = True,
+        state_path: Optional[str] = None
     ) -> BatchResult:
         """
         Execute all queued jobs.
@@ -432,11 +621,18 @@ class BatchRenderer:
         Args:
             parallel: Number of parallel renders
             verbose: Print progress
+            state_path: Progress file for resuming (see render_jobs)
 
         Returns:
             BatchResult
         """
-        result = render_jobs(self.jobs, parallel=parallel, verbose=verbose)
+        result = render_jobs(
+            self.jobs,
+            parallel=parallel,
+            verbose=verbose,
+            state_path=state_path,
+            cache=self.cache
+        )
         return result
 
     def clear(self) -> None:
@@ -0,0 +1,148 @@
+"""
+Persistent Blender Render Worker
+
+This script runs INSIDE Blender and is started by pool.py. It loads the
+scene once and then renders frame chunks sent over stdin until stdin
+closes or a quit request arrives. It is not meant to be run by hand:
+
+    blender -b scene.blend -E CYCLES -P blender_worker.py
+    blender -b -E CYCLES -P blender_worker.py -- --setup scene_setup.py \
+        --engine CYCLES --resolution 1920x1080 --samples 128
+
+When a scene script is given with --setup, it is executed without its
+__main__ block, and its setup_scene() is called if it defines one. The
+worker then applies the render settings its main() would have, through
+the script's render.configure() (GPU, denoiser, colour depth, ...).
+That is the layout engine.generate_render_script produces. A .blend keeps
+its saved render settings.
+
+Resolution and samples in a request override the scene's settings only
+when present.
+
+Protocol (one JSON object per line):
+
+    request:  {"frames": [[12, "/out/frame_0012.png"], ...],
+               "samples": 128, "resolution": [1920, 1080]}
+              {"quit": true}
+    replies:  {"ready": true}
+              {"frame": 12, "ok": true, "output": "...", "time": 4.1}
+              {"frame": 13, "ok": false, "error": "...", "time": 0.2}
+              {"chunk_done": true}
+
+Replies are printed on stdout with PROTOCOL_PREFIX, which separates them
+from Blender's own log output.
+"""
+
+import json
+import runpy
+import sys
+import time
+
+import bpy
+
+PROTOCOL_PREFIX = "@@render-worker "
+
+
+def _send(message: dict) -> None:
+    sys.stdout.write(PROTOCOL_PREFIX + json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def _parse_args() -> dict:
+    args = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parsed = {}
+    for i, arg in enumerate(args):
+        if i + 1 >= len(args):
+            break
+        if arg == "--setup":
+            parsed["setup"] = args[i + 1]
+        elif arg == "--engine":
+            parsed["engine"] = args[i + 1]
+        elif arg == "--samples":
+            parsed["samples"] = int(args[i + 1])
+        elif arg == "--resolution":
+            parsed["resolution"] = tuple(int(v) for v in args[i + 1].lower().split("x"))
+    return parsed
+
+
+def _run_setup(script_path: str, args: dict) -> None:
+    """Build the scene from a scene script and configure rendering as its
+    main() would, without running main() itself."""
+    namespace = runpy.run_path(script_path, run_name="__render_worker__")
+    setup = namespace.get("setup_scene")
+    if callable(setup):
+        setup()
+
+    render = namespace.get("render")
+    configure = getattr(render, "configure", None)
+    if callable(configure):
+        settings = {
+            key: args[key]
+            for key in ("engine", "samples", "resolution")
+            if args.get(key) is not None
+        }
+        configure(**settings)
+
+
+def _configure(scene, request: dict) -> None:
+    resolution = request.get("resolution")
+    if resolution:
+        scene.render.resolution_x = int(resolution[0])
+        scene.render.resolution_y = int(resolution[1])
+        scene.render.resolution_percentage = 100
+
+    samples = request.get("samples")
+    if samples:
+        if scene.render.engine == "CYCLES":
+            scene.cycles.samples = int(samples)
+        elif hasattr(scene, "eevee"):
+            scene.eevee.taa_render_samples = int(samples)
+
+
+def _render_chunk(request: dict) -> None:
+    scene = bpy.context.scene
+    _configure(scene, request)
+
+    for frame, output in request.get("frames", []):
+        start = time.perf_counter()
+        try:
+            scene.frame_set(int(frame))
+            scene.render.filepath = output
+            bpy.ops.render.render(write_still=True)
+        except Exception as e:
+            _send({
+                "frame": frame,
+                "ok": False,
+                "error": f"{type(e).__name__}: {e}",
+                "time": time.perf_counter() - start,
+            })
+            continue
+        _send({
+            "frame": frame,
+            "ok": True,
+            "output": output,
+            "time": time.perf_counter() - start,
+        })
+
+    _send({"chunk_done": True})
+
+
+def main():
+    args = _parse_args()
+    if args.get("setup"):
+        _run_setup(args["setup"], args)
+
+    _send({"ready": True})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        request = json.loads(line)
+        if request.get("quit"):
+            break
+        _render_chunk(request)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+Incremental Render Cache
+
+Skips renders whose inputs have not changed since the last successful
+render of the same output. A render's fingerprint covers:
+
+- the contents of the source .blend or .py file,
+- the assets it links: image/library paths found in the .blend, or, for a
+  script, the asset paths it names and the local modules it imports,
+- the RenderConfig fields that affect the image (resolution, samples,
+  engine, format, frame range, ...), plus any script arguments,
+- the Blender version.
+
+Fingerprints are stored per output path in a JSON manifest. A lookup is a
+hit only when the output file still exists and its stored fingerprint
+matches. Each hit or miss is recorded in the result's metadata['cache'],
+and save_batch_report summarises those in the batch report.
+
+It does not cover what a script finds only at run time: globbed or
+computed file paths, environment variables, the clock or random numbers.
+Such scripts can be served a stale render, so callers opt in to the cache
+(BatchRenderer(use_cache=True), pipeline.py --cache).
+"""
+
+import ast
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Callable
+
+from . import engine
+from .engine import RenderResult, RenderConfig
+
+CACHE_VERSION = 1
+MANIFEST_NAME = '.render-cache.json'
+
+ASSET_EXTENSIONS = (
+    'blend', 'png', 'jpg', 'jpeg', 'exr', 'hdr', 'tif', 'tiff', 'tga',
+    'glb', 'gltf', 'fbx', 'obj', 'abc', 'vdb', 'mp4', 'mov', 'wav',
+)
+
+# Config fields that change the rendered image (output_path is the cache key).
+FINGERPRINT_FIELDS = (
+    'resolution', 'samples', 'engine', 'format', 'use_gpu', 'frame',
+    'animation', 'frame_start', 'frame_end',
+)
+
+_BLEND_PATH_RE = re.compile(
+    rb'((?://|/|[A-Za-z]:\\)[^\x00\n]{1,1000}?\.(?:'
+    + b'|'.join(e.encode() for e in ASSET_EXTENSIONS)
+    + rb'))\x00',
+    re.IGNORECASE
+)
+_SCRIPT_PATH_RE = re.compile(
+    r'\.(?:' + '|'.join(ASSET_EXTENSIONS) + r')$',
+    re.IGNORECASE
+)
+
+_file_hashes: Dict[tuple, str] = {}
+_blender_versions: Dict[str, str] = {}
+
+
+def file_digest(path: str) -> Optional[str]:
+    """SHA-256 of a file's contents (memoised on path, mtime and size)."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    digest = _file_hashes.get(key)
+    if digest is None:
+        h = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                h.update(block)
+        digest = _file_hashes[key] = h.hexdigest()
+    return digest
+
+
+def blender_version() -> str:
+    """Version string of the configured Blender (queried once per process)."""
+    exe = engine.BLENDER_EXECUTABLE
+    if exe not in _blender_versions:
+        available, version = engine.check_blender()
+        _blender_versions[exe] = version if available else 'unavailable'
+    return _blender_versions[exe]
+
+
+def linked_assets(source: str) -> List[str]:
+    """Files the render of `source` reads besides `source` itself."""
+    if source.endswith('.blend'):
+        return _blend_assets(source)
+    if source.endswith('.py'):
+        return _script_assets(source, set())
+    return []
+
+
+def _blend_assets(blend_file: str) -> List[str]:
+    """Image and library paths stored in an uncompressed .blend.
+
+    Compressed .blend files cannot be scanned without Blender; for those
+    only the file itself is fingerprinted.
+    """
+    try:
+        with open(blend_file, 'rb') as f:
+            data = f.read()
+    except OSError:
+        return []
+    if not data.startswith(b'BLENDER'):
+        return []
+
+    base = os.path.dirname(os.path.abspath(blend_file))
+    assets = set()
+    for match in _BLEND_PATH_RE.finditer(data):
+        raw = match.group(1).decode('utf-8', errors='replace')
+        path = os.path.join(base, raw[2:]) if raw.startswith('//') else raw
+        assets.add(os.path.normpath(path))
+    return sorted(assets)
+
+
+def _script_assets(script: str, seen: set) -> List[str]:
+    """Asset paths named in a scene script and the local modules it imports."""
+    script = os.path.abspath(script)
+    if script in seen:
+        return []
+    seen.add(script)
+    try:
+        with open(script, 'r') as f:
+            tree = ast.parse(f.read(), filename=script)
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    here = os.path.dirname(script)
+    bases = [here, os.path.dirname(here), os.getcwd()]
+    assets = set()
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Constant) and isinstance(node.value, str):
+            if _SCRIPT_PATH_RE.search(node.value):
+                for base in bases:
+                    candidate = os.path.join(base, node.value.lstrip('/') if node.value.startswith('//') else node.value)
+                    if os.path.isfile(candidate):
+                        assets.add(os.path.normpath(candidate))
+                        break
+                else:
+                    assets.add(node.value)  # missing: still part of the key
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for module in _local_modules(node, bases):
+                assets.add(module)
+                assets.update(_script_assets(module, seen))
+
+    return sorted(assets)
+
+
+def _local_modules(node, bases: List[str]) -> List[str]:
+    if isinstance(node, ast.Import):
+        names = [alias.name for alias in node.names]
+    elif node.level == 0 and node.module:
+        names = [node.module] + [f"{node.module}.{a.name}" for a in node.names]
+    else:
+        return []
+
+    found = []
+    for name in names:
+        rel = name.replace('.', os.sep)
+        for base in bases:
+            for candidate in (os.path.join(base, rel + '.py'),
+                              os.path.join(base, rel, '__init__.py')):
+                if os.path.isfile(candidate):
+                    found.append(os.path.normpath(candidate))
+                    break
+            else:
+                continue
+            break
+    return found
+
+
+def fingerprint(
+    source: str,
+    config: RenderConfig,
+    extra: Optional[Dict[str, Any]] = None
+) -> str:
+    """Fingerprint of everything a render of `source` with `config` uses."""
+    payload = {
+        'version': CACHE_VERSION,
+        'source': file_digest(source),
+        'assets': {path: file_digest(path) for path in linked_assets(source)},
+        'config': {name: _jsonable(getattr(config, name)) for name in FINGERPRINT_FIELDS},
+        'extra': {k: _jsonable(v) for k, v in sorted((extra or {}).items())},
+        'blender': blender_version(),
+    }
+    encoded = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, tuple):
+        return list(value)
+    return value
+
+
+class RenderCache:
+    """
+    Fingerprint manifest for one output directory.
+
+    Not thread-safe: call it from the thread that schedules renders.
+    """
+
+    def __init__(self, manifest_path: str):
+        """
+        Args:
+            manifest_path: JSON file holding fingerprints per output path
+        """
+        self.manifest_path = manifest_path
+        self.entries: Dict[str, Dict[str, Any]] = self._load()
+
+    @classmethod
+    def for_dir(cls, output_dir: str) -> 'RenderCache':
+        return cls(os.path.join(output_dir, MANIFEST_NAME))
+
+    def lookup(
+        self,
+        source: str,
+        output_path: str,
+        config: RenderConfig,
+        extra: Optional[Dict[str, Any]] = None
+    ) -> tuple:
+        """
+        Check whether `output_path` is up to date.
+
+        Returns:
+            Tuple of (cached RenderResult or None, fingerprint, miss reason)
+        """
+        fp = fingerprint(source, config, extra)
+        key = os.path.abspath(output_path)
+        entry = self.entries.get(key)
+
+        if entry is None:
+            reason = 'not rendered before'
+        elif entry.get('fingerprint') != fp:
+            reason = 'inputs changed'
+        elif not os.path.exists(output_path):
+            reason = 'output missing'
+        else:
+            return RenderResult(
+                success=True,
+                output_path=output_path,
+                render_time=0.0,
+                metadata={
+                    'cache': {
+                        'status': 'hit',
+                        'fingerprint': fp,
+                        'rendered_at': entry.get('rendered_at'),
+                        'saved_time': entry.get('render_time', 0.0),
+                    }
+                }
+            ), fp, None
+        return None, fp, reason
+
+    def store(self, output_path: str, fp: str, result: RenderResult) -> None:
+        """Record a successful render and save the manifest."""
+        self.entries[os.path.abspath(output_path)] = {
+            'fingerprint': fp,
+            'rendered_at': datetime.now().isoformat(),
+            'render_time': result.render_time,
+        }
+        self.save()
+
+    def render(
+        self,
+        source: str,
+        output_path: str,
+        config: RenderConfig,
+        render_fn: Callable[[], RenderResult],
+        extra: Optional[Dict[str, Any]] = None
+    ) -> RenderResult:
+        """Return the cached result, or call `render_fn` and cache it."""
+        cached, fp, reason = self.lookup(source, output_path, config, extra)
+        if cached is not None:
+            return cached
+        result = render_fn()
+        result.metadata['cache'] = {'status': 'miss', 'fingerprint': fp, 'reason': reason}
+        if result.success:
+            self.store(output_path, fp, result)
+        return result
+
+    def save(self) -> None:
+        Path(self.manifest_path).parent.mkdir(parents=True, exist_ok=True)
+        tmp = f"{self.manifest_path}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump({'version': CACHE_VERSION, 'entries': self.entries}, f, indent=2)
+        os.replace(tmp, self.manifest_path)
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.manifest_path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != CACHE_VERSION:
+            return {}
+        return data.get('entries', {})
+
+
+def cache_manifest(results: Dict[str, RenderResult]) -> Optional[Dict[str, Any]]:
+    """Hit/miss summary of a batch's results, or None if the cache was off."""
+    jobs = {
+        name: result.metadata['cache']
+        for name, result in results.items()
+        if 'cache' in result.metadata
+    }
+    if not jobs:
+        return None
+    hits = sum(1 for entry in jobs.values() if entry.get('status') == 'hit')
+    return {
+        'hits': hits,
+        'misses': len(jobs) - hits,
+        'hit_rate': hits / len(jobs),
+        'saved_render_time': sum(e.get('saved_time', 0.0) for e in jobs.values()),
+        'jobs': jobs,
+    }
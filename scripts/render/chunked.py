@@ -0,0 +1,290 @@
+"""
+Adaptive Frame-Range Chunking
+
+Renders an animation as contiguous frame ranges, each in a single
+`blender -b scene.blend -s S -e E -a` invocation. This pays Blender
+startup and scene load once per chunk rather than once per frame.
+
+Chunks are sized while the render runs:
+
+- The first chunk on each worker is short (INITIAL_CHUNK frames) and
+  measures the per-frame render time.
+- Each later chunk is sized so it takes about `target_chunk_seconds` at
+  the current estimate, an exponential moving average of observed chunk
+  time per frame.
+- No chunk is longer than an even share of the remaining frames across
+  `parallel` workers, so the tail stays balanced.
+
+Blender writes each chunk into a staging directory. The frames are then
+moved to `output_pattern.format(frame=N)`, so output names and the
+per-frame BatchResult entries match single-frame rendering. Frames a
+failed chunk did not write are retried once as a chunk of their own. A
+chunk that raises is not retried; its frames are reported as failed.
+"""
+
+import math
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+
+from .engine import RenderResult, RenderConfig, render_blend_file
+from .batch import BatchResult
+
+INITIAL_CHUNK = 2
+DEFAULT_TARGET_CHUNK_SECONDS = 120.0
+ESTIMATE_WEIGHT = 0.5  # weight of the newest chunk in the estimate
+
+_SAVED_RE = re.compile(r"Saved: '([^']+)'")
+_TIME_RE = re.compile(r"^\s*Time: (?:(\d+):)?(\d+):(\d+(?:\.\d+)?)")
+
+
+class _FrameTimeEstimate:
+    """Running per-frame render time, shared by all workers."""
+
+    def __init__(self):
+        self.seconds: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def update(self, chunk_seconds: float, frames: int) -> None:
+        if frames <= 0:
+            return
+        observed = chunk_seconds / frames
+        with self._lock:
+            if self.seconds is None:
+                self.seconds = observed
+            else:
+                self.seconds += ESTIMATE_WEIGHT * (observed - self.seconds)
+
+
+def chunk_size(
+    estimate: Optional[float],
+    remaining: int,
+    parallel: int,
+    target_chunk_seconds: float
+) -> int:
+    """Frames for the next chunk given the per-frame estimate in seconds."""
+    share = max(1, math.ceil(remaining / max(1, parallel)))
+    if estimate is None:
+        return min(INITIAL_CHUNK, share)
+    wanted = max(1, int(target_chunk_seconds / max(estimate, 1e-3)))
+    return min(wanted, share)
+
+
+def parse_frame_times(stdout: str) -> Dict[str, float]:
+    """Per-file render time from Blender's "Saved: ... / Time: ..." log lines."""
+    times = {}
+    saved = None
+    for line in stdout.splitlines():
+        m = _SAVED_RE.search(line)
+        if m:
+            saved = m.group(1)
+            continue
+        m = _TIME_RE.match(line)
+        if m and saved is not None:
+            hours = int(m.group(1) or 0)
+            times[Path(saved).name] = hours * 3600 + int(m.group(2)) * 60 + float(m.group(3))
+            saved = None
+    return times
+
+
+def render_frames_chunked(
+    source: str,
+    output_pattern: str,
+    start_frame: int,
+    end_frame: int,
+    samples: int = 128,
+    resolution: tuple = (1920, 1080),
+    parallel: int = 1,
+    target_chunk_seconds: float = DEFAULT_TARGET_CHUNK_SECONDS,
+    frame_timeout: int = 600,
+    verbose: bool = True
+) -> BatchResult:
+    """
+    Render animation frames in adaptively sized `-a` chunks.
+
+    Args:
+        source: Path to the .blend file
+        output_pattern: Output pattern with {frame} placeholder
+        start_frame: First frame number
+        end_frame: Last frame number
+        samples: Render samples
+        resolution: Render resolution (width, height)
+        parallel: Number of concurrent Blender processes
+        target_chunk_seconds: Desired wall time per chunk
+        frame_timeout: Seconds allowed per frame (chunk timeout scales)
+        verbose: Print progress
+
+    Returns:
+        BatchResult with one result per frame, named frame_NNNN.
+        Its metadata lists the chunks rendered.
+    """
+    if not source.endswith('.blend'):
+        raise ValueError("Chunked rendering needs a .blend source (-a renders the saved scene)")
+
+    start_time = time.time()
+    outputs = {
+        frame: output_pattern.format(frame=frame, f=frame)
+        for frame in range(start_frame, end_frame + 1)
+    }
+    parallel = max(1, parallel)
+
+    estimate = _FrameTimeEstimate()
+    lock = threading.Lock()
+    cursor = [start_frame]
+    retries: List[Tuple[int, int]] = []
+    retried = set()
+    results: Dict[str, RenderResult] = {}
+    chunks: List[Dict[str, Any]] = []
+
+    def next_chunk() -> Optional[Tuple[int, int]]:
+        with lock:
+            if retries:
+                return retries.pop(0)
+            if cursor[0] > end_frame:
+                return None
+            remaining = end_frame - cursor[0] + 1
+            size = chunk_size(estimate.seconds, remaining, parallel, target_chunk_seconds)
+            first = cursor[0]
+            cursor[0] += size
+            return first, first + size - 1
+
+    def run_worker(slot: int) -> None:
+        while True:
+            chunk = next_chunk()
+            if chunk is None:
+                return
+            try:
+                render_chunk(slot, *chunk)
+            except Exception as e:
+                chunk_failed(slot, *chunk, e)
+
+    def chunk_failed(slot: int, first: int, last: int, error: Exception) -> None:
+        """Record the frames of a chunk that raised (rather than failed) as failed."""
+        message = f"Chunk {first}-{last} raised {type(error).__name__}: {error}"
+        with lock:
+            for frame in range(first, last + 1):
+                results.setdefault(f"frame_{frame:04d}", RenderResult(
+                    success=False,
+                    error_message=message,
+                    metadata={'frame': frame, 'chunk': [first, last]}
+                ))
+        if verbose:
+            print(f"  [worker-{slot}] {message}")
+
+    def render_chunk(slot: int, first: int, last: int) -> None:
+        frames = list(range(first, last + 1))
+        staging = Path(outputs[first]).parent / f".chunk-{first:06d}-{last:06d}"
+        staging.mkdir(parents=True, exist_ok=True)
+        config = RenderConfig(
+            output_path=str(staging / 'frame_######'),
+            samples=samples,
+            resolution=resolution,
+            animation=True,
+            frame_start=first,
+            frame_end=last,
+            timeout=frame_timeout * len(frames)
+        )
+
+        if verbose:
+            print(f"  [worker-{slot}] frames {first}-{last} ({len(frames)} frames)")
+        chunk_start = time.perf_counter()
+        result = render_blend_file(source, config.output_path, config, verbose=False)
+        elapsed = time.perf_counter() - chunk_start
+
+        frame_times = parse_frame_times(result.stdout)
+        written, missing = [], []
+        for frame in frames:
+            produced = sorted(staging.glob(f"frame_{frame:06d}.*"))
+            if not produced:
+                missing.append(frame)
+                continue
+            target = Path(outputs[frame])
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(produced[0]), str(target))
+            written.append((frame, frame_times.get(produced[0].name)))
+        shutil.rmtree(staging, ignore_errors=True)
+
+        if written:
+            estimate.update(elapsed, len(written))
+        amortized = elapsed / len(frames)
+
+        with lock:
+            chunks.append({
+                'start': first,
+                'end': last,
+                'worker': slot,
+                'time': elapsed,
+                'written': len(written),
+                'success': result.success,
+            })
+            for frame, seconds in written:
+                results[f"frame_{frame:04d}"] = RenderResult(
+                    success=True,
+                    output_path=outputs[frame],
+                    render_time=seconds if seconds is not None else amortized,
+                    metadata={'frame': frame, 'chunk': [first, last]}
+                )
+            for run_first, run_last in _contiguous_runs(missing):
+                if not result.success and (run_first, run_last) not in retried:
+                    retried.add((run_first, run_last))
+                    retries.append((run_first, run_last))
+                    continue
+                for frame in range(run_first, run_last + 1):
+                    results[f"frame_{frame:04d}"] = RenderResult(
+                        success=False,
+                        stdout=result.stdout,
+                        stderr=result.stderr,
+                        error_message=result.error_message or "Frame not written by chunk render",
+                        metadata={'frame': frame, 'chunk': [first, last]}
+                    )
+
+        if verbose:
+            per_frame = f"{estimate.seconds:.1f}s/frame" if estimate.seconds else "no estimate"
+            status = "ok" if not missing else f"{len(missing)} frames missing"
+            print(f"  [worker-{slot}] frames {first}-{last}: {elapsed:.1f}s, {status} ({per_frame})")
+
+    if verbose:
+        print(f"Rendering frames {start_frame}-{end_frame} in adaptive chunks "
+              f"on {parallel} workers (target {target_chunk_seconds:g}s per chunk)")
+
+    threads = [
+        threading.Thread(target=run_worker, args=(slot,), name=f"render-chunk-{slot}")
+        for slot in range(parallel)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    ordered = {
+        f"frame_{frame:04d}": results[f"frame_{frame:04d}"]
+        for frame in outputs
+    }
+    completed = sum(1 for r in ordered.values() if r.success)
+
+    return BatchResult(
+        total_jobs=len(outputs),
+        completed=completed,
+        failed=len(outputs) - completed,
+        total_time=time.time() - start_time,
+        results=ordered,
+        metadata={
+            'mode': 'chunked',
+            'workers': parallel,
+            'frame_time_estimate': estimate.seconds,
+            'chunks': sorted(chunks, key=lambda c: c['start']),
+        }
+    )
+
+
+def _contiguous_runs(frames: List[int]) -> List[Tuple[int, int]]:
+    runs = []
+    for frame in frames:
+        if runs and frame == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], frame)
+        else:
+            runs.append((frame, frame))
+    return runs
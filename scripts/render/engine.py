@@ -6,11 +6,13 @@ This module runs OUTSIDE of Blender and calls Blender as a subprocess.
 """
 
 import os
+import math
 import subprocess
 import tempfile
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -63,6 +65,10 @@ class RenderConfig:
         if self.engine:
             args.extend(['-E', self.engine])
 
+        # Blender handles arguments in order and -f/-a render immediately,
+        # so the output path must come first.
+        args.extend(['-o', self.output_path])
+
         if self.frame is not None:
             args.extend(['-f', str(self.frame)])
         elif self.animation:
@@ -72,8 +78,6 @@ class RenderConfig:
                 args.extend(['-e', str(self.frame_end)])
             args.append('-a')
 
-        args.extend(['-o', self.output_path])
-
         return args
 
 
@@ -314,6 +318,275 @@ def render_python_code(
             pass
 
 
+def tile_grid(tiles: int) -> Tuple[int, int]:
+    """
+    Split a tile count into the squarest (columns, rows) grid.
+
+    4 -> (2, 2), 6 -> (3, 2), 8 -> (4, 2), 9 -> (3, 3)
+    """
+    tiles = max(1, tiles)
+    rows = int(math.sqrt(tiles))
+    while tiles % rows:
+        rows -= 1
+    return tiles // rows, rows
+
+
+def tile_regions(width: int, height: int, cols: int, rows: int) -> List[Dict[str, Any]]:
+    """
+    Pixel rectangles (top-down) and matching Blender borders for a tile grid.
+
+    Blender measures borders from the bottom-left as fractions of the
+    frame and turns them into pixels by truncation or rounding, depending
+    on the version. Each edge is nudged a quarter pixel inwards so both
+    give the intended pixel, and tiles meet without gaps or overlap.
+    """
+    xs = [round(i * width / cols) for i in range(cols + 1)]
+    ys = [round(i * height / rows) for i in range(rows + 1)]
+
+    def frac(pixel: int, size: int) -> float:
+        return min(1.0, (pixel + 0.25) / size) if pixel else 0.0
+
+    regions = []
+    for row in range(rows):
+        for col in range(cols):
+            x0, x1, y0, y1 = xs[col], xs[col + 1], ys[row], ys[row + 1]
+            regions.append({
+                'index': len(regions),
+                'x0': x0, 'x1': x1, 'y0': y0, 'y1': y1,
+                'border': (
+                    frac(x0, width),
+                    frac(height - y1, height),
+                    frac(x1, width),
+                    frac(height - y0, height),
+                ),
+            })
+    return regions
+
+
+def _tile_setup_expr(region: Dict[str, Any], resolution: tuple, samples: int) -> str:
+    """--python-expr that crops every render in the process to one tile.
+
+    Applied from a render_pre handler so that scene scripts, which call
+    render.configure() after this expression runs, cannot undo it. The
+    handler also sets the sample count, which a .blend source would
+    otherwise take from the file.
+    """
+    min_x, min_y, max_x, max_y = region['border']
+    return '\n'.join([
+        'import bpy',
+        'from bpy.app.handlers import persistent',
+        '@persistent',
+        'def _render_tile(scene, *args):',
+        '    r = scene.render',
+        f'    r.resolution_x, r.resolution_y = {int(resolution[0])}, {int(resolution[1])}',
+        '    r.resolution_percentage = 100',
+        '    r.use_border = True',
+        '    r.use_crop_to_border = True',
+        f'    r.border_min_x, r.border_min_y = {min_x!r}, {min_y!r}',
+        f'    r.border_max_x, r.border_max_y = {max_x!r}, {max_y!r}',
+        "    r.image_settings.file_format = 'PNG'",
+        "    r.image_settings.color_depth = '8'",
+        "    if r.engine == 'CYCLES':",
+        f'        scene.cycles.samples = {int(samples)}',
+        "    elif hasattr(scene, 'eevee'):",
+        f'        scene.eevee.taa_render_samples = {int(samples)}',
+        'bpy.app.handlers.render_pre.append(_render_tile)',
+    ])
+
+
+def _render_tile(
+    source: str,
+    region: Dict[str, Any],
+    tile_dir: str,
+    config: RenderConfig,
+    threads: int
+) -> RenderResult:
+    """Render one border region into tile_dir in its own Blender process."""
+    tile_base = os.path.join(tile_dir, f"tile_{region['index']:02d}")
+    cmd = [BLENDER_EXECUTABLE, '-b']
+    if source.endswith('.blend'):
+        cmd.append(source)
+    cmd.extend(['-t', str(threads), '--python-expr', _tile_setup_expr(region, config.resolution, config.samples)])
+    if source.endswith('.blend'):
+        cmd.extend(['-E', config.engine, '-o', tile_base + '_####',
+                    '-f', str(config.frame if config.frame is not None else 1)])
+    else:
+        width, height = config.resolution
+        cmd.extend(['-P', source, '--',
+                    '--output', tile_base + '.png',
+                    '--samples', str(config.samples),
+                    '--resolution', f'{width}x{height}'])
+
+    start_time = datetime.now()
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=config.timeout)
+    except subprocess.TimeoutExpired:
+        return RenderResult(
+            success=False,
+            error_message=f"Tile {region['index']} timed out after {config.timeout} seconds"
+        )
+    render_time = (datetime.now() - start_time).total_seconds()
+
+    written = sorted(Path(tile_dir).glob(f"tile_{region['index']:02d}*"))
+    if result.returncode != 0 or not written:
+        return RenderResult(
+            success=False,
+            render_time=render_time,
+            stdout=result.stdout,
+            stderr=result.stderr,
+            error_message=(f"Tile {region['index']}: Blender exited with code {result.returncode}"
+                           if result.returncode else f"Tile {region['index']}: no image written")
+        )
+    return RenderResult(
+        success=True,
+        output_path=str(written[0]),
+        render_time=render_time,
+        metadata={'tile': region['index']}
+    )
+
+
+def stitch_tiles(
+    tiles: List[Tuple[Dict[str, Any], str]],
+    width: int,
+    height: int,
+    output_path: str
+) -> str:
+    """
+    Losslessly assemble rendered tiles into one image with NumPy.
+
+    Args:
+        tiles: (region, tile image path) pairs from tile_regions
+        width: Full frame width in pixels
+        height: Full frame height in pixels
+        output_path: Where to write the stitched PNG
+
+    Returns:
+        output_path
+    """
+    import numpy as np
+    from PIL import Image
+
+    canvas = None
+    mode = None
+    for region, path in tiles:
+        with Image.open(path) as img:
+            if mode is not None and img.mode != mode:
+                img = img.convert(mode)
+            mode = mode or img.mode
+            pixels = np.asarray(img)
+
+        expected = (region['y1'] - region['y0'], region['x1'] - region['x0'])
+        if pixels.shape[:2] != expected:
+            raise ValueError(
+                f"Tile {region['index']} is {pixels.shape[1]}x{pixels.shape[0]}, "
+                f"expected {expected[1]}x{expected[0]} (scene resolution overridden?)"
+            )
+        if canvas is None:
+            canvas = np.zeros((height, width) + pixels.shape[2:], dtype=pixels.dtype)
+        canvas[region['y0']:region['y1'], region['x0']:region['x1']] = pixels
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    Image.fromarray(canvas).save(output_path, format='PNG')
+    return output_path
+
+
+def render_tiled(
+    source: str,
+    output_path: str,
+    config: Optional[RenderConfig] = None,
+    tiles: int = 4,
+    parallel: Optional[int] = None,
+    verbose: bool = True
+) -> RenderResult:
+    """
+    Render one still as border regions in parallel Blender processes.
+
+    The frame is split into a grid of `tiles` regions. Each region is
+    rendered with render.use_border and use_crop_to_border, and the
+    regions are stitched back together with NumPy. CPU threads are divided
+    between the concurrent processes. Tiles are 8-bit PNG, because Pillow
+    cannot read or write 16-bit colour PNGs, so the stitched still is an
+    8-bit PNG. Each process still loads the scene, so this pays off for
+    heavy frames such as 4K stills, turnarounds and key art.
+
+    Args:
+        source: Path to .blend file or scene script (which must accept
+            --output/--samples/--resolution like generated scripts)
+        output_path: Output path for the stitched PNG
+        config: Render configuration (resolution, samples, engine, frame)
+        tiles: Number of regions
+        parallel: Concurrent Blender processes (None = one per tile)
+        verbose: Print progress
+
+    Returns:
+        RenderResult with per-tile times in metadata['tile_times']
+    """
+    if config is None:
+        config = RenderConfig(output_path=output_path)
+    config.output_path = output_path
+
+    width, height = (int(v) for v in config.resolution)
+    cols, rows = tile_grid(tiles)
+    regions = tile_regions(width, height, cols, rows)
+    parallel = max(1, min(parallel or len(regions), len(regions)))
+    threads = max(1, (os.cpu_count() or 1) // parallel)
+
+    if verbose:
+        print(f"Rendering {width}x{height} still as {cols}x{rows} tiles "
+              f"({parallel} Blender processes, {threads} threads each): {source}")
+
+    start_time = datetime.now()
+    with tempfile.TemporaryDirectory(prefix='tiles-') as tile_dir:
+        with ThreadPoolExecutor(max_workers=parallel) as executor:
+            results = list(executor.map(
+                lambda region: _render_tile(source, region, tile_dir, config, threads),
+                regions
+            ))
+
+        failed = [r for r in results if not r.success]
+        if failed:
+            return RenderResult(
+                success=False,
+                render_time=(datetime.now() - start_time).total_seconds(),
+                stdout=failed[0].stdout,
+                stderr=failed[0].stderr,
+                error_message='; '.join(r.error_message for r in failed)
+            )
+
+        try:
+            stitch_tiles(
+                [(region, r.output_path) for region, r in zip(regions, results)],
+                width,
+                height,
+                output_path
+            )
+        except (ImportError, OSError, ValueError) as e:
+            return RenderResult(
+                success=False,
+                render_time=(datetime.now() - start_time).total_seconds(),
+                error_message=f"Stitching failed: {e}"
+            )
+
+    render_time = (datetime.now() - start_time).total_seconds()
+    tile_times = [r.render_time for r in results]
+    if verbose:
+        print(f"  Stitched {len(regions)} tiles in {render_time:.1f}s "
+              f"(slowest tile {max(tile_times):.1f}s): {output_path}")
+
+    return RenderResult(
+        success=True,
+        output_path=output_path,
+        render_time=render_time,
+        metadata={
+            'source': source,
+            'tiles': len(regions),
+            'grid': [cols, rows],
+            'parallel': parallel,
+            'tile_times': tile_times,
+        }
+    )
+
+
 def generate_render_script(
     scene_description: dict,
     output_path: str
@@ -406,6 +679,9 @@ def generate_render_script(
         '    # Parse arguments',
         '    output = "render.png"',
         f'    samples = {samples}',
+        f'    resolution = {tuple(res)}',
+        '    quality = None  # "preview" / "production" / None (plain configure)',
+        '    engine = "CYCLES"',
         '    ',
         '    if "--" in sys.argv:',
         '        args = sys.argv[sys.argv.index("--") + 1:]',
@@ -414,14 +690,25 @@ def generate_render_script(
         '                output = args[i + 1]',
         '            elif arg == "--samples" and i + 1 < len(args):',
         '                samples = int(args[i + 1])',
+        '            elif arg == "--resolution" and i + 1 < len(args):',
+        '                resolution = tuple(int(v) for v in args[i + 1].lower().split("x"))',
+        '            elif arg == "--quality" and i + 1 < len(args):',
+        '                quality = args[i + 1]',
+        '            elif arg == "--engine" and i + 1 < len(args):',
+        '                engine = args[i + 1]',
         '    ',
         '    setup_scene()',
         '    ',
-        f'    render.configure(',
-        f'        output_path=output,',
-        f'        resolution={res},',
-        '        samples=samples',
-        '    )',
+        '    if quality == "preview":',
+        '        render.configure_for_preview(',
+        '            output_path=output, resolution=resolution, samples=samples, engine=engine',
+        '        )',
+        '    elif quality == "production":',
+        '        render.configure_for_production(',
+        '            output_path=output, resolution=resolution, samples=samples',
+        '        )',
+        '    else:',
+        '        render.configure(output_path=output, resolution=resolution, samples=samples)',
         '    render.execute()',
         '    ',
         '    print(f"Render complete: {{output}}")',
@@ -504,6 +791,48 @@ class RenderEngine:
                 config=config
             )
 
+    def render_tiled(
+        self,
+        script_or_blend: str,
+        output_path: str,
+        tiles: int = 4,
+        **kwargs
+    ) -> RenderResult:
+        """
+        Render a high-resolution still as parallel border tiles.
+
+        Args:
+            script_or_blend: Path to .py script or .blend file
+            output_path: Output render path
+            tiles: Number of regions to split the frame into
+            **kwargs: Additional configuration options (parallel, resolution,
+                samples, engine, frame, timeout)
+
+        Returns:
+            RenderResult
+        """
+        if not self.available:
+            return RenderResult(
+                success=False,
+                error_message=f"Blender not available: {self.version}"
+            )
+
+        config = RenderConfig(
+            output_path=output_path,
+            resolution=kwargs.get('resolution', (1920, 1080)),
+            samples=kwargs.get('samples', 128),
+            engine=kwargs.get('engine', 'CYCLES'),
+            frame=kwargs.get('frame'),
+            timeout=kwargs.get('timeout', 600)
+        )
+        return render_tiled(
+            script_or_blend,
+            output_path,
+            config,
+            tiles=tiles,
+            parallel=kwargs.get('parallel')
+        )
+
     def render_code(self, code: str, output_path: str, **kwargs) -> RenderResult:
         """
         Render inline Python code.
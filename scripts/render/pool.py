@@ -0,0 +1,414 @@
+"""
+Persistent Blender Worker Pool
+
+Rendering an animation one `blender -b` process per frame pays Blender
+startup and scene load on every frame, which dominates short frames.
+This module keeps N long-lived Blender processes (blender_worker.py) with
+the scene already loaded and streams frame-range chunks to them.
+
+- Each worker loads the .blend file, or runs the scene script's setup,
+  exactly once.
+- Chunks come from a shared queue, so faster workers pick up more of them.
+- Every frame reports its own render time.
+- A worker that crashes or hangs is restarted. The unfinished frames of
+  its chunk go back on the queue. A frame that takes down a worker
+  MAX_FRAME_ATTEMPTS times is marked failed rather than retried forever.
+"""
+
+import collections
+import json
+import math
+import queue
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Optional, Callable, Iterator, Tuple
+
+from . import engine
+from .engine import RenderResult
+from .batch import BatchResult
+
+WORKER_SCRIPT = str(Path(__file__).with_name('blender_worker.py'))
+
+# Must match blender_worker.PROTOCOL_PREFIX (that module imports bpy, so
+# it cannot be imported from here).
+PROTOCOL_PREFIX = "@@render-worker "
+
+MAX_FRAME_ATTEMPTS = 2   # worker crashes one frame may cause
+MAX_RESTARTS = 3         # per worker slot, before the slot gives up
+LOG_TAIL_LINES = 40
+
+
+class WorkerCrashed(Exception):
+    """The Blender worker exited or stopped responding."""
+
+
+class BlenderWorker:
+    """One long-lived Blender process with the scene loaded."""
+
+    def __init__(
+        self,
+        source: str,
+        render_engine: str = 'CYCLES',
+        timeout: int = 600,
+        name: str = 'worker-0',
+        samples: Optional[int] = None,
+        resolution: Optional[tuple] = None
+    ):
+        """
+        Args:
+            source: Path to .blend file or scene setup .py script
+            render_engine: Blender render engine (-E)
+            timeout: Seconds to wait for startup or for any single frame
+            name: Label used in logs and frame metadata
+            samples: Samples a scene script is configured with (None =
+                the script's render.configure default)
+            resolution: Resolution a scene script is configured with
+        """
+        self.source = source
+        self.render_engine = render_engine
+        self.samples = samples
+        self.resolution = resolution
+        self.timeout = timeout
+        self.name = name
+        self.startup_time = 0.0
+        self._proc: Optional[subprocess.Popen] = None
+        self._messages: "queue.Queue[Optional[dict]]" = queue.Queue()
+        self._log = collections.deque(maxlen=LOG_TAIL_LINES)
+
+    def command(self) -> List[str]:
+        cmd = [engine.BLENDER_EXECUTABLE, '-b']
+        if self.source.endswith('.blend'):
+            cmd.append(self.source)
+        cmd.extend(['-E', self.render_engine, '-P', WORKER_SCRIPT])
+        if not self.source.endswith('.blend'):
+            cmd.extend(['--', '--setup', self.source, '--engine', self.render_engine])
+            if self.samples is not None:
+                cmd.extend(['--samples', str(self.samples)])
+            if self.resolution is not None:
+                cmd.extend(['--resolution', f"{self.resolution[0]}x{self.resolution[1]}"])
+        return cmd
+
+    def start(self) -> float:
+        """Launch Blender and wait until the scene is loaded.
+
+        Returns:
+            Startup time in seconds
+        """
+        start = time.perf_counter()
+        try:
+            self._proc = subprocess.Popen(
+                self.command(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1
+            )
+        except OSError as e:
+            raise WorkerCrashed(f"Could not start Blender: {e}")
+
+        threading.Thread(
+            target=self._read_output,
+            name=f"{self.name}-reader",
+            daemon=True
+        ).start()
+
+        message = self._next_message()
+        if not message.get('ready'):
+            raise WorkerCrashed(f"Unexpected worker greeting: {message}")
+        self.startup_time = time.perf_counter() - start
+        return self.startup_time
+
+    def render_chunk(
+        self,
+        frames: List[Tuple[int, str]],
+        samples: Optional[int] = None,
+        resolution: Optional[tuple] = None
+    ) -> Iterator[dict]:
+        """Render (frame, output_path) pairs; yields one reply per frame.
+
+        Samples and resolution override the scene's settings only when given.
+
+        Raises:
+            WorkerCrashed: if Blender exits or a frame exceeds the timeout
+        """
+        request = {'frames': [[frame, output] for frame, output in frames]}
+        if samples is not None:
+            request['samples'] = samples
+        if resolution is not None:
+            request['resolution'] = list(resolution)
+        try:
+            self._proc.stdin.write(json.dumps(request) + "\n")
+            self._proc.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise WorkerCrashed(f"Worker stdin closed: {e}")
+
+        while True:
+            message = self._next_message()
+            if message.get('chunk_done'):
+                return
+            if 'frame' in message:
+                yield message
+
+    def stop(self) -> None:
+        """Ask the worker to quit; kill it if it does not."""
+        proc = self._proc
+        if proc is None:
+            return
+        self._proc = None
+        try:
+            if proc.poll() is None:
+                proc.stdin.write(json.dumps({'quit': True}) + "\n")
+                proc.stdin.flush()
+                proc.stdin.close()
+                proc.wait(timeout=10)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            proc.kill()
+            proc.wait()
+
+    def log_tail(self) -> str:
+        return "\n".join(self._log)
+
+    def _next_message(self) -> dict:
+        try:
+            message = self._messages.get(timeout=self.timeout)
+        except queue.Empty:
+            self._kill()
+            raise WorkerCrashed(f"No response from worker in {self.timeout}s")
+        if message is None:
+            code = self._proc.wait() if self._proc else None
+            raise WorkerCrashed(f"Blender exited with code {code}")
+        return message
+
+    def _read_output(self) -> None:
+        proc = self._proc
+        for line in proc.stdout:
+            if line.startswith(PROTOCOL_PREFIX):
+                try:
+                    self._messages.put(json.loads(line[len(PROTOCOL_PREFIX):]))
+                    continue
+                except ValueError:
+                    pass
+            self._log.append(line.rstrip())
+        self._messages.put(None)
+
+    def _kill(self) -> None:
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.kill()
+
+
+def default_chunk_size(frame_count: int, workers: int) -> int:
+    """About four chunks per worker: short enough to balance load, long
+    enough that per-chunk overhead stays negligible."""
+    return max(1, math.ceil(frame_count / (max(1, workers) * 4)))
+
+
+def render_frames_pooled(
+    source: str,
+    output_pattern: str,
+    start_frame: int,
+    end_frame: int,
+    samples: Optional[int] = None,
+    resolution: Optional[tuple] = None,
+    workers: int = 2,
+    chunk_size: Optional[int] = None,
+    render_engine: str = 'CYCLES',
+    timeout: int = 600,
+    progress_callback: Optional[Callable[[str, RenderResult], None]] = None,
+    verbose: bool = True
+) -> BatchResult:
+    """
+    Render animation frames on a pool of persistent Blender workers.
+
+    Args:
+        source: Path to .blend file or scene setup .py script
+        output_pattern: Output pattern with {frame} placeholder
+        start_frame: First frame number
+        end_frame: Last frame number
+        samples: Render samples (None = keep the scene's setting)
+        resolution: Render resolution (width, height) (None = keep the
+            scene's setting)
+        workers: Number of Blender processes
+        chunk_size: Frames per chunk (None = default_chunk_size)
+        render_engine: Blender render engine
+        timeout: Seconds allowed for worker startup and for each frame
+        progress_callback: Called after each frame (from worker threads)
+        verbose: Print progress
+
+    Returns:
+        BatchResult with one result per frame, named frame_NNNN.
+        Its metadata holds worker startup times, restarts and frame timing.
+    """
+    start_time = time.time()
+    frames = [
+        (frame, output_pattern.format(frame=frame, f=frame))
+        for frame in range(start_frame, end_frame + 1)
+    ]
+    for _, output in frames:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+
+    workers = max(1, min(workers, len(frames) or 1))
+    if chunk_size is None:
+        chunk_size = default_chunk_size(len(frames), workers)
+
+    chunks = collections.deque(
+        frames[i:i + chunk_size] for i in range(0, len(frames), chunk_size)
+    )
+    attempts: Dict[int, int] = collections.defaultdict(int)
+    results: Dict[str, RenderResult] = {}
+    startup_times: List[float] = []
+    restarts = [0]
+    lock = threading.Lock()
+
+    def record(frame: int, result: RenderResult) -> None:
+        name = f"frame_{frame:04d}"
+        with lock:
+            results[name] = result
+        if verbose:
+            status = f"{result.render_time:.1f}s" if result.success else f"FAILED: {result.error_message}"
+            print(f"  [{result.metadata.get('worker')}] frame {frame}: {status}")
+        if progress_callback:
+            progress_callback(name, result)
+
+    def take_chunk() -> Optional[List[Tuple[int, str]]]:
+        with lock:
+            return chunks.popleft() if chunks else None
+
+    def requeue(chunk: List[Tuple[int, str]]) -> None:
+        if chunk:
+            with lock:
+                chunks.appendleft(chunk)
+
+    def run_slot(slot: int) -> None:
+        name = f"worker-{slot}"
+        worker = None
+        slot_restarts = 0
+        try:
+            while True:
+                chunk = take_chunk()
+                if chunk is None:
+                    return
+
+                if worker is None:
+                    worker = BlenderWorker(
+                        source, render_engine, timeout, name,
+                        samples=samples, resolution=resolution
+                    )
+                    try:
+                        startup = worker.start()
+                    except WorkerCrashed as e:
+                        worker.stop()
+                        worker = None
+                        requeue(chunk)
+                        slot_restarts += 1
+                        if verbose:
+                            print(f"  [{name}] failed to start: {e}")
+                        if slot_restarts > MAX_RESTARTS:
+                            return
+                        continue
+                    with lock:
+                        startup_times.append(startup)
+                    if verbose:
+                        print(f"  [{name}] scene loaded in {startup:.1f}s")
+
+                pending = list(chunk)
+                try:
+                    for message in worker.render_chunk(chunk, samples, resolution):
+                        frame = message['frame']
+                        output = dict(pending).get(frame)
+                        pending = [p for p in pending if p[0] != frame]
+                        error = message.get('error')
+                        if message.get('ok') and not Path(output).exists():
+                            error = "Worker reported frame but output file not found"
+                        record(frame, RenderResult(
+                            success=error is None,
+                            output_path=output if error is None else None,
+                            render_time=message.get('time', 0.0),
+                            error_message=error,
+                            metadata={'frame': frame, 'worker': name, 'pooled': True}
+                        ))
+                except WorkerCrashed as e:
+                    log = worker.log_tail()
+                    worker.stop()
+                    worker = None
+                    slot_restarts += 1
+                    with lock:
+                        restarts[0] += 1
+                    if verbose:
+                        print(f"  [{name}] crashed ({e}); restarting")
+
+                    # The first unfinished frame is the one that was rendering.
+                    if pending:
+                        frame, output = pending[0]
+                        attempts[frame] += 1
+                        if attempts[frame] >= MAX_FRAME_ATTEMPTS:
+                            record(frame, RenderResult(
+                                success=False,
+                                stdout=log,
+                                error_message=f"Worker crashed on this frame {attempts[frame]} times: {e}",
+                                metadata={'frame': frame, 'worker': name, 'pooled': True}
+                            ))
+                            pending = pending[1:]
+                    requeue(pending)
+                    if slot_restarts > MAX_RESTARTS:
+                        return
+        finally:
+            if worker is not None:
+                worker.stop()
+
+    if verbose:
+        print(f"Rendering {len(frames)} frames on {workers} persistent "
+              f"Blender workers ({len(chunks)} chunks of <= {chunk_size})")
+
+    threads = [
+        threading.Thread(target=run_slot, args=(slot,), name=f"render-pool-{slot}")
+        for slot in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every slot gave up: whatever is left never rendered.
+    for frame, _ in frames:
+        if f"frame_{frame:04d}" not in results:
+            record(frame, RenderResult(
+                success=False,
+                error_message="No Blender worker could be started",
+                metadata={'frame': frame, 'worker': None, 'pooled': True}
+            ))
+
+    ordered = {f"frame_{frame:04d}": results[f"frame_{frame:04d}"] for frame, _ in frames}
+    frame_times = [r.render_time for r in ordered.values() if r.success]
+    completed = len(frame_times)
+    total_time = time.time() - start_time
+
+    metadata = {
+        'mode': 'worker_pool',
+        'workers': workers,
+        'chunk_size': chunk_size,
+        'worker_startup_times': startup_times,
+        'worker_restarts': restarts[0],
+        'frame_time': {
+            'mean': sum(frame_times) / completed if completed else 0.0,
+            'min': min(frame_times, default=0.0),
+            'max': max(frame_times, default=0.0),
+        },
+    }
+
+    if verbose:
+        ft = metadata['frame_time']
+        print(f"Pool finished: {completed}/{len(frames)} frames in {total_time:.1f}s "
+              f"(frame mean {ft['mean']:.1f}s, min {ft['min']:.1f}s, max {ft['max']:.1f}s; "
+              f"{restarts[0]} worker restarts)")
+
+    return BatchResult(
+        total_jobs=len(frames),
+        completed=completed,
+        failed=len(frames) - completed,
+        total_time=total_time,
+        results=ordered,
+        metadata=metadata
+    )
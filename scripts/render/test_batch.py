@@ -0,0 +1,153 @@
+"""Unit tests for the ``render_jobs`` scheduler in ``scripts.render.batch``.
+
+Run with::
+
+    python3 -m pytest scripts/render/test_batch.py -v
+
+``_execute_job`` is replaced with a stub, so no Blender is needed.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from scripts.render import batch
+from scripts.render.batch import BatchJob, render_jobs
+from scripts.render.engine import RenderResult
+
+
+class _StubExecutor:
+    """Stands in for ``_execute_job``; jobs named in ``fail`` fail that many times."""
+
+    def __init__(self):
+        self.calls: list[str] = []
+        self.fail: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, job, verbose):
+        with self._lock:
+            self.calls.append(job.name)
+            if self.fail.get(job.name, 0) > 0:
+                self.fail[job.name] -= 1
+                return RenderResult(success=False, error_message="render crashed")
+        Path(job.output).write_text(job.name)
+        return RenderResult(success=True, output_path=job.output, render_time=1.0)
+
+
+@pytest.fixture
+def executor(monkeypatch) -> _StubExecutor:
+    stub = _StubExecutor()
+    monkeypatch.setattr(batch, "_execute_job", stub)
+    return stub
+
+
+def _job(tmp_path, name, **kwargs) -> BatchJob:
+    return BatchJob(name=name, source="scene.py", output=str(tmp_path / f"{name}.png"), **kwargs)
+
+
+def test_ready_jobs_run_by_priority_then_submission_order(tmp_path, executor):
+    jobs = [
+        _job(tmp_path, "low"),
+        _job(tmp_path, "high", priority=5),
+        _job(tmp_path, "mid", priority=1),
+        _job(tmp_path, "also_low"),
+    ]
+    result = render_jobs(jobs, parallel=1, verbose=False)
+
+    assert result.completed == 4
+    assert executor.calls == ["high", "mid", "low", "also_low"]
+
+
+def test_dependents_wait_for_their_dependencies(tmp_path, executor):
+    jobs = [
+        _job(tmp_path, "comp", priority=9, dependencies=["bg", "fg"]),
+        _job(tmp_path, "bg"),
+        _job(tmp_path, "fg"),
+    ]
+    render_jobs(jobs, parallel=2, verbose=False)
+
+    calls = executor.calls
+    assert calls.index("comp") > max(calls.index("bg"), calls.index("fg"))
+
+
+def test_failed_render_is_retried_up_to_its_limit(tmp_path, executor):
+    executor.fail.update({"flaky": 1, "broken": 5})
+    jobs = [
+        _job(tmp_path, "flaky", retries=1),
+        _job(tmp_path, "broken", retries=2),
+        _job(tmp_path, "after_broken", dependencies=["broken"]),
+    ]
+    result = render_jobs(jobs, parallel=1, verbose=False)
+
+    assert result.results["flaky"].success
+    assert result.results["flaky"].metadata["attempts"] == 2
+    assert not result.results["broken"].success
+    assert executor.calls.count("broken") == 3
+    assert "after_broken" not in executor.calls
+    assert result.results["after_broken"].error_message == "Unmet dependencies: ['broken']"
+
+
+def test_missing_and_cyclic_dependencies_fail_without_rendering(tmp_path, executor):
+    jobs = [
+        _job(tmp_path, "orphan", dependencies=["nope"]),
+        _job(tmp_path, "a", dependencies=["b"]),
+        _job(tmp_path, "b", dependencies=["a"]),
+        _job(tmp_path, "fine"),
+    ]
+    result = render_jobs(jobs, verbose=False)
+
+    assert executor.calls == ["fine"]
+    assert result.completed == 1 and result.failed == 3
+    assert result.results["orphan"].error_message == "Unmet dependencies: ['nope']"
+
+
+def test_resume_skips_jobs_finished_by_an_earlier_run(tmp_path, executor):
+    state_path = str(tmp_path / "state.json")
+    executor.fail["second"] = 1
+    jobs = [_job(tmp_path, "first"), _job(tmp_path, "second"), _job(tmp_path, "third")]
+
+    first_run = render_jobs(jobs, verbose=False, state_path=state_path)
+    assert first_run.completed == 2
+    assert set(json.loads(Path(state_path).read_text())["jobs"]) == {"first", "third"}
+
+    executor.calls.clear()
+    Path(jobs[2].output).unlink()  # output gone: must render again
+    second_run = render_jobs(jobs, verbose=False, state_path=state_path)
+
+    assert second_run.completed == 3
+    assert executor.calls == ["second", "third"]
+    assert second_run.results["first"].output_path == jobs[0].output
+
+
+def test_resume_rerenders_a_job_whose_scene_changed(tmp_path, executor):
+    state_path = str(tmp_path / "state.json")
+    scene = tmp_path / "scene.py"
+    scene.write_text("CUBE = 1\n")
+    executor.fail["blocker"] = 1
+    jobs = [
+        BatchJob(name="shot", source=str(scene), output=str(tmp_path / "shot.png")),
+        _job(tmp_path, "blocker"),
+    ]
+    render_jobs(jobs, verbose=False, state_path=state_path)
+
+    scene.write_text("CUBE = 2\n")
+    executor.calls.clear()
+    render_jobs(jobs, verbose=False, state_path=state_path)
+
+    assert executor.calls == ["shot", "blocker"]
+
+
+def test_state_file_is_removed_once_every_job_succeeded(tmp_path, executor):
+    state_path = tmp_path / "state.json"
+    executor.fail["second"] = 1
+    jobs = [_job(tmp_path, "first"), _job(tmp_path, "second")]
+
+    render_jobs(jobs, verbose=False, state_path=str(state_path))
+    assert state_path.exists()
+
+    render_jobs(jobs, verbose=False, state_path=str(state_path))
+    assert not state_path.exists()
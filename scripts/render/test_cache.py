@@ -0,0 +1,115 @@
+"""Unit tests for ``scripts.render.cache``.
+
+Run with::
+
+    python3 -m pytest scripts/render/test_cache.py -v
+
+The Blender version is pinned so fingerprints do not depend on an install.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from scripts.render import cache as render_cache
+from scripts.render.cache import RenderCache
+from scripts.render.engine import RenderConfig, RenderResult
+
+
+@pytest.fixture(autouse=True)
+def _pinned_blender(monkeypatch):
+    monkeypatch.setattr(render_cache, "blender_version", lambda: "Blender 4.0.0")
+
+
+@pytest.fixture
+def scene(tmp_path):
+    source = tmp_path / "scene.py"
+    source.write_text("def setup_scene():\n    pass\n")
+    return source
+
+
+def _render_into(output):
+    def render():
+        output.write_text("pixels")
+        return RenderResult(success=True, output_path=str(output), render_time=12.5)
+    return render
+
+
+def test_lookup_misses_then_hits_after_a_render(tmp_path, scene):
+    output = tmp_path / "out.png"
+    config = RenderConfig(output_path=str(output), samples=64)
+    cache = RenderCache.for_dir(str(tmp_path))
+
+    cached, _, reason = cache.lookup(str(scene), str(output), config)
+    assert cached is None and reason == "not rendered before"
+
+    first = cache.render(str(scene), str(output), config, _render_into(output))
+    assert first.metadata["cache"]["status"] == "miss"
+
+    # A fresh instance reads the manifest back from disk.
+    cached, _, reason = RenderCache.for_dir(str(tmp_path)).lookup(str(scene), str(output), config)
+    assert reason is None
+    assert cached.success and cached.render_time == 0.0
+    assert cached.metadata["cache"]["status"] == "hit"
+    assert cached.metadata["cache"]["saved_time"] == 12.5
+
+
+@pytest.mark.parametrize("change", ["source", "config", "extra"])
+def test_lookup_misses_when_inputs_change(tmp_path, scene, change):
+    output = tmp_path / "out.png"
+    config = RenderConfig(output_path=str(output), samples=64)
+    cache = RenderCache.for_dir(str(tmp_path))
+    cache.render(str(scene), str(output), config, _render_into(output), extra={"shot": "1A"})
+
+    extra = {"shot": "1A"}
+    if change == "source":
+        scene.write_text("def setup_scene():\n    print('moved the camera')\n")
+    elif change == "config":
+        config = RenderConfig(output_path=str(output), samples=128)
+    else:
+        extra = {"shot": "1B"}
+
+    cached, _, reason = cache.lookup(str(scene), str(output), config, extra)
+    assert cached is None and reason == "inputs changed"
+
+
+def test_lookup_misses_when_a_linked_asset_changes(tmp_path):
+    texture = tmp_path / "wood.png"
+    texture.write_bytes(b"v1")
+    source = tmp_path / "scene.py"
+    source.write_text("TEXTURE = 'wood.png'\n")
+    output = tmp_path / "out.png"
+    config = RenderConfig(output_path=str(output))
+    cache = RenderCache.for_dir(str(tmp_path))
+    cache.render(str(source), str(output), config, _render_into(output))
+
+    texture.write_bytes(b"v2 with more bytes")
+
+    cached, _, reason = cache.lookup(str(source), str(output), config)
+    assert cached is None and reason == "inputs changed"
+
+
+def test_lookup_misses_when_output_was_deleted(tmp_path, scene):
+    output = tmp_path / "out.png"
+    config = RenderConfig(output_path=str(output))
+    cache = RenderCache.for_dir(str(tmp_path))
+    cache.render(str(scene), str(output), config, _render_into(output))
+
+    output.unlink()
+
+    cached, _, reason = cache.lookup(str(scene), str(output), config)
+    assert cached is None and reason == "output missing"
+
+
+def test_failed_render_is_not_cached(tmp_path, scene):
+    output = tmp_path / "out.png"
+    config = RenderConfig(output_path=str(output))
+    cache = RenderCache.for_dir(str(tmp_path))
+
+    failed = cache.render(
+        str(scene), str(output), config,
+        lambda: RenderResult(success=False, error_message="boom"),
+    )
+
+    assert failed.metadata["cache"]["reason"] == "not rendered before"
+    assert cache.entries == {}
@@ -0,0 +1,90 @@
+"""Unit tests for the chunk sizing helpers in ``scripts.render.chunked``.
+
+Run with::
+
+    python3 -m pytest scripts/render/test_chunked.py -v
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from scripts.render import chunked
+from scripts.render.chunked import (
+    INITIAL_CHUNK,
+    _contiguous_runs,
+    chunk_size,
+    parse_frame_times,
+    render_frames_chunked,
+)
+from scripts.render.engine import RenderResult
+
+
+def test_first_chunk_is_short_until_there_is_an_estimate():
+    assert chunk_size(None, remaining=100, parallel=1, target_chunk_seconds=120) == INITIAL_CHUNK
+    assert chunk_size(None, remaining=1, parallel=4, target_chunk_seconds=120) == 1
+
+
+@pytest.mark.parametrize("estimate, remaining, parallel, expected", [
+    (10.0, 100, 1, 12),    # 120s target / 10s per frame
+    (10.0, 20, 4, 5),      # capped at an even share of what is left
+    (300.0, 100, 1, 1),    # slower than the target: one frame at a time
+    (0.0, 7, 1, 7),        # instant frames: everything remaining
+    (10.0, 0, 2, 1),       # never below one frame
+])
+def test_chunk_size_targets_wall_time_within_a_fair_share(estimate, remaining, parallel, expected):
+    assert chunk_size(estimate, remaining, parallel, target_chunk_seconds=120) == expected
+
+
+def test_parse_frame_times_pairs_saved_files_with_their_time():
+    stdout = "\n".join([
+        "Fra:1 Mem:12.00M | Rendering 1 / 64 samples",
+        "Saved: '/tmp/out/.chunk-000001-000003/frame_000001.png'",
+        " Time: 00:04.25 (Saving: 00:00.01)",
+        "Saved: '/tmp/out/.chunk-000001-000003/frame_000002.png'",
+        " Time: 01:02:03.50 (Saving: 00:00.02)",
+        "Saved: '/tmp/out/.chunk-000001-000003/frame_000003.png'",
+        "Blender quit",
+    ])
+
+    assert parse_frame_times(stdout) == {
+        "frame_000001.png": pytest.approx(4.25),
+        "frame_000002.png": pytest.approx(3723.5),
+    }
+
+
+def test_parse_frame_times_ignores_time_lines_without_a_saved_file():
+    assert parse_frame_times(" Time: 00:01.00 (Saving: 00:00.00)\n") == {}
+
+
+@pytest.mark.parametrize("frames, runs", [
+    ([], []),
+    ([4], [(4, 4)]),
+    ([1, 2, 3], [(1, 3)]),
+    ([1, 2, 5, 7, 8, 9], [(1, 2), (5, 5), (7, 9)]),
+])
+def test_contiguous_runs(frames, runs):
+    assert _contiguous_runs(frames) == runs
+
+
+def test_chunk_that_raises_fails_its_frames_not_the_run(tmp_path, monkeypatch):
+    def render_blend_file(source, output_path, config, verbose=False):
+        if config.frame_start <= 3 <= config.frame_end:
+            raise OSError("staging disk full")
+        for frame in range(config.frame_start, config.frame_end + 1):
+            Path(output_path.replace("######", f"{frame:06d}") + ".png").write_bytes(b"png")
+        return RenderResult(success=True, render_time=0.1)
+
+    monkeypatch.setattr(chunked, "render_blend_file", render_blend_file)
+    batch = render_frames_chunked(
+        "scene.blend", str(tmp_path / "frame_{frame:04d}.png"), 1, 6, verbose=False
+    )
+
+    assert list(batch.results) == [f"frame_{n:04d}" for n in range(1, 7)]
+    failed = [name for name, r in batch.results.items() if not r.success]
+    # Frames 1-2 measured a fast estimate, so 3-6 went out as one chunk.
+    assert failed == ["frame_0003", "frame_0004", "frame_0005", "frame_0006"]
+    assert "OSError: staging disk full" in batch.results["frame_0006"].error_message
+    assert batch.completed == 2
@@ -0,0 +1,62 @@
+"""Unit tests for the tiled-still helpers in ``scripts.render.engine``.
+
+Run with::
+
+    python3 -m pytest scripts/render/test_engine.py -v
+"""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from scripts.render.engine import _tile_setup_expr, tile_grid, tile_regions
+
+
+@pytest.mark.parametrize("tiles, grid", [
+    (1, (1, 1)), (2, (2, 1)), (4, (2, 2)), (6, (3, 2)),
+    (7, (7, 1)), (8, (4, 2)), (9, (3, 3)), (0, (1, 1)),
+])
+def test_tile_grid_is_the_squarest_split(tiles, grid):
+    assert tile_grid(tiles) == grid
+
+
+@pytest.mark.parametrize("width, height, tiles", [
+    (192, 108, 4), (192, 108, 6), (101, 67, 9), (384, 216, 8), (7, 5, 4),
+])
+def test_tile_regions_cover_the_frame_exactly(width, height, tiles):
+    regions = tile_regions(width, height, *tile_grid(tiles))
+
+    covered = set()
+    for r in regions:
+        pixels = {(x, y) for x in range(r["x0"], r["x1"]) for y in range(r["y0"], r["y1"])}
+        assert not covered & pixels
+        covered |= pixels
+    assert len(covered) == width * height
+    assert [r["index"] for r in regions] == list(range(len(regions)))
+
+
+@pytest.mark.parametrize("to_pixel", [math.floor, round], ids=["truncate", "round"])
+@pytest.mark.parametrize("width, height, tiles", [
+    (1920, 1080, 4), (1001, 677, 9), (3840, 2160, 8), (7, 5, 4),
+])
+def test_tile_borders_round_trip_to_the_tile_pixels(to_pixel, width, height, tiles):
+    for r in tile_regions(width, height, *tile_grid(tiles)):
+        min_x, min_y, max_x, max_y = r["border"]
+        # Borders are bottom-up; tile rectangles are top-down.
+        assert to_pixel(min_x * width) == r["x0"]
+        assert to_pixel(max_x * width) == r["x1"]
+        assert to_pixel(min_y * height) == height - r["y1"]
+        assert to_pixel(max_y * height) == height - r["y0"]
+
+
+def test_tile_setup_expr_applies_resolution_and_samples():
+    region = tile_regions(1920, 1080, 2, 2)[3]
+    expr = _tile_setup_expr(region, (1920, 1080), 48)
+
+    compile(expr, "<tile-setup>", "exec")
+    assert "r.resolution_x, r.resolution_y = 1920, 1080" in expr
+    assert "scene.cycles.samples = 48" in expr
+    assert "scene.eevee.taa_render_samples = 48" in expr
+    assert "render_pre.append" in expr
@@ -0,0 +1,139 @@
+"""Unit tests for ``scripts.render.pool``.
+
+Run with::
+
+    python3 -m pytest scripts/render/test_pool.py -v
+
+A small Python script stands in for Blender: it speaks the worker
+protocol on stdin/stdout and crashes on the frames a test asks it to.
+"""
+
+from __future__ import annotations
+
+import json
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+
+from scripts.render import engine
+from scripts.render.pool import PROTOCOL_PREFIX, BlenderWorker, render_frames_pooled
+
+FAKE_BLENDER = """#!{python}
+import json, os, sys
+STATE = {state!r}
+CRASH_ONCE = {crash_once!r}
+CRASH_ALWAYS = {crash_always!r}
+P = {prefix!r}
+
+with open(os.path.join(STATE, "argv.log"), "a") as f:
+    f.write(json.dumps(sys.argv[1:]) + "\\n")
+print("Blender fake log line", flush=True)
+print(P + json.dumps({{"ready": True}}), flush=True)
+for line in sys.stdin:
+    request = json.loads(line)
+    if request.get("quit"):
+        break
+    with open(os.path.join(STATE, "requests.log"), "a") as f:
+        f.write(line)
+    for frame, output in request["frames"]:
+        marker = os.path.join(STATE, "crashed-%d" % frame)
+        if frame in CRASH_ALWAYS or (frame in CRASH_ONCE and not os.path.exists(marker)):
+            open(marker, "w").close()
+            os._exit(1)
+        with open(output, "w") as f:
+            f.write("x")
+        print(P + json.dumps({{"frame": frame, "ok": True, "output": output, "time": 0.01}}), flush=True)
+    print(P + json.dumps({{"chunk_done": True}}), flush=True)
+"""
+
+
+@pytest.fixture
+def fake_blender(tmp_path, monkeypatch):
+    """Install a fake Blender; returns a function taking the crash frames."""
+    state = tmp_path / "state"
+    state.mkdir()
+
+    def install(crash_once=(), crash_always=()):
+        exe = tmp_path / "blender"
+        exe.write_text(FAKE_BLENDER.format(
+            python=sys.executable,
+            state=str(state),
+            crash_once=list(crash_once),
+            crash_always=list(crash_always),
+            prefix=PROTOCOL_PREFIX,
+        ))
+        exe.chmod(exe.stat().st_mode | stat.S_IEXEC)
+        monkeypatch.setattr(engine, "BLENDER_EXECUTABLE", str(exe))
+        return state
+
+    return install
+
+
+def _requests(state: Path) -> list[dict]:
+    return [json.loads(line) for line in (state / "requests.log").read_text().splitlines()]
+
+
+def _render(tmp_path, source="scene.blend", **kwargs):
+    return render_frames_pooled(
+        str(tmp_path / source),
+        str(tmp_path / "out" / "frame_{frame:04d}.png"),
+        1, 6,
+        verbose=False,
+        **kwargs,
+    )
+
+
+def test_renders_every_frame_in_order(tmp_path, fake_blender):
+    fake_blender()
+    batch = _render(tmp_path, workers=2, chunk_size=2)
+
+    assert batch.completed == 6 and batch.failed == 0
+    assert list(batch.results) == [f"frame_{n:04d}" for n in range(1, 7)]
+    assert all(Path(r.output_path).exists() for r in batch.results.values())
+    assert batch.metadata["worker_restarts"] == 0
+
+
+def test_crashed_frame_is_requeued_on_a_restarted_worker(tmp_path, fake_blender):
+    state = fake_blender(crash_once=[3])
+    batch = _render(tmp_path, workers=1, chunk_size=3)
+
+    assert batch.completed == 6
+    assert batch.metadata["worker_restarts"] == 1
+    # Frames 1-2 were not rendered again after the crash.
+    rendered = [f for request in _requests(state) for f, _ in request["frames"]]
+    assert rendered.count(1) == 1 and rendered.count(3) == 2
+
+
+def test_frame_that_keeps_crashing_is_marked_failed(tmp_path, fake_blender):
+    fake_blender(crash_always=[4])
+    batch = _render(tmp_path, workers=1, chunk_size=2)
+
+    assert batch.completed == 5 and batch.failed == 1
+    failed = batch.results["frame_0004"]
+    assert not failed.success
+    assert "crashed on this frame 2 times" in failed.error_message
+    assert "Blender fake log line" in failed.stdout
+
+
+def test_blend_settings_are_not_overridden_unless_given(tmp_path, fake_blender):
+    state = fake_blender()
+    _render(tmp_path, workers=1, chunk_size=6)
+    assert set(_requests(state)[0]) == {"frames"}
+
+    (state / "requests.log").unlink()
+    _render(tmp_path, workers=1, chunk_size=6, samples=16, resolution=(640, 360))
+    request = _requests(state)[0]
+    assert request["samples"] == 16 and request["resolution"] == [640, 360]
+
+
+def test_script_worker_is_told_how_to_configure_the_scene():
+    worker = BlenderWorker("scene.py", "BLENDER_EEVEE", samples=32, resolution=(1280, 720))
+    cmd = worker.command()
+
+    assert cmd[cmd.index("--") + 1:] == [
+        "--setup", "scene.py", "--engine", "BLENDER_EEVEE",
+        "--samples", "32", "--resolution", "1280x720",
+    ]
+    assert "--samples" not in BlenderWorker("scene.blend", samples=32).command()
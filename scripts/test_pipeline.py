@@ -0,0 +1,107 @@
+"""Unit tests for the progressive iterative loop in ``scripts/pipeline.py``.
+
+Run with::
+
+    python3 -m pytest scripts/test_pipeline.py -v
+
+``scripts/pipeline.py`` is shadowed by the ``scripts/pipeline/`` package,
+so it is loaded from its file path. Rendering and validation are stubbed.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import types
+from pathlib import Path
+
+import pytest
+
+_spec = importlib.util.spec_from_file_location(
+    "pipeline_cli", Path(__file__).with_name("pipeline.py")
+)
+pipeline = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(pipeline)
+
+PREVIEW_TIME = 2.0
+PRODUCTION_TIME = 30.0
+
+
+def _progressive(tmp_path, *, verdicts, production_ok=True, max_iterations=3):
+    """A progressive Pipeline whose n-th validation returns ``verdicts[n]``."""
+    p = pipeline.Pipeline(pipeline.PipelineConfig(
+        scene_description="a red cube",
+        output_dir=str(tmp_path),
+        progressive=True,
+        max_iterations=max_iterations,
+        verbose=False,
+    ))
+    renders = []
+
+    def render(script, output, **kwargs):
+        quality = kwargs["script_args"]["quality"]
+        renders.append(quality)
+        ok = quality == "preview" or production_ok
+        return pipeline.RenderResult(
+            success=ok,
+            output_path=output if ok else None,
+            render_time=PREVIEW_TIME if quality == "preview" else PRODUCTION_TIME,
+            error_message=None if ok else "GPU out of memory",
+        )
+
+    answers = iter(verdicts)
+
+    def validate(output, description):
+        passed = next(answers)
+        return types.SimpleNamespace(
+            success=True, matches_description=passed, needs_changes=not passed,
+            confidence=0.9 if passed else 0.4, suggestions=[], error_message=None,
+        )
+
+    p.engine.render = render
+    p.validator.validate = validate
+    p.validator.get_improvement_prompt = lambda validation: "move the camera"
+    return p, renders
+
+
+def test_pass_on_first_preview_renders_production_once(tmp_path):
+    p, renders = _progressive(tmp_path, verdicts=[True])
+    result = p._run_iterative("scene.py")
+
+    assert renders == ["preview", "production"]
+    assert result.success
+    assert result.output_path == str(tmp_path / "render.png")
+    # Nothing was avoided: the preview only added to the production render.
+    assert result.time_saved == pytest.approx(-PREVIEW_TIME)
+    assert result.render_time == pytest.approx(PREVIEW_TIME + PRODUCTION_TIME)
+
+
+def test_pass_after_several_previews_credits_only_the_rejected_ones(tmp_path):
+    p, renders = _progressive(tmp_path, verdicts=[False, False, True])
+    result = p._run_iterative("scene.py")
+
+    assert renders == ["preview"] * 3 + ["production"]
+    assert result.success
+    assert [e["time_saved"] for e in result.history] == pytest.approx([
+        PRODUCTION_TIME - PREVIEW_TIME, PRODUCTION_TIME - PREVIEW_TIME, -PREVIEW_TIME,
+    ])
+    assert result.time_saved == pytest.approx(2 * PRODUCTION_TIME - 3 * PREVIEW_TIME)
+
+
+def test_production_failure_fails_the_run(tmp_path):
+    p, _ = _progressive(tmp_path, verdicts=[True], production_ok=False)
+    result = p._run_iterative("scene.py")
+
+    assert not result.success
+    assert result.output_path is None
+    assert result.error_message == "Production render failed: GPU out of memory"
+
+
+def test_never_passing_still_delivers_a_production_render(tmp_path):
+    p, renders = _progressive(tmp_path, verdicts=[False, False], max_iterations=2)
+    result = p._run_iterative("scene.py")
+
+    assert renders == ["preview", "preview", "production"]
+    assert result.success
+    assert result.output_path == str(tmp_path / "render.png")
+    assert not result.validation_result.matches_description
+    assert result.time_saved == pytest.approx(PRODUCTION_TIME - 2 * PREVIEW_TIME)
@@ -0,0 +1,256 @@
+"""Adaptive, process-wide rate limiting for the vision backends.
+
+Every Claude / Gemini call in the validators, the panel generator and
+``vision.py`` goes through one ``AdaptiveRateLimiter`` per (backend,
+model), so parallel workers share what the provider will actually accept
+instead of each discovering the limit on its own:
+
+* Token bucket (GCRA): calls are spaced ``1 / rate`` seconds apart with a
+  small ``burst``. Callers queue in arrival order; nobody spins.
+* AIMD: each success raises the rate additively (about ``increase`` req/s
+  per second of sustained success); a 429 / overloaded error cuts it
+  multiplicatively, once per burst of throttles rather than once per
+  in-flight request that hit it.
+* Retry-After: a throttle pauses the whole bucket for the server's
+  ``retry-after`` (header, or Gemini's ``retryDelay``), so every worker
+  waits out the same window and then comes back at the reduced rate.
+  Without a hint (the usual 529 / overloaded case) the pause follows the
+  old 8 -> 16 -> ... -> 90s backoff, so sustained overload is still
+  ridden out for minutes rather than given up on after a few seconds.
+
+``call`` wraps one request with the limiter plus the old exponential
+backoff for transient (5xx / connection) errors.
+
+Usage::
+
+    from scripts.validate import rate_limit
+
+    limiter = rate_limit.limiter_for("claude", model)
+    response = rate_limit.call(lambda: client.messages.create(...), limiter=limiter)
+"""
+
+from __future__ import annotations
+
+import email.utils
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Optional
+
+# Starting rate (requests/second) per backend. AIMD moves each limiter
+# from here toward the provider's real ceiling.
+DEFAULT_RATES = {"claude": 2.0, "gemini": 2.0}
+DEFAULT_RATE = 1.0
+DEFAULT_BURST = 2
+MIN_RATE = 0.05
+MAX_RATE = 20.0
+MAX_RETRY_AFTER_S = 300.0
+BACKOFF_BASE_S = 8.0
+MAX_BACKOFF_S = 90.0
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose rate adapts to observed throttling (AIMD)."""
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE,
+        *,
+        burst: int = DEFAULT_BURST,
+        min_rate: float = MIN_RATE,
+        max_rate: float = MAX_RATE,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.throttles = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tat = 0.0  # theoretical arrival time of the next call
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+
+    def acquire(self, sleep: Callable[[float], None] = time.sleep) -> float:
+        """Block until this caller may send a request; returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self._paused_until:
+                    delay, reserved = self._paused_until - now, False
+                else:
+                    interval = 1.0 / self.rate
+                    tat = max(self._tat, now)
+                    self._tat = tat + interval
+                    delay = max(0.0, tat - (self.burst - 1) * interval - now)
+                    reserved = True
+            if delay > 0:
+                sleep(delay)
+                waited += delay
+            # A throttle that arrived while we slept voids our slot.
+            if reserved and self._clock() >= self._paused_until:
+                return waited
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Record a 429 / overloaded response and pause the bucket."""
+        with self._lock:
+            now = self._clock()
+            self.throttles += 1
+            # Requests already in flight when the limit hit will all come
+            # back throttled; that is one congestion event, not N.
+            if now - self._last_decrease >= max(1.0, 1.0 / self.rate):
+                self.rate = max(self.min_rate, self.rate * self.decrease)
+                self._last_decrease = now
+            pause = retry_after if retry_after is not None else 1.0 / self.rate
+            self._paused_until = max(self._paused_until, now + pause)
+            self._tat = max(self._tat, self._paused_until)
+
+
+_limiters: dict[tuple[str, str], AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(backend: str, model: str) -> AdaptiveRateLimiter:
+    """The process-wide limiter for ``backend`` / ``model``."""
+    key = (backend, model)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = _limiters[key] = AdaptiveRateLimiter(
+                DEFAULT_RATES.get(backend, DEFAULT_RATE)
+            )
+        return limiter
+
+
+# ---------------------------------------------------------------------------
+# Error classification
+# ---------------------------------------------------------------------------
+
+_THROTTLE_MARKERS = (
+    "rate limit", "rate_limit", "429", "529", "overloaded", "resource_exhausted",
+)
+_TRANSIENT_MARKERS = (
+    "503", "502", "504", "deadline", "connection", "unavailable",
+)
+
+
+def _status(exc: BaseException) -> Optional[int]:
+    for attr in ("status_code", "code", "status"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    return None
+
+
+def is_throttle(exc: BaseException) -> bool:
+    """A rate-limit / overload response (Anthropic 429/529, Gemini 429)."""
+    if _status(exc) in (429, 529):
+        return True
+    msg = str(exc).lower()
+    return any(marker in msg for marker in _THROTTLE_MARKERS)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """A retryable failure that is not the provider pushing back."""
+    if _status(exc) in (500, 502, 503, 504):
+        return True
+    msg = str(exc).lower()
+    return any(marker in msg for marker in _TRANSIENT_MARKERS)
+
+
+def retry_after_s(exc: BaseException) -> Optional[float]:
+    """Server-requested wait: ``retry-after-ms`` / ``retry-after`` headers
+    (Anthropic) or a ``retryDelay`` in the error details (Gemini)."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is not None and hasattr(headers, "get"):
+        ms = headers.get("retry-after-ms")
+        if ms:
+            try:
+                return _clamp(float(ms) / 1000.0)
+            except ValueError:
+                pass
+        value = headers.get("retry-after")
+        if value:
+            try:
+                return _clamp(float(value))
+            except ValueError:
+                pass
+            try:  # HTTP-date form
+                when = email.utils.parsedate_to_datetime(value)
+                return _clamp(when.timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+    m = re.search(r"retry_?delay\W+(\d+(?:\.\d+)?)s", str(exc), re.IGNORECASE)
+    if m:
+        return _clamp(float(m.group(1)))
+    return None
+
+
+def _clamp(seconds: float) -> float:
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER_S)
+
+
+# ---------------------------------------------------------------------------
+# Metered call
+# ---------------------------------------------------------------------------
+
+
+def call(
+    fn: Callable[[], Any],
+    *,
+    limiter: Optional[AdaptiveRateLimiter] = None,
+    max_attempts: int = 6,
+    label: str = "call",
+    fatal: tuple[type[BaseException], ...] = (),
+    sleep: Callable[[float], None] = time.sleep,
+) -> Any:
+    """Run ``fn`` under ``limiter``, retrying throttles and transient errors.
+
+    Throttles feed the limiter (which paces every caller sharing it)
+    instead of sleeping privately: the bucket pauses for the server's
+    retry-after, or without one for this call's exponential backoff step.
+    Transient errors, and throttles when no limiter is given, back off
+    exponentially with jitter. ``fatal`` exceptions are never retried.
+    """
+    delay = BACKOFF_BASE_S
+    for attempt in range(1, max_attempts + 1):
+        if limiter is not None:
+            limiter.acquire(sleep)
+        try:
+            result = fn()
+        except fatal:
+            raise
+        except Exception as e:
+            throttled = is_throttle(e)
+            if not (throttled or is_transient(e)) or attempt == max_attempts:
+                raise
+            if throttled and limiter is not None:
+                hint = retry_after_s(e)
+                pause = hint if hint is not None else delay
+                limiter.on_throttle(pause)
+                delay = min(delay * 2.0, MAX_BACKOFF_S)
+                print(f"  [ratelimit] {label} attempt {attempt} throttled "
+                      f"({type(e).__name__}); pausing {pause:.1f}s, shared rate "
+                      f"now {limiter.rate:.2f}/s", flush=True)
+                continue
+            sleep_for = delay + random.uniform(0, 2.0)
+            print(f"  [retry] {label} attempt {attempt} hit retryable error "
+                  f"({type(e).__name__}); sleeping {sleep_for:.1f}s", flush=True)
+            sleep(sleep_for)
+            delay = min(delay * 2.0, MAX_BACKOFF_S)
+            continue
+        if limiter is not None:
+            limiter.on_success()
+        return result
+    raise RuntimeError("retry loop exited without result")
@@ -7,8 +7,11 @@ Compares a generated shot (video file or still image) against:
   - a locked location plate (or storyboard panel) for the shot's location
   - optionally, the previous shot's final keyframe for continuity
 
-For a video, three keyframes are extracted (first / middle / last) with
-ffmpeg, then each is graded by Claude vision against all reference images.
+For a video, keyframes are extracted (by default three: first / middle /
+last) in one ffmpeg call, then each is graded (concurrently) by Claude
+vision against all reference images. Extracted frames are kept in a
+``FrameStore`` keyed by the clip's content hash, so validate-scene and the
+orchestrator never decode a clip twice.
 Returns structured JSON per keyframe and an aggregated pass/fail.
 
 Usage:
@@ -34,18 +37,28 @@ from __future__ import annotations
 
 import argparse
 import base64
+import contextlib
+import hashlib
 import io
 import json
 import os
-import random
 import re
 import subprocess
 import sys
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from fractions import Fraction
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    from . import rate_limit
+except ImportError:  # run as a script: python scripts/validate/shot_validator.py
+    import rate_limit  # type: ignore[no-redef]
+
 
 # ---------------------------------------------------------------------------
 # Vision-backend wiring
@@ -64,6 +77,12 @@ DEFAULT_GEMINI_MODEL = "gemini-2.5-flash"
 
 CREDENTIALS_PATH = Path.home() / ".claude" / ".credentials.json"
 
+# Keyframes of one shot are graded concurrently (first/middle/last share a
+# client). Every call is paced by the shared per-model limiter in
+# rate_limit.py, so a 429 slows all workers together instead of each
+# backing off on its own.
+DEFAULT_KEYFRAME_CONCURRENCY = 3
+
 # Pricing for cost estimation (USD per 1M tokens).
 PRICING = {
     "claude-sonnet-4-5":      {"input": 3.00, "output": 15.00},
@@ -101,6 +120,31 @@ def _get_gemini_client():
     return genai.Client(api_key=api_key)
 
 
+# ---------------------------------------------------------------------------
+# Timing hook
+#
+# Anything with a ``span(name, *, cat, **args)`` context manager can be
+# installed here. The orchestrator installs its run tracer (see
+# scripts/pipeline/tracing.py); standalone CLI runs leave it unset.
+# ---------------------------------------------------------------------------
+
+_tracer: Optional[Any] = None
+
+
+def set_tracer(tracer: Optional[Any]) -> Optional[Any]:
+    """Install ``tracer`` as the span hook; returns the previous one."""
+    global _tracer
+    previous, _tracer = _tracer, tracer
+    return previous
+
+
+def _span(name: str, **args: Any):
+    tracer = _tracer
+    if tracer is None:
+        return contextlib.nullcontext(args)
+    return tracer.span(name, cat="validate", **args)
+
+
 # ---------------------------------------------------------------------------
 # Image / video helpers
 # ---------------------------------------------------------------------------
@@ -135,36 +179,92 @@ def _sniff_media_type(raw: bytes, path: Path) -> str:
 _MAX_IMAGE_EDGE = 1600
 
 
+# Process-wide cache of prepared (downsized, JPEG re-encoded) images. The
+# same turnarounds and location plates are attached to every keyframe call
+# of every shot, so each file is decoded + resized once per process. Keyed
+# on (path, mtime, size, max_edge) so an edited file is re-prepared; LRU-
+# bounded by total bytes held.
+_PREPARED_CACHE_MAX_BYTES = 96 * 1024 * 1024
+_prepared_cache: "OrderedDict[tuple, tuple[bytes, str]]" = OrderedDict()
+_prepared_cache_bytes = 0
+_prepared_cache_lock = threading.Lock()
+
+
+def _prepare_image(path: Path, max_edge: int = _MAX_IMAGE_EDGE) -> tuple[bytes, str]:
+    """Return ``(jpeg_bytes, base64_text)`` for ``path``, downsized to at
+    most ``max_edge`` on the long side. Cached process-wide."""
+    global _prepared_cache_bytes
+
+    st = os.stat(path)
+    key = (str(Path(path).resolve()), st.st_mtime_ns, st.st_size, max_edge)
+    with _prepared_cache_lock:
+        hit = _prepared_cache.get(key)
+        if hit is not None:
+            _prepared_cache.move_to_end(key)
+            return hit
+
+    from PIL import Image
+
+    with _span("image.encode", path=Path(path).name):
+        with open(path, "rb") as f:
+            raw = f.read()
+
+        img = Image.open(io.BytesIO(raw))
+        if img.mode in ("RGBA", "P", "LA"):
+            img = img.convert("RGB")
+        w, h = img.size
+        long_edge = max(w, h)
+        if long_edge > max_edge:
+            scale = max_edge / float(long_edge)
+            img = img.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
+        buf = io.BytesIO()
+        img.save(buf, format="JPEG", quality=85)
+        encoded = buf.getvalue()
+        entry = (encoded, base64.standard_b64encode(encoded).decode("utf-8"))
+
+    with _prepared_cache_lock:
+        if key not in _prepared_cache:
+            _prepared_cache[key] = entry
+            _prepared_cache_bytes += len(entry[0]) + len(entry[1])
+        while _prepared_cache_bytes > _PREPARED_CACHE_MAX_BYTES and len(_prepared_cache) > 1:
+            _old_key, (old_raw, old_b64) = _prepared_cache.popitem(last=False)
+            _prepared_cache_bytes -= len(old_raw) + len(old_b64)
+    return entry
+
+
+def _prepare_part(path: Path, max_edge: int = _MAX_IMAGE_EDGE) -> tuple[bytes, str]:
+    """``(bytes, media_type)`` for attaching ``path`` to an SDK request.
+
+    Normally the cached downsized JPEG from ``_prepare_image``, so panel
+    generation and validation share one decode + resize per file. If the
+    image cannot be re-encoded (no Pillow, or a format it cannot read) the
+    original bytes are sent with their sniffed media type instead of one
+    guessed from the extension.
+    """
+    try:
+        encoded, _b64 = _prepare_image(path, max_edge)
+        return encoded, "image/jpeg"
+    except (ImportError, OSError, ValueError):
+        raw = Path(path).read_bytes()
+        return raw, _sniff_media_type(raw, Path(path))
+
+
 def _encode_image(path: Path) -> dict:
     """Return an Anthropic image content block for the given path.
 
     Images are downsized to at most _MAX_IMAGE_EDGE on the long side and
-    re-encoded as JPEG to keep request payloads small. The media_type is
-    detected from the original bytes' magic header (some files have a
-    .png extension but JPEG bytes).
+    re-encoded as JPEG to keep request payloads small (see
+    ``_prepare_image``, which caches the result per file). Because of the
+    re-encode the block's media_type is always image/jpeg, whatever the
+    original bytes were (some files have a .png extension but JPEG bytes).
     """
-    from PIL import Image
-
-    with open(path, "rb") as f:
-        raw = f.read()
-
-    img = Image.open(io.BytesIO(raw))
-    if img.mode in ("RGBA", "P", "LA"):
-        img = img.convert("RGB")
-    w, h = img.size
-    long_edge = max(w, h)
-    if long_edge > _MAX_IMAGE_EDGE:
-        scale = _MAX_IMAGE_EDGE / float(long_edge)
-        img = img.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
-    buf = io.BytesIO()
-    img.save(buf, format="JPEG", quality=85)
-    encoded = buf.getvalue()
+    _raw, b64 = _prepare_image(path)
     return {
         "type": "image",
         "source": {
             "type": "base64",
             "media_type": "image/jpeg",
-            "data": base64.standard_b64encode(encoded).decode("utf-8"),
+            "data": b64,
         },
     }
 
@@ -179,64 +279,314 @@ def _video_duration(video_path: Path) -> float:
     return float(out)
 
 
-def extract_keyframes(video_path: Path, out_dir: Path) -> list[Path]:
-    """Extract first / middle / last keyframes from a video to JPEGs.
+DEFAULT_KEYFRAME_COUNT = 3
+
+
+def _keyframe_plan(duration: float, count: int) -> list[tuple[str, Optional[float]]]:
+    """(label, timestamp) pairs for ``count`` evenly spaced keyframes.
 
-    Returns the three image paths in temporal order. Uses ffmpeg in two
-    modes: regular seek for first/middle, and `-sseof` (seek-from-end)
-    for the last frame, which is reliable on short clips where ``-ss``
-    near the duration can run past the last decoded frame.
+    The final sample's timestamp is ``None``: it is "the last decoded
+    frame", which is found by seeking from the end rather than by time
+    (``-ss`` near the duration can run past the last frame on short clips).
+    A single sample is taken from the middle. Labels keep the historical
+    first/mid/last names so 3-frame output paths are unchanged.
     """
-    out_dir.mkdir(parents=True, exist_ok=True)
-    duration = _video_duration(video_path)
-    stem = video_path.stem
+    count = max(1, int(count))
+    if count == 1:
+        return [("mid", max(duration / 2.0, 0.0))]
+    plan: list[tuple[str, Optional[float]]] = []
+    for i in range(count - 1):
+        if i == 0:
+            label = "first"
+        elif count % 2 == 1 and i == count // 2:
+            label = "mid"
+        else:
+            label = f"t{i:02d}"
+        plan.append((label, max(duration * i / (count - 1), 0.0)))
+    plan.append(("last", None))
+    return plan
+
+
+# ffmpeg's ``-q:v 3`` for JPEG: fixed quantiser 3, i.e. global_quality of
+# 3 * FF_QP2LAMBDA. Both extraction paths encode with these settings.
+JPEG_QSCALE = 3
+_FF_QP2LAMBDA = 118
+
+
+def _save_jpeg(frame, path: Path) -> None:
+    """Encode a decoded PyAV frame exactly as ``ffmpeg -q:v 3 out.jpg`` does:
+    libavcodec's mjpeg encoder, full-range 4:2:0, fixed qscale."""
+    import av  # type: ignore
+
+    codec = av.CodecContext.create("mjpeg", "w")
+    codec.width, codec.height = frame.width, frame.height
+    codec.pix_fmt = "yuvj420p"
+    codec.time_base = Fraction(1, 25)
+    codec.options = {
+        "flags": "+qscale",
+        "global_quality": str(JPEG_QSCALE * _FF_QP2LAMBDA),
+    }
+    packets = codec.encode(frame.reformat(format="yuvj420p"))
+    packets += codec.encode(None)
+    path.write_bytes(b"".join(bytes(p) for p in packets))
 
-    first_ts = 0.0
-    mid_ts = max(duration / 2.0, 0.0)
 
-    paths: list[Path] = []
-    # first + middle: standard seek-before-input is fine
-    for label, ts in [("first", first_ts), ("mid", mid_ts)]:
-        out = out_dir / f"{stem}-{label}.jpg"
-        subprocess.run([
-            "ffmpeg", "-y", "-loglevel", "error",
-            "-ss", f"{ts:.3f}",
-            "-i", str(video_path),
-            "-frames:v", "1",
-            "-q:v", "3",
-            str(out),
-        ], check=True)
-        if not out.exists():
-            raise RuntimeError(f"ffmpeg did not produce keyframe at t={ts:.3f}s for {video_path}")
-        paths.insert(len(paths), out)
-
-    # last: seek from end of file, take 1 frame past that point
-    last_out = out_dir / f"{stem}-last.jpg"
-    subprocess.run([
-        "ffmpeg", "-y", "-loglevel", "error",
-        "-sseof", "-0.5",
-        "-i", str(video_path),
-        "-update", "1",
-        "-q:v", "3",
-        str(last_out),
-    ], check=True)
-    if not last_out.exists():
+def _extract_with_pyav(
+    video_path: Path, out_dir: Path, count: int
+) -> Optional[list[Path]]:
+    """Single in-process decode pass via PyAV.
+
+    Returns None when PyAV is not installed or fails on this clip (corrupt
+    stream, unsupported codec), so the caller falls back to ffmpeg.
+    """
+    try:
+        import av  # type: ignore
+    except ImportError:
+        return None
+
+    av_errors = tuple(
+        e for e in (getattr(av, "FFmpegError", None), getattr(av, "AVError", None)) if e
+    )
+    try:
+        return _decode_keyframes_pyav(av, video_path, out_dir, count)
+    except (*av_errors, RuntimeError, ValueError, OSError) as exc:
+        print(f"  [warn] PyAV could not extract keyframes from {video_path.name} "
+              f"({exc}); falling back to ffmpeg", flush=True)
+        return None
+
+
+def _decode_keyframes_pyav(
+    av, video_path: Path, out_dir: Path, count: int
+) -> list[Path]:
+    with av.open(str(video_path)) as container:
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+        if stream.duration is not None and stream.time_base is not None:
+            duration = float(stream.duration * stream.time_base)
+        elif container.duration is not None:
+            duration = container.duration / av.time_base
+        else:
+            duration = _video_duration(video_path)
+        plan = _keyframe_plan(duration, count)
+        stem = video_path.stem
+        out_paths = [out_dir / f"{stem}-{label}.jpg" for label, _ in plan]
+        for out in out_paths:
+            out.unlink(missing_ok=True)
+        timed = sorted(
+            (ts, idx) for idx, (_label, ts) in enumerate(plan) if ts is not None
+        )
+        last_frame = None
+        for frame in container.decode(stream):
+            t = float(frame.time or 0.0)
+            while timed and t + 1e-6 >= timed[0][0]:
+                _ts, idx = timed.pop(0)
+                _save_jpeg(frame, out_paths[idx])
+            last_frame = frame
+    if last_frame is None:
+        raise RuntimeError(f"PyAV decoded no frames from {video_path}")
+    # Targets past the final frame (and the "last" sample) get the final frame.
+    for idx, (_label, ts) in enumerate(plan):
+        if ts is None or not out_paths[idx].exists():
+            _save_jpeg(last_frame, out_paths[idx])
+    return out_paths
+
+
+def _extract_with_ffmpeg(
+    video_path: Path,
+    plan: list[tuple[str, Optional[float]]],
+    out_dir: Path,
+    duration: Optional[float] = None,
+) -> list[Path]:
+    """All keyframes from ONE ffmpeg process.
+
+    Each sample is its own fast-seeked input (``-ss`` / ``-sseof`` before
+    ``-i``), so ffmpeg decodes only from the nearest keyframe before each
+    target instead of the whole clip, and we pay one process start-up.
+    ``duration`` is only needed when the last frame falls back to a slow
+    seek; if it is None the clip is probed then.
+    """
+    stem = video_path.stem
+    out_paths = [out_dir / f"{stem}-{label}.jpg" for label, _ in plan]
+    inputs: list[str] = []
+    outputs: list[str] = []
+    for idx, ((_label, ts), out) in enumerate(zip(plan, out_paths)):
+        if ts is None:
+            # last: seek from end of file and keep overwriting -> final frame
+            inputs += ["-sseof", "-0.5", "-i", str(video_path)]
+            outputs += ["-map", f"{idx}:v:0", "-update", "1", "-q:v", str(JPEG_QSCALE), str(out)]
+        else:
+            inputs += ["-ss", f"{ts:.3f}", "-i", str(video_path)]
+            outputs += ["-map", f"{idx}:v:0", "-frames:v", "1", "-q:v", str(JPEG_QSCALE), str(out)]
+        out.unlink(missing_ok=True)
+    subprocess.run(
+        ["ffmpeg", "-y", "-loglevel", "error", *inputs, *outputs], check=True,
+    )
+
+    for (label, ts), out in zip(plan, out_paths):
+        if out.exists():
+            continue
+        if ts is not None:
+            raise RuntimeError(
+                f"ffmpeg did not produce keyframe at t={ts:.3f}s for {video_path}"
+            )
         # Final fallback: slow seek (after -i) to duration-0.1s.
+        if duration is None:
+            duration = _video_duration(video_path)
         fallback_ts = max(duration - 0.1, 0.0)
         subprocess.run([
             "ffmpeg", "-y", "-loglevel", "error",
             "-i", str(video_path),
             "-ss", f"{fallback_ts:.3f}",
             "-frames:v", "1",
-            "-q:v", "3",
-            str(last_out),
+            "-q:v", str(JPEG_QSCALE),
+            str(out),
         ], check=True)
-    if not last_out.exists():
-        raise RuntimeError(f"ffmpeg could not extract last frame of {video_path}")
-    paths.append(last_out)
+        if not out.exists():
+            raise RuntimeError(f"ffmpeg could not extract last frame of {video_path}")
+    return out_paths
+
+
+def extract_keyframes(
+    video_path: Path, out_dir: Path, count: int = DEFAULT_KEYFRAME_COUNT
+) -> list[Path]:
+    """Extract ``count`` evenly spaced keyframes from a video to JPEGs.
+
+    Returns the image paths in temporal order; the default of 3 gives the
+    first / middle / last frames. Uses a single PyAV decode pass when PyAV
+    is installed, otherwise a single multi-input ffmpeg invocation (see
+    ``_extract_with_ffmpeg``).
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with _span("keyframes.extract", clip=video_path.name, count=count):
+        paths = _extract_with_pyav(video_path, out_dir, count)
+        if paths is None:
+            duration = _video_duration(video_path)
+            paths = _extract_with_ffmpeg(
+                video_path, _keyframe_plan(duration, count), out_dir, duration
+            )
     return paths
 
 
+class FrameStore:
+    """Extracted frames of clips, keyed by the clip's content hash.
+
+    Layout: ``root/<hash[:2]>/<hash>/`` holds the JPEGs plus an
+    ``index.json`` mapping frame keys (``"t=1.250"`` for a timestamp,
+    ``"last"`` for the final decoded frame, ``"n3-mid"`` for a keyframe
+    set's samples) to files, and keyframe counts to their frame keys.
+
+    A clip is therefore decoded at most once per frame, however many paths,
+    attempts, validators or runs ask for it: the validator's keyframes and
+    the orchestrator's continuity frame (the last keyframe of the
+    predecessor) are the same file.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self._lock = threading.Lock()
+        self._clip_locks: dict[str, threading.Lock] = {}
+
+    @classmethod
+    def for_dir(cls, root: Path) -> "FrameStore":
+        """The process-wide store for ``root``, so every caller shares its
+        per-clip locks (concurrent shots never extract the same frame twice)."""
+        key = Path(root).resolve()
+        with _frame_stores_lock:
+            store = _frame_stores.get(key)
+            if store is None:
+                store = _frame_stores[key] = cls(key)
+            return store
+
+    def keyframes(self, clip: Path, count: int = DEFAULT_KEYFRAME_COUNT) -> list[Path]:
+        """``count`` evenly spaced keyframes (see ``extract_keyframes``)."""
+        digest = _file_digest(clip)
+        with self._clip_lock(digest):
+            index = self._load(digest)
+            keys = index["sets"].get(str(count))
+            paths = self._paths(digest, index, keys) if keys else None
+            if paths is not None:
+                return paths
+            out_dir = self._dir(digest)
+            keys = []
+            for path in extract_keyframes(clip, out_dir, count):
+                label = path.stem[len(clip.stem) + 1:]
+                # The final sample is the clip's last frame whatever the
+                # count, so every set (and last_frame) shares that file.
+                key = "last" if label == "last" else f"n{count}-{label}"
+                os.replace(path, out_dir / _frame_file(key))
+                index["frames"][key] = _frame_file(key)
+                keys.append(key)
+            index["sets"][str(count)] = keys
+            self._save(digest, index)
+            return [out_dir / index["frames"][k] for k in keys]
+
+    def last_frame(self, clip: Path) -> Path:
+        """The final decoded frame of ``clip``."""
+        return self.frame_at(clip, None)
+
+    def frame_at(self, clip: Path, timestamp: Optional[float]) -> Path:
+        """The frame at ``timestamp`` seconds (None = the last frame)."""
+        digest = _file_digest(clip)
+        key = _frame_key(timestamp)
+        with self._clip_lock(digest):
+            index = self._load(digest)
+            hit = self._paths(digest, index, [key])
+            if hit is not None:
+                return hit[0]
+            out_dir = self._dir(digest)
+            with _span("keyframes.extract", clip=clip.name, count=1):
+                (out,) = _extract_with_ffmpeg(clip, [("grab", timestamp)], out_dir)
+            os.replace(out, out_dir / _frame_file(key))
+            index["frames"][key] = _frame_file(key)
+            self._save(digest, index)
+            return out_dir / _frame_file(key)
+
+    def _clip_lock(self, digest: str) -> threading.Lock:
+        with self._lock:
+            return self._clip_locks.setdefault(digest, threading.Lock())
+
+    def _dir(self, digest: str) -> Path:
+        path = self.root / digest[:2] / digest
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def _load(self, digest: str) -> dict:
+        try:
+            index = json.loads((self._dir(digest) / "index.json").read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            index = {}
+        index.setdefault("frames", {})
+        index.setdefault("sets", {})
+        return index
+
+    def _save(self, digest: str, index: dict) -> None:
+        path = self._dir(digest) / "index.json"
+        tmp = path.with_name(f".index.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(index, indent=2), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def _paths(self, digest: str, index: dict, keys: list[str]) -> Optional[list[Path]]:
+        paths = []
+        for key in keys:
+            name = index["frames"].get(key)
+            if name is None or not (self._dir(digest) / name).exists():
+                return None
+            paths.append(self._dir(digest) / name)
+        return paths
+
+
+_frame_stores: dict[Path, FrameStore] = {}
+_frame_stores_lock = threading.Lock()
+
+
+def _frame_key(timestamp: Optional[float]) -> str:
+    return "last" if timestamp is None else f"t={float(timestamp):.3f}"
+
+
+def _frame_file(key: str) -> str:
+    return ("last" if key == "last" else key.replace("=", "")) + ".jpg"
+
+
 # ---------------------------------------------------------------------------
 # Reference resolution
 # ---------------------------------------------------------------------------
@@ -415,6 +765,34 @@ VALIDATION_TOOL = {
     "input_schema": VALIDATION_SCHEMA,
 }
 
+# Batched mode: every keyframe of a shot in ONE request, so the reference
+# images are sent once instead of once per keyframe. Each array entry is a
+# plain VALIDATION_SCHEMA verdict, so _aggregate consumes them unchanged.
+BATCH_VALIDATION_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "keyframes": {
+            "type": "array",
+            "description": (
+                "One full verdict per KEYFRAME UNDER TEST, in the order the "
+                "keyframes were presented."
+            ),
+            "items": VALIDATION_SCHEMA,
+        },
+    },
+    "required": ["keyframes"],
+}
+
+BATCH_VALIDATION_TOOL = {
+    "name": "report_batch_validation",
+    "description": (
+        "Report the validation of every keyframe of a shot against the shot "
+        "manifest and locked reference images, one entry per keyframe in "
+        "order. All scores are 0.0-1.0 where 1.0 is perfect adherence."
+    ),
+    "input_schema": BATCH_VALIDATION_SCHEMA,
+}
+
 
 def _normalize_identity(raw: Any) -> dict[str, dict]:
     """Coerce the model's character_identity into a name-keyed dict.
@@ -471,6 +849,7 @@ def _build_prompt(
     has_prior: bool,
     prior_shot: Optional[dict] = None,
     wardrobe_refs: Optional[dict[str, tuple[Path, str, str]]] = None,
+    n_keyframes: int = 1,
 ) -> str:
     expected = ", ".join(shot["characters"]) if shot["characters"] else "(no characters - prop/insert shot)"
     wardrobe_lines = "\n".join(
@@ -478,10 +857,23 @@ def _build_prompt(
     ) or "  (none specified)"
     props = "\n".join(f"  - {p}" for p in shot.get("key_props", [])) or "  (none)"
 
+    if n_keyframes > 1:
+        intro = (
+            f"You are validating {n_keyframes} keyframes (in temporal order) "
+            "from one generated animated shot against locked reference "
+            "images. Score EACH keyframe independently with the full rubric "
+            "below. You MUST call the report_batch_validation tool with "
+            f"exactly {n_keyframes} entries in 'keyframes', in the order the "
+            "keyframes are shown; do not respond in plain text."
+        )
+    else:
+        intro = (
+            "You are validating a single keyframe from a generated animated shot "
+            "against locked reference images. You MUST call the report_validation "
+            "tool with your findings; do not respond in plain text."
+        )
     parts = [
-        "You are validating a single keyframe from a generated animated shot "
-        "against locked reference images. You MUST call the report_validation "
-        "tool with your findings; do not respond in plain text.",
+        intro,
         "",
         f"SHOT ID: {shot['shot_id']}",
         f"LOCATION: {shot.get('location', 'unknown')}",
@@ -541,7 +933,13 @@ def _build_prompt(
         parts.append("  - LOCATION PLATE (locked set reference for this shot's location)")
     if has_prior:
         parts.append("  - PREVIOUS SHOT KEYFRAME (for continuity comparison)")
-    parts.append("  - KEYFRAME UNDER TEST (the image being validated)")
+    if n_keyframes > 1:
+        parts.append(
+            f"  - KEYFRAMES UNDER TEST 1..{n_keyframes} (the images being "
+            f"validated, in temporal order)"
+        )
+    else:
+        parts.append("  - KEYFRAME UNDER TEST (the image being validated)")
     parts.append("")
     parts.append(
         "RUBRIC - score each on 0.0 to 1.0:\n"
@@ -720,81 +1118,89 @@ def _build_labeled_images(
     return out
 
 
+def _build_batch_labeled_images(
+    char_refs: dict[str, Path],
+    location_ref: Optional[Path],
+    prior_keyframe: Optional[Path],
+    keyframes: list[Path],
+    wardrobe_refs: Optional[dict[str, tuple[Path, str, str]]] = None,
+) -> list[tuple[str, Path]]:
+    """Like ``_build_labeled_images``, but references once + every keyframe."""
+    refs = _build_labeled_images(
+        char_refs, location_ref, prior_keyframe, keyframes[0], wardrobe_refs=wardrobe_refs,
+    )[:-1]
+    n = len(keyframes)
+    return refs + [
+        (f"KEYFRAME UNDER TEST {i} of {n}:", kf) for i, kf in enumerate(keyframes, 1)
+    ]
+
+
 class _GeminiHardFailure(Exception):
     """Non-retryable structured-output failure (e.g. runaway generation)."""
 
 
-def _call_with_retry(fn, *, max_attempts: int = 6, label: str = "call"):
-    """Generic backoff wrapper around a callable that may raise rate-limit errors."""
-    delay = 8.0
-    for attempt in range(1, max_attempts + 1):
-        try:
-            return fn()
-        except _GeminiHardFailure:
-            raise
-        except Exception as e:
-            msg = str(e).lower()
-            retryable = (
-                "rate" in msg or "429" in msg or "overloaded" in msg or
-                "503" in msg or "502" in msg or "504" in msg or
-                "resource_exhausted" in msg or "deadline" in msg or
-                "connection" in msg or "unavailable" in msg
-            )
-            if not retryable or attempt == max_attempts:
-                raise
-            sleep_for = delay + random.uniform(0, 2.0)
-            print(f"  [retry] {label} attempt {attempt} hit retryable error "
-                  f"({type(e).__name__}); sleeping {sleep_for:.1f}s", flush=True)
-            time.sleep(sleep_for)
-            delay = min(delay * 2.0, 90.0)
-    raise RuntimeError("retry loop exited without result")
+def _call_with_retry(
+    fn,
+    *,
+    max_attempts: int = 6,
+    label: str = "call",
+    limiter: Optional["rate_limit.AdaptiveRateLimiter"] = None,
+):
+    """Run ``fn`` under the shared rate ``limiter`` (see ``rate_limit.call``).
+
+    Throttling (429 / overloaded) adjusts the limiter every worker shares;
+    other retryable errors back off with jitter. Both waits are traced as
+    ``retry.backoff``.
+    """
+    def _backoff(seconds: float) -> None:
+        with _span("retry.backoff", label=label):
+            time.sleep(seconds)
+
+    return rate_limit.call(
+        fn,
+        limiter=limiter,
+        max_attempts=max_attempts,
+        label=label,
+        fatal=(_GeminiHardFailure,),
+        sleep=_backoff,
+    )
 
 
 # --- Claude backend ---------------------------------------------------------
 
-def _validate_keyframe_claude(
+def _claude_structured_call(
     client,
     model: str,
-    keyframe: Path,
-    shot: dict,
-    char_refs: dict[str, Path],
-    missing_refs: list[str],
-    location_ref: Optional[Path],
-    prior_keyframe: Optional[Path],
-    prior_shot: Optional[dict] = None,
-    wardrobe_refs: Optional[dict[str, tuple[Path, str, str]]] = None,
+    images: list[tuple[str, Path]],
+    prompt: str,
+    *,
+    tool: dict,
+    max_tokens: int,
+    label: str,
 ) -> tuple[dict, dict]:
+    """One forced-tool-use request; returns (tool input, token usage)."""
     content: list[dict] = []
-    for caption, path in _build_labeled_images(
-        char_refs, location_ref, prior_keyframe, keyframe, wardrobe_refs=wardrobe_refs,
-    ):
+    for caption, path in images:
         content.append({"type": "text", "text": caption})
         content.append(_encode_image(path))
-
-    prompt = _build_prompt(
-        shot,
-        char_refs=char_refs,
-        missing_refs=missing_refs,
-        has_location_ref=location_ref is not None,
-        has_prior=prior_keyframe is not None,
-        prior_shot=prior_shot,
-        wardrobe_refs=wardrobe_refs,
-    )
     content.append({"type": "text", "text": prompt})
 
     def _do_call():
-        return client.messages.create(
-            model=model,
-            max_tokens=2048,
-            tools=[VALIDATION_TOOL],
-            tool_choice={"type": "tool", "name": "report_validation"},
-            messages=[{"role": "user", "content": content}],
-        )
-    response = _call_with_retry(_do_call, label=f"claude:{shot['shot_id']}")
+        with _span("vision.claude", model=model, label=label):
+            return client.messages.create(
+                model=model,
+                max_tokens=max_tokens,
+                tools=[tool],
+                tool_choice={"type": "tool", "name": tool["name"]},
+                messages=[{"role": "user", "content": content}],
+            )
+    response = _call_with_retry(
+        _do_call, label=label, limiter=rate_limit.limiter_for("claude", model)
+    )
 
     tool_input = None
     for block in response.content:
-        if getattr(block, "type", None) == "tool_use" and block.name == "report_validation":
+        if getattr(block, "type", None) == "tool_use" and block.name == tool["name"]:
             tool_input = block.input
             break
     if tool_input is None:
@@ -804,8 +1210,6 @@ def _validate_keyframe_claude(
             raise RuntimeError(f"Claude did not emit tool call; text was: {text!r}")
         tool_input = json.loads(m.group())
 
-    tool_input["character_identity"] = _normalize_identity(tool_input.get("character_identity"))
-    tool_input["character_wardrobe"] = _normalize_wardrobe(tool_input.get("character_wardrobe"))
     usage = {
         "input_tokens": response.usage.input_tokens,
         "output_tokens": response.usage.output_tokens,
@@ -813,6 +1217,41 @@ def _validate_keyframe_claude(
     return tool_input, usage
 
 
+def _validate_keyframe_claude(
+    client,
+    model: str,
+    keyframe: Path,
+    shot: dict,
+    char_refs: dict[str, Path],
+    missing_refs: list[str],
+    location_ref: Optional[Path],
+    prior_keyframe: Optional[Path],
+    prior_shot: Optional[dict] = None,
+    wardrobe_refs: Optional[dict[str, tuple[Path, str, str]]] = None,
+) -> tuple[dict, dict]:
+    images = _build_labeled_images(
+        char_refs, location_ref, prior_keyframe, keyframe, wardrobe_refs=wardrobe_refs,
+    )
+    prompt = _build_prompt(
+        shot,
+        char_refs=char_refs,
+        missing_refs=missing_refs,
+        has_location_ref=location_ref is not None,
+        has_prior=prior_keyframe is not None,
+        prior_shot=prior_shot,
+        wardrobe_refs=wardrobe_refs,
+    )
+    tool_input, usage = _claude_structured_call(
+        client, model, images, prompt,
+        tool=VALIDATION_TOOL,
+        max_tokens=2048,
+        label=f"claude:{shot['shot_id']}:{keyframe.stem}",
+    )
+    tool_input["character_identity"] = _normalize_identity(tool_input.get("character_identity"))
+    tool_input["character_wardrobe"] = _normalize_wardrobe(tool_input.get("character_wardrobe"))
+    return tool_input, usage
+
+
 # --- Gemini backend ---------------------------------------------------------
 
 def _try_repair_json(text: str) -> Optional[dict]:
@@ -929,46 +1368,30 @@ def _strip_gemini_unsupported(schema: Any) -> Any:
     return schema
 
 
-def _validate_keyframe_gemini(
+def _gemini_structured_call(
     client,
     model: str,
-    keyframe: Path,
-    shot: dict,
-    char_refs: dict[str, Path],
-    missing_refs: list[str],
-    location_ref: Optional[Path],
-    prior_keyframe: Optional[Path],
-    prior_shot: Optional[dict] = None,
-    wardrobe_refs: Optional[dict[str, tuple[Path, str, str]]] = None,
+    images: list[tuple[str, Path]],
+    prompt: str,
+    *,
+    schema: dict,
+    label: str,
 ) -> tuple[dict, dict]:
+    """One response_schema request; returns (parsed JSON, token usage)."""
     from google.genai import types
 
     parts: list = []
-    for caption, path in _build_labeled_images(
-        char_refs, location_ref, prior_keyframe, keyframe, wardrobe_refs=wardrobe_refs,
-    ):
+    for caption, path in images:
         parts.append(caption)
-        # Re-use the resized/encoded image bytes from the shared helper.
-        block = _encode_image(path)
-        img_bytes = base64.b64decode(block["source"]["data"])
-        parts.append(types.Part.from_bytes(data=img_bytes, mime_type=block["source"]["media_type"]))
-
-    prompt = _build_prompt(
-        shot,
-        char_refs=char_refs,
-        missing_refs=missing_refs,
-        has_location_ref=location_ref is not None,
-        has_prior=prior_keyframe is not None,
-        prior_shot=prior_shot,
-        wardrobe_refs=wardrobe_refs,
-    )
+        # Re-use the cached resized JPEG bytes directly (no base64 round trip).
+        img_bytes, mime = _prepare_part(path)
+        parts.append(types.Part.from_bytes(data=img_bytes, mime_type=mime))
     parts.append(prompt)
 
-    schema = _strip_gemini_unsupported(VALIDATION_SCHEMA)
     # Disable thinking on 2.5 models so the entire output budget goes to JSON.
     config_kwargs = dict(
         response_mime_type="application/json",
-        response_schema=schema,
+        response_schema=_strip_gemini_unsupported(schema),
         temperature=0.0,
         max_output_tokens=16384,
     )
@@ -979,11 +1402,12 @@ def _validate_keyframe_gemini(
     config = types.GenerateContentConfig(**config_kwargs)
 
     def _do_call():
-        resp = client.models.generate_content(
-            model=model,
-            contents=parts,
-            config=config,
-        )
+        with _span("vision.gemini", model=model, label=label):
+            resp = client.models.generate_content(
+                model=model,
+                contents=parts,
+                config=config,
+            )
         # Surface truncation as a retryable error so _call_with_retry kicks in.
         finish = None
         try:
@@ -1009,11 +1433,10 @@ def _validate_keyframe_gemini(
             print(f"  [warn] Gemini hit MAX_TOKENS but JSON was repaired "
                   f"({len(text)} chars output).", flush=True)
         return resp, data
-    pair = _call_with_retry(_do_call, label=f"gemini:{shot['shot_id']}")
-    response, data = pair
+    response, data = _call_with_retry(
+        _do_call, label=label, limiter=rate_limit.limiter_for("gemini", model)
+    )
 
-    data["character_identity"] = _normalize_identity(data.get("character_identity"))
-    data["character_wardrobe"] = _normalize_wardrobe(data.get("character_wardrobe"))
     usage_meta = getattr(response, "usage_metadata", None)
     usage = {
         "input_tokens": getattr(usage_meta, "prompt_token_count", 0) or 0,
@@ -1022,17 +1445,320 @@ def _validate_keyframe_gemini(
     return data, usage
 
 
+def _validate_keyframe_gemini(
+    client,
+    model: str,
+    keyframe: Path,
+    shot: dict,
+    char_refs: dict[str, Path],
+    missing_refs: list[str],
+    location_ref: Optional[Path],
+    prior_keyframe: Optional[Path],
+    prior_shot: Optional[dict] = None,
+    wardrobe_refs: Optional[dict[str, tuple[Path, str, str]]] = None,
+) -> tuple[dict, dict]:
+    images = _build_labeled_images(
+        char_refs, location_ref, prior_keyframe, keyframe, wardrobe_refs=wardrobe_refs,
+    )
+    prompt = _build_prompt(
+        shot,
+        char_refs=char_refs,
+        missing_refs=missing_refs,
+        has_location_ref=location_ref is not None,
+        has_prior=prior_keyframe is not None,
+        prior_shot=prior_shot,
+        wardrobe_refs=wardrobe_refs,
+    )
+    data, usage = _gemini_structured_call(
+        client, model, images, prompt,
+        schema=VALIDATION_SCHEMA,
+        label=f"gemini:{shot['shot_id']}:{keyframe.stem}",
+    )
+    data["character_identity"] = _normalize_identity(data.get("character_identity"))
+    data["character_wardrobe"] = _normalize_wardrobe(data.get("character_wardrobe"))
+    return data, usage
+
+
+# ---------------------------------------------------------------------------
+# Content-addressed verdict cache
+#
+# A keyframe verdict is a pure function of the images sent (keyframe +
+# references, with their captions), the rubric prompt, the output schema,
+# the backend and the model. Hashing exactly those inputs lets a re-run of
+# validate-scene, or a resumed orchestrator run, reuse verdicts for
+# keyframes already graded against the same references - at $0.
+# ---------------------------------------------------------------------------
+
+# Bump to invalidate every cached verdict (e.g. after a normalisation change).
+_CACHE_VERSION = "1"
+DEFAULT_CACHE_DIR = Path("./footage/validation-cache")
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+# sha256 per (path, mtime_ns, size): the same references and clips are
+# hashed for every cache key and frame-store lookup in a run.
+_digest_memo: dict[tuple[str, int, int], str] = {}
+_digest_memo_lock = threading.Lock()
+
+
+def _file_digest(path: Path) -> str:
+    st = os.stat(path)
+    key = (str(Path(path).resolve()), st.st_mtime_ns, st.st_size)
+    with _digest_memo_lock:
+        hit = _digest_memo.get(key)
+    if hit is not None:
+        return hit
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    digest = h.hexdigest()
+    with _digest_memo_lock:
+        _digest_memo[key] = digest
+    return digest
+
+
+def _keyframe_cache_key(
+    backend: str,
+    model: str,
+    *,
+    keyframe: Path,
+    shot: dict,
+    char_refs: dict[str, Path],
+    missing_refs: list[str],
+    location_ref: Optional[Path],
+    prior_keyframe: Optional[Path],
+    prior_shot: Optional[dict] = None,
+    wardrobe_refs: Optional[dict[str, tuple[Path, str, str]]] = None,
+) -> str:
+    """Hash every input that determines a ``_validate_keyframe`` verdict."""
+    prompt = _build_prompt(
+        shot,
+        char_refs=char_refs,
+        missing_refs=missing_refs,
+        has_location_ref=location_ref is not None,
+        has_prior=prior_keyframe is not None,
+        prior_shot=prior_shot,
+        wardrobe_refs=wardrobe_refs,
+    )
+    images = _build_labeled_images(
+        char_refs, location_ref, prior_keyframe, keyframe, wardrobe_refs=wardrobe_refs,
+    )
+    return _request_cache_key(backend, model, VALIDATION_SCHEMA, prompt, images)
+
+
+def _request_cache_key(
+    backend: str,
+    model: str,
+    schema: dict,
+    prompt: str,
+    images: list[tuple[str, Path]],
+) -> str:
+    h = hashlib.sha256()
+    for part in (
+        _CACHE_VERSION,
+        backend,
+        model,
+        json.dumps(schema, sort_keys=True),
+        prompt,
+    ):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    for caption, path in images:
+        h.update(caption.encode("utf-8"))
+        h.update(b"\0")
+        h.update(_file_digest(path).encode("ascii"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+class ValidationCache:
+    """On-disk, size-bounded LRU cache of keyframe verdicts.
+
+    One JSON file per key under ``root/<key[:2]>/``. A hit bumps the file's
+    mtime, and eviction removes least-recently-used files once the cache
+    grows past ``max_bytes``. The cache size is kept as a running total, so
+    the directory is only scanned on the first ``put`` and when the total
+    crosses the limit. Safe to share between the keyframe threads of
+    ``validate_shot`` (and between processes: writes are atomic renames;
+    other processes' writes are picked up at the next scan).
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._bytes: Optional[int] = None  # None until the first scan
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            os.utime(path)
+        except (OSError, json.JSONDecodeError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return payload.get("result")
+
+    def put(self, key: str, result: dict, usage: dict) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        data = json.dumps({"result": result, "usage": usage}).encode("utf-8")
+        tmp.write_bytes(data)
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+        os.replace(tmp, path)
+        with self._lock:
+            if self._bytes is None:
+                self._evict()
+                return
+            self._bytes += len(data) - replaced
+            if self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Rescan the cache, then drop LRU entries until it fits. Caller holds the lock."""
+        entries = []
+        total = 0
+        for path in self.root.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        if total > self.max_bytes:
+            entries.sort()
+            for _mtime, size, path in entries:
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+        self._bytes = total
+
+
 def _validate_keyframe(
     backend: str,
     client,
     model: str,
+    *,
+    cache: Optional[ValidationCache] = None,
     **kwargs,
 ) -> tuple[dict, dict]:
+    key = None
+    if cache is not None:
+        key = _keyframe_cache_key(backend, model, **kwargs)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached, {"input_tokens": 0, "output_tokens": 0, "cache_hits": 1}
     if backend == "claude":
-        return _validate_keyframe_claude(client, model, **kwargs)
-    if backend == "gemini":
-        return _validate_keyframe_gemini(client, model, **kwargs)
-    raise ValueError(f"Unknown backend: {backend}")
+        out, usage = _validate_keyframe_claude(client, model, **kwargs)
+    elif backend == "gemini":
+        out, usage = _validate_keyframe_gemini(client, model, **kwargs)
+    else:
+        raise ValueError(f"Unknown backend: {backend}")
+    if cache is not None and key is not None:
+        cache.put(key, out, usage)
+    return out, usage
+
+
+class _BatchShapeError(RuntimeError):
+    """A batched response did not carry exactly one verdict per keyframe.
+
+    ``usage`` is the token usage of the rejected call, which was still paid for.
+    """
+
+    def __init__(self, message: str, usage: dict):
+        super().__init__(message)
+        self.usage = usage
+
+
+def _validate_keyframes_batched(
+    backend: str,
+    client,
+    model: str,
+    *,
+    keyframes: list[Path],
+    shot: dict,
+    char_refs: dict[str, Path],
+    missing_refs: list[str],
+    location_ref: Optional[Path],
+    prior_keyframe: Optional[Path],
+    prior_shot: Optional[dict] = None,
+    wardrobe_refs: Optional[dict[str, tuple[Path, str, str]]] = None,
+    cache: Optional[ValidationCache] = None,
+) -> tuple[list[dict], dict]:
+    """Grade every keyframe of a shot in a single request.
+
+    References are sent once, followed by each keyframe. Returns one
+    normalized verdict per keyframe (same shape as ``_validate_keyframe``)
+    and the usage of the one call. Raises ``_BatchShapeError`` when the
+    model returns the wrong number of entries.
+    """
+    n = len(keyframes)
+    images = _build_batch_labeled_images(
+        char_refs, location_ref, prior_keyframe, keyframes, wardrobe_refs=wardrobe_refs,
+    )
+    prompt = _build_prompt(
+        shot,
+        char_refs=char_refs,
+        missing_refs=missing_refs,
+        has_location_ref=location_ref is not None,
+        has_prior=prior_keyframe is not None,
+        prior_shot=prior_shot,
+        wardrobe_refs=wardrobe_refs,
+        n_keyframes=n,
+    )
+    key = None
+    if cache is not None:
+        key = _request_cache_key(backend, model, BATCH_VALIDATION_SCHEMA, prompt, images)
+        cached = cache.get(key)
+        if cached is not None:
+            return cached["keyframes"], {"input_tokens": 0, "output_tokens": 0, "cache_hits": n}
+
+    label = f"{backend}:{shot['shot_id']}:batch{n}"
+    if backend == "claude":
+        data, usage = _claude_structured_call(
+            client, model, images, prompt,
+            tool=BATCH_VALIDATION_TOOL,
+            max_tokens=2048 * n,
+            label=label,
+        )
+    elif backend == "gemini":
+        data, usage = _gemini_structured_call(
+            client, model, images, prompt,
+            schema=BATCH_VALIDATION_SCHEMA,
+            label=label,
+        )
+    else:
+        raise ValueError(f"Unknown backend: {backend}")
+
+    entries = data.get("keyframes") if isinstance(data, dict) else None
+    if not isinstance(entries, list) or len(entries) != n:
+        got = len(entries) if isinstance(entries, list) else "no"
+        raise _BatchShapeError(
+            f"batched validation returned {got} verdicts for {n} keyframes", usage,
+        )
+    out: list[dict] = []
+    for entry in entries:
+        entry = dict(entry) if isinstance(entry, dict) else {}
+        entry["character_identity"] = _normalize_identity(entry.get("character_identity"))
+        entry["character_wardrobe"] = _normalize_wardrobe(entry.get("character_wardrobe"))
+        out.append(entry)
+    if cache is not None and key is not None:
+        cache.put(key, {"keyframes": out}, usage)
+    return out, usage
 
 
 def _wardrobe_key(text: str) -> str:
@@ -1177,6 +1903,7 @@ def validate_panel(
     backend: str = DEFAULT_BACKEND,
     model: Optional[str] = None,
     client=None,
+    cache: Optional[ValidationCache] = None,
 ) -> ShotValidationResult:
     """Validate a STILL PANEL image (storyboard panel) against the bible.
 
@@ -1203,6 +1930,7 @@ def validate_panel(
         backend=backend,
         model=model,
         client=client,
+        cache=cache,
     )
 
 
@@ -1218,20 +1946,43 @@ def validate_shot(
     backend: str = DEFAULT_BACKEND,
     model: Optional[str] = None,
     client=None,
+    max_concurrency: int = DEFAULT_KEYFRAME_CONCURRENCY,
+    cache: Optional[ValidationCache] = None,
+    keyframe_count: int = DEFAULT_KEYFRAME_COUNT,
+    batched: bool = False,
+    frame_store: Optional[FrameStore] = None,
 ) -> ShotValidationResult:
     """Validate a single shot. media_path may be a video or a still image.
 
     Still images (PNG/JPG/WEBP/GIF) are validated as a single keyframe;
-    videos have first/middle/last keyframes extracted via ffmpeg. The
-    rubric and pass/fail gate are identical.
+    videos have ``keyframe_count`` evenly spaced keyframes extracted
+    (default first/middle/last). The rubric and pass/fail gate are
+    identical.
+
+    Keyframes are graded concurrently on up to ``max_concurrency`` threads
+    sharing ``client``; results keep keyframe order. ``max_concurrency=1``
+    grades them serially. With a ``cache``, keyframes already graded against
+    identical inputs are answered from disk; ``usage["cache_hits"]`` counts
+    them (they contribute no tokens).
+
+    ``batched=True`` grades all keyframes in ONE request instead: the
+    reference images are sent once, and ``usage["requests"]`` reports the
+    single call. If the model's answer does not hold one verdict per
+    keyframe, the shot is re-graded per keyframe. ``usage["keyframes"]``
+    is the number of keyframes graded either way.
+
+    With a ``frame_store`` keyframes come from (and are kept in) the store
+    instead of ``keyframes_dir``, so a clip seen before is not decoded again.
     """
     if model is None:
         model = _default_model_for_backend(backend)
     if client is None:
         client = _make_client(backend)
 
-    if media_path.suffix.lower() in _VIDEO_SUFFIXES:
-        keyframes = extract_keyframes(media_path, keyframes_dir)
+    if media_path.suffix.lower() in _VIDEO_SUFFIXES and frame_store is not None:
+        keyframes = frame_store.keyframes(media_path, keyframe_count)
+    elif media_path.suffix.lower() in _VIDEO_SUFFIXES:
+        keyframes = extract_keyframes(media_path, keyframes_dir, keyframe_count)
     elif media_path.suffix.lower() in _IMAGE_SUFFIXES:
         keyframes = [media_path]
     else:
@@ -1242,10 +1993,8 @@ def validate_shot(
     char_refs, missing = resolve_character_refs(shot["characters"], characters_dir)
     location_ref = resolve_location_ref(shot, locations_dir)
 
-    per_keyframe: list[dict] = []
-    total_usage = {"input_tokens": 0, "output_tokens": 0}
-    for kf in keyframes:
-        out, usage = _validate_keyframe(
+    def _grade(kf: Path) -> tuple[dict, dict]:
+        return _validate_keyframe(
             backend=backend,
             client=client,
             model=model,
@@ -1257,11 +2006,69 @@ def validate_shot(
             prior_keyframe=prior_keyframe,
             prior_shot=prior_shot,
             wardrobe_refs=wardrobe_refs,
+            cache=cache,
         )
+
+    graded: Optional[list[tuple[dict, dict]]] = None
+    requests: Optional[int] = None
+    rejected_usage: Optional[dict] = None
+    if batched and len(keyframes) > 1:
+        try:
+            outs, usage = _validate_keyframes_batched(
+                backend=backend,
+                client=client,
+                model=model,
+                keyframes=keyframes,
+                shot=shot,
+                char_refs=char_refs,
+                missing_refs=missing,
+                location_ref=location_ref,
+                prior_keyframe=prior_keyframe,
+                prior_shot=prior_shot,
+                wardrobe_refs=wardrobe_refs,
+                cache=cache,
+            )
+        except _BatchShapeError as e:
+            print(f"  [warn] {shot['shot_id']}: {e}; grading per keyframe", flush=True)
+            rejected_usage = e.usage
+        else:
+            # Token usage belongs to the one request; hang it on the first
+            # keyframe so the totals below stay correct.
+            hit = 1 if usage.get("cache_hits") else 0
+            graded = [(outs[0], {**usage, "cache_hits": hit})]
+            graded += [
+                (o, {"input_tokens": 0, "output_tokens": 0, "cache_hits": hit})
+                for o in outs[1:]
+            ]
+            requests = 1 - hit
+
+    if graded is None:
+        workers = max(1, min(int(max_concurrency), len(keyframes)))
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="keyframe") as pool:
+                graded = list(pool.map(_grade, keyframes))
+        else:
+            graded = [_grade(kf) for kf in keyframes]
+
+    per_keyframe: list[dict] = []
+    total_usage = {"input_tokens": 0, "output_tokens": 0, "cache_hits": 0}
+    for kf, (out, usage) in zip(keyframes, graded):
         out["_keyframe_path"] = str(kf)
+        if usage.get("cache_hits"):
+            out["_cache_hit"] = True
         per_keyframe.append(out)
         total_usage["input_tokens"] += usage["input_tokens"]
         total_usage["output_tokens"] += usage["output_tokens"]
+        total_usage["cache_hits"] += usage.get("cache_hits", 0)
+    if requests is None:
+        requests = len(keyframes) - total_usage["cache_hits"]
+    if rejected_usage is not None:
+        # The discarded batch call still counts toward spend.
+        total_usage["input_tokens"] += rejected_usage["input_tokens"]
+        total_usage["output_tokens"] += rejected_usage["output_tokens"]
+        requests += 1
+    total_usage["requests"] = requests
+    total_usage["keyframes"] = len(keyframes)
 
     aggregate, overall_pass, reasons = _aggregate(per_keyframe)
 
@@ -1524,6 +2331,22 @@ def _match_footage(shot_id: str, footage_dir: Path) -> Optional[Path]:
     return None
 
 
+def _cache_from_args(args: argparse.Namespace) -> Optional[ValidationCache]:
+    if args.no_cache:
+        return None
+    return ValidationCache(Path(args.cache_dir), max_bytes=args.cache_max_mb * 1024 * 1024)
+
+
+def _add_cache_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--cache-dir", default=str(DEFAULT_CACHE_DIR),
+                        help="Content-addressed keyframe verdict cache.")
+    parser.add_argument("--cache-max-mb", type=int,
+                        default=DEFAULT_CACHE_MAX_BYTES // (1024 * 1024),
+                        help="LRU-evict cached verdicts beyond this size.")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always call the vision API; never read or write the cache.")
+
+
 def cmd_validate_shot(args: argparse.Namespace) -> int:
     manifest = _load_manifest(Path(args.manifest))
     shot = next((s for s in manifest if s["shot_id"] == args.shot_id), None)
@@ -1548,6 +2371,10 @@ def cmd_validate_shot(args: argparse.Namespace) -> int:
         prior_keyframe=prior,
         backend=backend,
         model=model,
+        max_concurrency=args.max_concurrency,
+        cache=_cache_from_args(args),
+        keyframe_count=args.keyframes,
+        batched=args.batch,
     )
 
     out_dict = result.to_dict()
@@ -1591,6 +2418,7 @@ def cmd_validate_panel(args: argparse.Namespace) -> int:
         keyframes_dir=keyframes_dir,
         backend=backend,
         model=model,
+        cache=_cache_from_args(args),
     )
     out_dict = result.to_dict()
     out_dict["backend"] = backend
@@ -1620,6 +2448,10 @@ def cmd_validate_scene(args: argparse.Namespace) -> int:
     model = args.model or _default_model_for_backend(backend)
 
     client = _make_client(backend)
+    cache = _cache_from_args(args)
+    # Re-validating a scene reuses every clip's keyframes; a shot's last
+    # keyframe doubles as the next shot's continuity frame.
+    frame_store = FrameStore.for_dir(keyframes_dir / "store")
     results: list[ShotValidationResult] = []
     last_keyframe: Optional[Path] = None
     last_shot: Optional[dict] = None
@@ -1656,6 +2488,11 @@ def cmd_validate_scene(args: argparse.Namespace) -> int:
             backend=backend,
             model=model,
             client=client,
+            max_concurrency=args.max_concurrency,
+            cache=cache,
+            keyframe_count=args.keyframes,
+            batched=args.batch,
+            frame_store=frame_store,
         )
         results.append(result)
         kf_paths = result.media_paths.get("keyframes", [])
@@ -1676,7 +2513,8 @@ def cmd_validate_scene(args: argparse.Namespace) -> int:
 
         gate = "PASS" if result.overall_pass else "FAIL"
         print(f"  -> {gate}  reasons={len(result.reasons)}  "
-              f"tokens(in/out)={result.usage['input_tokens']}/{result.usage['output_tokens']}")
+              f"tokens(in/out)={result.usage['input_tokens']}/{result.usage['output_tokens']}  "
+              f"cached={result.usage.get('cache_hits', 0)}")
 
     total_in = sum(r.usage["input_tokens"] for r in results)
     total_out = sum(r.usage["output_tokens"] for r in results)
@@ -1689,7 +2527,11 @@ def cmd_validate_scene(args: argparse.Namespace) -> int:
             "backend": backend,
             "model": model,
             "shots": [r.to_dict() for r in results],
-            "total_usage": {"input_tokens": total_in, "output_tokens": total_out},
+            "total_usage": {
+                "input_tokens": total_in,
+                "output_tokens": total_out,
+                "cache_hits": sum(r.usage.get("cache_hits", 0) for r in results),
+            },
             "estimated_cost_usd": round(total_cost, 4),
         }, f, indent=2)
     print(f"Wrote {json_path}")
@@ -1700,6 +2542,8 @@ def cmd_validate_scene(args: argparse.Namespace) -> int:
         f.write(report)
     print(f"Wrote {report_path}")
     print(f"Total cost: ${total_cost:.4f}")
+    if cache is not None:
+        print(f"Verdict cache: {cache.hits} hit(s), {cache.misses} miss(es)")
     return 0
 
 
@@ -1747,6 +2591,13 @@ def build_parser() -> argparse.ArgumentParser:
     a.add_argument("--backend", default=DEFAULT_BACKEND, choices=["claude", "gemini"])
     a.add_argument("--model", default=None,
                    help="Override the per-backend default model.")
+    a.add_argument("--max-concurrency", type=int, default=DEFAULT_KEYFRAME_CONCURRENCY,
+                   help="Keyframes graded in parallel (1 = serial).")
+    a.add_argument("--keyframes", type=int, default=DEFAULT_KEYFRAME_COUNT,
+                   help="Evenly spaced keyframes sampled from a video.")
+    a.add_argument("--batch", action="store_true",
+                   help="Grade all keyframes in one request (references sent once).")
+    _add_cache_args(a)
     a.set_defaults(func=cmd_validate_shot)
 
     pa = sub.add_parser("validate-panel", help="Validate a single still-panel image (storyboard PNG).")
@@ -1761,6 +2612,7 @@ def build_parser() -> argparse.ArgumentParser:
     pa.add_argument("--backend", default=DEFAULT_BACKEND, choices=["claude", "gemini"])
     pa.add_argument("--model", default=None,
                     help="Override the per-backend default model.")
+    _add_cache_args(pa)
     pa.set_defaults(func=cmd_validate_panel)
 
     b = sub.add_parser("validate-scene", help="Validate every shot in a manifest, emit markdown report.")
@@ -1774,6 +2626,13 @@ def build_parser() -> argparse.ArgumentParser:
     b.add_argument("--backend", default=DEFAULT_BACKEND, choices=["claude", "gemini"])
     b.add_argument("--model", default=None,
                    help="Override the per-backend default model.")
+    b.add_argument("--max-concurrency", type=int, default=DEFAULT_KEYFRAME_CONCURRENCY,
+                   help="Keyframes graded in parallel per shot (1 = serial).")
+    b.add_argument("--keyframes", type=int, default=DEFAULT_KEYFRAME_COUNT,
+                   help="Evenly spaced keyframes sampled from each video.")
+    b.add_argument("--batch", action="store_true",
+                   help="Grade each shot's keyframes in one request (references sent once).")
+    _add_cache_args(b)
     b.set_defaults(func=cmd_validate_scene)
 
     c = sub.add_parser("render-report",
@@ -0,0 +1,412 @@
+"""Unit tests for ``scripts.validate.shot_validator``.
+
+Run with::
+
+    python3 -m pytest scripts/validate/test_shot_validator.py -v
+
+Model calls and ffmpeg are replaced with fakes; nothing leaves the machine.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import types
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from scripts.validate import shot_validator as sv
+
+
+def test_batch_shape_fallback_keeps_the_rejected_calls_usage(tmp_path, monkeypatch):
+    keyframes = [tmp_path / f"kf{i}.png" for i in range(3)]
+    monkeypatch.setattr(sv, "extract_keyframes", lambda media, out_dir, count: keyframes)
+
+    def batched(**kwargs):
+        raise sv._BatchShapeError(
+            "batched validation returned 2 verdicts for 3 keyframes",
+            {"input_tokens": 900, "output_tokens": 300},
+        )
+
+    def single(**kwargs):
+        return {}, {"input_tokens": 100, "output_tokens": 40}
+
+    monkeypatch.setattr(sv, "_validate_keyframes_batched", batched)
+    monkeypatch.setattr(sv, "_validate_keyframe", single)
+
+    result = sv.validate_shot(
+        {"shot_id": "1A", "characters": []},
+        Path("clip.mp4"),
+        tmp_path / "characters",
+        tmp_path / "locations",
+        tmp_path / "keyframes",
+        model="m",
+        client=object(),
+        max_concurrency=1,
+        batched=True,
+    )
+
+    assert result.usage["input_tokens"] == 900 + 3 * 100
+    assert result.usage["output_tokens"] == 300 + 3 * 40
+    assert result.usage["requests"] == 4
+    assert result.usage["keyframes"] == 3
+
+
+# ---------------------------------------------------------------------------
+# Concurrent keyframe grading
+# ---------------------------------------------------------------------------
+
+
+def _validate_video(tmp_path, monkeypatch, grade, *, count=4, max_concurrency=4):
+    keyframes = [tmp_path / f"kf{i}.jpg" for i in range(count)]
+    monkeypatch.setattr(sv, "extract_keyframes", lambda media, out_dir, n: keyframes)
+    monkeypatch.setattr(sv, "_validate_keyframe", lambda **kw: grade(kw["keyframe"]))
+    return sv.validate_shot(
+        {"shot_id": "1A", "characters": []},
+        Path("clip.mp4"),
+        tmp_path / "characters",
+        tmp_path / "locations",
+        tmp_path / "keyframes",
+        model="m",
+        client=object(),
+        max_concurrency=max_concurrency,
+        keyframe_count=count,
+    )
+
+
+def test_concurrent_grading_keeps_keyframe_order(tmp_path, monkeypatch):
+    # Later keyframes answer first: kf0 only returns once kf3 has finished.
+    finished: list[str] = []
+    done = {i: threading.Event() for i in range(4)}
+
+    def grade(keyframe):
+        i = int(keyframe.stem[2:])
+        if i < 3:
+            assert done[i + 1].wait(timeout=5), "keyframes were not graded concurrently"
+        finished.append(keyframe.name)
+        done[i].set()
+        return {"overall_pass": True, "id": i}, {"input_tokens": 10, "output_tokens": 1}
+
+    result = _validate_video(tmp_path, monkeypatch, grade)
+
+    assert finished == ["kf3.jpg", "kf2.jpg", "kf1.jpg", "kf0.jpg"]
+    assert [kf["id"] for kf in result.keyframes] == [0, 1, 2, 3]
+    assert [Path(kf["_keyframe_path"]).name for kf in result.keyframes] == [
+        "kf0.jpg", "kf1.jpg", "kf2.jpg", "kf3.jpg",
+    ]
+    assert result.usage["input_tokens"] == 40
+
+
+def test_one_failing_keyframe_neither_cancels_nor_reorders_the_rest(tmp_path, monkeypatch):
+    graded: list[str] = []
+    lock = threading.Lock()
+
+    def grade(keyframe):
+        i = int(keyframe.stem[2:])
+        time.sleep([0.05, 0.0, 0.03, 0.01][i])
+        with lock:
+            graded.append(keyframe.name)
+        verdict = {"overall_pass": i != 1, "id": i, "reasons": ["dino off model"] if i == 1 else []}
+        return verdict, {"input_tokens": 10, "output_tokens": 1}
+
+    result = _validate_video(tmp_path, monkeypatch, grade)
+
+    assert sorted(graded) == ["kf0.jpg", "kf1.jpg", "kf2.jpg", "kf3.jpg"]
+    assert [kf["id"] for kf in result.keyframes] == [0, 1, 2, 3]
+    assert [kf["overall_pass"] for kf in result.keyframes] == [True, False, True, True]
+    assert not result.overall_pass
+    assert result.reasons == ["dino off model"]
+
+
+def test_a_raising_keyframe_still_lets_the_others_finish(tmp_path, monkeypatch):
+    graded: list[str] = []
+    lock = threading.Lock()
+
+    def grade(keyframe):
+        if keyframe.stem == "kf0":
+            raise RuntimeError("backend exploded")
+        time.sleep(0.02)
+        with lock:
+            graded.append(keyframe.name)
+        return {"overall_pass": True}, {"input_tokens": 10, "output_tokens": 1}
+
+    with pytest.raises(RuntimeError, match="backend exploded"):
+        _validate_video(tmp_path, monkeypatch, grade)
+    assert sorted(graded) == ["kf1.jpg", "kf2.jpg", "kf3.jpg"]
+
+
+# ---------------------------------------------------------------------------
+# Prepared reference images
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def fake_pil(monkeypatch):
+    """A Pillow stand-in that counts encodes; the "JPEG" is the file's bytes."""
+    encodes: list[bytes] = []
+
+    class _Img:
+        mode, size = "RGB", (800, 600)
+
+        def __init__(self, raw):
+            self.raw = raw
+
+        def save(self, buf, format, quality):
+            encodes.append(self.raw)
+            buf.write(b"jpeg:" + self.raw)
+
+    pil = types.ModuleType("PIL")
+    pil.Image = types.SimpleNamespace(open=lambda f: _Img(f.read()), LANCZOS=1)
+    monkeypatch.setitem(sys.modules, "PIL", pil)
+    monkeypatch.setattr(sv, "_prepared_cache", OrderedDict())
+    monkeypatch.setattr(sv, "_prepared_cache_bytes", 0)
+    return encodes
+
+
+def test_prepared_reference_is_reused_until_the_file_changes(tmp_path, fake_pil):
+    ref = tmp_path / "mia_turnaround.png"
+    ref.write_bytes(b"v1")
+    os.utime(ref, ns=(1_000_000_000, 1_000_000_000))
+
+    first = sv._prepare_image(ref)
+    assert sv._prepare_image(ref) is first
+    assert sv._prepare_image(tmp_path / "." / ref.name) is first  # same resolved path
+    assert fake_pil == [b"v1"]
+
+    ref.write_bytes(b"v2")  # same size; only the mtime tells them apart
+    os.utime(ref, ns=(2_000_000_000, 2_000_000_000))
+
+    second = sv._prepare_image(ref)
+    assert fake_pil == [b"v1", b"v2"]
+    assert second[0] == b"jpeg:v2"
+
+
+# ---------------------------------------------------------------------------
+# Keyframe extraction (ffmpeg path, subprocess mocked)
+# ---------------------------------------------------------------------------
+
+
+class _FakeFfmpeg:
+    """Records ffmpeg commands and writes each ``.jpg`` output it names.
+
+    Outputs listed in ``drop`` are not written on the first call, as
+    ffmpeg does when ``-sseof`` lands past the end of a very short clip.
+    """
+
+    def __init__(self, drop: tuple[str, ...] = ()):
+        self.calls: list[list[str]] = []
+        self.drop = drop
+
+    def __call__(self, cmd, check=False, **kwargs):
+        self.calls.append(list(cmd))
+        for arg in cmd:
+            if arg.endswith(".jpg") and not (len(self.calls) == 1 and arg.endswith(self.drop)):
+                Path(arg).write_bytes(b"jpeg")
+
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch):
+    def install(duration: float, drop: tuple[str, ...] = ()) -> _FakeFfmpeg:
+        fake = _FakeFfmpeg(drop)
+        monkeypatch.setattr(sv, "_extract_with_pyav", lambda *a: None)
+        monkeypatch.setattr(sv, "_video_duration", lambda path: duration)
+        monkeypatch.setattr(sv.subprocess, "run", fake)
+        return fake
+    return install
+
+
+@pytest.mark.parametrize("duration, count, expected", [
+    (6.0, 3, [("first", 0.0), ("mid", 3.0), ("last", None)]),
+    (6.0, 1, [("mid", 3.0)]),
+    (6.0, 0, [("mid", 3.0)]),
+    (6.0, 2, [("first", 0.0), ("last", None)]),
+    (0.2, 5, [("first", 0.0), ("t01", 0.05), ("mid", 0.1), ("t03", 0.15), ("last", None)]),
+    (0.0, 3, [("first", 0.0), ("mid", 0.0), ("last", None)]),
+    (-1.0, 1, [("mid", 0.0)]),
+])
+def test_keyframe_plan(duration, count, expected):
+    plan = sv._keyframe_plan(duration, count)
+    assert [label for label, _ in plan] == [label for label, _ in expected]
+    for (_, ts), (_, want) in zip(plan, expected):
+        assert ts == (None if want is None else pytest.approx(want))
+
+
+def test_extract_keyframes_uses_one_ffmpeg_process(tmp_path, fake_ffmpeg):
+    fake = fake_ffmpeg(duration=6.0)
+    paths = sv.extract_keyframes(tmp_path / "clip.mp4", tmp_path / "kf", count=5)
+
+    assert [p.name for p in paths] == [
+        "clip-first.jpg", "clip-t01.jpg", "clip-mid.jpg", "clip-t03.jpg", "clip-last.jpg",
+    ]
+    assert all(p.exists() for p in paths)
+    assert len(fake.calls) == 1
+    cmd = fake.calls[0]
+    assert cmd.count("-i") == 5
+    assert [cmd[i + 1] for i, a in enumerate(cmd) if a == "-ss"] == [
+        "0.000", "1.500", "3.000", "4.500",
+    ]
+    assert cmd[cmd.index("-sseof") + 1] == "-0.5"
+
+
+def test_more_keyframes_than_frames_on_a_very_short_clip(tmp_path, fake_ffmpeg):
+    # A 3-frame clip at 24fps asked for 6 keyframes: several samples land on
+    # the same frame, and -sseof -0.5 seeks before the start of the clip.
+    fake = fake_ffmpeg(duration=0.125, drop=("clip-last.jpg",))
+    paths = sv.extract_keyframes(tmp_path / "clip.mp4", tmp_path / "kf", count=6)
+
+    assert len(paths) == 6 and all(p.exists() for p in paths)
+    assert len(fake.calls) == 2
+    fallback = fake.calls[1]
+    assert fallback[fallback.index("-ss") + 1] == "0.025"
+    assert fallback[-1].endswith("clip-last.jpg")
+
+
+def test_fallback_seek_is_clamped_to_the_start(tmp_path, fake_ffmpeg):
+    fake = fake_ffmpeg(duration=0.04, drop=("clip-last.jpg",))
+    sv.extract_keyframes(tmp_path / "clip.mp4", tmp_path / "kf", count=2)
+
+    fallback = fake.calls[1]
+    assert fallback[fallback.index("-ss") + 1] == "0.000"
+
+
+def test_missing_timed_keyframe_is_an_error(tmp_path, fake_ffmpeg):
+    fake_ffmpeg(duration=6.0, drop=("clip-mid.jpg",))
+    with pytest.raises(RuntimeError, match="t=3.000s"):
+        sv.extract_keyframes(tmp_path / "clip.mp4", tmp_path / "kf", count=3)
+
+
+def test_last_frame_probes_the_duration_only_for_the_fallback(tmp_path, fake_ffmpeg, monkeypatch):
+    probes = []
+
+    def probe(path):
+        probes.append(path.name)
+        return 6.0
+
+    store = sv.FrameStore(tmp_path / "frames")
+    fast, slow = tmp_path / "fast.mp4", tmp_path / "slow.mp4"
+    fast.write_bytes(b"clip one")
+    slow.write_bytes(b"clip two")
+
+    fake_ffmpeg(duration=6.0)
+    monkeypatch.setattr(sv, "_video_duration", probe)
+    assert store.last_frame(fast).exists()
+    assert probes == []
+
+    # -sseof came back empty: only now is the clip probed for the slow seek.
+    fake = fake_ffmpeg(duration=6.0, drop=("slow-grab.jpg",))
+    monkeypatch.setattr(sv, "_video_duration", probe)
+    assert store.last_frame(slow).exists()
+    assert probes == ["slow.mp4"]
+    assert fake.calls[1][fake.calls[1].index("-ss") + 1] == "5.900"
+
+
+def _fake_av(*, frames=3, fps=10.0, fail_on_open=False):
+    """A stand-in ``av`` module: a clip of ``frames`` frames whose mjpeg
+    encoder records its settings and emits the frame index as the JPEG."""
+    av = types.ModuleType("av")
+    av.time_base = 1_000_000
+    av.encoders = []
+
+    class FFmpegError(Exception):
+        pass
+
+    class Frame:
+        def __init__(self, index):
+            self.index, self.time = index, index / fps
+            self.width, self.height = 64, 36
+
+        def reformat(self, format):
+            self.format = format
+            return self
+
+    class Encoder:
+        def __init__(self):
+            av.encoders.append(self)
+            self.frames = []
+
+        def encode(self, frame):
+            if frame is None:
+                return []
+            self.frames.append(frame)
+            return [f"jpeg-{frame.index}".encode()]
+
+    class Container:
+        def __init__(self):
+            stream = types.SimpleNamespace(duration=frames, time_base=1 / fps)
+            self.streams = types.SimpleNamespace(video=[stream])
+            self.duration = None
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def decode(self, stream):
+            return (Frame(i) for i in range(frames))
+
+    def open_(path):
+        if fail_on_open:
+            raise FFmpegError("Invalid data found when processing input")
+        return Container()
+
+    av.FFmpegError = FFmpegError
+    av.open = open_
+    av.CodecContext = types.SimpleNamespace(create=lambda name, mode: Encoder())
+    return av
+
+
+def test_pyav_encodes_jpegs_like_ffmpeg_q3(tmp_path, monkeypatch):
+    av = _fake_av(frames=5)
+    monkeypatch.setitem(sys.modules, "av", av)
+    paths = sv.extract_keyframes(tmp_path / "clip.mp4", tmp_path / "kf", count=3)
+
+    # 0.5s clip: first, first frame at or after 0.25s, last.
+    assert [p.read_bytes() for p in paths] == [b"jpeg-0", b"jpeg-3", b"jpeg-4"]
+    for encoder in av.encoders:
+        assert encoder.pix_fmt == "yuvj420p"
+        assert encoder.options == {"flags": "+qscale", "global_quality": str(3 * 118)}
+        assert encoder.frames[0].format == "yuvj420p"
+
+
+def test_pyav_failure_falls_back_to_ffmpeg(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "av", _fake_av(fail_on_open=True))
+    monkeypatch.setattr(sv, "_video_duration", lambda path: 6.0)
+    ffmpeg = _FakeFfmpeg()
+    monkeypatch.setattr(sv.subprocess, "run", ffmpeg)
+
+    paths = sv.extract_keyframes(tmp_path / "clip.mp4", tmp_path / "kf", count=3)
+
+    assert len(ffmpeg.calls) == 1
+    assert all(p.read_bytes() == b"jpeg" for p in paths)
+
+
+# ---------------------------------------------------------------------------
+# ValidationCache
+# ---------------------------------------------------------------------------
+
+
+def test_validation_cache_scans_only_when_the_limit_is_crossed(tmp_path, monkeypatch):
+    cache = sv.ValidationCache(tmp_path / "cache", max_bytes=1000)
+    scans = []
+    evict = sv.ValidationCache._evict
+    monkeypatch.setattr(sv.ValidationCache, "_evict", lambda self: (scans.append(1), evict(self)))
+    verdict = {"pass": True, "notes": "x" * 150}  # ~200 bytes on disk
+
+    cache.put("aa01", verdict, {})
+    assert len(scans) == 1  # first put sizes the existing cache
+    for i in range(2, 5):
+        cache.put(f"aa{i:02d}", verdict, {})
+        cache.put("aa01", verdict, {})  # rewriting an entry does not grow it
+    assert len(scans) == 1
+
+    for i in range(5, 8):
+        cache.put(f"aa{i:02d}", verdict, {})
+    assert len(scans) > 1
+    files = list((tmp_path / "cache").glob("*/*.json"))
+    assert sum(f.stat().st_size for f in files) <= 1000
+    assert cache.get("aa07") == verdict
@@ -12,6 +12,8 @@ from pathlib import Path
 from typing import Optional, List, Dict, Any, Union
 from dataclasses import dataclass, field
 
+from . import rate_limit
+
 
 # Check for anthropic library
 try:
@@ -103,6 +105,17 @@ def get_media_type(image_path: Union[str, Path]) -> str:
     return media_types.get(suffix, 'image/png')
 
 
+def _create_message(client, **kwargs):
+    """``client.messages.create`` paced by the shared per-model limiter, so
+    parallel render validations back off together on a 429."""
+    return rate_limit.call(
+        lambda: client.messages.create(**kwargs),
+        limiter=rate_limit.limiter_for("claude", kwargs["model"]),
+        max_attempts=4,
+        label="vision",
+    )
+
+
 def check_api_available() -> tuple:
     """
     Check if the Claude API is available.
@@ -179,7 +192,8 @@ Respond ONLY with the JSON object, no other text."""
         image_data = encode_image(image_path)
         media_type = get_media_type(image_path)
 
-        response = client.messages.create(
+        response = _create_message(
+            client,
             model=model,
             max_tokens=max_tokens,
             messages=[
@@ -267,7 +281,8 @@ def analyze_render(
         image_data = encode_image(image_path)
         media_type = get_media_type(image_path)
 
-        response = client.messages.create(
+        response = _create_message(
+            client,
             model=model,
             max_tokens=max_tokens,
             messages=[
@@ -349,7 +364,8 @@ Respond ONLY with the JSON object."""
         media_type1 = get_media_type(image1_path)
         media_type2 = get_media_type(image2_path)
 
-        response = client.messages.create(
+        response = _create_message(
+            client,
             model=model,
             max_tokens=max_tokens,
             messages=[
@@ -501,7 +517,8 @@ Respond ONLY with the JSON object."""
     try:
         client = anthropic.Anthropic()
 
-        response = client.messages.create(
+        response = _create_message(
+            client,
             model=model,
             max_tokens=max_tokens,
             messages=[
@@ -8,20 +8,32 @@ Usage:
     gen = create_generator("veo-3.1")
     result = gen.generate(prompt="A dinosaur in a jungle", output_path="output.mp4")
     print(f"Cost: ${result.estimated_cost:.3f}, Duration: {result.duration_seconds}s")
+
+    # Or keep many jobs in flight and drive them from one loop:
+    jobs = [(gen, gen.submit(prompt=p, output_path=f"out{i}.mp4")) for i, p in enumerate(prompts)]
+    results = run_jobs(jobs)
 """
 
 from video.base import (
+    JobTiming,
     VideoGenerator,
+    VideoJob,
     VideoResult,
     create_generator,
+    run_jobs,
+    run_queue,
 )
 from video.veo_generator import VeoGenerator
 from video.pvideo_generator import PVideoGenerator
 
 __all__ = [
+    "JobTiming",
     "VideoGenerator",
+    "VideoJob",
     "VideoResult",
     "VeoGenerator",
     "PVideoGenerator",
     "create_generator",
+    "run_jobs",
+    "run_queue",
 ]
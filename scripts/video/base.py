@@ -1,10 +1,22 @@
 #!/usr/bin/env python3
-"""Base abstraction for video generation models."""
+"""Base abstraction for video generation models.
 
+Generators expose two interfaces:
+
+* ``generate(...)`` — blocking; returns when the video is on disk.
+* ``submit(...)`` / ``poll(job)`` / ``fetch(job)`` — non-blocking, so one
+  process can keep many remote jobs in flight and drive them all from a
+  single loop (see ``run_jobs``). Generators without a native remote job
+  API get a synchronous adapter that runs ``generate`` on a worker thread.
+"""
+
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, Union
 
 
 @dataclass
@@ -19,6 +31,37 @@ class VideoResult:
     metadata: dict = field(default_factory=dict)
 
 
+@dataclass
+class VideoJob:
+    """Handle for one submitted generation.
+
+    ``handle`` is backend-specific (a Veo operation, a Replicate
+    prediction, or a ``Future`` for the synchronous adapter).
+    ``poll_interval`` is how often ``run_jobs`` should poll it.
+    """
+
+    prompt: str
+    output_path: str
+    params: dict = field(default_factory=dict)
+    handle: Any = None
+    submitted_at: float = field(default_factory=time.time)
+    poll_interval: float = 0.05
+
+
+# Worker pool for the synchronous adapter (generators whose SDK only offers
+# a blocking call). Created on first use.
+_SYNC_POOL: Optional[ThreadPoolExecutor] = None
+_SYNC_POOL_LOCK = threading.Lock()
+
+
+def _sync_pool() -> ThreadPoolExecutor:
+    global _SYNC_POOL
+    with _SYNC_POOL_LOCK:
+        if _SYNC_POOL is None:
+            _SYNC_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="video-gen")
+        return _SYNC_POOL
+
+
 class VideoGenerator(ABC):
     """Abstract base class for video generation models."""
 
@@ -74,6 +117,160 @@ class VideoGenerator(ABC):
         """Return a human-readable model identifier."""
         ...
 
+    # -- submit / poll / fetch ---------------------------------------------
+    #
+    # Default implementation is the synchronous adapter: ``generate`` runs on
+    # a worker thread and polling checks its future. Generators with a real
+    # remote job API override all three.
+
+    def submit(
+        self,
+        prompt: str,
+        output_path: str,
+        duration_seconds: int = 8,
+        aspect_ratio: str = "16:9",
+        resolution: str = "720p",
+        image_path: Optional[str] = None,
+        **kwargs,
+    ) -> VideoJob:
+        """Start a generation and return immediately with a job handle.
+
+        Takes the same arguments as ``generate``.
+        """
+        params = dict(
+            duration_seconds=duration_seconds,
+            aspect_ratio=aspect_ratio,
+            resolution=resolution,
+            image_path=image_path,
+            **kwargs,
+        )
+        future = _sync_pool().submit(self.generate, prompt, output_path, **params)
+        return VideoJob(prompt=prompt, output_path=output_path, params=params, handle=future)
+
+    def poll(self, job: VideoJob) -> bool:
+        """Return True once ``job`` has finished (successfully or not)."""
+        return job.handle.done()
+
+    def fetch(self, job: VideoJob) -> VideoResult:
+        """Return the finished job's result (downloading it if needed).
+
+        Raises whatever the generation raised.
+        """
+        return job.handle.result()
+
+
+@dataclass
+class JobTiming:
+    """Where one job's wall-clock time went, in seconds.
+
+    ``queue_seconds``: waiting for a free concurrency slot before submit.
+    ``generation_seconds``: submit until the backend reported it finished.
+    ``download_seconds``: ``fetch`` (for the synchronous adapter the
+    download happens inside ``generate`` and is counted as generation).
+    """
+
+    queue_seconds: float = 0.0
+    generation_seconds: float = 0.0
+    download_seconds: float = 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "queue_seconds": round(self.queue_seconds, 3),
+            "generation_seconds": round(self.generation_seconds, 3),
+            "download_seconds": round(self.download_seconds, 3),
+        }
+
+
+JobOutcome = Union[VideoResult, BaseException]
+
+
+def run_queue(
+    tasks: list[tuple[VideoGenerator, Union[dict, VideoJob]]],
+    *,
+    max_in_flight: Optional[int] = None,
+    on_done: Optional[Callable[[int, JobOutcome, JobTiming], None]] = None,
+) -> list[tuple[JobOutcome, JobTiming]]:
+    """Run many generations with at most ``max_in_flight`` submitted at once.
+
+    Each task is ``(generator, submit_kwargs)``, or ``(generator, job)`` for
+    a job that was already submitted. Tasks are submitted in order as slots
+    free up, every in-flight job is polled from this one loop at its own
+    ``poll_interval``, and finished jobs are fetched immediately.
+    ``on_done(index, result_or_exception, timing)`` fires in completion
+    order. Returns ``(result_or_exception, timing)`` in input order; a
+    failed task yields its exception instead of raising, so one bad model
+    never strands the rest.
+    """
+    limit = max_in_flight if max_in_flight and max_in_flight > 0 else len(tasks)
+    start = time.monotonic()
+    out: list[Optional[tuple[JobOutcome, JobTiming]]] = [None] * len(tasks)
+    timings = [JobTiming() for _ in tasks]
+    jobs: dict[int, VideoJob] = {}
+    submitted_at: dict[int, float] = {}
+    next_poll: dict[int, float] = {}
+    queue = list(range(len(tasks)))
+
+    def _finish(i: int, outcome: JobOutcome) -> None:
+        out[i] = (outcome, timings[i])
+        if on_done is not None:
+            on_done(i, outcome, timings[i])
+
+    while queue or jobs:
+        while queue and len(jobs) < limit:
+            i = queue.pop(0)
+            gen, spec = tasks[i]
+            now = time.monotonic()
+            timings[i].queue_seconds = now - start
+            submitted_at[i] = now
+            try:
+                job = spec if isinstance(spec, VideoJob) else gen.submit(**spec)
+            except Exception as e:
+                _finish(i, e)
+                continue
+            jobs[i] = job
+            next_poll[i] = now
+
+        now = time.monotonic()
+        for i in sorted(jobs):
+            if next_poll[i] > now:
+                continue
+            gen = tasks[i][0]
+            job = jobs[i]
+            try:
+                if not gen.poll(job):
+                    next_poll[i] = now + job.poll_interval
+                    continue
+                done_at = time.monotonic()
+                timings[i].generation_seconds = done_at - submitted_at[i]
+                outcome: JobOutcome = gen.fetch(job)
+                timings[i].download_seconds = time.monotonic() - done_at
+            except Exception as e:
+                outcome = e
+            del jobs[i]
+            _finish(i, outcome)
+
+        if jobs and not (queue and len(jobs) < limit):
+            wait = min(next_poll[i] for i in jobs) - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+    return out  # type: ignore[return-value]
+
+
+def run_jobs(
+    jobs: list[tuple[VideoGenerator, VideoJob]],
+    on_done: Optional[Callable[[int, JobOutcome], None]] = None,
+) -> list[JobOutcome]:
+    """Drive already-submitted jobs to completion from one polling loop.
+
+    Same semantics as ``run_queue`` without the concurrency bound or
+    timings: ``on_done(index, result_or_exception)`` fires in completion
+    order, and results come back in input order.
+    """
+    callback = None
+    if on_done is not None:
+        callback = lambda i, outcome, _timing: on_done(i, outcome)  # noqa: E731
+    return [outcome for outcome, _ in run_queue(jobs, on_done=callback)]
+
 
 # Registry of model name -> (class, kwargs) for the factory
 _REGISTRY: dict[str, tuple[type, dict]] = {}
@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 """Compare video generation across multiple models.
 
-Generates the same prompt with each model, collects timing and cost data,
-and optionally uploads results to R2.
+Generates each prompt (optionally once per seed) with each model, collects
+queue / generation / download timing and cost data, and optionally uploads
+results to R2. Jobs fan out across models, prompts and seeds with at most
+``--max-concurrency`` in flight, all polled from one loop, so the run
+takes roughly as long as the slowest batch rather than the sum of every
+model's latency. The summary JSON also carries per-model latency
+percentiles and throughput for benchmarking backends under load.
 
 Usage:
     # From the scripts/ directory:
@@ -11,6 +16,9 @@ Usage:
     # With image input:
     python -m video.compare "Camera orbits around a 3D character" --image char.png --models veo-3.1 p-video
 
+    # Load test: every prompt in a file x 3 seeds, 8 jobs in flight:
+    python -m video.compare --prompt-file prompts.txt --seeds 1 2 3 --max-concurrency 8 --models p-video-draft
+
     # Upload results to R2:
     python -m video.compare "Test prompt" --models p-video-draft --upload
 """
@@ -23,11 +31,58 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from video.base import create_generator, VideoResult
+from video.base import JobTiming, create_generator, run_queue, VideoResult
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def load_prompt_file(path: str) -> list[str]:
+    """One prompt per line; blank lines and ``#`` comments are ignored."""
+    prompts = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            prompts.append(line)
+    return prompts
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100.0
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def _model_stats(results: list[dict], wall_seconds: float) -> dict:
+    """Per-model latency percentiles, cost and throughput."""
+    stats: dict = {}
+    for model in dict.fromkeys(r["model"] for r in results):
+        rows = [r for r in results if r["model"] == model]
+        ok = [r for r in rows if r["status"] == "success"]
+        entry = {
+            "jobs": len(rows),
+            "succeeded": len(ok),
+            "failed": sum(1 for r in rows if r["status"] == "error"),
+            "skipped": sum(1 for r in rows if r["status"] == "skipped"),
+            "total_cost": round(sum(r["estimated_cost"] for r in ok), 4),
+            "jobs_per_minute": round(len(ok) / wall_seconds * 60.0, 3) if wall_seconds else 0.0,
+        }
+        for key in ("queue_seconds", "generation_seconds", "download_seconds"):
+            values = [r["timing"][key] for r in ok]
+            entry[key] = {
+                "mean": round(sum(values) / len(values), 3) if values else 0.0,
+                "p50": round(_percentile(values, 50), 3),
+                "p95": round(_percentile(values, 95), 3),
+            }
+        stats[model] = entry
+    return stats
 
 
 def run_comparison(
-    prompt: str,
+    prompt: Optional[str],
     models: list[str],
     output_dir: str = "./video_compare",
     image_path: Optional[str] = None,
@@ -35,36 +90,61 @@ def run_comparison(
     resolution: str = "720p",
     aspect_ratio: str = "16:9",
     upload: bool = False,
+    prompts: Optional[list[str]] = None,
+    seeds: Optional[list[int]] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
 ) -> dict:
     """Generate videos with multiple models and compare results.
 
-    Returns a summary dict with per-model results and cost totals.
+    One job runs per (prompt, seed, model). ``prompts`` extends the single
+    ``prompt``; ``seeds`` (passed to the generator as ``seed``) repeats
+    every prompt once per seed. At most ``max_concurrency`` jobs are in
+    flight at once.
+
+    Returns a summary dict with per-job results (including timing), per-model
+    statistics and cost totals.
     """
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
+    all_prompts = ([prompt] if prompt else []) + list(prompts or [])
+    if not all_prompts:
+        raise ValueError("run_comparison needs a prompt or a prompts list")
+    seed_list: list[Optional[int]] = list(seeds) if seeds else [None]
+    fan_out = len(all_prompts) > 1 or seeds
+
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    results: list[dict] = []
     total_cost = 0.0
 
     print("=" * 60)
     print("Video Generation Comparison")
     print("=" * 60)
-    print(f"Prompt:     {prompt[:80]}{'...' if len(prompt) > 80 else ''}")
+    for p in all_prompts[:5]:
+        print(f"Prompt:     {p[:80]}{'...' if len(p) > 80 else ''}")
+    if len(all_prompts) > 5:
+        print(f"            ... and {len(all_prompts) - 5} more")
     print(f"Models:     {', '.join(models)}")
+    if seeds:
+        print(f"Seeds:      {', '.join(str(x) for x in seeds)}")
     print(f"Resolution: {resolution}")
     print(f"Duration:   {duration_seconds}s")
+    print(f"Concurrency: {max_concurrency}")
     if image_path:
         print(f"Image:      {image_path}")
     print("=" * 60)
     print()
 
+    # Build one generator per model, then one task per (prompt, seed, model).
+    results: list[Optional[dict]] = []
+    tasks = []
+    task_slots: list[int] = []  # results index of each task
+    generators = {}
     for model_name in models:
         print(f"--- {model_name} ---")
 
         # Cost estimate before running
         try:
-            gen = create_generator(model_name)
+            generators[model_name] = create_generator(model_name)
         except (ValueError, EnvironmentError) as e:
             print(f"  SKIP: {e}")
             results.append({
@@ -75,61 +155,91 @@ def run_comparison(
             print()
             continue
 
-        est_cost = gen.estimate_cost(duration_seconds, resolution)
-        print(f"  Estimated cost: ${est_cost:.4f}")
-
-        safe_name = model_name.replace(".", "_").replace(" ", "_")
-        filename = f"{safe_name}_{timestamp}.mp4"
-        out_path = str(output_dir / filename)
-
-        try:
-            result: VideoResult = gen.generate(
-                prompt=prompt,
-                output_path=out_path,
-                duration_seconds=duration_seconds,
-                aspect_ratio=aspect_ratio,
-                resolution=resolution,
-                image_path=image_path,
-            )
-
-            total_cost += result.estimated_cost
-            entry = {
-                "model": model_name,
-                "status": "success",
-                "file": result.file_path,
-                "filename": filename,
-                "duration_seconds": result.duration_seconds,
-                "estimated_cost": result.estimated_cost,
-                "generation_time_seconds": result.generation_time_seconds,
-                "model_used": result.model_used,
-                "metadata": result.metadata,
-            }
-            results.append(entry)
-
-            print(f"  Duration:  {result.duration_seconds}s")
-            print(f"  Cost:      ${result.estimated_cost:.4f}")
-            print(f"  Gen time:  {result.generation_time_seconds:.1f}s")
-            print(f"  Saved:     {result.file_path}")
+        est_cost = generators[model_name].estimate_cost(duration_seconds, resolution)
+        n_jobs = len(all_prompts) * len(seed_list)
+        print(f"  Estimated cost: ${est_cost:.4f}" + (f" x {n_jobs} jobs" if n_jobs > 1 else ""))
+        print()
 
-        except Exception as e:
-            results.append({
-                "model": model_name,
-                "status": "error",
-                "error": str(e),
-            })
-            print(f"  ERROR: {e}")
+    for pi, text in enumerate(all_prompts):
+        for seed in seed_list:
+            for model_name, gen in generators.items():
+                safe_name = model_name.replace(".", "_").replace(" ", "_")
+                suffix = ""
+                if fan_out:
+                    suffix = f"_p{pi:02d}" + (f"_s{seed}" if seed is not None else "")
+                filename = f"{safe_name}_{timestamp}{suffix}.mp4"
+                submit_kwargs = dict(
+                    prompt=text,
+                    output_path=str(output_dir / filename),
+                    duration_seconds=duration_seconds,
+                    aspect_ratio=aspect_ratio,
+                    resolution=resolution,
+                    image_path=image_path,
+                )
+                if seed is not None:
+                    submit_kwargs["seed"] = seed
+                task_slots.append(len(results))
+                results.append({
+                    "model": model_name,
+                    "prompt": text,
+                    "seed": seed,
+                    "filename": filename,
+                })
+                tasks.append((gen, submit_kwargs))
+
+    def _on_done(i: int, outcome, timing: JobTiming) -> None:
+        nonlocal total_cost
+        entry = results[task_slots[i]]
+        label = entry["model"] + (f" [p{all_prompts.index(entry['prompt']):02d}" if fan_out else "")
+        if fan_out:
+            label += f" seed={entry['seed']}]" if entry["seed"] is not None else "]"
+        print(f"--- {label} finished ---")
+        entry["timing"] = timing.as_dict()
+        if isinstance(outcome, BaseException):
+            entry.update(status="error", error=str(outcome))
+            print(f"  ERROR: {outcome}")
+            print()
+            return
+        result: VideoResult = outcome
+        total_cost += result.estimated_cost
+        entry.update(
+            status="success",
+            file=result.file_path,
+            duration_seconds=result.duration_seconds,
+            estimated_cost=result.estimated_cost,
+            generation_time_seconds=result.generation_time_seconds,
+            model_used=result.model_used,
+            metadata=result.metadata,
+        )
+        print(f"  Duration:  {result.duration_seconds}s")
+        print(f"  Cost:      ${result.estimated_cost:.4f}")
+        print(f"  Queue:     {timing.queue_seconds:.1f}s")
+        print(f"  Gen time:  {timing.generation_seconds:.1f}s")
+        print(f"  Download:  {timing.download_seconds:.1f}s")
+        print(f"  Saved:     {result.file_path}")
+        print()
 
+    started = time.monotonic()
+    if tasks:
+        print(f"Running {len(tasks)} job(s), up to {max_concurrency} in flight...")
         print()
+        run_queue(tasks, max_in_flight=max_concurrency, on_done=_on_done)
+    wall_seconds = time.monotonic() - started
 
     # Build summary
     summary = {
         "timestamp": timestamp,
-        "prompt": prompt,
+        "prompt": all_prompts[0],
+        "prompts": all_prompts,
+        "seeds": list(seeds) if seeds else [],
         "image_path": image_path,
         "resolution": resolution,
         "duration_seconds": duration_seconds,
         "aspect_ratio": aspect_ratio,
+        "max_concurrency": max_concurrency,
+        "wall_time_seconds": round(wall_seconds, 3),
         "total_estimated_cost": round(total_cost, 4),
+        "per_model": _model_stats(results, wall_seconds),
         "results": results,
     }
 
@@ -145,19 +255,24 @@ def run_comparison(
 
     # Print final table
     print()
-    print("=" * 60)
+    print("=" * 78)
     print("COMPARISON SUMMARY")
-    print("=" * 60)
-    print(f"{'Model':<20} {'Status':<10} {'Cost':>8} {'Gen Time':>10} {'Duration':>10}")
-    print("-" * 60)
-    for r in results:
-        status = r["status"]
-        cost = f"${r.get('estimated_cost', 0):.4f}" if status == "success" else "—"
-        gen_time = f"{r.get('generation_time_seconds', 0):.1f}s" if status == "success" else "—"
-        duration = f"{r.get('duration_seconds', 0)}s" if status == "success" else "—"
-        print(f"{r['model']:<20} {status:<10} {cost:>8} {gen_time:>10} {duration:>10}")
-    print("-" * 60)
-    print(f"{'TOTAL':<20} {'':10} ${total_cost:>7.4f}")
+    print("=" * 78)
+    print(f"{'Model':<20} {'OK/Jobs':>8} {'Cost':>9} {'Queue p50':>10} "
+          f"{'Gen p50':>9} {'Gen p95':>9} {'DL p50':>8}")
+    print("-" * 78)
+    for model, st in summary["per_model"].items():
+        if not st["succeeded"]:
+            status = "skipped" if st["skipped"] else "error"
+            print(f"{model:<20} {status:>8} {'—':>9} {'—':>10} {'—':>9} {'—':>9} {'—':>8}")
+            continue
+        print(
+            f"{model:<20} {st['succeeded']:>3}/{st['jobs']:<4} ${st['total_cost']:>8.4f} "
+            f"{st['queue_seconds']['p50']:>9.1f}s {st['generation_seconds']['p50']:>8.1f}s "
+            f"{st['generation_seconds']['p95']:>8.1f}s {st['download_seconds']['p50']:>7.1f}s"
+        )
+    print("-" * 78)
+    print(f"{'TOTAL':<20} {'':8} ${total_cost:>8.4f}   wall {wall_seconds:.1f}s")
     print()
 
     return summary
@@ -195,13 +310,25 @@ def main():
     parser = argparse.ArgumentParser(
         description="Compare video generation across models"
     )
-    parser.add_argument("prompt", help="Text prompt for video generation")
+    parser.add_argument("prompt", nargs="?", help="Text prompt for video generation")
+    parser.add_argument(
+        "--prompt-file",
+        help="File with one prompt per line (added to the positional prompt)",
+    )
     parser.add_argument(
         "--models",
         nargs="+",
         default=["veo-3.1", "p-video-draft"],
         help="Models to compare (default: veo-3.1 p-video-draft)",
     )
+    parser.add_argument(
+        "--seeds", nargs="+", type=int, default=None,
+        help="Generate every prompt once per seed",
+    )
+    parser.add_argument(
+        "--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY,
+        help=f"Max jobs in flight at once (default: {DEFAULT_MAX_CONCURRENCY})",
+    )
     parser.add_argument("--image", help="Optional image path for image-to-video")
     parser.add_argument(
         "--duration", type=int, default=5, help="Video duration in seconds (default: 5)"
@@ -212,6 +339,9 @@ def main():
     parser.add_argument("--upload", action="store_true", help="Upload results to R2")
 
     args = parser.parse_args()
+    prompts = load_prompt_file(args.prompt_file) if args.prompt_file else None
+    if not args.prompt and not prompts:
+        parser.error("give a prompt or --prompt-file")
 
     run_comparison(
         prompt=args.prompt,
@@ -222,6 +352,9 @@ def main():
         resolution=args.resolution,
         aspect_ratio=args.aspect_ratio,
         upload=args.upload,
+        prompts=prompts,
+        seeds=args.seeds,
+        max_concurrency=args.max_concurrency,
     )
 
 
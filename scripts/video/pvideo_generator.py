@@ -7,7 +7,7 @@ import urllib.request
 from pathlib import Path
 from typing import Optional
 
-from video.base import VideoGenerator, VideoResult
+from video.base import VideoGenerator, VideoJob, VideoResult
 
 # Pricing: USD per second of generated video
 _PVIDEO_COST = {
@@ -20,6 +20,9 @@ _PVIDEO_COST = {
 
 REPLICATE_MODEL = "prunaai/p-video"
 
+# Replicate prediction statuses that will not change any more.
+_TERMINAL_STATUSES = {"succeeded", "failed", "canceled"}
+
 
 class PVideoGenerator(VideoGenerator):
     """Video generation using Replicate P-Video (prunaai/p-video).
@@ -32,8 +35,10 @@ class PVideoGenerator(VideoGenerator):
         self,
         draft: bool = False,
         api_token: Optional[str] = None,
+        poll_interval: int = 5,
     ):
         self._draft = draft
+        self._poll_interval = poll_interval
         self._api_token = api_token or os.environ.get("REPLICATE_API_TOKEN")
         if not self._api_token:
             raise EnvironmentError(
@@ -65,19 +70,7 @@ class PVideoGenerator(VideoGenerator):
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
         start = time.time()
 
-        # Build input payload
-        input_data: dict = {
-            "prompt": prompt,
-            "duration": min(max(duration_seconds, 1), 10),
-            "aspect_ratio": aspect_ratio,
-            "resolution": resolution,
-            "fps": kwargs.get("fps", 24),
-            "draft": self._draft,
-            "prompt_upsampling": kwargs.get("prompt_upsampling", True),
-        }
-
-        if "seed" in kwargs:
-            input_data["seed"] = kwargs["seed"]
+        input_data = self._build_input(prompt, duration_seconds, aspect_ratio, resolution, kwargs)
 
         # Image input
         if image_path:
@@ -99,6 +92,120 @@ class PVideoGenerator(VideoGenerator):
         if audio_path and hasattr(input_data.get("audio"), "close"):
             input_data["audio"].close()
 
+        return self._finish(output, output_path, input_data, resolution, prompt, elapsed)
+
+    def submit(
+        self,
+        prompt: str,
+        output_path: str,
+        duration_seconds: int = 5,
+        aspect_ratio: str = "16:9",
+        resolution: str = "720p",
+        image_path: Optional[str] = None,
+        **kwargs,
+    ) -> VideoJob:
+        """Create a Replicate prediction without waiting for it."""
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        submitted_at = time.time()
+        input_data = self._build_input(prompt, duration_seconds, aspect_ratio, resolution, kwargs)
+
+        # Files are uploaded by predictions.create, so they can be closed
+        # as soon as it returns.
+        handles = []
+        if image_path:
+            handles.append(open(image_path, "rb"))
+            input_data["image"] = handles[-1]
+        audio_path = kwargs.get("audio_path")
+        if audio_path:
+            handles.append(open(audio_path, "rb"))
+            input_data["audio"] = handles[-1]
+        try:
+            print(f"[PVideoGenerator] Submitting to {REPLICATE_MODEL} (draft={self._draft})...")
+            prediction = self._client.predictions.create(
+                model=REPLICATE_MODEL, input=input_data
+            )
+        finally:
+            for fh in handles:
+                fh.close()
+
+        input_data.pop("image", None)
+        input_data.pop("audio", None)
+        return VideoJob(
+            prompt=prompt,
+            output_path=output_path,
+            params={"input": input_data, "resolution": resolution},
+            handle=prediction,
+            submitted_at=submitted_at,
+            poll_interval=self._poll_interval,
+        )
+
+    def poll(self, job: VideoJob) -> bool:
+        prediction = job.handle
+        if prediction.status not in _TERMINAL_STATUSES:
+            prediction.reload()
+        return prediction.status in _TERMINAL_STATUSES
+
+    def fetch(self, job: VideoJob) -> VideoResult:
+        prediction = job.handle
+        if prediction.status != "succeeded":
+            raise RuntimeError(
+                f"P-Video prediction {getattr(prediction, 'id', '?')} "
+                f"{prediction.status}: {getattr(prediction, 'error', None)}"
+            )
+        elapsed = time.time() - job.submitted_at
+        return self._finish(
+            prediction.output,
+            job.output_path,
+            job.params["input"],
+            job.params["resolution"],
+            job.prompt,
+            elapsed,
+        )
+
+    def estimate_cost(
+        self,
+        duration_seconds: int = 5,
+        resolution: str = "720p",
+        **kwargs,
+    ) -> float:
+        draft = kwargs.get("draft", self._draft)
+        key = (draft, resolution)
+        per_sec = _PVIDEO_COST.get(key, 0.02)
+        return round(per_sec * duration_seconds, 4)
+
+    # -- helpers -----------------------------------------------------------
+
+    def _build_input(
+        self,
+        prompt: str,
+        duration_seconds: int,
+        aspect_ratio: str,
+        resolution: str,
+        kwargs: dict,
+    ) -> dict:
+        input_data: dict = {
+            "prompt": prompt,
+            "duration": min(max(duration_seconds, 1), 10),
+            "aspect_ratio": aspect_ratio,
+            "resolution": resolution,
+            "fps": kwargs.get("fps", 24),
+            "draft": self._draft,
+            "prompt_upsampling": kwargs.get("prompt_upsampling", True),
+        }
+
+        if "seed" in kwargs:
+            input_data["seed"] = kwargs["seed"]
+        return input_data
+
+    def _finish(
+        self,
+        output,
+        output_path: str,
+        input_data: dict,
+        resolution: str,
+        prompt: str,
+        elapsed: float,
+    ) -> VideoResult:
         # Download output video
         video_url = self._extract_url(output)
         print(f"[PVideoGenerator] Downloading from {video_url[:80]}...")
@@ -118,26 +225,13 @@ class PVideoGenerator(VideoGenerator):
                 "replicate_model": REPLICATE_MODEL,
                 "draft": self._draft,
                 "fps": input_data["fps"],
-                "aspect_ratio": aspect_ratio,
+                "aspect_ratio": input_data["aspect_ratio"],
                 "resolution": resolution,
                 "prompt": prompt,
                 "video_url": video_url,
             },
         )
 
-    def estimate_cost(
-        self,
-        duration_seconds: int = 5,
-        resolution: str = "720p",
-        **kwargs,
-    ) -> float:
-        draft = kwargs.get("draft", self._draft)
-        key = (draft, resolution)
-        per_sec = _PVIDEO_COST.get(key, 0.02)
-        return round(per_sec * duration_seconds, 4)
-
-    # -- helpers -----------------------------------------------------------
-
     @staticmethod
     def _extract_url(output) -> str:
         """Extract video URL from replicate output (may be str, FileOutput, or list)."""
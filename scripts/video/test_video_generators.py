@@ -7,6 +7,7 @@ Run:  cd scripts && python -m pytest video/test_video_generators.py -v
 import os
 import json
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -16,7 +17,16 @@ import pytest
 os.environ.setdefault("GEMINI_API_KEY", "test-key")
 os.environ.setdefault("REPLICATE_API_TOKEN", "test-token")
 
-from video.base import VideoGenerator, VideoResult, create_generator, _REGISTRY, _ensure_registry
+from video.base import (
+    VideoGenerator,
+    VideoJob,
+    VideoResult,
+    create_generator,
+    run_jobs,
+    run_queue,
+    _REGISTRY,
+    _ensure_registry,
+)
 from video.veo_generator import VeoGenerator
 from video.pvideo_generator import PVideoGenerator
 
@@ -141,6 +151,32 @@ class TestVeoGenerator:
         gen._client.files.download.assert_called_once()
         mock_video_file.save.assert_called_once()
 
+    @patch("video.veo_generator.genai", create=True)
+    def test_submit_poll_fetch(self, _mock_genai):
+        """submit() returns at once; poll() refreshes the operation."""
+        gen = VeoGenerator(api_key="fake", poll_interval=0)
+
+        running = MagicMock()
+        running.done = False
+        finished = MagicMock()
+        finished.done = True
+        finished.error = None
+        finished.response.generated_videos = [MagicMock()]
+
+        gen._client.models.generate_videos = MagicMock(return_value=running)
+        gen._client.operations.get = MagicMock(return_value=finished)
+        gen._client.files.download = MagicMock()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            job = gen.submit("test prompt", os.path.join(tmpdir, "test.mp4"))
+            assert isinstance(job, VideoJob)
+            gen._client.operations.get.assert_not_called()
+            assert gen.poll(job) is True
+            result = gen.fetch(job)
+
+        assert result.model_used == gen.model_name
+        gen._client.files.download.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # PVideoGenerator
@@ -200,6 +236,103 @@ class TestPVideoGenerator:
         gen._client.run.assert_called_once()
         mock_urlretrieve.assert_called_once()
 
+    @patch("video.pvideo_generator.urllib.request.urlretrieve")
+    def test_submit_creates_prediction(self, mock_urlretrieve):
+        """submit() creates a prediction instead of blocking on run()."""
+        gen = PVideoGenerator(draft=True, api_token="fake")
+        prediction = MagicMock(status="starting", output=None)
+
+        def _reload():
+            prediction.status = "succeeded"
+            prediction.output = "https://example.com/video.mp4"
+
+        prediction.reload = MagicMock(side_effect=_reload)
+        gen._client.predictions.create = MagicMock(return_value=prediction)
+        gen._client.run = MagicMock()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            job = gen.submit("test prompt", os.path.join(tmpdir, "t.mp4"), duration_seconds=3)
+            assert gen.poll(job) is True
+            result = gen.fetch(job)
+
+        gen._client.run.assert_not_called()
+        assert result.estimated_cost == 0.015
+        mock_urlretrieve.assert_called_once()
+
+    def test_failed_prediction_raises_on_fetch(self):
+        gen = PVideoGenerator(draft=True, api_token="fake")
+        job = VideoJob(
+            prompt="p",
+            output_path="x.mp4",
+            handle=MagicMock(status="failed", error="nsfw"),
+        )
+        assert gen.poll(job) is True
+        with pytest.raises(RuntimeError, match="failed"):
+            gen.fetch(job)
+
+
+# ---------------------------------------------------------------------------
+# Submit / poll driver
+# ---------------------------------------------------------------------------
+
+class _BlockingGenerator(VideoGenerator):
+    """Only implements generate(); exercises the synchronous adapter."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    @property
+    def model_name(self):
+        return "blocking"
+
+    def estimate_cost(self, duration_seconds=8, resolution="720p", **kwargs):
+        return 0.0
+
+    def generate(self, prompt, output_path, duration_seconds=8, **kwargs):
+        if self.fail:
+            raise RuntimeError("boom")
+        return VideoResult(output_path, duration_seconds, self.model_name, 0.0, 0.0)
+
+
+class TestRunJobs:
+    def test_sync_adapter_and_failures(self):
+        ok, bad = _BlockingGenerator(), _BlockingGenerator(fail=True)
+        jobs = [
+            (ok, ok.submit("a", "a.mp4", duration_seconds=2)),
+            (bad, bad.submit("b", "b.mp4")),
+        ]
+        seen = []
+        results = run_jobs(jobs, on_done=lambda i, r: seen.append(i))
+        assert isinstance(results[0], VideoResult)
+        assert results[0].duration_seconds == 2
+        assert isinstance(results[1], RuntimeError)
+        assert sorted(seen) == [0, 1]
+
+    def test_run_queue_bounds_in_flight_and_times_jobs(self):
+        import threading
+
+        lock = threading.Lock()
+        state = {"now": 0, "peak": 0}
+
+        class _Counting(_BlockingGenerator):
+            def generate(self, prompt, output_path, duration_seconds=8, **kwargs):
+                with lock:
+                    state["now"] += 1
+                    state["peak"] = max(state["peak"], state["now"])
+                time.sleep(0.02)
+                with lock:
+                    state["now"] -= 1
+                return super().generate(prompt, output_path, duration_seconds, **kwargs)
+
+        gen = _Counting()
+        tasks = [(gen, {"prompt": str(i), "output_path": f"{i}.mp4"}) for i in range(6)]
+        out = run_queue(tasks, max_in_flight=2)
+        assert state["peak"] <= 2
+        assert all(isinstance(r, VideoResult) for r, _ in out)
+        # Later jobs waited for a slot before being submitted.
+        assert out[-1][1].queue_seconds > 0
+        assert all(t.generation_seconds > 0 for _, t in out)
+
 
 # ---------------------------------------------------------------------------
 # Compare
@@ -210,7 +343,9 @@ class TestCompare:
     def test_run_comparison(self, mock_urlretrieve):
         """Test comparison with a single mock model."""
         gen = PVideoGenerator(draft=True, api_token="fake")
-        gen._client.run = MagicMock(return_value="https://example.com/video.mp4")
+        gen._client.predictions.create = MagicMock(
+            return_value=MagicMock(status="succeeded", output="https://example.com/video.mp4")
+        )
 
         with tempfile.TemporaryDirectory() as tmpdir:
             # Patch create_generator to return our mock
@@ -227,6 +362,34 @@ class TestCompare:
         assert summary["total_estimated_cost"] > 0
         assert len(summary["results"]) == 1
         assert summary["results"][0]["status"] == "success"
+        assert set(summary["results"][0]["timing"]) == {
+            "queue_seconds", "generation_seconds", "download_seconds",
+        }
+
+    def test_run_comparison_fans_out_prompts_and_seeds(self):
+        gen = _BlockingGenerator()
+        gen.estimate_cost = lambda *a, **k: 0.0
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch("video.compare.create_generator", return_value=gen):
+                from video.compare import run_comparison
+
+                summary = run_comparison(
+                    prompt=None,
+                    prompts=["one", "two"],
+                    seeds=[1, 2],
+                    models=["blocking"],
+                    output_dir=tmpdir,
+                    max_concurrency=3,
+                )
+
+        results = summary["results"]
+        assert [(r["prompt"], r["seed"]) for r in results] == [
+            ("one", 1), ("one", 2), ("two", 1), ("two", 2),
+        ]
+        assert len({r["filename"] for r in results}) == 4
+        stats = summary["per_model"]["blocking"]
+        assert stats["jobs"] == stats["succeeded"] == 4
+        assert "p95" in stats["generation_seconds"]
 
     def test_run_comparison_skip_missing_key(self):
         """Models with missing API keys are skipped, not crashed."""
@@ -6,7 +6,7 @@ import time
 from pathlib import Path
 from typing import Optional
 
-from video.base import VideoGenerator, VideoResult
+from video.base import VideoGenerator, VideoJob, VideoResult
 
 
 # Cost estimates per second of video (USD).  Google doesn't publish exact
@@ -78,10 +78,35 @@ class VeoGenerator(VideoGenerator):
         image_path: Optional[str] = None,
         **kwargs,
     ) -> VideoResult:
+        job = self.submit(
+            prompt,
+            output_path,
+            duration_seconds=duration_seconds,
+            aspect_ratio=aspect_ratio,
+            resolution=resolution,
+            image_path=image_path,
+            **kwargs,
+        )
+        # Poll until done
+        while not self.poll(job):
+            print(f"[VeoGenerator] Waiting ({self._poll_interval}s)...")
+            time.sleep(self._poll_interval)
+        return self.fetch(job)
+
+    def submit(
+        self,
+        prompt: str,
+        output_path: str,
+        duration_seconds: int = 8,
+        aspect_ratio: str = "16:9",
+        resolution: str = "720p",
+        image_path: Optional[str] = None,
+        **kwargs,
+    ) -> VideoJob:
         from google.genai import types
 
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        start = time.time()
+        submitted_at = time.time()
 
         # Build config
         config = types.GenerateVideosConfig(
@@ -112,20 +137,46 @@ class VeoGenerator(VideoGenerator):
         print(f"[VeoGenerator] Submitting to {self._variant}...")
         operation = self._client.models.generate_videos(**gen_kwargs)
 
-        # Poll until done
-        while not operation.done:
-            print(f"[VeoGenerator] Waiting ({self._poll_interval}s)...")
-            time.sleep(self._poll_interval)
-            operation = self._client.operations.get(operation)
+        return VideoJob(
+            prompt=prompt,
+            output_path=output_path,
+            params=dict(
+                duration_seconds=duration_seconds,
+                aspect_ratio=aspect_ratio,
+                resolution=resolution,
+                image_path=image_path,
+                **kwargs,
+            ),
+            handle=operation,
+            submitted_at=submitted_at,
+            poll_interval=self._poll_interval,
+        )
 
-        elapsed = time.time() - start
+    def poll(self, job: VideoJob) -> bool:
+        if not job.handle.done:
+            job.handle = self._client.operations.get(job.handle)
+        return bool(job.handle.done)
+
+    def fetch(self, job: VideoJob) -> VideoResult:
+        operation = job.handle
+        elapsed = time.time() - job.submitted_at
+        error = getattr(operation, "error", None)
+        if error and not getattr(operation, "response", None):
+            raise RuntimeError(f"Veo generation failed: {error}")
 
         # Download and save
+        output_path = job.output_path
         video = operation.response.generated_videos[0]
         self._client.files.download(file=video.video)
         video.video.save(output_path)
         print(f"[VeoGenerator] Saved to {output_path}")
 
+        params = dict(job.params)
+        duration_seconds = params.pop("duration_seconds")
+        aspect_ratio = params.pop("aspect_ratio")
+        resolution = params.pop("resolution")
+        params.pop("image_path", None)
+
         actual_duration = _DEFAULT_DURATION.get(self._variant, duration_seconds)
         cost = self.estimate_cost(actual_duration, resolution)
 
@@ -139,8 +190,8 @@ class VeoGenerator(VideoGenerator):
                 "variant": self._variant,
                 "aspect_ratio": aspect_ratio,
                 "resolution": resolution,
-                "prompt": prompt,
-                **{k: v for k, v in kwargs.items()},
+                "prompt": job.prompt,
+                **{k: v for k, v in params.items()},
             },
         )
 